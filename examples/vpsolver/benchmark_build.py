@@ -0,0 +1,129 @@
+#!/usr/bin/env python
+"""
+This code is part of the Arc-flow Vector Packing Solver (VPSolver).
+
+Benchmark the arc-flow graph construction of 'vbp2afg'.
+
+Usage: benchmark_build.py [--baseline BINDIR] [--threads N] [--repeat N]
+                          [instance ...]
+
+Runs 'vbp2afg' from the PATH (and optionally from BINDIR, e.g. the build
+directory of another revision) on the example instances, plus a few larger
+randomly generated ones, and reports the wall-clock time, the peak memory
+and the number of dp states of each build. With a baseline (or, with
+--threads, against a single-threaded run) the speedup is reported and the
+graphs built by both runs are compared.
+"""
+from __future__ import print_function
+
+import os
+import re
+import sys
+import time
+import random
+import argparse
+import tempfile
+import subprocess
+
+sdir = os.path.dirname(os.path.abspath(__file__))
+EXAMPLES = [
+    os.path.join(sdir, "instance.vbp"),
+    os.path.join(sdir, "instance.mvp"),
+] + [
+    os.path.join(sdir, "..", "..", "pyvpsolver", "webapp", "data", "examples", f)
+    for f in ["vbp/bpp.vbp", "vbp/csp.vbp", "vbp/vbp.vbp", "mvp/vsbpp.mvp"]
+]
+
+
+def random_vbp(fname, W, m, wmin, wmax, bmax, seed=1):
+    """Write a random .vbp instance with item sizes in [wmin, wmax]% of W."""
+    rnd = random.Random(seed)
+    lines = [str(len(W)), " ".join(map(str, W)), str(m)]
+    for _ in range(m):
+        w = [rnd.randint(wmin * Wd // 100, wmax * Wd // 100) for Wd in W]
+        lines.append(" ".join(map(str, w + [rnd.randint(1, bmax)])))
+    with open(fname, "w") as f:
+        f.write("\n".join(lines) + "\n")
+    return fname
+
+
+def generated(tmp_dir):
+    """Return larger instances that exercise the dp memo."""
+    return [
+        random_vbp(os.path.join(tmp_dir, "rnd1d.vbp"), [5000], 60, 2, 30, 10),
+        random_vbp(os.path.join(tmp_dir, "rnd2d.vbp"), [500, 500], 50, 5, 30, 4),
+        random_vbp(os.path.join(tmp_dir, "rnd3d.vbp"), [100, 100, 100], 40, 5, 35, 3),
+        random_vbp(os.path.join(tmp_dir, "rnd4d.vbp"), [60] * 4, 40, 5, 35, 3),
+    ]
+
+
+def build(vbp2afg, instance, afg_file, threads=1):
+    """Run vbp2afg once and return (seconds, peak RSS in MB, #dp)."""
+    args = [vbp2afg, instance, afg_file]
+    if threads > 1:
+        args += ["-3", "-1", "-", str(threads)]
+    t0 = time.time()
+    proc = subprocess.Popen(args, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+    output = proc.stdout.read().decode()
+    _, status, usage = os.wait4(proc.pid, 0)
+    proc.returncode = status
+    elapsed = time.time() - t0
+    if status != 0:
+        raise RuntimeError("failed to run '{} {}'".format(vbp2afg, instance))
+    match = re.search(r"#dp: (\d+)", output)
+    ndp = int(match.group(1)) if match else -1
+    if sys.platform == "darwin":
+        peak = usage.ru_maxrss / float(1 << 20)
+    else:
+        peak = usage.ru_maxrss / 1024.0
+    return elapsed, peak, ndp
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("instances", nargs="*")
+    parser.add_argument("--baseline", help="directory with a reference vbp2afg")
+    parser.add_argument("--threads", type=int, default=1)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    tmp_dir = tempfile.mkdtemp()
+    instances = args.instances or EXAMPLES + generated(tmp_dir)
+    current = "current" if args.threads == 1 else "{} threads".format(args.threads)
+    binaries = [(current, "vbp2afg", args.threads)]
+    if args.baseline is not None:
+        binaries.insert(0, ("baseline", os.path.join(args.baseline, "vbp2afg"), 1))
+    elif args.threads > 1:
+        binaries.insert(0, ("1 thread", "vbp2afg", 1))
+
+    print("{:<14} {:>10} {:>10} {:>9} {:>10}".format(
+        "instance", "binary", "time (s)", "RSS (MB)", "#dp"
+    ))
+    for instance in instances:
+        name = os.path.basename(instance)
+        times, graphs = {}, {}
+        for i, (label, vbp2afg, threads) in enumerate(binaries):
+            afg_file = os.path.join(tmp_dir, "{}.afg".format(i))
+            runs = [
+                build(vbp2afg, instance, afg_file, threads) for _ in range(args.repeat)
+            ]
+            with open(afg_file, "rb") as f:
+                graphs[i] = f.read()
+            elapsed = min(r[0] for r in runs)
+            times[i] = elapsed
+            print("{:<14} {:>10} {:>10.3f} {:>9.1f} {:>10}".format(
+                name, label, elapsed, runs[0][1], runs[0][2]
+            ))
+        if len(times) == 2 and times[1] > 0:
+            print("{:<14} {:>10} {:>10.2f}x".format(
+                name, "speedup", times[0] / times[1]
+            ))
+            if graphs[0] != graphs[1]:
+                print("{:<14} {:>10}".format(name, "DIFFERENT"))
+    for fname in os.listdir(tmp_dir):
+        os.remove(os.path.join(tmp_dir, fname))
+    os.rmdir(tmp_dir)
+
+
+if __name__ == "__main__":
+    main()
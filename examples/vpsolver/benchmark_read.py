@@ -0,0 +1,118 @@
+#!/usr/bin/env python
+"""
+This code is part of the Arc-flow Vector Packing Solver (VPSolver).
+
+Benchmark the .afg and solution file readers of the native tools.
+
+Usage: benchmark_read.py [--baseline BINDIR] [--repeat N] [--arcs N]
+
+Writes a random .afg graph with --arcs arcs (50M by default) and a solution
+file with a value for every arc, then times 'afg2mps' (with the model written
+to /dev/null) and 'vbpsol' from the PATH (and optionally from BINDIR, e.g. the
+build directory of another revision) reading them, and reports the wall-clock
+time and the peak memory of each run.
+"""
+from __future__ import print_function
+
+import os
+import sys
+import time
+import random
+import argparse
+import tempfile
+import subprocess
+
+CHUNK = 1 << 16
+
+
+def random_afg(fname, narcs, nitems=100, seed=1):
+    """Write a random .afg graph with narcs arcs (items with zero demand)."""
+    rnd = random.Random(seed)
+    nv = max(narcs // 50, 2)
+    with open(fname, "w") as f:
+        f.write("#INSTANCE_BEGIN#\n$INSTANCE{\n1\n1\n")
+        f.write(" {} 1 -1\n{}\n".format(nv, nitems))
+        for i in range(nitems):
+            f.write("1 0\n {}\n".format(rnd.randint(1, nv - 1)))
+        f.write("};\n$VTYPE{I};\n$METHOD{-3};\n$BINARY{0};\n#INSTANCE_END#\n")
+        f.write("#GRAPH_BEGIN#\n$NBTYPES{1};\n$S{0};\n")
+        f.write("$Ts{{{}}};\n$LOSS{{{}}};\n".format(nv - 1, nitems))
+        f.write("$NV{{{}}};\n$NA{{{}}};\n$ARCS{{\n".format(nv, narcs))
+        for start in range(0, narcs, CHUNK):
+            n = min(CHUNK, narcs - start)
+            arcs = []
+            for _ in range(n):
+                u = rnd.randrange(nv - 1)
+                arcs += [u, rnd.randint(u + 1, nv - 1), rnd.randint(0, nitems)]
+            f.write("%d %d %d\n" * n % tuple(arcs))
+        f.write("};\n#GRAPH_END#\n")
+    return fname
+
+
+def zero_solution(fname, narcs):
+    """Write a solution file with a zero value for each arc variable."""
+    with open(fname, "w") as f:
+        for start in range(0, narcs, CHUNK):
+            n = min(CHUNK, narcs - start)
+            f.write("X%x 0\n" * n % tuple(range(start, start + n)))
+    return fname
+
+
+def run(args):
+    """Run a command once and return (seconds, peak RSS in MB)."""
+    t0 = time.time()
+    proc = subprocess.Popen(args, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+    proc.stdout.read()
+    _, status, usage = os.wait4(proc.pid, 0)
+    proc.returncode = status
+    elapsed = time.time() - t0
+    if status != 0:
+        raise RuntimeError("failed to run '{}'".format(" ".join(args)))
+    if sys.platform == "darwin":
+        peak = usage.ru_maxrss / float(1 << 20)
+    else:
+        peak = usage.ru_maxrss / 1024.0
+    return elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--baseline", help="directory with reference binaries")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--arcs", type=int, default=50000000)
+    args = parser.parse_args()
+
+    tmp_dir = tempfile.mkdtemp()
+    afg_file = random_afg(os.path.join(tmp_dir, "graph.afg"), args.arcs)
+    sol_file = zero_solution(os.path.join(tmp_dir, "vars.sol"), args.arcs)
+    commands = [
+        ("afg2mps", [afg_file, os.devnull]),
+        ("vbpsol", [afg_file, sol_file]),
+    ]
+    binaries = [("current", "")]
+    if args.baseline is not None:
+        binaries.insert(0, ("baseline", args.baseline))
+
+    print("{:<10} {:>10} {:>10} {:>9}".format(
+        "tool", "binary", "time (s)", "RSS (MB)"
+    ))
+    for tool, files in commands:
+        times = {}
+        for label, bindir in binaries:
+            command = [os.path.join(bindir, tool)] + files
+            runs = [run(command) for _ in range(args.repeat)]
+            times[label] = min(r[0] for r in runs)
+            print("{:<10} {:>10} {:>10.3f} {:>9.1f}".format(
+                tool, label, times[label], runs[0][1]
+            ))
+        if len(times) == 2 and times["current"] > 0:
+            print("{:<10} {:>10} {:>10.2f}x".format(
+                tool, "speedup", times["baseline"] / times["current"]
+            ))
+    for fname in os.listdir(tmp_dir):
+        os.remove(os.path.join(tmp_dir, fname))
+    os.rmdir(tmp_dir)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,6 @@
 #!/usr/bin/env python
 from __future__ import print_function
+import contextlib
 
 inf = float("inf")
 
@@ -33,6 +34,88 @@ def test_vbpsolver():
     assert obj == 1
     vbpsolver.print_solution(obj, patterns)
 
+    solution = vbpsolver.solve(W, w, b, b_max=[3], script="vpsolver_glpk.sh")
+    obj, patterns = solution
+    assert obj == 1
+
+
+def test_solve_many():
+    """Test solve_many."""
+    from pyvpsolver.solvers import vbpsolver, mvpsolver
+
+    instances = [((n,), [(2,), (3,)], [n, n]) for n in range(5, 15)]
+    instances.append(((1,), [(2,)], [1]))
+    results = {}
+    for i, solution, error in vbpsolver.solve_many(
+        instances, processes=2, script="vpsolver_glpk.sh"
+    ):
+        results[i] = (solution, error)
+    assert sorted(results) == list(range(len(instances)))
+    for i in range(len(instances) - 1):
+        solution, error = results[i]
+        assert error is None and solution[0] >= 1
+    assert results[len(instances) - 1][1] is not None
+
+    instances = [
+        dict(Ws=[(5,), (3,)], Cs=[3, 2], Qs=[inf, inf], ws=[[(2,)], [(3,)]], b=[2, 1])
+    ]
+    for i, solution, error in mvpsolver.solve_many(
+        instances, script="vpsolver_glpk.sh"
+    ):
+        assert error is None and solution[0] > 0
+
+
+def _sleep(seconds, verbose=None):
+    import time
+
+    time.sleep(seconds)
+    return seconds
+
+
+def _worker_pid(seconds, verbose=None):
+    """Sleep for some seconds and return the process id (for solve_many)."""
+    import os
+
+    _sleep(seconds)
+    return os.getpid()
+
+
+def test_solve_many_timeout():
+    """Test that solve_many terminates the instances that time out."""
+    import time
+    from pyvpsolver import VPSolver
+    from pyvpsolver.solvers import pool, vbpsolver
+
+    t0 = time.time()
+    results = dict(
+        (i, (solution, error))
+        for i, solution, error in pool.solve_many(
+            _sleep, [(60,), (0,)], processes=2, timeout=1
+        )
+    )
+    assert results[1] == (0, None)
+    assert results[0][0] is None
+    assert isinstance(results[0][1], pool.TimeLimitExceeded)
+    assert time.time() - t0 < 30
+
+    # one worker solves the instances in turn and is replaced after a timeout
+    results = list(
+        pool.solve_many(_worker_pid, [(0,), (0,), (60,), (0,)], processes=1, timeout=2)
+    )
+    pids = [solution for i, solution, error in results]
+    assert [i for i, solution, error in results] == [0, 1, 2, 3]
+    assert pids[0] == pids[1] and pids[2] is None and pids[3] != pids[0]
+
+    # the timeout also interrupts the in-process graph construction
+    assert VPSolver.INPROCESS
+    W, w, b = (5000,), [(100 + 7 * i,) for i in range(60)], [10] * 60
+    t0 = time.time()
+    for i, solution, error in vbpsolver.solve_many(
+        [(W, w, b)], timeout=1, script="vpsolver_glpk.sh"
+    ):
+        assert isinstance(error, pool.TimeLimitExceeded)
+    assert time.time() - t0 < 5
+
 
 def test_mvpsolvers():
     """Test mvpsolvers."""
@@ -130,6 +213,117 @@ def test_vbpsol():
     assert obj == 1
 
 
+def test_read_solution():
+    """Test reading solutions written by vbpsol."""
+    import warnings
+    from pyvpsolver import VPSolver, VBP, AFG, utils
+
+    afg = AFG(VBP(W=(1,), w=[(1,)], b=[1]))
+    NV, S, Ts, LOSS, arcs = afg.load()
+    sol_file = VPSolver.new_tmp_file(".sol")
+    with open(sol_file, "w") as f:
+        f.write(" ".join("X{:x} 1".format(i) for i in range(len(arcs) // 3)))
+    assert VPSolver.vbpsol(afg, sol_file, verbose=False) == (1, [[(1, [(0, 0)])]])
+    assert VPSolver.vbpsol(afg, sol_file, pyout=False, verbose=False) is None
+    pysol_file = VPSolver.new_tmp_file(".sol")
+    with open(pysol_file, "w") as f:
+        f.write("5 2\n2\n3 2 0 0 1 2\n1 0\n1\n1 1 2 0\n")
+    assert utils.read_solution(pysol_file) == (
+        5,
+        [[(3, [(0, 0), (1, 2)]), (1, [])], [(1, [(2, 0)])]],
+    )
+    assert utils.read_solution(VPSolver.new_tmp_file(".sol")) is None
+    for content in ["5", "5 2\n2\n3 2 0 0 1\n", "5 1\n1\n1 0\n7\n", "5 1\n1\n1 -1\n"]:
+        with open(pysol_file, "w") as f:
+            f.write(content)
+        try:
+            utils.read_solution(pysol_file)
+            assert False
+        except ValueError:
+            pass
+    with warnings.catch_warnings(record=True) as w:
+        warnings.simplefilter("always")
+        assert VPSolver.parse_vbpsol("PYSOL=(1,[[(1,[(0,0)])]])\n") == (
+            1,
+            [[(1, [(0, 0)])]],
+        )
+        assert w and issubclass(w[0].category, DeprecationWarning)
+
+
+def _write_sol(content):
+    """Write a solution file for 'vbpsol' and return its name."""
+    from pyvpsolver import VPSolver
+
+    sol_file = VPSolver.new_tmp_file(".sol")
+    with open(sol_file, "w") as f:
+        f.write(content)
+    return sol_file
+
+
+def test_read_tokens():
+    """Test the native readers on malformed input."""
+    from pyvpsolver import VPSolver, VBP, AFG
+
+    vbp_file = VPSolver.new_tmp_file(".vbp")
+    afg_file = VPSolver.new_tmp_file(".afg")
+    for content in ["1\n10\n1\n3 2147483647\n", "1\n10\n1\n+3 5\n"]:
+        with open(vbp_file, "w") as f:
+            f.write(content)
+        VPSolver.vbp2afg(vbp_file, afg_file, verbose=False)
+    for content in [
+        "1\n10\n1\n3 99999999999\n",  # demand out of int range
+        "1\n10\n1\n3 -2147483649\n",
+        "1\n10\n1\nx 1\n",  # malformed weight
+        "1\n10\n2\n3 1\n",  # missing item
+        "1\n10\n1\n3\n",  # missing demand
+    ]:
+        with open(vbp_file, "w") as f:
+            f.write(content)
+        try:
+            VPSolver.vbp2afg(vbp_file, afg_file, verbose=False)
+            assert False
+        except RuntimeError:
+            pass
+
+    afg = AFG(VBP(W=(20,), w=[(3,), (4,), (5,), (6,)], b=[1] * 4), verbose=False)
+    NV, S, Ts, LOSS, arcs = afg.load()
+    arcs = [tuple(arcs[i : i + 3]) for i in range(0, len(arcs), 3)]
+    assert len(arcs) > 10
+
+    def paths(u):
+        if u in Ts:
+            yield [arcs.index((u, S, LOSS))]
+            return
+        for i, (tail, head, _) in enumerate(arcs):
+            if tail == u:
+                for path in paths(head):
+                    yield [i] + path
+
+    # one bin with every item: a path from S to T and the feedback arc
+    path = next(p for p in paths(S) if {arcs[i][2] for i in p} >= {0, 1, 2, 3})
+    expected = VPSolver.vbpsol(
+        afg, _write_sol(" ".join("{:02d} 1".format(i) for i in path)), verbose=False
+    )
+    assert expected[0] == 1
+    tokens = ["X{:x} 1.0".format(i) for i in path]
+    tokens += ["Y 1", "X 1", "Xzz 1", "X0 abc", "X1 0", "X2"]
+    sol_file = _write_sol(" ".join(tokens))
+    assert VPSolver.vbpsol(afg, sol_file, verbose=False) == expected
+    for content in [
+        "X{:x} 1".format(len(arcs)),  # out of range in hex, not in decimal
+        "X100000000 1",  # wraps around as an int
+        "99999999999999999999 1",  # out of long range
+        "-1 1",
+        "X1g 1",
+        "X{} 1".format("0" * 300),  # token too long
+    ]:
+        try:
+            VPSolver.vbpsol(afg, _write_sol(content), verbose=False)
+            assert False
+        except RuntimeError:
+            pass
+
+
 def test_draw():
     """Test scripts."""
     from pyvpsolver import VPSolver, VBP, MVP, AFG
@@ -153,6 +347,582 @@ def test_draw():
             print(repr(e))
 
 
+def test_build_graph():
+    """Test the in-process graph builder."""
+    from pyvpsolver import VPSolver, VBP, MVP, AFG
+
+    vbp = VBP(W=(5, 3), w=[(2, 1), (3, 2)], b=[2, 1])
+    mvp = MVP(
+        Ws=[(5, 3), (4, 4)],
+        Cs=[3, 2],
+        Qs=[inf, -1],
+        ws=[[(2, 1)], [(3, 2), (1, 3)]],
+        b=[2, 1],
+    )
+    for instance in [vbp, mvp]:
+        NV, S, Ts, LOSS, arcs = VPSolver.build_graph(instance, verbose=False)
+        assert len(arcs) % 3 == 0
+        assert LOSS == len(instance.labels)
+        afg_file = VPSolver.new_tmp_file(".afg")
+        VPSolver.vbp2afg(instance, afg_file, verbose=False)
+        afg = AFG(instance, verbose=False)
+        graph = AFG.from_file(afg.filename).graph()
+        assert set(graph.A) == set(AFG.from_file(afg_file).graph().A)
+
+
+def test_afgb():
+    """Test the binary .afgb graph format."""
+    from pyvpsolver import VPSolver, VBP, MVP, AFG
+    from pyvpsolver import utils
+
+    vbp = VBP(W=(5, 3), w=[(2, 1), (3, 2)], b=[2, 1])
+    mvp = MVP(
+        Ws=[(5, 3), (4, 4)],
+        Cs=[3, 2],
+        Qs=[inf, -1],
+        ws=[[(2, 1)], [(3, 2), (1, 3)]],
+        b=[2, 1],
+    )
+    for instance in [vbp, mvp]:
+        afg_file = VPSolver.new_tmp_file(".afg")
+        afgb_file = VPSolver.new_tmp_file(".afgb")
+        VPSolver.vbp2afg(instance, afg_file, verbose=False)
+        VPSolver.vbp2afg(instance, afgb_file, verbose=False)
+        models = []
+        for fname in [afg_file, afgb_file]:
+            mps_file = VPSolver.new_tmp_file(".mps")
+            VPSolver.afg2mps(fname, mps_file, verbose=False)
+            models.append(utils.get_content(mps_file))
+        assert models[0] == models[1]
+        graph = AFG.from_file(afg_file).graph()
+        assert graph.A == AFG.from_file(afgb_file).graph().A
+        afg = AFG(instance, verbose=False)
+        afg.write(afgb_file)
+        assert graph.A == AFG.from_file(afgb_file).graph().A
+
+
+def test_afgraph():
+    """Test the array-backed AFGraph."""
+    from pyvpsolver import AFGraph
+
+    V = ["S", 1, 2, "T"]
+    A = [("S", 1, "a"), (1, 2, "b"), ("S", 2, "a"), (2, "T", "L"), ("T", "S", "L")]
+    graph = AFGraph(V, A + A[:2], "S", ["T"], "L")
+    assert sorted(graph.A, key=repr) == sorted(A, key=repr)
+    index = graph._index
+    varl, cons = graph.get_flow_cons()
+    assert len(varl) == len(A) and len(cons) == len(V)
+    assert graph._index is index
+    assert [graph.V[u] for u in index.topo] == ["S", 1, 2, "T"]
+    weights, capacities = {"a": (1,), "b": (2,)}, [(5,)]
+    lp_source = graph.lpaths_source(weights, capacities)
+    lp_targets = graph.lpaths_targets(weights, capacities)
+    assert lp_source.shape == (len(V), 1)
+    assert lp_source[:, 0].tolist() == [0, 1, 3, 3]
+    assert lp_targets[:, 0].tolist() == [2, 3, 5, 5]
+    assocs = graph.get_assocs()
+    assert sorted(assocs) == ["L", "a", "b"] and len(assocs["a"]) == 2
+    flow = dict(zip(A, [2, 2, 1, 3, 3]))
+    graph.set_flow({graph.vname(*arc): f for arc, f in flow.items()})
+    assert graph.flow == flow
+    graph.set_labels({arc: [arc[2]] for arc in A if arc[2] != "L"})
+    solution = graph.extract_solution("S", "<-", "T")
+    assert sorted(solution) == [(1, ["a"]), (2, ["a", "b"])]
+    n = 5000  # deeper than the default recursion limit
+    chain = [(i, i + 1, i % 2) for i in range(n)] + [(n, 0, "L")]
+    graph = AFGraph(range(n + 1), chain, 0, [n], "L")
+    graph.set_flow({graph.vname(*arc): 3 for arc in chain})
+    graph.set_labels({arc: [arc[2]] for arc in chain[:-1]})
+    assert graph.extract_solution(0, "->", n, 2) == [(2, [0] * 2500 + [1] * 2500)]
+    assert graph.extract_solution(0, "<-", n) == [(1, [0] * 2500 + [1] * 2500)]
+
+    graph = AFGraph(V, A, "S", ["T"], "L")
+    index = graph._index
+    graph.relabel(lambda u: 2 if u == 1 else u)
+    assert graph._index is not index
+    assert sorted(graph.A, key=repr) == sorted(
+        [("S", 2, "a"), (2, "T", "L"), ("T", "S", "L")], key=repr
+    )
+    assert isinstance(graph.V, tuple) and graph.A is graph.A
+    graph.A = [arc for arc in graph.A if arc[1] != "S"]
+    assert len(graph.A) == 2 and ("T", "S", "L") not in graph.A
+
+
+def test_sections():
+    """Test the $KEY{...} section indexer."""
+    from pyvpsolver import utils
+
+    content = "2\n5 3\n1\n2 1 3\n$VTYPE{C};\n$Ts{4,5};\n$ARCS{\n1 2 3\n-4 5 6\n};\n"
+    sections = utils.index_sections(content)
+    assert sorted(sections) == ["ARCS", "Ts", "VTYPE"]
+    assert utils.get_opt("VTYPE", content, sections=sections) == "C"
+    assert utils.get_opt("BINARY", content, "0", sections) == "0"
+    assert utils.get_ints("Ts", content, sections).tolist() == [4, 5]
+    assert utils.get_ints("ARCS", content, sections).tolist() == [1, 2, 3, -4, 5, 6]
+    assert utils.get_instance_data(content) == [2, 5, 3, 1, 2, 1, 3]
+    assert utils.parse_ints(" +1,2\n-3 ").tolist() == [1, 2, -3]
+    assert utils.parse_ints(" \n").tolist() == []
+    for text in ["1 x", "1.5", "99999999999999999999"]:
+        try:
+            utils.parse_ints(text)
+            assert False
+        except ValueError:
+            pass
+
+
+def test_read_instance():
+    """Test the streaming instance reader."""
+    import io
+    from pyvpsolver import VBP, MVP, utils
+
+    content = "2\n10 8\n3\n1 2 3\n4 5 6\n7 8 9\n$VTYPE{C};\n"
+    ints, opts = content.split("$")
+    afg = "\n \n #INSTANCE_BEGIN#\n$INSTANCE{\n" + ints + "};\n$" + opts
+    afg += "#INSTANCE_END#\n"
+    for chunk_size in [1, 4, 1 << 20]:
+        data, options = utils.read_instance(io.StringIO(content), chunk_size)
+        assert data.tolist() == [2, 10, 8, 3, 1, 2, 3, 4, 5, 6, 7, 8, 9]
+        assert options == {"VTYPE": "C"}
+        # leading whitespace longer than a chunk
+        data, options = utils.read_instance(io.StringIO(afg), chunk_size)
+        assert data.tolist() == [2, 10, 8, 3, 1, 2, 3, 4, 5, 6, 7, 8, 9]
+        assert options == {"VTYPE": "C"}
+    vbp = VBP.from_file(io.StringIO(content))
+    assert (vbp.W, vbp.w, vbp.b, vbp.vtype) == (
+        [10, 8],
+        [[1, 2], [4, 5], [7, 8]],
+        [3, 6, 9],
+        "C",
+    )
+    mvp = MVP.from_data([1, 2, 5, 1, -1, 4, 2, 0, 2, 2, 3, 1, 2, 1, 1, 1])
+    assert (mvp.Ws, mvp.Cs, mvp.Qs) == ([[5], [4]], [1, 2], [-1, 0])
+    assert (mvp.ws, mvp.b) == ([[[1], [2]], [[1]]], [3, 1])
+
+
+def test_lazy_instance():
+    """Test that instance files are only written when needed."""
+    import os
+    from pyvpsolver import VBP, MVP
+
+    vbp = VBP(W=(5, 3), w=[(2, 1), (3, 2)], b=[2, 1], binary=True, vtype="C")
+    mvp = MVP(Ws=[(5,)], Cs=[1], Qs=[inf], ws=[[(2,), (3,)]], b=[2], binary=True)
+    for instance, cls in [(vbp, VBP), (mvp, MVP)]:
+        assert instance.weights() and instance.filename is not None
+        assert os.path.exists(instance.filename)
+        other = cls.from_file(instance.filename)
+        assert other.to_str() == instance.to_str()
+        assert other.binary is True
+    assert VBP.from_str(vbp.to_str()).vtype == "C"
+    assert MVP(Ws=[(1,)], Cs=[1], Qs=[inf], ws=[[(1,)]], b=[1]).mvp_file is None
+
+
+def test_graph_cache():
+    """Test the on-disk graph cache."""
+    import os
+    from pyvpsolver import VPSolver, VBP, MVP, AFG, GraphCache
+
+    cache = GraphCache(VPSolver.new_tmp_file("cache"))
+    W, w, b = (5, 3), [(2, 1), (3, 2), (1, 1)], [2, 1, 3]
+    vbp1 = VBP(W=W, w=w, b=b)
+    vbp2 = VBP(W=W, w=w[::-1], b=b[::-1])
+    mvp = MVP(
+        Ws=[(5,), (4,)], Cs=[3, 2], Qs=[inf, 2], ws=[[(2,), (3,)], [(1,)]], b=[2, 1]
+    )
+    try:
+        VPSolver.GRAPH_CACHE = cache
+        afg1 = AFG(vbp1)
+        afg2 = AFG(vbp2)
+        graph1, graph2 = afg1.graph(), afg2.graph()
+        assert (cache.hits, cache.misses) == (1, 1)
+        assert afg2.stats == afg1.stats and afg2.stats["ndp"] > 0
+        assert cache.key(vbp1) == cache.key(vbp2)
+        assert cache.key(vbp1) == cache.key(VBP(W=W, w=w, b=b, vtype="C"))
+        assert cache.key(vbp1) != cache.key(vbp1, method=-2)
+        assert cache.get(vbp1, method=-2) is None
+        VPSolver.GRAPH_CACHE = None
+        graph3 = AFG(vbp2).graph()
+        assert sorted(map(repr, graph2.A)) == sorted(map(repr, graph3.A))
+        assert len(graph1.A) == len(graph2.A)
+        VPSolver.GRAPH_CACHE = cache
+        graph4 = AFG(mvp).graph()
+        graph5 = AFG(mvp).graph()
+        assert sorted(map(repr, graph4.A)) == sorted(map(repr, graph5.A))
+        assert (cache.hits, cache.misses) == (2, 3)
+        assert not [f for f in os.listdir(cache.directory) if f.endswith(".tmp")]
+        fname = cache._path(cache.key(mvp))
+        with open(fname, "r+b") as f:
+            f.truncate(os.path.getsize(fname) - 2)
+        graph6 = AFG(mvp).graph()
+        assert sorted(map(repr, graph4.A)) == sorted(map(repr, graph6.A))
+        assert (cache.hits, cache.misses) == (2, 4)
+        cache.max_size = 1
+        cache.evict()
+        assert len(cache._entries()) == 1
+        cache.clear()
+        assert cache.size() == 0 and os.listdir(cache.directory) == []
+    finally:
+        VPSolver.GRAPH_CACHE = None
+
+
+def test_with_demands():
+    """Test reusing a graph with new demands."""
+    from pyvpsolver import VPSolver, VBP, MVP, AFG
+
+    vbp = VBP(W=(10,), w=[(3,), (4,)], b=[5, 4])
+    mvp = MVP(Ws=[(10,)], Cs=[1], Qs=[inf], ws=[[(3,), (2,)], [(4,)]], b=[5, 4])
+    for instance in [vbp, mvp]:
+        afg = AFG(instance)
+        reused = afg.with_demands([2, 1])
+        assert reused.arcflow is afg.arcflow
+        assert reused.instance.b == [2, 1]
+        assert reused.with_demands([1, 0]).demand_bounds == [5, 4]
+        lp_file = VPSolver.new_tmp_file(".lp")
+        VPSolver.afg2lp(reused, lp_file)
+        content = open(lp_file).read()
+        assert ">= 2" in content and "= 1" in content
+        try:
+            afg.with_demands([6, 1])
+            assert False
+        except ValueError:
+            pass
+
+
+def test_aio():
+    """Test the asynchronous API."""
+    import asyncio
+    from pyvpsolver import VPSolver, VBP, AFG, aio
+
+    async def build(n):
+        vbp = VBP(W=(n,), w=[(2,), (3,)], b=[n, n])
+        afg = await aio.build_afg(vbp, verbose=False)
+        lp_file = VPSolver.new_tmp_file(".lp")
+        await aio.afg2lp(afg, lp_file, verbose=False)
+        return len(afg.graph().A), open(lp_file).read()
+
+    async def build_all():
+        return await asyncio.gather(*[build(n) for n in range(5, 15)])
+
+    async def cancel():
+        task = asyncio.ensure_future(aio.run(["sleep", "60"]))
+        await asyncio.sleep(0.1)
+        task.cancel()
+        try:
+            await task
+            assert False
+        except asyncio.CancelledError:
+            pass
+
+    loop = asyncio.new_event_loop()
+    try:
+        results = loop.run_until_complete(build_all())
+        for n, (na, lp) in zip(range(5, 15), results):
+            assert na == len(AFG(VBP(W=(n,), w=[(2,), (3,)], b=[n, n])).graph().A)
+            assert lp.startswith("Minimize")
+        loop.run_until_complete(cancel())
+        try:
+            loop.run_until_complete(aio.run(["false"]))
+            assert False
+        except RuntimeError:
+            pass
+    finally:
+        loop.close()
+
+
+def test_session():
+    """Test per-thread sessions."""
+    import os
+    import threading
+    from pyvpsolver import VPSolver, Session, VBP
+
+    files, errors = {}, []
+
+    def worker(n):
+        try:
+            with Session() as session:
+                assert VPSolver.session() is session
+                vbp = VBP(W=(n,), w=[(2,), (3,)], b=[n, n])
+                afg_file = VPSolver.new_tmp_file(".afg")
+                VPSolver.vbp2afg(vbp, afg_file, verbose=False)
+                assert afg_file.startswith(session.tmp_dir)
+                assert not session.plist
+                files[n] = (session.tmp_dir, afg_file)
+            assert not os.path.exists(session.tmp_dir)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(5, 25)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert not errors
+    assert len(set(tmp_dir for tmp_dir, afg_file in files.values())) == len(threads)
+    assert VPSolver.session() is None
+    with Session() as outer:
+        with Session() as inner:
+            assert VPSolver.session() is inner
+        assert VPSolver.session() is outer
+
+
+def test_output_capture():
+    """Test the chunked output capture."""
+    import io
+    from pyvpsolver import VPSolver, utils
+
+    buf = utils.OutputBuffer(5)
+    for chunk in ["ab", "cdef", "", "ghi"]:
+        buf.write(chunk)
+    assert buf.getvalue() == "efghi" and buf.size == 5
+
+    cmd = "printf 'x=1\\ny=\\303\\251\\nx=3'"
+    sink = io.StringIO()
+    assert VPSolver.run(cmd, verbose=False, sinks=[sink]) == "x=1\ny=\u00e9\nx=3"
+    assert sink.getvalue() == "x=1\ny=\u00e9\nx=3"
+    assert VPSolver.run(cmd, grep="x=", verbose=False) == "x=1\nx=3"
+    assert VPSolver.run(cmd, grepv="x=", verbose=False) == "y=\u00e9\n"
+    max_output = VPSolver.MAX_OUTPUT
+    try:
+        VPSolver.MAX_OUTPUT = 1000
+        output = VPSolver.run("seq 100000", verbose=False)
+        assert len(output) == 1000 and output.endswith("99999\n100000\n")
+    finally:
+        VPSolver.MAX_OUTPUT = max_output
+
+    # in-process builds write their log to sys.stdout and AFG.output
+    if VPSolver.native_builder() is not None:
+        import sys
+        from pyvpsolver import AFG
+
+        stdout = sys.stdout
+        try:
+            sys.stdout = io.StringIO()
+            with _inprocess(True):
+                afg = AFG(_small_vbp(), verbose=True)
+            log = sys.stdout.getvalue()
+        finally:
+            sys.stdout = stdout
+        assert "#dp: " in afg.output and afg.output == log
+        with _inprocess(True):
+            assert AFG(_small_vbp(), verbose=False).output == afg.output
+
+
+def test_vbp2model():
+    """Test the fused vbp2model pipeline."""
+    from pyvpsolver import VPSolver, VBP, MVP, AFG, MPS, LP
+    from pyvpsolver import utils
+
+    vbp = VBP(W=(5, 3), w=[(2, 1), (3, 2)], b=[2, 1])
+    mvp = MVP(
+        Ws=[(5, 3), (4, 4)],
+        Cs=[3, 2],
+        Qs=[inf, -1],
+        ws=[[(2, 1)], [(3, 2), (1, 3)]],
+        b=[2, 1],
+    )
+    for instance in [vbp, mvp]:
+        afg_file = VPSolver.new_tmp_file(".afg")
+        VPSolver.vbp2afg(instance, afg_file, verbose=False)
+        for ext, afg2model in [(".mps", VPSolver.afg2mps), (".lp", VPSolver.afg2lp)]:
+            model_file = VPSolver.new_tmp_file(ext)
+            afg2model(afg_file, model_file, verbose=False)
+            fused_model = VPSolver.new_tmp_file(ext)
+            fused_afg = VPSolver.new_tmp_file(".afg")
+            VPSolver.vbp2model(instance, fused_model, fused_afg, verbose=False)
+            assert utils.get_content(fused_model) == utils.get_content(model_file)
+            assert utils.get_content(fused_afg) == utils.get_content(afg_file)
+            VPSolver.vbp2model(instance, fused_model, verbose=False)
+            assert utils.get_content(fused_model) == utils.get_content(model_file)
+        for cls in [MPS, LP]:
+            model = cls(instance, verbose=False)
+            afg = model.afg_graph
+            assert afg.instance is instance
+            assert afg.graph().A == AFG(instance, verbose=False).graph().A
+
+
+def test_deep_graph():
+    """Test graphs deeper than the native stack allows to recurse."""
+    from pyvpsolver import VPSolver, VBP, AFG
+
+    vbp = VBP(W=(100000,), w=[(1,)], b=[100000])
+    afg_file = VPSolver.new_tmp_file(".afgb")
+    VPSolver.vbp2afg(vbp, afg_file, verbose=False)
+    NV, S, Ts, LOSS, arcs = AFG.from_file(afg_file).load()
+    assert NV == 100002 and len(arcs) // 3 == 200001
+    if VPSolver.native_builder() is not None:
+        NV, S, Ts, LOSS, arcs = VPSolver.build_graph(vbp, verbose=False)
+        assert NV == 100002 and len(arcs) // 3 == 200001
+
+
+def _small_vbp():
+    """Return the instance shared by the graph construction tests."""
+    from pyvpsolver import VBP
+
+    return VBP(W=(100,), w=[(13,), (17,), (29,), (31,)], b=[5, 4, 3, 2])
+
+
+def _build_afgb(instance):
+    """Build the graph of an instance with 'vbp2afg' into a new .afgb file
+    and return the file name and the output."""
+    from pyvpsolver import VPSolver
+
+    afg_file = VPSolver.new_tmp_file(".afgb")
+    return afg_file, VPSolver.vbp2afg(instance, afg_file, verbose=False)
+
+
+@contextlib.contextmanager
+def _inprocess(value, threads=None):
+    """Set VPSolver.INPROCESS (and VPSolver.THREADS) within a block."""
+    from pyvpsolver import VPSolver
+
+    saved = VPSolver.INPROCESS, VPSolver.THREADS
+    try:
+        VPSolver.INPROCESS = value
+        if threads is not None:
+            VPSolver.THREADS = threads
+        yield
+    finally:
+        VPSolver.INPROCESS, VPSolver.THREADS = saved
+
+
+def test_threads():
+    """Test that multithreaded builds produce the sequential graph."""
+    import threading
+    from pyvpsolver import VPSolver, VBP, MVP, AFG
+
+    vbp = VBP(W=(50, 40), w=[(9, 5), (7, 11), (5, 3), (12, 6)], b=[4, 3, 6, 2])
+    mvp = MVP(
+        Ws=[(5, 3), (4, 4)],
+        Cs=[3, 2],
+        Qs=[inf, -1],
+        ws=[[(2, 1)], [(3, 2), (1, 3)]],
+        b=[2, 1],
+    )
+    for instance in [vbp, mvp]:
+        graphs = []
+        for threads in [1, 2, 5]:
+            afg_file = VPSolver.new_tmp_file(".afgb")
+            opts = VPSolver.build_opts(instance, threads)
+            VPSolver.vbp2afg(instance, afg_file, opts, verbose=False)
+            with open(afg_file, "rb") as f:
+                graphs.append(f.read())
+        assert graphs[0] == graphs[1] == graphs[2]
+        if VPSolver.native_builder() is not None:
+            arcs1 = VPSolver.build_graph(instance, verbose=False)[-1]
+            arcs4 = VPSolver.build_graph(instance, verbose=False, threads=4)[-1]
+            assert arcs1 == arcs4
+            # concurrent in-process builds (the GIL is released)
+            results = []
+            workers = [
+                threading.Thread(
+                    target=lambda: results.append(
+                        VPSolver.build_graph(instance, verbose=False)[-1]
+                    )
+                )
+                for _ in range(4)
+            ]
+            for worker in workers:
+                worker.start()
+            for worker in workers:
+                worker.join()
+            assert results == [arcs1] * 4
+        with _inprocess(False, threads=3):
+            afg = AFG(instance, verbose=False)
+            assert afg.load()[-1] == AFG.from_file(afg_file).load()[-1]
+
+
+def test_lift_cache():
+    """Test the lift_state cache statistics."""
+    import os
+    import re
+    from pyvpsolver import VPSolver
+
+    afg_file, output = _build_afgb(_small_vbp())
+    match = re.search(r"#lift: (\d+) hits, (\d+) misses", output)
+    assert match is not None
+    hits, misses = map(int, match.groups())
+    assert hits > 0 and misses > 0
+    stats_file = VPSolver.new_tmp_file(".json")
+    VPSolver.vbp2afg(_small_vbp(), afg_file, verbose=False, stats_file=stats_file)
+    stats = VPSolver.read_stats(stats_file)
+    assert (stats["lift_hits"], stats["lift_misses"]) == (hits, misses)
+    assert "STATS=" not in output and not os.path.exists(stats_file)
+
+
+def test_budget():
+    """Test the graph construction budget."""
+    import os
+    from pyvpsolver import VPSolver, AFG, BudgetExceeded
+
+    vbp = _small_vbp()
+    estimate = VPSolver.estimate_graph(vbp)
+    afg_file, output = _build_afgb(vbp)
+    ndp = int(output.split("#dp: ")[1].split()[0])
+    assert ndp > 10 and estimate["states"] == ndp and estimate["memory"] > 0
+    assert AFG(vbp, max_states=ndp).load()[-1] == AFG.from_file(afg_file).load()[-1]
+    rough = VPSolver.estimate_graph(vbp, cap=20)
+    assert rough["states"] > ndp
+    for in_process in [True, False]:
+        with _inprocess(in_process):
+            try:
+                AFG(vbp, verbose=False, max_states=10)
+                assert False
+            except BudgetExceeded as e:
+                assert e.states == 11
+            assert VPSolver.estimate_graph(vbp, cap=20) == rough
+    with _inprocess(False):  # the sample graphs are removed
+        tmp_dir = os.path.dirname(VPSolver.new_tmp_file())
+        before = set(os.listdir(tmp_dir))
+        VPSolver.estimate_graph(vbp, cap=20)
+        assert not [f for f in os.listdir(tmp_dir) if f not in before]
+    opts = VPSolver.build_opts(vbp, threads=1, max_states=0, max_memory=0)
+    assert opts == "" and VPSolver.build_opts(vbp, method=-2).startswith("-2 ")
+    try:
+        VPSolver.vbp2afg(vbp.filename, afg_file, verbose=False, max_states=10)
+        assert False
+    except BudgetExceeded as e:
+        assert e.states == 11
+
+
+def test_build_stats():
+    """Test the graph construction statistics."""
+    from pyvpsolver import VPSolver, AFG
+
+    vbp = _small_vbp()
+    phases = ["build", "final_compression_step", "finalize", "reduce_redundancy"]
+    for in_process in [True, False]:
+        with _inprocess(in_process):
+            afg = AFG(vbp, verbose=False)
+        stats = afg.stats
+        assert stats["ndp"] > 0 and stats["threads"] == 1
+        assert stats["lift_hits"] > 0 and stats["lift_misses"] > 0
+        assert all(name in stats["phases"] for name in phases + ["write"])
+        NV, S, Ts, LOSS, arcs = afg.load()
+        final = stats["phases"]["reduce_redundancy"]
+        assert (final["nv"], final["na"]) == (NV, len(arcs) // 3)
+        for phase in stats["phases"].values():
+            assert phase["wall"] >= 0 and phase["cpu"] >= 0
+    assert AFG.from_file(afg.filename).stats == {}
+    assert VPSolver.read_stats(VPSolver.new_tmp_file(".json")) == {}
+
+
+def test_return_stats():
+    """Test that every solver returns the build statistics in one shape."""
+    from pyvpsolver.solvers import vbpsolver, mvpsolver2013, mvpsolver2016
+
+    vbp = _small_vbp()
+    obj, sol, stats = vbpsolver.solve(
+        vbp.W, vbp.w, vbp.b, script="vpsolver_glpk.sh", return_stats=True
+    )
+    assert stats["ndp"] > 0 and "build" in stats["phases"]
+    Ws, Cs, Qs = [(100, 75), (75, 50)], [3, 2], [inf, -1]
+    ws, b = [[(75, 50)], [(40, 75), (25, 25)]], [2, 1]
+    for mvpsolver in [mvpsolver2013, mvpsolver2016]:
+        obj, sol, stats = mvpsolver.solve(
+            Ws, Cs, Qs, ws, b, script="vpsolver_glpk.sh", return_stats=True
+        )
+        assert stats["ndp"] > 0 and "build" in stats["phases"]
+
+
 def test_lowlevel():
     """Test low-level API."""
     from pyvpsolver import VPSolver, VBP, MVP, AFG
@@ -175,8 +945,30 @@ def test_lowlevel():
 
 if __name__ == "__main__":
     test_vbpsolver()
+    test_solve_many()
+    test_solve_many_timeout()
     test_mvpsolvers()
     test_scripts()
     test_vbpsol()
+    test_read_solution()
+    test_read_tokens()
     test_draw()
+    test_build_graph()
+    test_afgb()
+    test_afgraph()
+    test_sections()
+    test_read_instance()
+    test_lazy_instance()
+    test_graph_cache()
+    test_with_demands()
+    test_aio()
+    test_session()
+    test_output_capture()
+    test_vbp2model()
+    test_deep_graph()
+    test_threads()
+    test_lift_cache()
+    test_budget()
+    test_build_stats()
+    test_return_stats()
     test_lowlevel()
@@ -5,5 +5,6 @@ This code is part of the Arc-flow Vector Packing Solver (VPSolver).
 __version__ = "3.1.4"
 
 from .afgraph import AFGraph
-from .vpsolver import VPSolver, VBP, MVP, AFG, MPS, LP
+from .vpsolver import VPSolver, Session, BudgetExceeded, VBP, MVP, AFG, MPS, LP
+from .graphcache import GraphCache
 from . import solvers
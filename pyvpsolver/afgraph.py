@@ -1,36 +1,213 @@
 """
 This code is part of the Arc-flow Vector Packing Solver (VPSolver).
 """
+
 from builtins import zip
 from builtins import map
 from builtins import range
 from builtins import sorted
 from builtins import object
 
+from collections import Counter
+
+import numpy as np
+
 from .utils import inf, relabel_graph, sort_vertices, sort_arcs, draw_graph
 
 
+def _ranks(table):
+    """Return the position of each entry of a table in sorted order."""
+    order = sorted(range(len(table)), key=lambda k: (repr(type(table[k])), table[k]))
+    ranks = np.empty(len(table), dtype=np.int32)
+    ranks[order] = np.arange(len(table), dtype=np.int32)
+    return ranks
+
+
+def _group(keys, order, n):
+    """Group the entries of order by key (CSR pointers and members)."""
+    keys = keys[order]
+    members = order[np.argsort(keys, kind="stable")]
+    ptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(keys, minlength=n), out=ptr[1:])
+    return ptr, members
+
+
+def _gather(ptr, members, nodes):
+    """Return the members of all the given nodes."""
+    counts = ptr[nodes + 1] - ptr[nodes]
+    starts = np.repeat(ptr[nodes] - np.cumsum(counts) + counts, counts)
+    return members[starts + np.arange(counts.sum())]
+
+
+def _toposort(nv, au, av):
+    """Return a topological order of the vertices grouped in levels."""
+    ptr, members = _group(au, np.arange(len(au)), nv)
+    heads = av[members]
+    indeg = np.bincount(av, minlength=nv)
+    frontier = np.flatnonzero(indeg == 0)
+    levels = []
+    while frontier.size != 0:
+        levels.append(frontier)
+        succ = _gather(ptr, heads, frontier)
+        indeg -= np.bincount(succ, minlength=nv)
+        succ = np.unique(succ)
+        frontier = succ[indeg[succ] == 0]
+    ptr = np.zeros(len(levels) + 1, dtype=np.int64)
+    np.cumsum([len(level) for level in levels], out=ptr[1:])
+    topo = np.concatenate(levels) if levels else np.zeros(0, dtype=np.int64)
+    return topo, ptr
+
+
+class _GraphIndex(object):
+    """Adjacency index of an AFGraph (built on demand)."""
+
+    def __init__(self, graph):
+        nv, nl = len(graph._vtab), len(graph._ltab)
+        au, av, al = graph._au, graph._av, graph._al
+        self.vidx = {u: k for k, u in enumerate(graph._vtab)}
+        self.vorder = np.argsort(_ranks(graph._vtab))
+        vrank = np.empty(nv, dtype=np.int32)
+        vrank[self.vorder] = np.arange(nv, dtype=np.int32)
+        lrank = _ranks(graph._ltab)
+        self.order = np.lexsort((lrank[al], vrank[av], vrank[au]))
+        self.out_ptr, self.out_arcs = _group(au, self.order, nv)
+        self.in_ptr, self.in_arcs = _group(av, self.order, nv)
+        self.lbl_ptr, self.lbl_arcs = _group(al, self.order, nl)
+        # ignore the arcs to the source in order to break the cycles
+        self.forward = np.flatnonzero(av != self.vidx.get(graph.S, -1))
+        self.topo, self.level_ptr = _toposort(nv, au[self.forward], av[self.forward])
+        self.level = np.empty(nv, dtype=np.int64)
+        self.level[self.topo] = np.repeat(
+            np.arange(len(self.level_ptr) - 1), np.diff(self.level_ptr)
+        )
+
+
 class AFGraph(object):
     """Manipulable graph objects."""
 
     def __init__(self, V, A, S, Ts, LOSS=None):
-        self.V, self.A = list(set(V)), list(set(A))
         self.S, self.Ts, self.LOSS = S, Ts, LOSS
         self.names = {}
-        self.flow = None
         self.labels = None
+        self._flow = None
+        self._set_graph(V, A)
+
+    @classmethod
+    def from_arrays(cls, vertices, labels, au, av, al, S, Ts, LOSS=None):
+        """Create a graph from arrays of vertex and label indices."""
+        graph = cls([], [], S, Ts, LOSS)
+        graph._vtab = list(vertices)
+        graph._ltab = list(labels)
+        graph._set_arrays(au, av, al)
+        return graph
+
+    def _set_graph(self, V, A):
+        """Store the vertices and arcs in the array representation."""
+        vidx, lidx = {}, {}
+        for u in V:
+            vidx.setdefault(u, len(vidx))
+        au, av, al = [], [], []
+        for u, v, i in A:
+            au.append(vidx.setdefault(u, len(vidx)))
+            av.append(vidx.setdefault(v, len(vidx)))
+            al.append(lidx.setdefault(i, len(lidx)))
+        self._vtab = list(vidx)
+        self._ltab = list(lidx)
+        self._set_arrays(au, av, al)
+
+    def _set_arrays(self, au, av, al):
+        """Store the arc arrays removing duplicated arcs."""
+        arcs = np.stack(
+            [
+                np.asarray(au, dtype=np.int32),
+                np.asarray(av, dtype=np.int32),
+                np.asarray(al, dtype=np.int32),
+            ],
+            axis=1,
+        )
+        arcs = np.unique(arcs.reshape(-1, 3), axis=0)
+        self._au = np.ascontiguousarray(arcs[:, 0])
+        self._av = np.ascontiguousarray(arcs[:, 1])
+        self._al = np.ascontiguousarray(arcs[:, 2])
+        self._idx = None
+        self._arcs = None
+
+    @property
+    def _index(self):
+        """Adjacency index (rebuilt after the graph is modified)."""
+        if self._idx is None:
+            self._idx = _GraphIndex(self)
+        return self._idx
+
+    @property
+    def V(self):
+        """Tuple of vertices (assign to V to modify the graph)."""
+        return tuple(self._vtab)
+
+    @V.setter
+    def V(self, V):
+        self._set_graph(V, self.A)
+
+    @property
+    def A(self):
+        """Tuple of arcs as (u, v, label) tuples (assign to A to modify the
+        graph)."""
+        if self._arcs is None:
+            vt, lt = self._vtab, self._ltab
+            au, av, al = self._au.tolist(), self._av.tolist(), self._al.tolist()
+            self._arcs = tuple((vt[u], vt[v], lt[i]) for u, v, i in zip(au, av, al))
+        return self._arcs
+
+    @A.setter
+    def A(self, A):
+        self._set_graph(self._vtab, A)
+
+    @property
+    def flow(self):
+        """Dictionary with the arcs with non-zero flow."""
+        if self._flow is None:
+            return None
+        A = self.A
+        return {A[k]: f for k, f in enumerate(self._flow.tolist()) if f != 0}
+
+    @staticmethod
+    def _remap(table, f):
+        """Apply f to a table and return the index map and the new table."""
+        idx = {}
+        fmap = np.array([idx.setdefault(f(x), len(idx)) for x in table], dtype=np.int32)
+        return fmap, list(idx)
+
+    def _arc_names(self, order, vnames=None):
+        """Return the variable names of all arcs (assigned following order)."""
+        if vnames is None:
+            vnames = self.names
+        vt, lt = self._vtab, self._ltab
+        au, av, al = self._au.tolist(), self._av.tolist(), self._al.tolist()
+        names = [None] * len(au)
+        for k in order.tolist():
+            arc = (vt[au[k]], vt[av[k]], lt[al[k]])
+            name = vnames.get(arc)
+            if name is None:
+                name = vnames[arc] = "F{0:x}".format(len(vnames))
+            names[k] = name
+        return names
 
     def relabel(self, fv, fa=lambda x: x):
         """Relabel the graph."""
-        assert self.flow is None
+        assert self._flow is None
         assert self.labels is None
-        self.V, self.A = relabel_graph(self.V, self.A, fv, fa)
+        vmap, self._vtab = self._remap(self._vtab, fv)
+        lmap, self._ltab = self._remap(self._ltab, fa)
+        au, av, al = vmap[self._au], vmap[self._av], lmap[self._al]
+        keep = au != av
+        self._set_arrays(au[keep], av[keep], al[keep])
         if self.LOSS is not None:
             self.LOSS = fa(self.LOSS)
         if self.S is not None:
             self.S = fv(self.S)
         if self.Ts is not None:
             self.Ts = [fv(t) for t in self.Ts]
+        self._idx = None
 
     def draw(
         self,
@@ -55,15 +232,17 @@ class AFGraph(object):
         if lpaths:
             assert weights is not None
             assert capacities is not None
-            lp_source = self.lpaths_source(weights, capacities)
-            lp_targets = self.lpaths_targets(weights, capacities)
+            lp_source = self.lpaths_source(weights, capacities).tolist()
+            lp_targets = self.lpaths_targets(weights, capacities).tolist()
+
+            def fmt(label):
+                return ",".join(str(x if x == inf else int(x)) for x in label)
+
             newlabels = {
                 v: "{}:\nL({})\nU({})".format(
-                    str(v),
-                    ",".join(map(str, lp_source[v])),
-                    ",".join(map(str, lp_targets[v])),
+                    str(v), fmt(lp_source[k]), fmt(lp_targets[k])
                 )
-                for v in V
+                for k, v in enumerate(V)
             }
             if ignore is not None:
                 ignore = [
@@ -95,108 +274,93 @@ class AFGraph(object):
         # vnames[u, v, i] = "F_{0}_{1}_{2}".format(u, v, i)
         return vnames[u, v, i]
 
+    def _label_weights(self, weights, ndims):
+        """Return the weight vector of each label (zero if it has no weight)."""
+        zero = tuple([0] * ndims)
+        return np.array(
+            [weights.get(lbl, zero) for lbl in self._ltab], dtype=np.int64
+        ).reshape(-1, ndims)
+
     def lpaths_source(self, weights, capacities):
-        """Compute longest paths to the source."""
+        """Compute longest paths to the source (one row per vertex in V)."""
         ndims = len(capacities[0])
-        radj = {u: [] for u in self.V}
-        for u, v, lbl in self.A:
-            if v != self.S:
-                radj[v].append((u, lbl))
-
-        zero = tuple([0] * ndims)
-        minlabel = tuple([0] * ndims)
-
-        def lp_source(u, labels):
-            if u in labels:
-                return labels[u]
-            lbl = minlabel
-            for v, it in radj[u]:
-                wi = weights.get(it, zero)
-                vlbl = lp_source(v, labels)
-                lbl = tuple(max(lbl[d], vlbl[d] + wi[d]) for d in range(ndims))
-            labels[u] = lbl
-            return lbl
-
-        labels = {}
-        for t in self.Ts:
-            lp_source(t, labels)
+        index = self._index
+        assert len(index.topo) == len(self._vtab)
+        arcs = index.forward
+        au, av = self._au[arcs], self._av[arcs]
+        w = self._label_weights(weights, ndims)[self._al[arcs]]
+        nlevels = len(index.level_ptr) - 1
+        ptr, members = _group(index.level[av], np.arange(len(arcs)), nlevels)
+        labels = np.zeros((len(self._vtab), ndims), dtype=np.int64)
+        for lvl in range(1, nlevels):
+            ks = members[ptr[lvl] : ptr[lvl + 1]]
+            np.maximum.at(labels, av[ks], labels[au[ks]] + w[ks])
         return labels
 
     def lpaths_targets(self, weights, capacities):
-        """Compute longest paths to the targets."""
+        """Compute longest paths to the targets (one row per vertex in V)."""
         ndims = len(capacities[0])
-        adj = {u: [] for u in self.V}
-        for u, v, lbl in self.A:
-            if v != self.S:
-                adj[u].append((v, lbl))
-
-        zero = tuple([0] * ndims)
-        maxlabel = tuple([inf] * ndims)
-
-        def lp_targets(u, labels):
-            if u in labels:
-                return labels[u]
-            lbl = maxlabel
-            for v, it in adj[u]:
-                wi = weights.get(it, zero)
-                vlbl = lp_targets(v, labels)
-                lbl = tuple(min(lbl[d], vlbl[d] - wi[d]) for d in range(ndims))
-            labels[u] = lbl
-            return lbl
-
-        labels = {t: Wt for t, Wt in zip(self.Ts, capacities)}
-        lp_targets(self.S, labels)
+        index = self._index
+        assert len(index.topo) == len(self._vtab)
+        targets = [index.vidx[t] for t in self.Ts]
+        arcs = index.forward
+        arcs = arcs[~np.isin(self._au[arcs], targets)]
+        au, av = self._au[arcs], self._av[arcs]
+        w = self._label_weights(weights, ndims)[self._al[arcs]]
+        nlevels = len(index.level_ptr) - 1
+        ptr, members = _group(index.level[au], np.arange(len(arcs)), nlevels)
+        labels = np.full((len(self._vtab), ndims), inf)
+        labels[targets] = capacities
+        for lvl in reversed(range(nlevels)):
+            ks = members[ptr[lvl] : ptr[lvl + 1]]
+            np.minimum.at(labels, au[ks], labels[av[ks]] - w[ks])
         return labels
 
     def get_vertices_sorted(self, reverse=False):
         """Return the list of vertices sorted."""
-        return sort_vertices(self.V, reverse)
+        order = self._index.vorder
+        if reverse:
+            order = order[::-1]
+        return [self._vtab[k] for k in order.tolist()]
 
     def get_arcs_sorted(self, reverse=False):
         """Return the list of arcs sorted."""
-        return sort_arcs(self.A, reverse)
+        order = self._index.order
+        if reverse:
+            order = order[::-1]
+        A = self.A
+        return [A[k] for k in order.tolist()]
 
     def get_flow_cons(self, vnames=None):
         """Return the list of flow conservation constraints."""
-        Ain = {u: [] for u in self.V}
-        Aout = {u: [] for u in self.V}
-        varl = []
-        for (u, v, i) in self.get_arcs_sorted():
-            name = self.vname(u, v, i, vnames)
-            Aout[u].append(name)
-            Ain[v].append(name)
-            varl.append(name)
+        index = self._index
+        names = self._arc_names(index.order, vnames)
+        varl = [names[k] for k in index.order.tolist()]
+        inptr, inarcs = index.in_ptr.tolist(), index.in_arcs.tolist()
+        outptr, outarcs = index.out_ptr.tolist(), index.out_arcs.tolist()
         cons = []
-        for u in self.get_vertices_sorted():
-            if Ain[u] != [] and Aout[u] != []:
-                lincomb = []
-                if u in Ain:
-                    lincomb += [(var, 1) for var in Ain[u]]
-                if u in Aout:
-                    lincomb += [(var, -1) for var in Aout[u]]
-                if lincomb != []:
-                    cons.append((lincomb, "=", 0))
+        for u in index.vorder.tolist():
+            if inptr[u] != inptr[u + 1] and outptr[u] != outptr[u + 1]:
+                lincomb = [(names[k], 1) for k in inarcs[inptr[u] : inptr[u + 1]]]
+                lincomb += [(names[k], -1) for k in outarcs[outptr[u] : outptr[u + 1]]]
+                cons.append((lincomb, "=", 0))
         return varl, cons
 
     def get_assocs(self, vnames=None):
         """Return the arc variables grouped by label."""
+        index = self._index
+        names = self._arc_names(index.order, vnames)
+        ptr, members = index.lbl_ptr.tolist(), index.lbl_arcs.tolist()
         assocs = {}
-        for (u, v, i) in self.get_arcs_sorted():
-            if i not in assocs:
-                assocs[i] = []
-            name = self.vname(u, v, i, vnames)
-            assocs[i].append(name)
+        for i, lbl in enumerate(self._ltab):
+            if ptr[i] != ptr[i + 1]:
+                assocs[lbl] = [names[k] for k in members[ptr[i] : ptr[i + 1]]]
         return assocs
 
     def set_flow(self, varvalues, vnames=None):
         """Set flows."""
-        flow = {}
-        for (u, v, i) in self.A:
-            name = self.vname(u, v, i, vnames)
-            f = varvalues.get(name, 0)
-            if f != 0:
-                flow[u, v, i] = f
-        self.flow = flow
+        names = self._arc_names(self._index.order, vnames)
+        self._flow = np.array([varvalues.get(name, 0) for name in names])
 
     def set_labels(self, labels):
         """Set labels."""
@@ -205,57 +369,72 @@ class AFGraph(object):
     def extract_solution(self, source, direction, target, flow_limit=inf):
         """Extract a vector packing solution form an arc-flow solution."""
         assert direction in ("<-", "->")
-        assert self.flow is not None
+        assert self._flow is not None
         assert self.labels is not None
-        flow = self.flow
-        labels = self.labels
-        adj = {u: [] for u in self.V}
+        index = self._index
+        vidx = index.vidx
+        if source not in vidx or target not in vidx:
+            return []
 
+        flow = self._flow.tolist()
+        vt, lt = self._vtab, self._ltab
+        au, av, al = self._au, self._av, self._al
         if direction == "<-":
-            node_a, node_b = target, source
-            for (u, v, i) in flow:
-                adj[v].append((u, (u, v, i)))
+            node_a, node_b = vidx[target], vidx[source]
+            ptr, adj, head = index.in_ptr, index.in_arcs, au
         else:
-            node_a, node_b = source, target
-            for (u, v, i) in flow:
-                adj[u].append((v, (u, v, i)))
-
-        if node_a not in adj or node_b not in adj:
-            return []
-
-        solution = []
-
-        def go(u, f, path):
-            """Recursive function for flow extraction."""
-            if f == 0:
-                return
-            if u == node_b:
+            node_a, node_b = vidx[source], vidx[target]
+            ptr, adj, head = index.out_ptr, index.out_arcs, av
+        ptr, adj, head = ptr.tolist(), adj.tolist(), head.tolist()
+
+        arc_labels = {}
+
+        def get_labels(k):
+            if k not in arc_labels:
+                arc = (vt[au[k]], vt[av[k]], lt[al[k]])
+                arc_labels[k] = self.labels.get(arc, [])
+            return arc_labels[k]
+
+        # Depth-first flow decomposition with an explicit stack: node[d] is the
+        # vertex at depth d, rem[d] the flow that can still go through it and
+        # pos[d] the next arc to try; path[d] is the arc taken from depth d and
+        # sent[d] the flow sent through it.
+        nv = len(vt)
+        node, rem, pos = [0] * (nv + 1), [0] * (nv + 1), [0] * (nv + 1)
+        path, sent = [0] * nv, [0] * nv
+        node[0], rem[0], pos[0] = node_a, flow_limit, ptr[node_a]
+        patterns = {}
+        d = 0
+        while d >= 0:
+            u = node[d]
+            if rem[d] != 0 and u == node_b:
+                f = rem[d]
                 patt = []
-                for arc in path:
-                    flow[arc] -= f
-                    patt += labels.get(arc, [])
-                solution.append((f, patt))
-            else:
-                for v, arc in adj[u]:
-                    # v != node_a to avoid cycles
-                    if v != node_a and flow[arc] > 0:
-                        ff = min(f, flow[arc])
-                        go(v, ff, path + [arc])
-                        f -= ff
-
-        go(node_a, flow_limit, [])
-
-        # group identical patterns
-        rep = {}
-        for (r, p) in solution:
-            p = tuple(sorted(p, key=repr))
-            if p not in rep:
-                rep[p] = r
-            else:
-                rep[p] += r
-
-        solution = []
-        for p in rep:
-            solution.append((rep[p], list(p)))
-
-        return solution
+                for k in path[:d]:
+                    flow[k] -= f
+                    patt += get_labels(k)
+                # group identical patterns
+                key = frozenset(Counter(patt).items())
+                if key not in patterns:
+                    patterns[key] = [0, patt]
+                patterns[key][0] += f
+            elif rem[d] != 0:
+                p, end = pos[d], ptr[u + 1]
+                # head[k] != node_a to avoid cycles
+                while p < end and (head[adj[p]] == node_a or flow[adj[p]] <= 0):
+                    p += 1
+                if p < end:
+                    k = adj[p]
+                    pos[d] = p + 1
+                    path[d] = k
+                    sent[d] = min(rem[d], flow[k])
+                    d += 1
+                    node[d], rem[d], pos[d] = head[k], sent[d - 1], ptr[head[k]]
+                    continue
+            # return to the previous vertex
+            d -= 1
+            if d >= 0:
+                rem[d] -= sent[d]
+        self._flow = np.array(flow)
+
+        return [(r, sorted(patt, key=repr)) for r, patt in patterns.values()]
@@ -0,0 +1,202 @@
+"""
+This code is part of the Arc-flow Vector Packing Solver (VPSolver).
+
+Asynchronous interface to the VPSolver binaries and scripts built on
+asyncio subprocesses (Python 3.5+).
+"""
+import os
+import sys
+import signal
+import asyncio
+from . import utils
+from .vpsolver import VPSolver, BudgetExceeded, VBP, MVP, AFG, MPS, LP
+
+
+async def run(args, grep=None, grepv=None, verbose=None, sinks=None):
+    """Run a command without blocking the event loop and return its output.
+
+    If the task is cancelled, the process group of the command is terminated
+    before the cancellation is propagated.
+    """
+    if verbose is None:
+        verbose = VPSolver.VERBOSE
+    args = [str(arg) for arg in args]
+    proc = await asyncio.create_subprocess_exec(
+        *args,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.STDOUT,
+        start_new_session=True
+    )
+    session = VPSolver.session()
+    if session is not None:
+        session.register(proc)
+    output = utils.OutputBuffer(VPSolver.MAX_OUTPUT)
+    sinks = [output] + list(sinks or [])
+    if verbose:
+        sinks.append(sys.stdout)
+    splitter = utils.OutputSplitter(sinks, grep, grepv)
+    try:
+        while True:
+            data = await proc.stdout.read(VPSolver.CHUNK_SIZE)
+            splitter.feed(data)
+            if not data:
+                break
+        exit_code = await proc.wait()
+    except BaseException:
+        try:
+            os.killpg(proc.pid, signal.SIGTERM)
+        except OSError:
+            pass
+        await asyncio.shield(proc.wait())
+        raise
+    finally:
+        if session is not None:
+            session.unregister(proc)
+    if exit_code == BudgetExceeded.EXIT_CODE:
+        raise BudgetExceeded.from_output(output.getvalue())
+    if exit_code != 0:
+        raise RuntimeError("failed to run '{}'".format(" ".join(args)))
+    return output.getvalue()
+
+
+async def vbp2afg(instance_file, afg_file, opts="", verbose=None):
+    """Call 'vbp2afg' to create an arc-flow graph for a .vbp instance."""
+    instance = instance_file
+    if isinstance(instance, (VBP, MVP)):
+        instance_file = instance.filename
+    return await run(
+        [VPSolver.VBP2AFG_EXEC, instance_file, afg_file] + opts.split(),
+        verbose=verbose,
+    )
+
+
+async def afg2mps(afg_file, mps_file, opts="", verbose=None):
+    """Call 'afg2mps' to create a .mps model for an arc-flow graph."""
+    graph = afg_file
+    if isinstance(graph, AFG):
+        afg_file = graph.filename
+    return await run(
+        [VPSolver.AFG2MPS_EXEC, afg_file, mps_file] + opts.split(), verbose=verbose
+    )
+
+
+async def afg2lp(afg_file, lp_file, opts="", verbose=None):
+    """Call 'afg2lp' to create a .lp model for an arc-flow graph."""
+    graph = afg_file
+    if isinstance(graph, AFG):
+        afg_file = graph.filename
+    return await run(
+        [VPSolver.AFG2LP_EXEC, afg_file, lp_file] + opts.split(), verbose=verbose
+    )
+
+
+async def script(
+    script_name,
+    arg1=None,
+    arg2=None,
+    options=None,
+    pyout=True,
+    verbose=None,
+    sinks=None,
+):
+    """Call a VPSolver script and return a vector packing solution."""
+    args = [script_name]
+    for arg in [arg1, arg2]:
+        if isinstance(arg, MPS):
+            args += ["--mps", arg.filename]
+        elif isinstance(arg, LP):
+            args += ["--lp", arg.filename]
+        elif isinstance(arg, AFG):
+            args += ["--afg", arg.filename]
+        elif isinstance(arg, VBP):
+            args += ["--vbp", arg.filename]
+        elif isinstance(arg, MVP):
+            args += ["--mvp", arg.filename]
+        elif isinstance(arg, str):
+            if arg.endswith(".mps"):
+                args += ["--mps", arg]
+            elif arg.endswith(".lp"):
+                args += ["--lp", arg]
+            elif arg.endswith((".afg", ".afgb")):
+                args += ["--afg", arg]
+            elif arg.endswith(".vbp"):
+                args += ["--vbp", arg]
+            elif arg.endswith(".mvp"):
+                args += ["--mvp", arg]
+            else:
+                raise Exception("Invalid file extension!")
+    if options is not None:
+        args += ["--options", options]
+    if pyout is True:
+        pysol_file = VPSolver.new_tmp_file(".sol")
+        args += ["--pysol", pysol_file]
+    output = await run(args, verbose=verbose, sinks=sinks)
+    if pyout is True:
+        return output, VPSolver.read_solution(pysol_file)
+    return output, None
+
+
+async def build_afg(instance, verbose=None):
+    """Build the arc-flow graph of an instance with 'vbp2afg'."""
+    assert isinstance(instance, (VBP, MVP))
+    afg = AFG.from_instance_file(instance, None)
+    cache = VPSolver.GRAPH_CACHE
+    if cache is not None:
+        afg.arcflow = cache.get(instance)
+    if afg.arcflow is not None:
+        afg.stats = cache.get_stats(instance)
+    else:
+        afg.afg_file = VPSolver.new_tmp_file(".afgb")
+        stats_file = VPSolver.new_tmp_file(".json")
+        afg.output = await vbp2afg(
+            instance,
+            afg.afg_file,
+            VPSolver.build_opts(instance, stats_file=stats_file),
+            verbose=verbose,
+        )
+        afg.stats = VPSolver.read_stats(stats_file)
+        if cache is not None:
+            cache.put(instance, utils.load_afgb(afg.afg_file)[2], afg.stats)
+    return afg
+
+
+async def solve_afg(afg, script_name, script_options=None, verbose=None):
+    """Solve the model of an arc-flow graph with a VPSolver script."""
+    mps_file = VPSolver.new_tmp_file(".mps")
+    try:
+        await afg2mps(afg, mps_file, verbose=verbose)
+        out, (obj, sol) = await script(
+            script_name, mps_file, afg, options=script_options, verbose=verbose
+        )
+    finally:
+        try:
+            os.remove(mps_file)
+        except OSError:
+            pass
+    return obj, sol
+
+
+async def vbpsolve(
+    W, w, b, script=None, script_options=None, verbose=None, b_max=None
+):
+    """Asynchronous version of vbpsolver.solve."""
+    assert script is not None
+    if b_max is None:
+        afg = await build_afg(VBP(W, w, b), verbose=verbose)
+    else:
+        afg = await build_afg(VBP(W, w, b_max), verbose=verbose)
+        afg = afg.with_demands(b)
+    return await solve_afg(afg, script, script_options, verbose)
+
+
+async def mvpsolve(
+    Ws, Cs, Qs, ws, b, script=None, script_options=None, verbose=None, b_max=None
+):
+    """Asynchronous version of mvpsolver2016.solve."""
+    assert script is not None
+    if b_max is None:
+        afg = await build_afg(MVP(Ws, Cs, Qs, ws, b), verbose=verbose)
+    else:
+        afg = await build_afg(MVP(Ws, Cs, Qs, ws, b_max), verbose=verbose)
+        afg = afg.with_demands(b)
+    return await solve_afg(afg, script, script_options, verbose)
@@ -0,0 +1,197 @@
+"""
+This code is part of the Arc-flow Vector Packing Solver (VPSolver).
+"""
+from builtins import range
+from builtins import object
+
+import os
+import json
+import hashlib
+import tempfile
+import numpy as np
+from . import utils
+
+
+class GraphCache(object):
+    """
+    Content-addressed on-disk cache of arc-flow graphs.
+
+    Graphs are stored in .afgb format under a key that only depends on the
+    canonical form of the instance (bins, items sorted and binary) and on
+    the construction method, so instances that only differ in the order of
+    the items (or in vtype) share the same graph. The build statistics of a graph are kept next to it in a .json
+    file. Damaged entries count as misses and are removed. The least
+    recently used graphs are evicted when the directory grows beyond
+    max_size bytes.
+    """
+
+    def __init__(self, directory, max_size=1 << 30):
+        self.directory = directory
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        if not os.path.exists(directory):
+            os.makedirs(directory)
+
+    @staticmethod
+    def canonical(instance):
+        """Return the canonical instance data and the canonical label order."""
+        data = instance.mvp_data()
+        ndims, nbtypes = data[0], data[1]
+        p = 2 + nbtypes * (ndims + 2)
+        header, m = data[:p], data[p]
+        p += 1
+        items, first = [], []
+        nlabels = 0
+        for i in range(m):
+            size = 2 + data[p] * ndims
+            items.append(tuple(data[p : p + size]))
+            first.append(nlabels)
+            nlabels += data[p]
+            p += size
+        order = sorted(range(m), key=lambda i: items[i])
+        canonical = header + [m]
+        labels = []
+        for i in order:
+            canonical += items[i]
+            labels += range(first[i], first[i] + items[i][0])
+        return canonical, labels
+
+    def _path(self, key, ext=".afgb"):
+        return os.path.join(self.directory, key + ext)
+
+    def key(self, instance, method=-3):
+        """Return the cache key of an instance."""
+        return self._key(self.canonical(instance)[0], instance, method)
+
+    @staticmethod
+    def _key(data, instance, method):
+        content = "{} {:d} {:d}".format(
+            " ".join(map(str, data)), int(instance.binary), method
+        )
+        return hashlib.sha256(content.encode("ascii")).hexdigest()
+
+    @staticmethod
+    def _relabel(graph, labels):
+        """Apply a label map (the loss label is kept) to the arcs of a graph."""
+        NV, S, Ts, LOSS, arcs = graph
+        lmap = np.append(np.asarray(labels, dtype=np.int32), LOSS)
+        arcs = np.array(arcs, dtype=np.int32)
+        arcs[2::3] = lmap[arcs[2::3]]
+        return NV, S, Ts, LOSS, arcs
+
+    def get(self, instance, method=-3):
+        """Return the cached graph of an instance (None if not found)."""
+        data, labels = self.canonical(instance)
+        fname = self._path(self._key(data, instance, method))
+        try:
+            graph = utils.load_afgb(fname)[2]
+            os.utime(fname, None)
+        except (IOError, OSError):
+            self.misses += 1
+            return None
+        except ValueError:  # damaged entry
+            self.misses += 1
+            self._remove(fname)
+            return None
+        self.hits += 1
+        # cached labels follow the canonical order; map them to the instance
+        return self._relabel(graph, labels)
+
+    def get_stats(self, instance, method=-3):
+        """Return the build statistics stored with the graph of an instance
+        (empty if there are none)."""
+        try:
+            with open(self._path(self.key(instance, method), ".json")) as f:
+                return json.load(f)
+        except (IOError, OSError, ValueError):
+            return {}
+
+    def put(self, instance, graph, stats=None, method=-3):
+        """Store the graph of an instance (and its build statistics)."""
+        data, labels = self.canonical(instance)
+        inverse = np.empty(len(labels), dtype=np.int32)
+        inverse[labels] = np.arange(len(labels), dtype=np.int32)
+        b = [data[i + 1] for i in self._item_offsets(data)]
+        options = {
+            "vtype": instance.vtype,
+            "binary": instance.binary,
+            "method": method,
+            "ctypes": ["=" if bi <= 1 else ">" for bi in b],
+        }
+        key = self._key(data, instance, method)
+        if stats:
+            tmp_file = self._tmp_file()
+            with open(tmp_file, "w") as f:
+                json.dump(stats, f)
+            self._commit(tmp_file, self._path(key, ".json"))
+        tmp_file = self._tmp_file()
+        utils.dump_afgb(tmp_file, data, options, self._relabel(graph, inverse))
+        self._commit(tmp_file, self._path(key))
+        self.evict()
+
+    def _tmp_file(self):
+        """Create a temporary file, unique across processes and threads, in
+        the cache directory."""
+        fd, tmp_file = tempfile.mkstemp(suffix=".tmp", dir=self.directory)
+        os.close(fd)
+        return tmp_file
+
+    @staticmethod
+    def _commit(tmp_file, fname):
+        """Move a temporary file into place."""
+        try:
+            os.rename(tmp_file, fname)
+        except OSError:
+            os.remove(tmp_file)
+
+    @staticmethod
+    def _item_offsets(data):
+        """Return the offset of each item in instance data."""
+        ndims, nbtypes = data[0], data[1]
+        p = 2 + nbtypes * (ndims + 2)
+        offsets = []
+        for i in range(data[p]):
+            offsets.append(p + 1)
+            p += 2 + data[p + 1] * ndims
+        return offsets
+
+    def size(self):
+        """Return the total size of the cached graphs."""
+        return sum(size for mtime, size, fname in self._entries())
+
+    def _entries(self):
+        entries = []
+        for f in os.listdir(self.directory):
+            if f.endswith(".afgb"):
+                fname = os.path.join(self.directory, f)
+                try:
+                    st = os.stat(fname)
+                except OSError:
+                    continue
+                entries.append((st.st_mtime, st.st_size, fname))
+        return entries
+
+    @staticmethod
+    def _remove(fname):
+        """Remove a cached graph and its build statistics."""
+        for f in (fname, fname[: -len(".afgb")] + ".json"):
+            try:
+                os.remove(f)
+            except OSError:
+                pass
+
+    def evict(self):
+        """Remove the least recently used graphs until the cache fits."""
+        entries = sorted(self._entries())
+        total = sum(size for mtime, size, fname in entries)
+        for mtime, size, fname in entries[:-1]:
+            if total <= self.max_size:
+                break
+            self._remove(fname)
+            total -= size
+
+    def clear(self):
+        """Remove all cached graphs."""
+        for mtime, size, fname in self._entries():
+            self._remove(fname)
@@ -8,11 +8,29 @@ from builtins import range
 
 import os
 import sys
+import functools
 from .. import VPSolver, VBP, AFG
 from .. import AFGraph
+from . import pool
 from pympl import Model
 
 
+def _merge_stats(graph_stats):
+    """Sum the construction statistics of several graphs into one dict."""
+    merged = {"ndp": 0, "lift_hits": 0, "lift_misses": 0, "phases": {}}
+    for stats in graph_stats:
+        for key in ["ndp", "lift_hits", "lift_misses"]:
+            merged[key] += stats.get(key, 0)
+        for key in ["threads", "peak_rss_mb"]:
+            if key in stats:
+                merged[key] = max(merged.get(key, 0), stats[key])
+        for name, phase in stats.get("phases", {}).items():
+            total = merged["phases"].setdefault(name, {})
+            for key, value in phase.items():
+                total[key] = total.get(key, 0) + value
+    return merged
+
+
 def solve(
     Ws,
     Cs,
@@ -27,6 +45,7 @@ def solve(
     script_options=None,
     stats=None,
     verbose=None,
+    return_stats=False,
 ):
     """
     Solve multiple-choice vector bin packing instances
@@ -35,6 +54,10 @@ def solve(
     Bin Packing: Arc-flow Formulation with Graph Compression. Technical Report
     DCC-2013-13, Faculdade de Ciencias da Universidade do Porto, Universidade
     do Porto, Portugal.
+
+    With return_stats, (obj, sol, build_stats) is returned, where build_stats
+    is the dict of graph construction statistics (see AFG.stats) summed over
+    the graphs of the bin types.
     """
     assert script is not None
     assert svg_file == "" or svg_file.endswith(".svg")
@@ -55,6 +78,7 @@ def solve(
     LOSS = "L"
     instances = [None] * nbtypes
     graphs = [None] * nbtypes
+    graph_stats = [None] * nbtypes
     Ss, Ts = [None] * nbtypes, [None] * nbtypes
     for i in range(nbtypes):
         bbi = bb[:]
@@ -64,14 +88,16 @@ def solve(
                 continue
         symb = "G{0}:".format(i)
         instances[i] = VBP(Ws[i], ww, bbi, verbose=False)
-        graphs[i] = AFG(instances[i], verbose=verbose).graph()
+        afg = AFG(instances[i], verbose=verbose)
+        graph_stats[i] = afg.stats
+        graphs[i] = afg.graph()
         loss = graphs[i].LOSS
         graphs[i].relabel(
             lambda u: "{0}{1}".format(symb, u), lambda lbl: lbl if lbl != loss else LOSS
         )
         Ss[i] = graphs[i].S
         Ts[i] = graphs[i].Ts[0]
-        graphs[i].A.remove((Ts[i], Ss[i], LOSS))
+        graphs[i].A = [a for a in graphs[i].A if a != (Ts[i], Ss[i], LOSS)]
         if svg_file.endswith(".svg"):
             try:
                 graphs[i].draw(
@@ -81,8 +107,8 @@ def solve(
                 VPSolver.log(e, verbose)
 
     S, T = "S", "T"
-    V = sum([g.V for g in graphs], [])
-    A = sum([g.A for g in graphs], [])
+    V = [u for g in graphs for u in g.V]
+    A = [a for g in graphs for a in g.A]
     V += [S, T]
     A += [(S, s, LOSS) for s in Ss]
     A += [(t, T, LOSS) for t in Ts]
@@ -292,9 +318,14 @@ def solve(
     )
     assert c1 == c2
 
+    if return_stats:
+        return c1, lst_sol, _merge_stats(graph_stats)
     return c1, lst_sol
 
 
+solve_many = functools.partial(pool.solve_many, solve)
+
+
 def validate_solution(lst_solutions, nbtypes, ndims, Ws, ws, b):
     """Validate multiple-choice vector packing solutions."""
     if any(
@@ -4,17 +4,26 @@ This code is part of the Arc-flow Vector Packing Solver (VPSolver).
 from __future__ import print_function
 
 import sys
+import functools
 from .. import VPSolver, MVP, AFG, MPS
+from . import pool
 
 
 def solve(Ws, Cs, Qs, ws, b,
           svg_file="", lp_file="", mps_file="",
-          script=None, script_options=None, stats=None, verbose=None):
+          script=None, script_options=None, stats=None, verbose=None,
+          b_max=None, return_stats=False):
     """
     Solve multiple-choice vector bin packing instances
     using the method proposed in:
     Brandao, F. (2016). VPSolver 3: Multiple-choice Vector Packing Solver.
     arXiv:1602.04876. http://arxiv.org/abs/1602.04876
+
+    If b_max is given, the graph is built for the demand bounds b_max and
+    reused with demands b (with VPSolver.GRAPH_CACHE set, across calls).
+
+    With return_stats, (obj, sol, build_stats) is returned, where build_stats
+    is the dict of graph construction statistics (see AFG.stats).
     """
     assert script is not None
     assert svg_file == "" or svg_file.endswith(".svg")
@@ -22,10 +31,21 @@ def solve(Ws, Cs, Qs, ws, b,
         stats = verbose
     instance = MVP(Ws, Cs, Qs, ws, b, verbose=False)
     if (stats == verbose and svg_file == "" and
-            lp_file == "" and mps_file == ""):
+            lp_file == "" and mps_file == "" and
+            VPSolver.GRAPH_CACHE is None and b_max is None and
+            not return_stats):
         out, (obj, sol) = VPSolver.script(script, instance, verbose=verbose)
     else:
-        afg = AFG(instance, verbose=stats)
+        mps_model = None
+        if (b_max is None and VPSolver.GRAPH_CACHE is None and
+                not VPSolver.in_process()):
+            mps_model = MPS(instance, verbose=stats)
+            afg = mps_model.afg_graph
+        elif b_max is None:
+            afg = AFG(instance, verbose=stats)
+        else:
+            afg = AFG(MVP(Ws, Cs, Qs, ws, b_max),
+                      verbose=stats).with_demands(b)
         if svg_file.endswith(".svg"):
             VPSolver.log("Generating .SVG file...", verbose)
             try:
@@ -34,18 +54,25 @@ def solve(Ws, Cs, Qs, ws, b,
             except Exception as e:
                 VPSolver.log(e, verbose)
         if lp_file.endswith(".lp"):
-            VPSolver.afg2lp(afg.afg_file, lp_file, verbose=False)
+            VPSolver.afg2lp(afg.filename, lp_file, verbose=False)
             VPSolver.log(".LP model successfully generated!", verbose)
         if mps_file.endswith(".mps"):
-            VPSolver.afg2mps(afg.afg_file, mps_file, verbose=False)
+            VPSolver.afg2mps(afg.filename, mps_file, verbose=False)
             VPSolver.log(".MPS model successfully generated!", verbose)
-        mps_model = MPS(afg, verbose=verbose)
+        if mps_model is None:
+            mps_model = MPS(afg, verbose=verbose)
         out, (obj, sol) = VPSolver.script(
             script, mps_model, afg, options=script_options, verbose=verbose
         )
+        build_stats = afg.stats
+    if return_stats:
+        return obj, sol, build_stats
     return obj, sol
 
 
+solve_many = functools.partial(pool.solve_many, solve)
+
+
 def print_solution(solution, arg2=None, i0=1, fout=sys.stdout):
     """Pretty-print a multiple-choice vector packing solution."""
     if arg2 is None:
@@ -0,0 +1,164 @@
+"""
+This code is part of the Arc-flow Vector Packing Solver (VPSolver).
+"""
+import sys
+import time
+import shutil
+import signal
+import tempfile
+import multiprocessing
+import multiprocessing.connection
+from .. import Session
+
+
+class TimeLimitExceeded(RuntimeError):
+    """
+    Reported by solve_many for the instances still running after the timeout.
+    """
+
+
+def _terminate(signum, frame):
+    raise SystemExit(1)
+
+
+def _worker(conn, solve):
+    """Solve the instances received through conn, each with private
+    temporary files, until None is received."""
+    if sys.platform != "win32":
+        # on timeout, let the session kill the child processes it started
+        signal.signal(signal.SIGTERM, _terminate)
+    while True:
+        try:
+            task = conn.recv()
+        except EOFError:
+            break
+        if task is None:
+            break
+        args, kwargs, tmp_dir = task
+        try:
+            with Session(tmp_dir):
+                result = (solve(*args, **kwargs), None)
+        except Exception as e:
+            result = (None, e)
+        try:
+            conn.send(result)
+        except Exception as e:  # the exception may not be picklable
+            conn.send((None, RuntimeError(repr(result[1] or e))))
+    conn.close()
+
+
+class _Worker(object):
+    """A worker process and the instance it is solving."""
+
+    def __init__(self, solve):
+        self.conn, child_conn = multiprocessing.Pipe()
+        self.process = multiprocessing.Process(
+            target=_worker, args=(child_conn, solve)
+        )
+        self.process.start()
+        child_conn.close()
+        self.task = None  # (index, tmp_dir, deadline)
+
+    def submit(self, i, args, kwargs, timeout):
+        tmp_dir = tempfile.mkdtemp()
+        deadline = None if timeout is None else time.time() + timeout
+        self.task = (i, tmp_dir, deadline)
+        self.conn.send((args, kwargs, tmp_dir))
+
+    def finish(self):
+        """Clear the current task and return its index."""
+        i, tmp_dir, deadline = self.task
+        self.task = None
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        return i
+
+    def stop(self, grace=1.0):
+        """Terminate the worker, giving it some time to clear its session."""
+        if self.task is None:
+            try:
+                self.conn.send(None)
+            except (IOError, OSError):
+                pass
+        else:
+            self.process.terminate()
+        self.process.join(grace)
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join()
+        self.conn.close()
+        if self.task is not None:
+            self.finish()
+
+
+def _wait(workers):
+    """Wait until some workers finish or time out and return their results.
+    The workers that time out or die are stopped and removed."""
+    busy = [w for w in workers if w.task is not None]
+    deadlines = [w.task[2] for w in busy if w.task[2] is not None]
+    wait_time = None
+    if deadlines:
+        wait_time = max(min(deadlines) - time.time(), 0)
+    ready = multiprocessing.connection.wait([w.conn for w in busy], wait_time)
+    now = time.time()
+    results = []
+    for worker in list(workers):
+        if worker.task is None:
+            continue
+        if worker.conn in ready:
+            try:
+                solution, error = worker.conn.recv()
+                results.append((worker.finish(), solution, error))
+                continue
+            except EOFError:
+                worker.process.join()
+                solution, error = None, RuntimeError(
+                    "worker exited with code {}".format(worker.process.exitcode)
+                )
+        elif worker.task[2] is not None and now >= worker.task[2]:
+            solution, error = None, TimeLimitExceeded("time limit exceeded")
+        else:
+            continue
+        i = worker.task[0]
+        worker.stop()
+        workers.remove(worker)
+        results.append((i, solution, error))
+    return results
+
+
+def solve_many(solve, instances, processes=None, timeout=None, **kwargs):
+    """Solve instances in worker processes and yield results as they finish.
+
+    Each instance is a tuple of positional arguments or a dictionary of
+    keyword arguments for solve; kwargs are passed to every call. At most
+    `processes` long-lived workers solve one instance at a time each, with
+    its own temporary directory. A worker still solving an instance `timeout`
+    seconds after it started is terminated and replaced by a new one. Yields
+    (index, solution, error) where error is the exception raised while
+    solving the instance (TimeLimitExceeded on timeout; solution is then None).
+    """
+    if processes is None:
+        processes = multiprocessing.cpu_count()
+    kwargs.setdefault("verbose", False)
+    workers = []
+    try:
+        for i, instance in enumerate(instances):
+            while True:
+                idle = [w for w in workers if w.task is None]
+                if not idle and len(workers) < processes:
+                    workers.append(_Worker(solve))
+                    idle = workers[-1:]
+                if idle:
+                    break
+                for result in _wait(workers):
+                    yield result
+            if isinstance(instance, dict):
+                args, ikwargs = (), dict(kwargs, **instance)
+            else:
+                args, ikwargs = tuple(instance), kwargs
+            idle[0].submit(i, args, ikwargs, timeout)
+        while any(w.task is not None for w in workers):
+            for result in _wait(workers):
+                yield result
+    finally:
+        for worker in workers:
+            worker.stop()
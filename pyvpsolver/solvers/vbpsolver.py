@@ -4,7 +4,9 @@ This code is part of the Arc-flow Vector Packing Solver (VPSolver).
 from __future__ import print_function
 
 import sys
+import functools
 from .. import VPSolver, VBP, AFG, MPS
+from . import pool
 
 
 def solve(
@@ -18,6 +20,8 @@ def solve(
     script_options=None,
     stats=None,
     verbose=None,
+    b_max=None,
+    return_stats=False,
 ):
     """
     Solve vector packing instances using the method proposed in:
@@ -25,16 +29,37 @@ def solve(
     Problems: General Arc-flow Formulation with Graph Compression. Technical
     Report DCC-2013-08, Faculdade de Ciencias da Universidade do Porto,
     Universidade do Porto, Portugal.
+
+    If b_max is given, the graph is built for the demand bounds b_max and
+    reused with demands b (with VPSolver.GRAPH_CACHE set, across calls).
+
+    With return_stats, (obj, sol, build_stats) is returned, where build_stats
+    is the dict of graph construction statistics (see AFG.stats).
     """
     assert script is not None
     assert svg_file == "" or svg_file.endswith(".svg")
     if stats is None and verbose is not None:
         stats = verbose
     instance = VBP(W, w, b, verbose=False)
-    if stats == verbose and svg_file == "" and lp_file == "" and mps_file == "":
+    if (
+        stats == verbose
+        and svg_file == ""
+        and lp_file == ""
+        and mps_file == ""
+        and VPSolver.GRAPH_CACHE is None
+        and b_max is None
+        and not return_stats
+    ):
         out, (obj, sol) = VPSolver.script(script, instance, verbose=verbose)
     else:
-        afg = AFG(instance, verbose=stats)
+        mps_model = None
+        if b_max is None and VPSolver.GRAPH_CACHE is None and not VPSolver.in_process():
+            mps_model = MPS(instance, verbose=stats)
+            afg = mps_model.afg_graph
+        elif b_max is None:
+            afg = AFG(instance, verbose=stats)
+        else:
+            afg = AFG(VBP(W, w, b_max), verbose=stats).with_demands(b)
         if svg_file.endswith(".svg"):
             VPSolver.log("Generating .SVG file...", verbose)
             try:
@@ -42,18 +67,25 @@ def solve(
             except Exception as e:
                 VPSolver.log(e, verbose)
         if lp_file.endswith(".lp"):
-            VPSolver.afg2lp(afg.afg_file, lp_file, verbose=False)
+            VPSolver.afg2lp(afg.filename, lp_file, verbose=False)
             VPSolver.log(".LP model successfully generated!", verbose)
         if mps_file.endswith(".mps"):
-            VPSolver.afg2mps(afg.afg_file, mps_file, verbose=False)
+            VPSolver.afg2mps(afg.filename, mps_file, verbose=False)
             VPSolver.log(".MPS model successfully generated!", verbose)
-        mps_model = MPS(afg, verbose=verbose)
+        if mps_model is None:
+            mps_model = MPS(afg, verbose=verbose)
         out, (obj, sol) = VPSolver.script(
             script, mps_model, afg, options=script_options, verbose=verbose
         )
+        build_stats = afg.stats
+    if return_stats:
+        return obj, sol, build_stats
     return obj, sol
 
 
+solve_many = functools.partial(pool.solve_many, solve)
+
+
 def print_solution(solution, arg2=None, i0=1, fout=sys.stdout):
     """Pretty-print a vector packing solution."""
     if arg2 is None:
@@ -10,6 +10,11 @@ from builtins import range
 from builtins import object
 from builtins import sorted
 import re
+import mmap
+import codecs
+import collections
+import array
+import numpy as np
 
 inf = float("inf")
 
@@ -20,26 +25,277 @@ def get_content(fname):
         return f.read()
 
 
-def get_opt(key, content, default=None):
+_SECTION_RE = re.compile(r"\$(\w+)\s*{([^}]+)}")
+_NOT_INT_RE = re.compile(r"[^\s\d+-]")
+
+
+def index_sections(content):
+    """Scan the content once and return the offsets of every $KEY{...} block."""
+    sections = {}
+    for match in _SECTION_RE.finditer(content):
+        sections.setdefault(match.group(1), match.span(2))
+    return sections
+
+
+def parse_ints(text):
+    """Parse a string of whitespace/comma-separated integers into an array."""
+    if "," in text:
+        text = text.replace(",", " ")
+    try:
+        return np.array(text.split(), dtype=np.int64)
+    except (ValueError, OverflowError):
+        raise ValueError("invalid integer data")
+
+
+def get_opt(key, content, default=None, sections=None):
     """Extract an option from the content of a .vbp/.afg file."""
-    matches = re.findall("\${0}\s*{{([^}}]+)}}".format(key), content)
-    if matches == []:
+    if sections is None:
+        sections = index_sections(content)
+    if key not in sections:
         return default
-    else:
-        return matches[0]
+    start, end = sections[key]
+    return content[start:end]
+
+
+def get_ints(key, content, sections=None):
+    """Extract a block of integers from the content of a .vbp/.afg file."""
+    return parse_ints(get_opt(key, content, "", sections))
 
 
-def get_instance_data(content):
+def get_instance_data(content, sections=None):
     """Extract the instance data from the content of a .vbp/.afg file."""
-    if "$INSTANCE" in content:
-        lst = list(map(int, get_opt("INSTANCE", content).split()))
+    if sections is None:
+        sections = index_sections(content)
+    if "INSTANCE" in sections:
+        data = get_ints("INSTANCE", content, sections)
     else:
-        lst = []
-        for value in content.split():
-            if int(value) != float(value):
-                break
-            lst.append(int(value))
-    return lst
+        match = _NOT_INT_RE.search(content)
+        end = match.start() if match is not None else len(content)
+        data = parse_ints(content[:end])
+    return data.tolist()
+
+
+def read_instance(fobj, chunk_size=1 << 20):
+    """
+    Read the instance data and options of a .vbp/.mvp/.afg file in chunks.
+
+    Accepts a file object or a filename. Integers are parsed chunk by chunk
+    into arrays, so the full token list is never held in memory.
+    """
+    if not hasattr(fobj, "read"):
+        with open(fobj, "r") as f:
+            return read_instance(f, chunk_size)
+
+    # detect the format from the first non-whitespace character
+    buf = fobj.read(chunk_size).lstrip()
+    while buf == "":
+        data = fobj.read(chunk_size)
+        if not data:
+            break
+        buf = data.lstrip()
+    afg = buf[:1] in ("#", "$")
+    if afg:
+        # skip everything up to the beginning of the $INSTANCE{...} block
+        start = buf.find("$INSTANCE")
+        while start == -1 or buf.find("{", start) == -1:
+            data = fobj.read(chunk_size)
+            if not data:
+                raise ValueError("$INSTANCE{...} not found")
+            buf += data
+            start = buf.find("$INSTANCE")
+        buf = buf[buf.find("{", start) + 1 :]
+
+    chunks = []
+    while True:
+        match = _NOT_INT_RE.search(buf)
+        if match is not None:
+            chunks.append(parse_ints(buf[: match.start()]))
+            buf = buf[match.start() :]
+            break
+        data = fobj.read(chunk_size)
+        if not data:
+            chunks.append(parse_ints(buf))
+            buf = ""
+            break
+        # keep the last (possibly incomplete) token for the next chunk
+        cut = max(buf.rfind(" "), buf.rfind("\n"), buf.rfind("\t")) + 1
+        chunks.append(parse_ints(buf[:cut]))
+        buf = buf[cut:] + data
+
+    # read the options (for .afg files only up to the end of the instance)
+    while True:
+        if afg and "#INSTANCE_END#" in buf:
+            buf = buf[: buf.index("#INSTANCE_END#")]
+            break
+        data = fobj.read(chunk_size)
+        if not data:
+            break
+        buf += data
+    sections = index_sections(buf)
+    options = {key: buf[start:end] for key, (start, end) in sections.items()}
+    return np.concatenate(chunks), options
+
+
+AFGB_MAGIC = b"AFGB"
+AFGB_VERSION = 1
+
+
+def load_afgb(fname):
+    """Map a binary .afgb file and return (instance data, options, graph).
+
+    Raises ValueError if the file is not a well-formed .afgb file.
+    """
+    with open(fname, "rb") as f:
+        buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    if buf[:4] != AFGB_MAGIC or len(buf) % 4 != 0:
+        raise ValueError("{} is not a valid .afgb file".format(fname))
+    ints = memoryview(buf)[4:].cast("i")
+    pos = [0]
+
+    def take(n):
+        if n < 0 or pos[0] + n > len(ints):
+            raise ValueError("{} is truncated or damaged".format(fname))
+        pos[0] += n
+        return ints[pos[0] - n : pos[0]]
+
+    version, NV, NA, S, LOSS, nbtypes = take(6)
+    if version != AFGB_VERSION:
+        raise ValueError("unsupported .afgb version {}".format(version))
+    if min(NV, S, LOSS) < 0 or S >= NV:
+        raise ValueError("{} has an invalid header".format(fname))
+    Ts = list(take(nbtypes))
+    data = list(take(take(1)[0]))
+    vtype, method, relax, binary, m = take(5)
+    options = {
+        "vtype": chr(vtype),
+        "method": method,
+        "relax": bool(relax),
+        "binary": bool(binary),
+        "ctypes": [chr(c) for c in take(m)],
+    }
+    arcs = take(3 * NA)
+    if pos[0] != len(ints):
+        raise ValueError("{} has trailing data".format(fname))
+    return data, options, (NV, S, Ts, LOSS, arcs)
+
+
+def dump_afgb(fname, data, options, graph):
+    """Write an arc-flow graph in the binary .afgb format."""
+    NV, S, Ts, LOSS, arcs = graph
+    header = [AFGB_VERSION, NV, len(arcs) // 3, S, LOSS, len(Ts)] + list(Ts)
+    header += [len(data)] + list(data)
+    header += [
+        ord(options["vtype"]),
+        options.get("method", -3),
+        int(options.get("relax", False)),
+        int(options["binary"]),
+        len(options["ctypes"]),
+    ]
+    header += [ord(c) for c in options["ctypes"]]
+    with open(fname, "wb") as f:
+        f.write(AFGB_MAGIC)
+        f.write(array.array("i", header).tobytes())
+        if isinstance(arcs, list):
+            arcs = array.array("i", arcs)
+        f.write(arcs)
+
+
+def read_solution(fname):
+    """Read a solution written by 'vbpsol'/'vpsolver' (None if not found).
+
+    The file contains the objective value and the number of bin types
+    followed, for each bin type, by the number of patterns and one line per
+    pattern with its multiplicity, its length and its (item, option) pairs.
+    Raises ValueError if the file is malformed.
+    """
+    try:
+        content = get_content(fname)
+    except IOError:
+        return None
+    data = parse_ints(content).tolist()
+    if not data:
+        return None
+    pos = [0]
+
+    def take(n):
+        if n < 0 or pos[0] + n > len(data):
+            raise ValueError("{} is truncated or damaged".format(fname))
+        pos[0] += n
+        return data[pos[0] - n : pos[0]]
+
+    obj, nbtypes = take(2)
+    lst_sol = []
+    for t in range(nbtypes):
+        sol = []
+        for i in range(take(1)[0]):
+            mult, size = take(2)
+            pairs = take(2 * size)
+            sol.append((mult, list(zip(pairs[::2], pairs[1::2]))))
+        lst_sol.append(sol)
+    if pos[0] != len(data):
+        raise ValueError("{} has trailing data".format(fname))
+    return obj, lst_sol
+
+
+class OutputBuffer(object):
+    """Text sink that keeps the last max_size characters written to it."""
+
+    def __init__(self, max_size=None):
+        self.max_size = max_size
+        self.size = 0
+        self.chunks = collections.deque()
+
+    def write(self, text):
+        self.chunks.append(text)
+        self.size += len(text)
+        while self.max_size is not None and self.size > self.max_size:
+            excess = self.size - self.max_size
+            head = self.chunks.popleft()
+            if len(head) > excess:
+                self.chunks.appendleft(head[excess:])
+                self.size -= excess
+            else:
+                self.size -= len(head)
+
+    def flush(self):
+        pass
+
+    def getvalue(self):
+        """Return the buffered text."""
+        return "".join(self.chunks)
+
+
+class OutputSplitter(object):
+    """Decode chunks of command output and write them to text sinks.
+
+    If grep/grepv are set, only the complete lines that contain/do not
+    contain them are written.
+    """
+
+    def __init__(self, sinks, grep=None, grepv=None):
+        self.sinks = sinks
+        self.grep, self.grepv = grep, grepv
+        self.decoder = codecs.getincrementaldecoder("utf-8")("replace")
+        self.rest = ""
+
+    def feed(self, data):
+        """Process a chunk of output (an empty chunk marks the end)."""
+        text = self.decoder.decode(data, final=not data)
+        if self.grep is not None or self.grepv is not None:
+            text, self.rest = self.rest + text, ""
+            if data:
+                cut = text.rfind("\n") + 1
+                text, self.rest = text[:cut], text[cut:]
+            text = "".join(
+                line
+                for line in text.splitlines(True)
+                if (self.grep is None or self.grep in line)
+                and (self.grepv is None or self.grepv not in line)
+            )
+        if text:
+            for f in self.sinks:
+                f.write(text)
+                f.flush()
 
 
 def relabel_graph(V, A, fv, fa=lambda x: x):
@@ -10,15 +10,44 @@ from builtins import object
 import six
 
 import os
+import re
 import sys
+import ast
+import json
+import array
 import signal
 import atexit
 import shutil
 import tempfile
+import warnings
+import threading
 import subprocess
+import numpy as np
 from . import utils
 from .afgraph import AFGraph
 
+_lock = threading.Lock()
+_local = threading.local()
+
+
+class BudgetExceeded(RuntimeError):
+    """
+    Raised when a graph construction exceeds its state/memory budget.
+    """
+
+    EXIT_CODE = 2
+
+    def __init__(self, message):
+        super(BudgetExceeded, self).__init__(message)
+        match = re.search(r"reached (\d+) states", message)
+        self.states = int(match.group(1)) if match else None
+
+    @classmethod
+    def from_output(cls, output):
+        """Return the exception reported in the output of a tool."""
+        lines = [line for line in output.splitlines() if "BudgetExceeded" in line]
+        return cls(lines[-1] if lines else "BudgetExceeded")
+
 
 class VBP(object):
     """
@@ -26,60 +55,97 @@ class VBP(object):
     """
 
     def __init__(self, W, w, b, binary=False, vtype="I", verbose=False):
-        self.vbp_file = VPSolver.new_tmp_file(".vbp")
-        with open(self.vbp_file, "w") as fdst:
-            print(len(W), file=fdst)  # ndims
-            print(" ".join(map(str, W)), file=fdst)  # W
-            print(len(w), file=fdst)  # m
-            for i in range(len(w)):  # items
-                row = list(w[i]) + [b[i]]
-                assert len(row) == len(W) + 1
-                print(" ".join(map(str, row)), file=fdst)
-            print("BINARY{{{:d}}};".format(binary), file=fdst)
-            print("VTYPE{{{}}};".format(vtype), file=fdst)
-        if verbose:
-            print(utils.get_content(self.vbp_file))
+        assert len(w) == len(b)
+        assert all(len(wi) == len(W) for wi in w)
+        self.vbp_file = None
         self.m = len(b)
         self.ndims = len(W)
         self.binary = binary
         self.vtype = vtype
         self.W, self.w, self.b = W, w, b
         self.labels = list(range(self.m))
+        if verbose:
+            print(self.to_str())
+
+    def to_str(self):
+        """Return the instance in .vbp format."""
+        lines = [str(self.ndims), " ".join(map(str, self.W)), str(self.m)]
+        lines += [
+            " ".join(map(str, list(wi) + [bi])) for wi, bi in zip(self.w, self.b)
+        ]
+        lines += [
+            "$BINARY{{{:d}}};".format(self.binary),
+            "$VTYPE{{{}}};".format(self.vtype),
+            "",
+        ]
+        return "\n".join(lines)
 
     @classmethod
     def from_str(cls, content, verbose=False):
-        lst = utils.get_instance_data(content)
-        ndims = lst.pop(0)
-        W = lst[:ndims]
-        lst = lst[ndims:]
-        m = lst.pop(0)
-        w, b = [], []
-        for i in range(m):
-            w.append(lst[:ndims])
-            lst = lst[ndims:]
-            b.append(lst.pop(0))
-        assert lst == []
-        binary = bool(int(utils.get_opt("BINARY", content, False)))
-        vtype = utils.get_opt("VTYPE", content, "I")
+        sections = utils.index_sections(content)
+        lst = utils.get_instance_data(content, sections)
+        binary = bool(int(utils.get_opt("BINARY", content, False, sections)))
+        vtype = utils.get_opt("VTYPE", content, "I", sections)
+        return cls.from_data(lst, binary, vtype, verbose)
+
+    @classmethod
+    def from_data(cls, data, binary=False, vtype="I", verbose=False):
+        data = np.asarray(data, dtype=np.int64)
+        ndims = int(data[0])
+        W = data[1 : 1 + ndims].tolist()
+        m = int(data[1 + ndims])
+        assert len(data) == 2 + ndims + m * (ndims + 1)
+        items = data[2 + ndims :].reshape(m, ndims + 1)
+        w, b = items[:, :ndims].tolist(), items[:, ndims].tolist()
         return cls(W, w, b, binary, vtype, verbose)
 
     @classmethod
     def from_file(cls, vbp_file, verbose=False):
-        return cls.from_str(utils.get_content(vbp_file), verbose=verbose)
+        data, options = utils.read_instance(vbp_file)
+        binary = bool(int(options.get("BINARY", False)))
+        vtype = options.get("VTYPE", "I")
+        return cls.from_data(data, binary, vtype, verbose)
 
     @property
     def filename(self):
-        """Return the filename."""
+        """Return the filename (the file is only written on first access)."""
+        if self.vbp_file is None:
+            vbp_file = VPSolver.new_tmp_file(".vbp")
+            with open(vbp_file, "w") as f:
+                f.write(self.to_str())
+            self.vbp_file = vbp_file
         return self.vbp_file
 
     def weights(self):
         """Return the item weights."""
         return {i: tuple(self.w[i]) for i in range(self.m)}
 
+    def mvp_data(self):
+        """Return the instance data in .mvp format as a list of integers."""
+        data = [self.ndims, 1] + list(self.W) + [1, -1, self.m]
+        for i in range(self.m):
+            data += [1, self.b[i]] + list(self.w[i])
+        return data
+
     def capacities(self):
         """Return the bin capacities."""
         return [tuple(self.W)]
 
+    def with_demands(self, b):
+        """Return a copy of the instance with different demands."""
+        return VBP(self.W, self.w, b, binary=self.binary, vtype=self.vtype)
+
+    def coarsened(self, k):
+        """Return a copy of the instance with the capacities and weights
+        divided by k (rounded up)."""
+        return VBP(
+            [-(-Wd // k) for Wd in self.W],
+            [[-(-wd // k) for wd in wi] for wi in self.w],
+            self.b,
+            binary=self.binary,
+            vtype=self.vtype,
+        )
+
     def __del__(self):
         try:
             os.remove(self.vbp_file)
@@ -93,29 +159,13 @@ class MVP(object):
     """
 
     def __init__(self, Ws, Cs, Qs, ws, b, binary=False, vtype="I", verbose=False):
-        self.mvp_file = VPSolver.new_tmp_file(".mvp")
-        with open(self.mvp_file, "w") as fdst:
-            ndims = len(Ws[0])
-            print(ndims, file=fdst)  # ndims
-            print(len(Ws), file=fdst)  # nbtypes
-            assert len(Ws) == len(Cs)
-            assert len(Ws) == len(Qs)
-            for Wi, Ci, Qi in zip(Ws, Cs, Qs):  # Ws, Cs, Qs
-                assert len(Wi) == ndims
-                if Qi == utils.inf:
-                    Qi = -1
-                print(" ".join(map(str, list(Wi) + [Ci] + [Qi])), file=fdst)
-            assert len(ws) == len(b)
-            print(len(ws), file=fdst)  # m
-            for i in range(len(ws)):  # items
-                print("{} {}".format(len(ws[i]), b[i]), file=fdst)
-                for j, w in enumerate(ws[i]):
-                    assert len(w) == ndims
-                    print(" ".join(map(str, w)), file=fdst)
-            print("BINARY{{{:d}}};".format(binary), file=fdst)
-            print("VTYPE{{{}}};".format(vtype), file=fdst)
-        if verbose:
-            print(utils.get_content(self.mvp_file))
+        ndims = len(Ws[0])
+        assert len(Ws) == len(Cs)
+        assert len(Ws) == len(Qs)
+        assert all(len(Wi) == ndims for Wi in Ws)
+        assert len(ws) == len(b)
+        assert all(len(w) == ndims for wsi in ws for w in wsi)
+        self.mvp_file = None
         self.m = len(b)
         self.ndims = ndims
         self.binary = binary
@@ -125,40 +175,72 @@ class MVP(object):
         self.labels = [
             (i, j) for i in range(len(self.ws)) for j in range(len(self.ws[i]))
         ]
+        if verbose:
+            print(self.to_str())
+
+    def to_str(self):
+        """Return the instance in .mvp format."""
+        lines = [str(self.ndims), str(len(self.Ws))]
+        for Wi, Ci, Qi in zip(self.Ws, self.Cs, self.Qs):
+            Qi = Qi if Qi != utils.inf else -1
+            lines.append(" ".join(map(str, list(Wi) + [Ci, Qi])))
+        lines.append(str(self.m))
+        for wsi, bi in zip(self.ws, self.b):
+            lines.append("{} {}".format(len(wsi), bi))
+            lines += [" ".join(map(str, w)) for w in wsi]
+        lines += [
+            "$BINARY{{{:d}}};".format(self.binary),
+            "$VTYPE{{{}}};".format(self.vtype),
+            "",
+        ]
+        return "\n".join(lines)
 
     @classmethod
     def from_str(cls, content, verbose=False):
-        lst = utils.get_instance_data(content)
-        ndims = lst.pop(0)
-        nbtypes = lst.pop(0)
+        sections = utils.index_sections(content)
+        lst = utils.get_instance_data(content, sections)
+        binary = bool(int(utils.get_opt("BINARY", content, False, sections)))
+        vtype = utils.get_opt("VTYPE", content, "I", sections)
+        return cls.from_data(lst, binary, vtype, verbose)
+
+    @classmethod
+    def from_data(cls, data, binary=False, vtype="I", verbose=False):
+        lst = np.asarray(data, dtype=np.int64).tolist()
+        ndims, nbtypes = lst[0], lst[1]
+        p = 2
         Ws, Cs, Qs = [], [], []
         for i in range(nbtypes):
-            Ws.append(lst[:ndims])
-            lst = lst[ndims:]
-            Cs.append(lst.pop(0))
-            Qs.append(lst.pop(0))
-        m = lst.pop(0)
+            Ws.append(lst[p : p + ndims])
+            Cs.append(lst[p + ndims])
+            Qs.append(lst[p + ndims + 1])
+            p += ndims + 2
+        m = lst[p]
+        p += 1
         ws, b = [], []
         for i in range(m):
-            ws.append([])
-            qi = lst.pop(0)
-            bi = lst.pop(0)
+            qi, bi = lst[p], lst[p + 1]
+            p += 2
             b.append(bi)
-            for j in range(qi):
-                ws[i].append(lst[:ndims])
-                lst = lst[ndims:]
-        assert lst == []
-        binary = bool(int(utils.get_opt("BINARY", content, False)))
-        vtype = utils.get_opt("VTYPE", content, "I")
+            ws.append([lst[p + j * ndims : p + (j + 1) * ndims] for j in range(qi)])
+            p += qi * ndims
+        assert p == len(lst)
         return cls(Ws, Cs, Qs, ws, b, binary, vtype, verbose)
 
     @classmethod
     def from_file(cls, mvp_file, verbose=False):
-        return cls.from_str(utils.get_content(mvp_file), verbose=verbose)
+        data, options = utils.read_instance(mvp_file)
+        binary = bool(int(options.get("BINARY", False)))
+        vtype = options.get("VTYPE", "I")
+        return cls.from_data(data, binary, vtype, verbose)
 
     @property
     def filename(self):
-        """Return the filename."""
+        """Return the filename (the file is only written on first access)."""
+        if self.mvp_file is None:
+            mvp_file = VPSolver.new_tmp_file(".mvp")
+            with open(mvp_file, "w") as f:
+                f.write(self.to_str())
+            self.mvp_file = mvp_file
         return self.mvp_file
 
     def weights(self):
@@ -173,6 +255,43 @@ class MVP(object):
         """Return the bin capacities."""
         return list(map(tuple, self.Ws))
 
+    def with_demands(self, b):
+        """Return a copy of the instance with different demands."""
+        return MVP(
+            self.Ws,
+            self.Cs,
+            self.Qs,
+            self.ws,
+            b,
+            binary=self.binary,
+            vtype=self.vtype,
+        )
+
+    def coarsened(self, k):
+        """Return a copy of the instance with the capacities and weights
+        divided by k (rounded up)."""
+        return MVP(
+            [[-(-Wd // k) for Wd in Wi] for Wi in self.Ws],
+            self.Cs,
+            self.Qs,
+            [[[-(-wd // k) for wd in w] for w in opts] for opts in self.ws],
+            self.b,
+            binary=self.binary,
+            vtype=self.vtype,
+        )
+
+    def mvp_data(self):
+        """Return the instance data in .mvp format as a list of integers."""
+        data = [self.ndims, len(self.Ws)]
+        for Wi, Ci, Qi in zip(self.Ws, self.Cs, self.Qs):
+            data += list(Wi) + [Ci, Qi if Qi != utils.inf else -1]
+        data.append(self.m)
+        for i in range(self.m):
+            data += [len(self.ws[i]), self.b[i]]
+            for w in self.ws[i]:
+                data += list(w)
+        return data
+
     def __del__(self):
         try:
             os.remove(self.mvp_file)
@@ -182,39 +301,129 @@ class MVP(object):
 
 class AFG(object):
     """
-    Wrapper for .afg files.
+    Wrapper for .afg/.afgb files.
     """
 
-    def __init__(self, instance, verbose=None):
+    def __init__(
+        self, instance, verbose=None, max_states=None, max_memory=None, method=-3
+    ):
+        self.afg_file = None
+        self.arcflow = None
+        self.stats = {}
         if instance is not None:
             assert isinstance(instance, (VBP, MVP))
             self.instance = instance
-            self.afg_file = VPSolver.new_tmp_file(".afg")
-            self.output = VPSolver.vbp2afg(instance, self.filename, verbose=verbose)
+            self.demand_bounds = list(instance.b)
+            cache = VPSolver.GRAPH_CACHE
+            if cache is not None:
+                self.arcflow = cache.get(instance, method)
+            if self.arcflow is not None:
+                self.output = ""
+                self.stats = cache.get_stats(instance, method)
+            elif VPSolver.in_process():
+                self.arcflow = VPSolver.build_graph(
+                    instance,
+                    method=method,
+                    verbose=verbose,
+                    max_states=max_states,
+                    max_memory=max_memory,
+                )
+                self.output = VPSolver.build_log()
+                self.stats = VPSolver.build_stats()
+                if cache is not None:
+                    cache.put(instance, self.arcflow, self.stats, method)
+            else:
+                self.afg_file = VPSolver.new_tmp_file(".afgb")
+                stats_file = VPSolver.new_tmp_file(".json")
+                self.output = VPSolver.vbp2afg(
+                    instance,
+                    self.afg_file,
+                    verbose=verbose,
+                    max_states=max_states,
+                    max_memory=max_memory,
+                    stats_file=stats_file,
+                    method=method,
+                )
+                self.stats = VPSolver.read_stats(stats_file)
+                if cache is not None:
+                    graph = utils.load_afgb(self.afg_file)[2]
+                    cache.put(instance, graph, self.stats, method)
 
     @classmethod
     def from_file(cls, afg_file, verbose=None):
         obj = cls(None)
-        obj.instance = MVP.from_file(afg_file)
-        obj.afg_file = VPSolver.new_tmp_file(".afg")
+        ext = ".afgb" if afg_file.endswith(".afgb") else ".afg"
+        obj.afg_file = VPSolver.new_tmp_file(ext)
         shutil.copyfile(afg_file, obj.afg_file)
+        if ext == ".afgb":
+            data, options, obj.arcflow = utils.load_afgb(obj.afg_file)
+            obj.instance = MVP.from_data(data, options["binary"], options["vtype"])
+        else:
+            obj.instance = MVP.from_file(afg_file)
+        obj.demand_bounds = list(obj.instance.b)
         return obj
 
+    @classmethod
+    def from_instance_file(cls, instance, afg_file, output="", stats=None):
+        """Wrap a graph file built for an instance."""
+        obj = cls(None)
+        obj.instance = instance
+        obj.demand_bounds = list(instance.b)
+        obj.afg_file = afg_file
+        obj.output = output
+        obj.stats = stats or {}
+        return obj
+
+    def with_demands(self, b):
+        """Return an AFG that reuses this graph with new demands.
+
+        The graph remains valid for any demands up to the ones it was built
+        for, so only the model (right-hand sides and bounds) changes.
+        """
+        assert len(b) == len(self.demand_bounds)
+        if any(bi > bmax for bi, bmax in zip(b, self.demand_bounds)):
+            raise ValueError("demands exceed the bounds the graph was built for")
+        obj = AFG(None)
+        obj.instance = self.instance.with_demands(b)
+        obj.demand_bounds = self.demand_bounds
+        obj.arcflow = self.load()
+        obj.output = ""
+        obj.stats = self.stats
+        return obj
+
+    def load(self):
+        """Return the graph as a (NV, S, Ts, LOSS, arcs) tuple."""
+        if self.arcflow is not None:
+            return self.arcflow
+        if self.filename.endswith(".afgb"):
+            return utils.load_afgb(self.filename)[2]
+        content = utils.get_content(self.filename)
+        sections = utils.index_sections(content)
+        NV = int(utils.get_opt("NV", content, sections=sections))
+        S = int(utils.get_opt("S", content, sections=sections))
+        Ts = utils.get_ints("Ts", content, sections).tolist()
+        arcs = utils.get_ints("ARCS", content, sections)
+        LOSS = int(utils.get_opt("LOSS", content, sections=sections))
+        return NV, S, Ts, LOSS, arcs
+
     def graph(self):
         """Return the graph as an AFGraph object."""
-        content = utils.get_content(self.filename)
-        labels = self.instance.labels
-        S = int(utils.get_opt("S", content))
-        Ts = list(map(int, utils.get_opt("Ts", content).split(",")))
-        arcs = list(map(int, utils.get_opt("ARCS", content).split()))
-        LOSS = int(utils.get_opt("LOSS", content))
-        V, A = set([]), []
-        for i in range(0, len(arcs), 3):
-            u, v, i = arcs[i : i + 3]
-            V.add(u)
-            V.add(v)
-            A.append((u, v, labels[i] if i != LOSS else LOSS))
-        graph = AFGraph(V, A, S, Ts, LOSS)
+        labels = list(self.instance.labels)
+        NV, S, Ts, LOSS, arcs = self.load()
+        assert LOSS == len(labels)
+        arcs = np.asarray(arcs, dtype=np.int32).reshape(-1, 3)
+        nodes, index = np.unique(arcs[:, :2], return_inverse=True)
+        index = index.reshape(-1, 2)
+        graph = AFGraph.from_arrays(
+            nodes.tolist(),
+            labels + [LOSS],
+            index[:, 0],
+            index[:, 1],
+            arcs[:, 2],
+            S,
+            Ts,
+            LOSS,
+        )
         lbls = {S: "S"}
         if len(Ts) == 1:
             lbls[Ts[0]] = "T"
@@ -241,9 +450,50 @@ class AFG(object):
             verbose=verbose,
         )
 
+    def write(self, afg_file):
+        """Write a graph built in-process to a .afg/.afgb file."""
+        assert self.arcflow is not None
+        NV, S, Ts, LOSS, arcs = self.arcflow
+        instance = self.instance
+        if afg_file.endswith(".afgb"):
+            options = {
+                "vtype": instance.vtype,
+                "binary": instance.binary,
+                "ctypes": ["=" if bi <= 1 else ">" for bi in instance.b],
+            }
+            utils.dump_afgb(afg_file, instance.mvp_data(), options, self.arcflow)
+            return
+        lines = [
+            "#INSTANCE_BEGIN#",
+            "$INSTANCE{",
+            " ".join(map(str, instance.mvp_data())),
+            "};",
+            "$VTYPE{{{}}};".format(instance.vtype),
+            "$BINARY{{{:d}}};".format(instance.binary),
+            "#INSTANCE_END#",
+            "#GRAPH_BEGIN#",
+            "$NBTYPES{{{:d}}};".format(len(Ts)),
+            "$S{{{:d}}};".format(S),
+            "$Ts{{{}}};".format(",".join(map(str, Ts))),
+            "$LOSS{{{:d}}};".format(LOSS),
+            "$NV{{{:d}}};".format(NV),
+            "$NA{{{:d}}};".format(len(arcs) // 3),
+            "$ARCS{",
+        ]
+        lines += [
+            "{} {} {}".format(arcs[i], arcs[i + 1], arcs[i + 2])
+            for i in range(0, len(arcs), 3)
+        ]
+        lines += ["};", "#GRAPH_END#", ""]
+        with open(afg_file, "w") as f:
+            f.write("\n".join(lines))
+
     @property
     def filename(self):
         """Return the filename."""
+        if self.afg_file is None:
+            self.afg_file = VPSolver.new_tmp_file(".afgb")
+            self.write(self.afg_file)
         return self.afg_file
 
     def __del__(self):
@@ -259,10 +509,26 @@ class MPS(object):
     """
 
     def __init__(self, graph, verbose=None):
-        assert isinstance(graph, AFG)
-        self.afg_graph = graph
         self.mps_file = VPSolver.new_tmp_file(".mps")
-        self.output = VPSolver.afg2mps(graph.filename, self.filename, verbose=verbose)
+        if isinstance(graph, (VBP, MVP)):
+            afg_file = VPSolver.new_tmp_file(".afgb")
+            stats_file = VPSolver.new_tmp_file(".json")
+            self.output = VPSolver.vbp2model(
+                graph,
+                self.filename,
+                afg_file,
+                VPSolver.build_opts(graph, stats_file=stats_file),
+                verbose=verbose,
+            )
+            graph = AFG.from_instance_file(
+                graph, afg_file, self.output, VPSolver.read_stats(stats_file)
+            )
+        else:
+            assert isinstance(graph, AFG)
+            self.output = VPSolver.afg2mps(
+                graph.filename, self.filename, verbose=verbose
+            )
+        self.afg_graph = graph
 
     @property
     def filename(self):
@@ -282,10 +548,26 @@ class LP(object):
     """
 
     def __init__(self, graph, verbose=None):
-        assert isinstance(graph, AFG)
-        self.afg_graph = graph
         self.lp_file = VPSolver.new_tmp_file(".lp")
-        self.output = VPSolver.afg2lp(graph.filename, self.filename, verbose=verbose)
+        if isinstance(graph, (VBP, MVP)):
+            afg_file = VPSolver.new_tmp_file(".afgb")
+            stats_file = VPSolver.new_tmp_file(".json")
+            self.output = VPSolver.vbp2model(
+                graph,
+                self.filename,
+                afg_file,
+                VPSolver.build_opts(graph, stats_file=stats_file),
+                verbose=verbose,
+            )
+            graph = AFG.from_instance_file(
+                graph, afg_file, self.output, VPSolver.read_stats(stats_file)
+            )
+        else:
+            assert isinstance(graph, AFG)
+            self.output = VPSolver.afg2lp(
+                graph.filename, self.filename, verbose=verbose
+            )
+        self.afg_graph = graph
 
     @property
     def filename(self):
@@ -299,6 +581,74 @@ class LP(object):
             pass
 
 
+class Session(object):
+    """
+    Temporary files and child processes of a group of VPSolver calls.
+
+    Inside a "with Session():" block, the VPSolver calls made by the current
+    thread use the session instead of the global state; the session is
+    cleared when the block exits.
+    """
+
+    def __init__(self, tmp_dir=None):
+        if tmp_dir is None:
+            tmp_dir = tempfile.mkdtemp()
+        self.tmp_dir = tmp_dir
+        self.tmp_cnt = 0
+        self.plist = []
+        self._lock = threading.Lock()
+
+    def new_tmp_file(self, ext="tmp"):
+        """Create a temporary file."""
+        if not ext.startswith("."):
+            ext = ".{}".format(ext)
+        with self._lock:
+            fname = "{}/{}{}".format(self.tmp_dir, self.tmp_cnt, ext)
+            self.tmp_cnt += 1
+            if not os.path.exists(self.tmp_dir):
+                os.makedirs(self.tmp_dir)
+        return fname
+
+    def register(self, proc):
+        """Register a child process."""
+        with self._lock:
+            self.plist.append(proc)
+
+    def unregister(self, proc):
+        """Unregister a child process that has finished."""
+        with self._lock:
+            if proc in self.plist:
+                self.plist.remove(proc)
+
+    def kill(self):
+        """Kill the child processes of the session."""
+        with self._lock:
+            plist, self.plist = self.plist, []
+        for p in plist:
+            try:
+                os.killpg(p.pid, signal.SIGTERM)
+            except:
+                pass
+
+    def clear(self):
+        """Kill the child processes and delete the temporary files."""
+        self.kill()
+        try:
+            shutil.rmtree(self.tmp_dir)
+        except:
+            pass
+
+    def __enter__(self):
+        if not hasattr(_local, "sessions"):
+            _local.sessions = []
+        _local.sessions.append(self)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        _local.sessions.remove(self)
+        self.clear()
+
+
 class VPSolver(object):
     """
     Tools to interact with VPSolver binaries and scripts.
@@ -308,12 +658,20 @@ class VPSolver(object):
     VBP2AFG_EXEC = "vbp2afg"
     AFG2MPS_EXEC = "afg2mps"
     AFG2LP_EXEC = "afg2lp"
+    VBP2MODEL_EXEC = "vbp2model"
     VBPSOL_EXEC = "vbpsol"
 
     TMP_DIR = tempfile.mkdtemp()
     TMP_CNT = 0
     PLIST = []
     VERBOSE = True
+    INPROCESS = True
+    GRAPH_CACHE = None
+    THREADS = 1
+    MAX_STATES = 0
+    MAX_MEMORY = 0
+    MAX_OUTPUT = 1 << 24
+    CHUNK_SIZE = 1 << 16
 
     @staticmethod
     def set_verbose(verbose):
@@ -321,15 +679,25 @@ class VPSolver(object):
         if verbose is not None:
             VPSolver.VERBOSE = verbose
 
+    @staticmethod
+    def session():
+        """Return the active session of the current thread (or None)."""
+        sessions = getattr(_local, "sessions", None)
+        return sessions[-1] if sessions else None
+
     @staticmethod
     def new_tmp_file(ext="tmp"):
         """Create a temporary file."""
+        session = VPSolver.session()
+        if session is not None:
+            return session.new_tmp_file(ext)
         if not ext.startswith("."):
             ext = ".{}".format(ext)
-        fname = "{}/{}{}".format(VPSolver.TMP_DIR, VPSolver.TMP_CNT, ext)
-        VPSolver.TMP_CNT += 1
-        if not os.path.exists(VPSolver.TMP_DIR):
-            os.makedirs(VPSolver.TMP_DIR)
+        with _lock:
+            fname = "{}/{}{}".format(VPSolver.TMP_DIR, VPSolver.TMP_CNT, ext)
+            VPSolver.TMP_CNT += 1
+            if not os.path.exists(VPSolver.TMP_DIR):
+                os.makedirs(VPSolver.TMP_DIR)
         return fname
 
     @staticmethod
@@ -355,8 +723,13 @@ class VPSolver(object):
             print(msg)
 
     @staticmethod
-    def run(cmd, tee=None, grep=None, grepv=None, verbose=None):
-        """Run a system command."""
+    def run(cmd, tee=None, grep=None, grepv=None, verbose=None, sinks=None):
+        """Run a system command and return its output.
+
+        The output is read in chunks and the last VPSolver.MAX_OUTPUT
+        characters are kept in memory; it is also written to stdout if
+        verbose, to the file tee and to the given sinks.
+        """
         if verbose is None:
             verbose = VPSolver.VERBOSE
 
@@ -367,147 +740,477 @@ class VPSolver(object):
             stderr=subprocess.STDOUT,
             preexec_fn=os.setsid,
         )
-        VPSolver.PLIST.append(proc)
+        session = VPSolver.session()
+        if session is not None:
+            session.register(proc)
+        else:
+            VPSolver.PLIST.append(proc)
 
-        def pipe_output(fin, fout_list, grep=None, grepv=None):
+        output = utils.OutputBuffer(VPSolver.MAX_OUTPUT)
+        sinks = [output] + list(sinks or [])
+        if verbose:
+            sinks.append(sys.stdout)
+        ftee = open(tee, "w") if tee is not None else None
+        if ftee is not None:
+            sinks.append(ftee)
+        splitter = utils.OutputSplitter(sinks, grep, grepv)
+        try:
+            fd = proc.stdout.fileno()
             while True:
-                line = fin.readline().decode("utf-8")
-                if not line:
+                data = os.read(fd, VPSolver.CHUNK_SIZE)
+                splitter.feed(data)
+                if not data:
                     break
-                if grep is not None and grep not in line:
-                    continue
-                if grepv is not None and grepv in line:
-                    continue
-                for f in fout_list:
-                    if f is sys.stdout and line.startswith("PYSOL="):
-                        continue
-                    f.write(line)
-                    f.flush()
-
-        if tee is None:
-            if verbose:
-                pipe_output(proc.stdout, [sys.stdout], grep, grepv)
-        else:
-            with open(tee, "w") as ftee:
-                if verbose:
-                    pipe_output(proc.stdout, [sys.stdout, ftee], grep, grepv)
-                else:
-                    pipe_output(proc.stdout, [ftee], grep, grepv)
+        finally:
+            if ftee is not None:
+                ftee.close()
 
         exit_code = proc.wait()
         proc.stdout.close()
+        if session is not None:
+            session.unregister(proc)
+        if exit_code == BudgetExceeded.EXIT_CODE:
+            raise BudgetExceeded.from_output(output.getvalue())
         if exit_code != 0:
             raise RuntimeError("failed to run '{}'".format(cmd))
+        return output.getvalue()
 
     @staticmethod
     def parse_vbpsol(vpsol_output):
-        """Transform 'vbpsol' solutions into python data."""
+        """Transform 'vbpsol' solutions into python data.
+
+        Deprecated: the solutions are read from the file written by 'vbpsol'
+        (see VPSolver.read_solution).
+        """
+        warnings.warn(
+            "VPSolver.parse_vbpsol is deprecated; use VPSolver.read_solution",
+            DeprecationWarning,
+            stacklevel=2,
+        )
         marker = "PYSOL="
         if marker in vpsol_output:
             vpsol_output = vpsol_output[vpsol_output.find(marker) + len(marker) :]
             vpsol_output = vpsol_output[: vpsol_output.find("\n")]
-            obj, sol = eval(vpsol_output)
+            obj, sol = ast.literal_eval(vpsol_output)
             return obj, sol
         else:
             return None
 
+    @staticmethod
+    def read_stats(stats_file):
+        """Read and delete the build statistics written by 'vbp2afg'/
+        'vbp2model' to stats_file (see VPSolver.build_opts) and return them
+        as a dict (empty if there are none)."""
+        try:
+            with open(stats_file) as f:
+                content = f.read()
+            os.remove(stats_file)
+        except (IOError, OSError):
+            return {}
+        return json.loads(content) if content.strip() else {}
+
     @staticmethod
     def vbpsol(afg_file, sol_file, print_inst=False, pyout=True, verbose=None):
         """Call 'vbpsol' to extract a vector packing solution."""
-        if isinstance(afg_file, AFG):
-            afg_file = afg_file.filename
-        out_file = VPSolver.new_tmp_file()
-        opts = "{print_inst:d} {pyout:d}".format(print_inst=print_inst, pyout=pyout)
+        graph = afg_file
+        if isinstance(graph, AFG):
+            afg_file = graph.filename
+        opts = "{print_inst:d} 0".format(print_inst=print_inst)
+        if pyout:
+            pysol_file = VPSolver.new_tmp_file(".sol")
+            opts += " {}".format(pysol_file)
         VPSolver.run(
             "{} {} {} {}".format(VPSolver.VBPSOL_EXEC, afg_file, sol_file, opts),
-            tee=out_file,
             verbose=verbose,
         )
-        output = utils.get_content(out_file)
-        os.remove(out_file)
-        return VPSolver.parse_vbpsol(output)
+        if pyout:
+            return VPSolver.read_solution(pysol_file)
 
     @staticmethod
     def vpsolver(instance_file, print_inst=False, pyout=True, verbose=None):
         """Call 'vpsolver' to solve .vbp instances."""
-        if isinstance(instance_file, (VBP, MVP)):
-            instance_file = instance_file.filename
+        instance = instance_file
+        if isinstance(instance, (VBP, MVP)):
+            instance_file = instance.filename
         content = utils.get_content(instance_file)
-        method = int(utils.get_opt("METHOD", content, -3))
-        binary = int(utils.get_opt("BINARY", content, 0))
-        vtype = utils.get_opt("VTYPE", content, "I")
-        out_file = VPSolver.new_tmp_file()
-        opts = "{method:d} {binary:d} {vtype} {print_inst:d} {pyout:d}".format(
+        sections = utils.index_sections(content)
+        method = int(utils.get_opt("METHOD", content, -3, sections))
+        binary = int(utils.get_opt("BINARY", content, 0, sections))
+        vtype = utils.get_opt("VTYPE", content, "I", sections)
+        opts = "{method:d} {binary:d} {vtype} {print_inst:d} 0".format(
             method=method,
             binary=binary,
             vtype=vtype,
             print_inst=print_inst,
-            pyout=pyout,
         )
-        VPSolver.run(
+        if pyout:
+            pysol_file = VPSolver.new_tmp_file(".sol")
+            opts += " {}".format(pysol_file)
+        output = VPSolver.run(
             "{} {} {}".format(VPSolver.VPSOLVER_EXEC, instance_file, opts),
-            tee=out_file,
             verbose=verbose,
         )
-        output = utils.get_content(out_file)
-        os.remove(out_file)
-        return output, VPSolver.parse_vbpsol(output)
+        if pyout:
+            return output, VPSolver.read_solution(pysol_file)
+        return output, None
 
     @staticmethod
-    def vbp2afg(instance_file, afg_file, opts="", verbose=None):
-        """Call 'vbp2afg' to create an arc-flow graph for a .vbp instance."""
-        if isinstance(instance_file, (VBP, MVP)):
-            instance_file = instance_file.filename
-        out_file = VPSolver.new_tmp_file()
-        VPSolver.run(
+    def read_solution(pysol_file):
+        """Read and delete a solution file written by 'vbpsol'/'vpsolver'."""
+        try:
+            return utils.read_solution(pysol_file)
+        finally:
+            try:
+                os.remove(pysol_file)
+            except OSError:
+                pass
+
+    @staticmethod
+    def native_builder():
+        """Return the in-process arc-flow graph builder if available."""
+        try:
+            from _vbp2afg import swig_build
+        except ImportError:
+            return None
+        return swig_build
+
+    @staticmethod
+    def build_stats():
+        """Return the statistics of the last in-process build of this thread."""
+        try:
+            from _vbp2afg import swig_stats
+        except ImportError:
+            return {}
+        return json.loads(swig_stats() or "{}")
+
+    @staticmethod
+    def build_log():
+        """Return the log of the last in-process build of this thread."""
+        try:
+            from _vbp2afg import swig_log
+        except ImportError:
+            return ""
+        return swig_log()
+
+    @staticmethod
+    def in_process():
+        """Return True if graphs are built in-process."""
+        return VPSolver.INPROCESS and VPSolver.native_builder() is not None
+
+    @staticmethod
+    def build_opts(
+        instance,
+        threads=None,
+        max_states=None,
+        max_memory=None,
+        stats_file=None,
+        method=-3,
+    ):
+        """Return the 'vbp2afg'/'vbp2model' options to build with method and
+        threads and a budget of max_states states and max_memory MB
+        (VPSolver.THREADS, VPSolver.MAX_STATES and VPSolver.MAX_MEMORY by
+        default; 0: no limit) and to write the build statistics to stats_file
+        (see VPSolver.read_stats). Without an instance, the binary and vtype
+        options of the instance file are kept."""
+        if threads is None:
+            threads = VPSolver.THREADS
+        if max_states is None:
+            max_states = VPSolver.MAX_STATES
+        if max_memory is None:
+            max_memory = VPSolver.MAX_MEMORY
+        if (
+            method == -3
+            and threads == 1
+            and max_states == 0
+            and max_memory == 0
+            and not stats_file
+        ):
+            return ""
+        if instance is None:
+            binary, vtype = -1, "-"
+        else:
+            binary, vtype = int(instance.binary), instance.vtype
+        opts = "{:d} {:d} {} {:d}".format(method, binary, vtype, threads)
+        if max_states != 0 or max_memory != 0 or stats_file:
+            opts += " {:d} {:d}".format(max_states, max_memory)
+        if stats_file:
+            opts += " {}".format(stats_file)
+        return opts
+
+    @staticmethod
+    def _sample_build(instance, cap):
+        """Return the build statistics of an instance, or None if the
+        construction goes past cap states."""
+        try:
+            if VPSolver.in_process():
+                VPSolver.build_graph(
+                    instance, verbose=False, threads=1, max_states=cap, max_memory=0
+                )
+                return VPSolver.build_stats()
+            afg_file = VPSolver.new_tmp_file(".afgb")
+            stats_file = VPSolver.new_tmp_file(".json")
+            try:
+                VPSolver.vbp2afg(
+                    instance,
+                    afg_file,
+                    verbose=False,
+                    max_states=cap,
+                    max_memory=0,
+                    stats_file=stats_file,
+                )
+            finally:
+                try:
+                    os.remove(afg_file)
+                except OSError:
+                    pass
+            return VPSolver.read_stats(stats_file)
+        except BudgetExceeded:
+            return None
+
+    @staticmethod
+    def estimate_graph(instance, cap=50000):
+        """Estimate the size of the arc-flow graph of an instance.
+
+        Returns a dict with the number of dp states and vertices, and the
+        memory (in MB) charged against the max_memory budget during the
+        build. The graph is built (with at most cap states each) for copies
+        of the instance with capacities and weights divided by k = 2^j,
+        halving k until a build goes past cap; the counts are extrapolated
+        from the last two builds that fit. The result is exact if the
+        instance itself fits in cap states. Otherwise it is an estimate:
+        with the default cap, between 1 and 4 times the actual number of
+        states on the benchmark instances (smaller caps give rougher
+        estimates), and never above a (usually much looser) upper bound that
+        assumes every load is reachable with every item.
+        """
+        assert isinstance(instance, (VBP, MVP))
+        if isinstance(instance, VBP):
+            options = [[wi] for wi in instance.w]
+        else:
+            options = instance.ws
+        maxW = [max(W[d] for W in instance.capacities()) for d in range(instance.ndims)]
+        nsizes, pairs, maxb = 0, 1, 0
+        for opts, bi in zip(options, instance.b):
+            bi = 1 if instance.binary else bi
+            maxb = max(maxb, bi)
+            for w in opts:
+                rep = min([bi] + [Wd // wd for Wd, wd in zip(maxW, w) if wd > 0])
+                nsizes += 1
+                pairs += 1 if instance.binary else max(rep, 1)
+        loads = 1
+        for Wd in maxW:
+            loads *= Wd + 1
+        nbits = [Wd.bit_length() for Wd in maxW] + [nsizes.bit_length()]
+        if not instance.binary:
+            nbits.append(maxb.bit_length())
+        key_words = (sum(nbits) + 31) // 32
+        # bytes per dp state and per lift cache entry (see Arcflow::init)
+        memo_bytes = 4 * (key_words + 3) + 24
+        lift_bytes = 4 * (key_words + instance.ndims + 2)
+        bound = {
+            "states": loads * pairs,
+            "vertices": loads * (nsizes + 2 if instance.binary else 1)
+            + len(instance.capacities()),
+        }
+
+        k = 1
+        while k < max(maxW):
+            k *= 2
+        samples = []  # (states, vertices, lift cache entries) for k, k/2, ...
+        while True:
+            stats = VPSolver._sample_build(instance.coarsened(k), cap)
+            if stats is None:
+                break
+            samples.append(
+                (
+                    stats["ndp"],
+                    stats["phases"]["reduce_redundancy"]["nv"],
+                    stats["lift_misses"],
+                )
+            )
+            if k == 1:
+                break
+            k //= 2
+        if not samples:
+            states, vertices = bound["states"], bound["vertices"]
+            lifts = states
+        elif stats is not None:
+            states, vertices, lifts = samples[-1]
+        else:
+            # the last build that fit was at scale 2k; extrapolate to scale 1
+            # assuming each halving of k multiplies the counts by the same
+            # factor as the last one
+            if len(samples) >= 2:
+                growth = [a / float(max(b, 1)) for a, b in zip(*samples[-1:-3:-1])]
+            else:
+                growth = [2**instance.ndims] * 3
+            steps = (2 * k).bit_length() - 1
+            states, vertices, lifts = [
+                value * g**steps for value, g in zip(samples[-1], growth)
+            ]
+            states = min(states, bound["states"])
+            vertices = min(vertices, bound["vertices"])
+        return {
+            "states": int(states),
+            "vertices": int(vertices),
+            "memory": (states * memo_bytes + lifts * lift_bytes) / float(1 << 20),
+        }
+
+    @staticmethod
+    def build_graph(
+        instance,
+        method=-3,
+        verbose=None,
+        threads=None,
+        max_states=None,
+        max_memory=None,
+    ):
+        """Build the arc-flow graph of an instance in-process.
+
+        Returns (NV, S, Ts, LOSS, arcs) where arcs is a flat integer array
+        of (u, v, label) triples in .afg order. The graph is built with
+        threads threads and a budget of max_states states and max_memory MB
+        (see VPSolver.build_opts); BudgetExceeded is raised past the budget.
+        The construction log is written to sys.stdout if verbose and is
+        returned by VPSolver.build_log. The GIL is released during the build.
+        """
+        assert isinstance(instance, (VBP, MVP))
+        swig_build = VPSolver.native_builder()
+        if swig_build is None:
+            raise RuntimeError("the '_vbp2afg' extension is not available")
+        import _vbp2afg
+
+        if verbose is None:
+            verbose = VPSolver.VERBOSE
+        if threads is None:
+            threads = VPSolver.THREADS
+        if max_states is None:
+            max_states = VPSolver.MAX_STATES
+        if max_memory is None:
+            max_memory = VPSolver.MAX_MEMORY
+        try:
+            data = swig_build(
+                instance.mvp_data(),
+                method,
+                int(instance.binary),
+                instance.vtype,
+                True,
+                threads,
+                max_states,
+                max_memory,
+            )
+        except _vbp2afg.BudgetExceeded as e:
+            raise BudgetExceeded(str(e))
+        finally:
+            if verbose:
+                sys.stdout.write(VPSolver.build_log())
+        data = array.array("i", data)
+        NV, NA, S, LOSS, nbtypes = data[:5]
+        Ts = data[5 : 5 + nbtypes].tolist()
+        arcs = data[5 + nbtypes :]
+        assert len(arcs) == 3 * NA
+        return NV, S, Ts, LOSS, arcs
+
+    @staticmethod
+    def vbp2afg(
+        instance_file,
+        afg_file,
+        opts="",
+        verbose=None,
+        max_states=None,
+        max_memory=None,
+        stats_file=None,
+        method=-3,
+    ):
+        """Call 'vbp2afg' to create an arc-flow graph for a .vbp instance.
+
+        With max_states/max_memory, the build stops with BudgetExceeded once
+        it goes past that many states or MB (see VPSolver.build_opts). With
+        stats_file, the build statistics are written there (see
+        VPSolver.read_stats).
+        """
+        instance = instance_file
+        if isinstance(instance, (VBP, MVP)):
+            instance_file = instance.filename
+        else:
+            instance = None
+        if (
+            max_states is not None
+            or max_memory is not None
+            or stats_file
+            or method != -3
+        ):
+            assert opts == ""
+            opts = VPSolver.build_opts(
+                instance,
+                max_states=max_states,
+                max_memory=max_memory,
+                stats_file=stats_file,
+                method=method,
+            )
+        output = VPSolver.run(
             "{} {} {} {}".format(VPSolver.VBP2AFG_EXEC, instance_file, afg_file, opts),
-            tee=out_file,
             verbose=verbose,
         )
-        output = utils.get_content(out_file)
-        os.remove(out_file)
         return output
 
+    @staticmethod
+    def vbp2model(instance_file, model_file, afg_file=None, opts="", verbose=None):
+        """Call 'vbp2model' to create a .mps/.lp model (and optionally the
+        arc-flow graph) for an instance without writing the graph first."""
+        instance = instance_file
+        if isinstance(instance, (VBP, MVP)):
+            instance_file = instance.filename
+        if afg_file is None:
+            afg_file = "-"
+        return VPSolver.run(
+            "{} {} {} {} {}".format(
+                VPSolver.VBP2MODEL_EXEC, instance_file, model_file, afg_file, opts
+            ),
+            verbose=verbose,
+        )
+
     @staticmethod
     def afg2mps(afg_file, mps_file, opts="", verbose=None):
         """Call 'afg2mps' to create a .mps model for an arc-flow graph."""
-        if isinstance(afg_file, AFG):
-            afg_file = afg_file.filename
-        out_file = VPSolver.new_tmp_file()
-        VPSolver.run(
+        graph = afg_file
+        if isinstance(graph, AFG):
+            afg_file = graph.filename
+        output = VPSolver.run(
             "{} {} {} {}".format(VPSolver.AFG2MPS_EXEC, afg_file, mps_file, opts),
-            tee=out_file,
             verbose=verbose,
         )
-        output = utils.get_content(out_file)
-        os.remove(out_file)
         return output
 
     @staticmethod
     def afg2lp(afg_file, lp_file, opts="", verbose=None):
         """Call 'afg2lp' to create a .lp model for an arc-flow graph."""
-        if isinstance(afg_file, AFG):
-            afg_file = afg_file.filename
-        out_file = VPSolver.new_tmp_file()
-        VPSolver.run(
+        graph = afg_file
+        if isinstance(graph, AFG):
+            afg_file = graph.filename
+        output = VPSolver.run(
             "{} {} {} {}".format(VPSolver.AFG2LP_EXEC, afg_file, lp_file, opts),
-            tee=out_file,
             verbose=verbose,
         )
-        output = utils.get_content(out_file)
-        os.remove(out_file)
         return output
 
     @staticmethod
     def afg2svg(afg_file, svg_file, verbose=None):
-        """Draw a .afg arc-flow graph in .svg format."""
-        if isinstance(afg_file, AFG):
-            afg_file = afg_file.filename
+        """Draw a .afg/.afgb arc-flow graph in .svg format."""
+        graph = afg_file
+        if isinstance(graph, AFG):
+            afg_file = graph.filename
         AFG.from_file(afg_file).draw(svg_file)
 
     @staticmethod
     def script(
-        script_name, arg1=None, arg2=None, options=None, pyout=True, verbose=None
+        script_name,
+        arg1=None,
+        arg2=None,
+        options=None,
+        pyout=True,
+        verbose=None,
+        sinks=None,
     ):
         """Call a VPSolver script and return a vector packing solution."""
         cmd = script_name
@@ -527,7 +1230,7 @@ class VPSolver(object):
                     cmd += " --mps {}".format(arg)
                 elif arg.endswith(".lp"):
                     cmd += " --lp {}".format(arg)
-                elif arg.endswith(".afg"):
+                elif arg.endswith((".afg", ".afgb")):
                     cmd += " --afg {}".format(arg)
                 elif arg.endswith(".vbp"):
                     cmd += " --vbp {}".format(arg)
@@ -538,12 +1241,12 @@ class VPSolver(object):
         if options is not None:
             cmd += ' --options "{}"'.format(options)
         if pyout is True:
-            cmd += " --pyout"
-        out_file = VPSolver.new_tmp_file()
-        VPSolver.run(cmd, tee=out_file, verbose=verbose)
-        output = utils.get_content(out_file)
-        os.remove(out_file)
-        return output, VPSolver.parse_vbpsol(output)
+            pysol_file = VPSolver.new_tmp_file(".sol")
+            cmd += " --pysol {}".format(pysol_file)
+        output = VPSolver.run(cmd, verbose=verbose, sinks=sinks)
+        if pyout is True:
+            return output, VPSolver.read_solution(pysol_file)
+        return output, None
 
     @staticmethod
     def script_wsol(script_name, model, options=None, verbose=None):
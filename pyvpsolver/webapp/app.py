@@ -13,7 +13,7 @@ import signal
 from flask import Flask, Response
 from flask import render_template, json, request, redirect, url_for
 from multiprocessing import Process
-from pyvpsolver import VPSolver, VBP, MVP, AFG, LP
+from pyvpsolver import VPSolver, Session, VBP, MVP, AFG, LP
 from pympl import PyMPL
 
 DEBUG = False
@@ -143,15 +143,11 @@ def mvp(example):
 
 def solve_worker(app_name, method, form, args, output=sys.stdout):
     """Worker for solving the problem in a separate process."""
-    VPSolver.PLIST = []
+    session = Session()
 
     def signal_handler(sig, frame):
         """Signal handler for cleaner exit."""
-        for p in VPSolver.PLIST:
-            try:
-                os.killpg(p.pid, signal.SIGTERM)
-            except Exception as e:
-                pass
+        session.clear()
         sys.exit(0)
 
     signal.signal(signal.SIGTERM, signal_handler)
@@ -163,26 +159,27 @@ def solve_worker(app_name, method, form, args, output=sys.stdout):
         print("Input:\n{0}\n\nOutput:".format(input_))
         output.flush()
 
-    if app_name == "vbp":
-        tmpfile = VPSolver.new_tmp_file(ext=".vbp")
-        with open(tmpfile, "w") as f:
-            f.write(input_)
-        instance = VBP.from_file(tmpfile, verbose=False)
-        afg = AFG(instance, verbose=True)
-        lp_model = LP(afg, verbose=False)
-        out, sol = VPSolver.script(
-            form["script"], lp_model, afg, pyout=False, verbose=True
-        )
-    elif app_name == "mvp":
-        tmpfile = VPSolver.new_tmp_file(ext=".mvp")
-        with open(tmpfile, "w") as f:
-            f.write(input_)
-        instance = MVP.from_file(tmpfile, verbose=False)
-        afg = AFG(instance, verbose=True)
-        lp_model = LP(afg, verbose=False)
-        out, sol = VPSolver.script(
-            form["script"], lp_model, afg, pyout=False, verbose=True
-        )
+    with session:
+        if app_name == "vbp":
+            tmpfile = VPSolver.new_tmp_file(ext=".vbp")
+            with open(tmpfile, "w") as f:
+                f.write(input_)
+            instance = VBP.from_file(tmpfile, verbose=False)
+            afg = AFG(instance, verbose=True)
+            lp_model = LP(afg, verbose=False)
+            out, sol = VPSolver.script(
+                form["script"], lp_model, afg, pyout=False, verbose=True
+            )
+        elif app_name == "mvp":
+            tmpfile = VPSolver.new_tmp_file(ext=".mvp")
+            with open(tmpfile, "w") as f:
+                f.write(input_)
+            instance = MVP.from_file(tmpfile, verbose=False)
+            afg = AFG(instance, verbose=True)
+            lp_model = LP(afg, verbose=False)
+            out, sol = VPSolver.script(
+                form["script"], lp_model, afg, pyout=False, verbose=True
+            )
 
     print("EOF\n")
     output.flush()
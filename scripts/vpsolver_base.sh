@@ -12,6 +12,7 @@ init_vars() {
     afg_file=""
     sol_file=""
     vbpsol_opts=""
+    pysol_file=""
     solver=""
     options=""
 }
@@ -20,9 +21,9 @@ usage(){
     basename=`basename $0`
     echo -e "Usage:"
     echo -e "  $basename --vbp/--mvp instance.vbp/.mvp"
-    echo -e "  $basename --afg graph.afg"
+    echo -e "  $basename --afg graph.afg[b]"
     echo -e "  $basename --mps/--lp model.mps/.lp"
-    echo -e "  $basename --mps/--lp model.mps/.lp --afg graph.afg"
+    echo -e "  $basename --mps/--lp model.mps/.lp --afg graph.afg[b]"
 }
 
 error(){
@@ -53,7 +54,7 @@ parse_args(){
             shift 2;;
 
         --afg)
-            if [[ -z "$afg_file" && -n "$2" && -e "$2" && "$2" =~ \.afg$ ]]; then
+            if [[ -z "$afg_file" && -n "$2" && -e "$2" && "$2" =~ \.afgb?$ ]]; then
                 afg_file=$2
             else
                 error
@@ -92,6 +93,14 @@ parse_args(){
             fi
             shift 1;;
 
+        --pysol)
+            if [[ -z "$pysol_file" && -n "$2" ]]; then
+                pysol_file=$2
+            else
+                error
+            fi
+            shift 2;;
+
         --solver)
             if [[ -n "$2" ]]; then
                 solver=$2
@@ -128,17 +137,14 @@ generate_model(){
             error
         fi
 
-        afg_file=$TMP_DIR/graph.afg
+        afg_file=$TMP_DIR/graph.afgb
         model_file=$TMP_DIR/model.mps
 
-        echo -e "\n>>> vbp2afg..."
-        vbp2afg $instance_file $afg_file &
+        echo -e "\n>>> vbp2model..."
+        vbp2model $instance_file $model_file $afg_file &
         pid=$!
         trap "kill $pid &> /dev/null" SIGHUP SIGINT SIGTERM
         wait $pid
-
-        echo -e "\n>>> afg2mps..."
-        afg2mps $afg_file $model_file
     elif [[ -n "$afg_file" ]]; then
         if [[ -n "$instance_file" ]]; then
             error
@@ -163,7 +169,7 @@ generate_ampl_model(){
             error
         fi
 
-        afg_file=$TMP_DIR/graph.afg
+        afg_file=$TMP_DIR/graph.afgb
         model_file=$TMP_DIR/arcflow.mod
         data_file=$TMP_DIR/arcflow.dat
 
@@ -193,7 +199,11 @@ generate_ampl_model(){
 extract_solution() {
     if [[ -n "$afg_file" && -z "$sol_file" ]]; then
         echo -e "\n>>> vbpsol..."
-        vbpsol $afg_file $TMP_DIR/vars.sol $vbpsol_opts
+        if [[ -n "$pysol_file" ]]; then
+            vbpsol $afg_file $TMP_DIR/vars.sol ${vbpsol_opts:-0 0} $pysol_file
+        else
+            vbpsol $afg_file $TMP_DIR/vars.sol $vbpsol_opts
+        fi
     fi
 
     if [[ -n "$sol_file" ]]; then
@@ -63,12 +63,21 @@ def compile_args():
             '-Wno-catch-value',
             '-Wno-unused-variable',
         ]
-        return ['-std=c++11', '-O2'] + ignore_warnings
+        return ['-std=c++11', '-O2', '-pthread'] + ignore_warnings
     elif OSTYPE == 'Darwin':
         ignore_warnings = [
             '-Wno-unused-variable',
         ]
-        return ['-std=c++11', '-O2', '-mmacosx-version-min=10.9'] + ignore_warnings
+        return [
+            '-std=c++11', '-O2', '-pthread', '-mmacosx-version-min=10.9'
+        ] + ignore_warnings
+    else:
+        return []
+
+
+def link_args():
+    if OSTYPE in ('Linux', 'Darwin'):
+        return ['-pthread']
     else:
         return []
 
@@ -81,6 +90,7 @@ _vbp2afg = Extension(
         "src/arcflow.cpp", "src/common.cpp"
     ],
     extra_compile_args=compile_args(),
+    extra_link_args=link_args(),
     undef_macros=['NDEBUG'],
 )
 
@@ -92,6 +102,7 @@ _afg2ampl = Extension(
         "src/arcflow.cpp", "src/common.cpp"
     ],
     extra_compile_args=compile_args(),
+    extra_link_args=link_args(),
     undef_macros=['NDEBUG'],
 )
 
@@ -100,9 +111,11 @@ _afg2lp = Extension(
     sources=[
         "swig/afg2lp_wrap.cxx", "src/afg2lp.cpp",
         "src/instance.cpp", "src/graph.cpp",
-        "src/arcflow.cpp", "src/common.cpp"
+        "src/arcflow.cpp", "src/model.cpp",
+        "src/common.cpp"
     ],
     extra_compile_args=compile_args(),
+    extra_link_args=link_args(),
     undef_macros=['NDEBUG'],
 )
 
@@ -111,9 +124,24 @@ _afg2mps = Extension(
     sources=[
         "swig/afg2mps_wrap.cxx", "src/afg2mps.cpp",
         "src/instance.cpp", "src/graph.cpp",
-        "src/arcflow.cpp", "src/common.cpp"
+        "src/arcflow.cpp", "src/model.cpp",
+        "src/common.cpp"
+    ],
+    extra_compile_args=compile_args(),
+    extra_link_args=link_args(),
+    undef_macros=['NDEBUG'],
+)
+
+_vbp2model = Extension(
+    "_vbp2model",
+    sources=[
+        "swig/vbp2model_wrap.cxx", "src/vbp2model.cpp",
+        "src/instance.cpp", "src/graph.cpp",
+        "src/arcflow.cpp", "src/model.cpp",
+        "src/common.cpp"
     ],
     extra_compile_args=compile_args(),
+    extra_link_args=link_args(),
     undef_macros=['NDEBUG'],
 )
 
@@ -126,6 +154,7 @@ _vbpsol = Extension(
         "src/common.cpp"
     ],
     extra_compile_args=compile_args(),
+    extra_link_args=link_args(),
     undef_macros=['NDEBUG'],
 )
 
@@ -158,5 +187,5 @@ setup(
         "License :: OSI Approved :: BSD License",
         "Topic :: Scientific/Engineering"
     ],
-    ext_modules=[_vbp2afg, _afg2ampl, _afg2lp, _afg2mps, _vbpsol],
+    ext_modules=[_vbp2afg, _afg2ampl, _afg2lp, _afg2mps, _vbp2model, _vbpsol],
 )
@@ -11,11 +11,12 @@ int swig_main(int argc, char **argv) {
 	printf(PACKAGE_STRING", Copyright (C) 2013-2022, Filipe Brandao\n");
 	setvbuf(stdout, NULL, _IONBF, 0);
 	if (argc != 4) {
-		printf("Usage: afg2ampl graph.afg model.mod data.dat\n");
+		printf("Usage: afg2ampl graph.afg[b] model.mod data.dat\n");
 		return 1;
 	}
 	try {
-		throw_assert(check_ext(argv[1], ".afg"));
+		throw_assert(check_ext(argv[1], ".afg") ||
+					 check_ext(argv[1], ".afgb"));
 		Arcflow afg(argv[1]);
 		Instance &inst = afg.inst;
 
@@ -136,7 +137,8 @@ int swig_main(int argc, char **argv) {
 		fprintf(fdat, ";\n");
 
 		fprintf(fdat, "set A :=");
-		for (const Arc &a : afg.A) {
+		for (int i = 0; i < afg.NA; i++) {
+			const Arc &a = afg.arc(i);
 			fprintf(fdat, " (%d, %d, %d)", a.u, a.v, a.label);
 		}
 		fprintf(fdat, ";\n");
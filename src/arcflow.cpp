@@ -2,19 +2,48 @@
 This code is part of the Arc-flow Vector Packing Solver (VPSolver).
 **/
 #include <climits>
+#include <cstdarg>
+#include <cstring>
+#include <string>
+#include <cstddef>
 #include <ctime>
-#include <set>
-#include <map>
 #include <vector>
 #include <algorithm>
+#include <exception>
+#include <mutex>
+#include <thread>
 #include "graph.hpp"
 #include "common.hpp"
 #include "arcflow.hpp"
 
+/* Class BudgetExceeded */
+
+static std::string budget_message(long long states, long long limit,
+								  const char *unit) {
+	char msg[MAX_LEN];
+	snprintf(msg, MAX_LEN,
+			 "BudgetExceeded: the construction reached %lld states (limit: %lld %s)",
+			 states, limit, unit);
+	return msg;
+}
+
+BudgetExceeded::BudgetExceeded(long long _states, long long limit, const char *unit):
+	std::runtime_error(budget_message(_states, limit, unit)), states(_states) {}
+
 /* Class Arcflow */
 
-Arcflow::Arcflow(const Instance &_inst) {
+Arcflow::Arcflow(const Instance &_inst, bool _verbose, int _threads,
+				 long long _max_states, long long _max_memory,
+				 std::string *_log_output) {
 	ready = false;
+	verbose = _verbose;
+	log_output = _log_output;
+	threads = std::max(_threads, 1);
+	max_states = _max_states;
+	max_memory = _max_memory;
+	ndp = 0;
+	lift_hits = lift_misses = 0;
+	mapped_arcs = NULL;
 	tstart = CURTIME;
 	init(_inst);
 	throw_assert(ready == true);
@@ -22,6 +51,13 @@ Arcflow::Arcflow(const Instance &_inst) {
 
 Arcflow::Arcflow(const char *fname) {
 	ready = false;
+	verbose = true;
+	log_output = NULL;
+	threads = 1;
+	max_states = max_memory = 0;
+	ndp = 0;
+	lift_hits = lift_misses = 0;
+	mapped_arcs = NULL;
 	tstart = CURTIME;
 	init(fname);
 	throw_assert(ready == true);
@@ -64,6 +100,7 @@ void Arcflow::init(const Instance &_inst) {
 
 	max_rep = count_max_rep(maxW, 0, 0);
 
+	int key_bits = 0;
 	for (int i = 0; i < static_cast<int>(max_state.size()); i++) {
 		int nbits = 0, value = max_state[i];
 		while (value) {
@@ -71,26 +108,51 @@ void Arcflow::init(const Instance &_inst) {
 			value >>= 1;
 		}
 		hash_bits.push_back(nbits);
+		key_bits += nbits;
 	}
+	int word_bits = sizeof(int) * 8;
+	key_words = (key_bits + word_bits - 1) / word_bits;
+
+	// Memory charged against max_memory: a memo entry (key, slot and value)
+	// plus about two arcs of 12 bytes per dp state, and a lift cache entry
+	// (key, slot and lifted dimensions) per lifted state.
+	memo_bytes = sizeof(int) * (key_words + 3) + 2 * sizeof(Arc);
+	lift_bytes = sizeof(int) * (key_words + inst.ndims + 2);
 
-	printf("Build (method = %d)\n", inst.method);
+	if (verbose) {
+		print("Build (method = %d)\n", inst.method);
+		if (max_states > 0) {
+			print("  Budget: %lld states\n", max_states);
+		}
+		if (max_memory > 0) {
+			print("  Budget: %lld MB\n", max_memory >> 20);
+		}
+	}
 	throw_assert(inst.method >= MIN_METHOD && inst.method <= MAX_METHOD);
 
+	Stopwatch sw;
 	build();  // build step-3' graph
+	add_phase("build", sw, NS.size(), A.size());
 	int nv1 = NS.size() + inst.nbtypes;
 	int na1 = A.size() + (NS.size() - 1) * inst.nbtypes + 1;
-	printf("  Step-3' Graph: %d vertices and %d arcs (%.2fs)\n",
-		   nv1, na1, TIMEDIF(tstart));
+	if (verbose) {
+		print("  Step-3' Graph: %d vertices and %d arcs (%.2fs)\n",
+			  nv1, na1, TIMEDIF(tstart));
+	}
 
+	sw = Stopwatch();
 	final_compression_step();  // create step-4' graph
+	add_phase("final_compression_step", sw, NS.size(), A.size());
 	finalize();  // add the final loss arcs
 	int nv2 = NS.size() + Ts.size();
 	int na2 = A.size();
-	printf("  Step-4' Graph: %d vertices and %d arcs (%.2fs)\n",
-		   nv2, na2, TIMEDIF(tstart));
-	printf("  #V4/#V3 = %.2f\n", nv2 / static_cast<double>(nv1));
-	printf("  #A4/#A3 = %.2f\n", na2 / static_cast<double>(na1));
-	printf("Ready! (%.2fs)\n", TIMEDIF(tstart));
+	if (verbose) {
+		print("  Step-4' Graph: %d vertices and %d arcs (%.2fs)\n",
+			  nv2, na2, TIMEDIF(tstart));
+		print("  #V4/#V3 = %.2f\n", nv2 / static_cast<double>(nv1));
+		print("  #A4/#A3 = %.2f\n", na2 / static_cast<double>(na1));
+		print("Ready! (%.2fs)\n", TIMEDIF(tstart));
+	}
 	throw_assert(ready == true);
 }
 
@@ -102,6 +164,8 @@ void Arcflow::init(const char *fname) {
 		init(Instance(fname));
 	} else if (check_ext(fname, ".afg")) {
 		read(fname);
+	} else if (check_ext(fname, ".afgb")) {
+		read_binary(fname);
 	} else {
 		throw_error("Invalid file extension");
 	}
@@ -127,51 +191,66 @@ bool Arcflow::is_full(const std::vector<int> &u, const std::vector<int> &W) cons
 }
 
 void Arcflow::relabel_graph(const std::vector<int> &labels) {
-	std::set<Arc> arcs;
+	int na = 0;
 	for (const Arc &a : A) {
 		int u = labels[a.u];
 		int v = labels[a.v];
 		if (u != v) {
-			arcs.insert(Arc(u, v, a.label));
+			A[na++] = Arc(u, v, a.label);
 		}
 	}
-	A.assign(all(arcs));
+	A.resize(na);
+	sort(all(A));
+	A.erase(unique(all(A)), A.end());
+	A.shrink_to_fit();
 }
 
 std::vector<int> Arcflow::count_max_rep(const std::vector<int> &space, int i0 = 0,
 										int sub_i0 = 0) const {
-	std::vector<int> r(inst.nsizes);
+	std::vector<int> r;
+	count_max_rep(space, i0, sub_i0, &r);
+	return r;
+}
+
+void Arcflow::count_max_rep(const std::vector<int> &space, int i0, int sub_i0,
+							std::vector<int> *r) const {
+	r->assign(inst.nsizes, 0);
 	for (int i = i0; i < inst.nsizes; i++) {
 		int dem = inst.binary ? 1 : sitems[i].demand;
-		r[i] = i != i0 ? dem : std::max(0, dem - sub_i0);
+		int &ri = (*r)[i];
+		ri = i != i0 ? dem : std::max(0, dem - sub_i0);
 		for (int d : sitems[i].nonzero) {
-			r[i] = std::min(r[i], space[d] / weights[i][d]);
-			if (!r[i]) {
+			ri = std::min(ri, space[d] / weights[i][d]);
+			if (!ri) {
 				break;
 			}
 		}
 	}
-	return r;
 }
 
 int Arcflow::min_slack(const std::vector<int> &b, int i0, int d,
-					   const std::vector<int> &caps) const {
+					   const std::vector<int> &caps, Worker *wk) const {
 	int C = caps.back();
 	if (C == 0) {
 		return 0;
 	}
-	std::vector<int> Q;
-	std::vector<bool> vis(C + 1);
+	// vis is all false between calls: only the positions in Q are reset
+	std::vector<int> &Q = wk->queue;
+	std::vector<char> &vis = wk->vis;
+	if (static_cast<int>(vis.size()) <= C) {
+		vis.resize(C + 1, false);
+	}
+	Q.assign(1, 0);
 	vis[0] = true;
-	Q.push_back(0);
 	int res = 0;
-	for (int i = i0; i < inst.nsizes; i++) {
+	bool exact = false;
+	for (int i = i0; i < inst.nsizes && !exact; i++) {
 		const int &w = weights[i][d];
 		if (!w) {
 			continue;
 		}
 		int qs = Q.size();
-		for (int j = 0; j < qs; j++) {
+		for (int j = 0; j < qs && !exact; j++) {
 			int u = Q[j];
 			int v = u;
 			for (int k = 1; k <= b[i]; k++) {
@@ -179,7 +258,8 @@ int Arcflow::min_slack(const std::vector<int> &b, int i0, int d,
 				if (v > C) {
 					break;
 				} else if (v == C) {
-					return 0;
+					exact = true;
+					break;
 				} else if (vis[v]) {
 					break;
 				}
@@ -191,10 +271,13 @@ int Arcflow::min_slack(const std::vector<int> &b, int i0, int d,
 			vis[Q[j]] = true;
 		}
 	}
-	if (res <= caps[0]) {
-		return caps[0] - res;
+	int mslack;
+	if (exact) {
+		mslack = 0;
+	} else if (res <= caps[0]) {
+		mslack = caps[0] - res;
 	} else {
-		int mslack = C - res;
+		mslack = C - res;
 		for (int cap : caps) {
 			int p = cap;
 			while (!vis[p] && cap - p <= mslack) {
@@ -202,20 +285,25 @@ int Arcflow::min_slack(const std::vector<int> &b, int i0, int d,
 			}
 			mslack = std::min(mslack, cap - p);
 		}
-		return mslack;
 	}
+	for (int v : Q) {
+		vis[v] = false;
+	}
+	return mslack;
 }
 
 void Arcflow::lift_state(const std::vector<int> &valid_opts, std::vector<int> &u, int it,
-						 int ic) const {
+						 int ic, Worker *wk) const {
 	if (it >= inst.nsizes) {
 		return;
 	}
-	std::vector<int> space(inst.ndims);
+	std::vector<int> &space = wk->space;
+	space.resize(inst.ndims);
 	for (int d = 0; d < inst.ndims; d++) {
 		space[d] = maxW[d] - u[d];
 	}
-	const std::vector<int> &r = count_max_rep(space, it, ic);
+	count_max_rep(space, it, ic, &wk->reps);
+	const std::vector<int> &r = wk->reps;
 	for (int d = 0; d < inst.ndims; d++) {
 		int minw = maxW[d];
 		for (int t : valid_opts) {
@@ -231,7 +319,8 @@ void Arcflow::lift_state(const std::vector<int> &valid_opts, std::vector<int> &u
 				u[d] = maxpos;
 			} else {
 				// lift method 2
-				std::vector<int> caps;
+				std::vector<int> &caps = wk->caps;
+				caps.clear();
 				for (int t : valid_opts) {
 					caps.push_back(inst.Ws[t][d] - u[d]);
 				}
@@ -239,24 +328,48 @@ void Arcflow::lift_state(const std::vector<int> &valid_opts, std::vector<int> &u
 					sort(all(caps));
 					caps.erase(unique(all(caps)), caps.end());
 				}
-				u[d] += min_slack(r, it, d, caps);
+				u[d] += min_slack(r, it, d, caps, wk);
 			}
 		}
 	}
 }
 
-inline std::vector<int> Arcflow::hash(const std::vector<int> &su) {
-	static int last_size = 1;
-	std::vector<int> h;
-	h.reserve(last_size);
-	int *p = NULL, dst_bits = 0;
+void Arcflow::lift_cached(const std::vector<int> &valid_opts, std::vector<int> &u,
+						  int it, int ic, Worker *wk) const {
+	// The lifted state depends only on the state itself (valid_opts is a
+	// function of u), so the unlifted state is the cache key.
+	if (it >= inst.nsizes) {
+		return;
+	}
+	StateIndex &lifts = wk->lifts;
+	if (lifts.size() == 0 && lifts.key_width() != key_words) {
+		lifts.clear(key_words);
+	}
+	const int *key = hash(u, wk);
+	int ind = lifts.find(key);
+	if (ind != -1) {
+		wk->lift_hits++;
+		const int *lifted = &wk->lifted[static_cast<size_t>(ind) * inst.ndims];
+		std::copy(lifted, lifted + inst.ndims, u.begin());
+		return;
+	}
+	wk->lift_misses++;
+	lifts.insert(key);
+	charge(lift_bytes);
+	lift_state(valid_opts, u, it, ic, wk);
+	wk->lifted.insert(wk->lifted.end(), u.begin(), u.begin() + inst.ndims);
+}
+
+inline const int *Arcflow::hash(const std::vector<int> &su, Worker *wk) const {
+	std::vector<int> &key = wk->key;
+	key.assign(key_words, 0);
+	int *p = key.data() - 1, dst_bits = 0;
 	for (int i = 0; i < static_cast<int>(su.size()); i++) {
 		int x = su[i];
 		int src_bits = hash_bits[i];
 		while (src_bits != 0) {
 			if (dst_bits == 0) {
-				h.push_back(0);
-				p = &h.back();
+				p++;
 				dst_bits = sizeof(int) * 8;
 			}
 			int window_width = std::min(src_bits, dst_bits);
@@ -267,11 +380,122 @@ inline std::vector<int> Arcflow::hash(const std::vector<int> &su) {
 			dst_bits -= window_width;
 		}
 	}
-	last_size = h.size();
-	return h;
+	return key.data();
+}
+
+static inline int shard_of(const int *key, int nwords, int nshards) {
+	unsigned h = 0;
+	for (int i = 0; i < nwords; i++) {
+		h = (h ^ static_cast<unsigned>(key[i])) * 0x9e3779b1u;
+	}
+	return (h >> 16) & (nshards - 1);
+}
+
+int Arcflow::find_state(const std::vector<int> &su, Worker *wk) {
+	const int *key = hash(su, wk);
+	if (threads == 1) {
+		return dp[0].find(key);
+	}
+	int i = shard_of(key, key_words, dp.size());
+	std::lock_guard<std::mutex> lock(dp_locks[i]);
+	return dp[i].find(key);
+}
+
+int Arcflow::memoize(const std::vector<int> &su, int value, Worker *wk) {
+	const int *key = hash(su, wk);
+	Memo *memo = &dp[0];
+	std::unique_lock<std::mutex> lock;
+	if (threads > 1) {
+		int i = shard_of(key, key_words, dp.size());
+		memo = &dp[i];
+		lock = std::unique_lock<std::mutex>(dp_locks[i]);
+	}
+	int nvalues = memo->values.size();
+	value = memo->insert(key, value);
+	if ((max_states > 0 || max_memory > 0) &&
+		static_cast<int>(memo->values.size()) != nvalues) {
+		long long n = ++nstates;
+		if (max_states > 0 && n > max_states) {
+			throw BudgetExceeded(n, max_states);
+		}
+		charge(memo_bytes);
+	}
+	return value;
+}
+
+void Arcflow::print(const char *fmt, ...) const {
+	// the build log goes to stdout or, if given, to log_output
+	va_list args;
+	va_start(args, fmt);
+	if (log_output == NULL) {
+		vprintf(fmt, args);
+	} else {
+		char buf[MAX_LEN];
+		vsnprintf(buf, MAX_LEN, fmt, args);
+		*log_output += buf;
+	}
+	va_end(args);
+}
+
+void Arcflow::charge(long long bytes) const {
+	if (max_memory > 0 && (used_memory += bytes) > max_memory) {
+		throw BudgetExceeded(nstates, max_memory >> 20, "MB");
+	}
 }
 
-int Arcflow::go(std::vector<int> su) {
+void Arcflow::LabelTable::reset(int _width) {
+	width = _width;
+	blocks.reset(new std::atomic<int *>[(INT_MAX >> BLOCK_BITS) + 1]());
+	std::vector<std::unique_ptr<int[]>>().swap(owned);
+}
+
+void Arcflow::LabelTable::set(int ind, const int *lbl) {
+	// called with ns_lock held, before ind is visible to other threads
+	std::atomic<int *> &block = blocks[ind >> BLOCK_BITS];
+	if (block.load(std::memory_order_relaxed) == NULL) {
+		owned.emplace_back(new int[static_cast<size_t>(width) << BLOCK_BITS]);
+		block.store(owned.back().get(), std::memory_order_release);
+	}
+	int *dst = block.load(std::memory_order_relaxed) +
+			   static_cast<size_t>(ind & ((1 << BLOCK_BITS) - 1)) * width;
+	std::copy(lbl, lbl + width, dst);
+}
+
+int Arcflow::node_index(const std::vector<int> &lbl, Worker *wk) {
+	if (threads == 1) {
+		return NS.get_index(lbl);
+	}
+	// most labels repeat, so each worker keeps the indices it has seen and
+	// only takes ns_lock for the labels that are new to it
+	StateIndex &nodes = wk->nodes;
+	if (nodes.size() == 0 && nodes.key_width() != label_size) {
+		nodes.clear(label_size);
+	}
+	int ind = nodes.find(lbl.data());
+	if (ind != -1) {
+		return wk->node_ids[ind];
+	}
+	int iu;
+	{
+		std::lock_guard<std::mutex> lock(ns_lock);
+		int nv = NS.size();
+		iu = NS.get_index(lbl);
+		if (iu == nv) {
+			ns_labels.set(iu, lbl.data());
+		}
+	}
+	nodes.insert(lbl.data());
+	wk->node_ids.push_back(iu);
+	return iu;
+}
+
+void Arcflow::node_label(int ind, std::vector<int> *lbl) const {
+	const int *p = threads == 1 ? NS.label(ind) : ns_labels.get(ind);
+	lbl->assign(p, p + label_size);
+}
+
+int Arcflow::push_state(std::vector<int> su, std::vector<Frame> *stack,
+						Worker *wk) {
 	int it = su[inst.ndims];
 	int ic = inst.binary ? 0 : su[inst.ndims + 1];
 	std::vector<int> valid_opts;
@@ -289,90 +513,255 @@ int Arcflow::go(std::vector<int> su) {
 	if (valid_opts.empty()) {  // if invalid
 		return -1;
 	} else if (is_full(su, maxw)) {  // if full
-		return NS.get_index(mu);
+		return node_index(mu, wk);
 	} else {
-		lift_state(valid_opts, su, it, ic);
+		lift_cached(valid_opts, su, it, ic, wk);
+	}
+
+	int memo = find_state(su, wk);
+	if (memo != -1) {
+		return memo;
+	}
+
+	stack->push_back(Frame());
+	Frame &f = stack->back();
+	f.su.swap(su);
+	f.mu.swap(mu);
+	f.maxw.swap(maxw);
+	f.up = -1;
+	f.stage = 0;
+	return -1;
+}
+
+bool Arcflow::up_state(const Frame &f, std::vector<int> *sv) const {
+	int it = f.su[inst.ndims];
+	if (it + 1 >= inst.nsizes) {
+		return false;
+	}
+	*sv = f.su;
+	(*sv)[inst.ndims] = it + 1;
+	if (!inst.binary) {
+		(*sv)[inst.ndims + 1] = 0;
 	}
+	return true;
+}
 
-	// const vector<int> key(su);
-	const std::vector<int> key(hash(su));
-	std::map<std::vector<int>, int>::iterator itr = dp.find(key);
-	if (itr != dp.end()) {
-		return itr->second;
+bool Arcflow::take_state(const Frame &f, std::vector<int> *sv) const {
+	int it = f.su[inst.ndims];
+	int ic = inst.binary ? 0 : f.su[inst.ndims + 1];
+	if (it >= inst.nsizes || ic >= max_rep[it]) {
+		return false;
+	}
+	*sv = f.su;
+	const std::vector<int> &w = weights[it];
+	for (int d : sitems[it].nonzero) {
+		(*sv)[d] += w[d];
+		if ((*sv)[d] > f.maxw[d]) {  // if invalid
+			return false;
+		}
 	}
 
-	int up = -1;
-	if (it + 1 < inst.nsizes) {
-		std::vector<int> sv(su);
-		sv[inst.ndims] = it + 1;
-		if (!inst.binary) {
-			sv[inst.ndims + 1] = 0;
+	if (inst.binary) {
+		(*sv)[inst.ndims] = it + 1;
+	} else {
+		if (ic + 1 < max_rep[it]) {
+			(*sv)[inst.ndims] = it;
+			(*sv)[inst.ndims + 1] = ic + 1;
+		} else {
+			(*sv)[inst.ndims] = it + 1;
+			(*sv)[inst.ndims + 1] = 0;
 		}
-		up = go(sv);
-		throw_assert(up != -1);
-		mu = NS.get_label(up);
 	}
+	return true;
+}
+
+void Arcflow::set_up(Frame *f, int up) const {
+	f->up = up;
+	throw_assert(f->up != -1);
+	node_label(f->up, &f->mu);
+}
 
-	if (it < inst.nsizes && ic < max_rep[it]) {
-		std::vector<int> sv(su);
+int Arcflow::close_state(const Frame &f, int iv, Worker *wk) {
+	std::vector<int> &mu = wk->mu;
+	mu = f.mu;
+	if (iv != -1) {
+		int it = f.su[inst.ndims];
 		const std::vector<int> &w = weights[it];
-		for (int d : sitems[it].nonzero) {
-			sv[d] += w[d];
-			if (sv[d] > maxw[d]) {  // if invalid
-				return dp[key] = NS.get_index(mu);
-			}
+		std::vector<int> &v = wk->label;
+		node_label(iv, &v);
+		for (int d = 0; d < inst.ndims; d++) {
+			mu[d] = std::min(mu[d], v[d] - w[d]);
 		}
-
 		if (inst.binary) {
-			sv[inst.ndims] = it + 1;
-		} else {
-			if (ic + 1 < max_rep[it]) {
-				sv[inst.ndims] = it;
-				sv[inst.ndims + 1] = ic + 1;
-			} else {
-				sv[inst.ndims] = it + 1;
-				sv[inst.ndims + 1] = 0;
-			}
+			mu[inst.ndims] = std::min(mu[inst.ndims], it + 1);
 		}
+		int iu = node_index(mu, wk);
+		wk->arcs.push_back(Arc(iu, iv, it));
+		if (f.up != -1 && iu != f.up) {
+			wk->arcs.push_back(Arc(iu, f.up, LOSS));
+		}
+	}
+	return memoize(f.su, node_index(mu, wk), wk);
+}
 
-		int iv = go(sv);
+int Arcflow::go(std::vector<int> su, Worker *wk) {
+	// Depth-first search over the states with an explicit stack; each frame
+	// resumes at `stage` with the value of its last child in `ret`:
+	// stage 0: visit the state that skips the current item (`up`);
+	// stage 1: visit the state that takes one more copy of the item;
+	// stage 2: add the arcs and memoize the label of the state.
+	std::vector<Frame> stack;
+	std::vector<int> sv;
+	int ret = push_state(su, &stack, wk);
+	while (!stack.empty()) {
+		Frame &f = stack.back();
+		if (f.stage == 0) {
+			f.stage = 1;
+			if (up_state(f, &sv)) {
+				ret = push_state(sv, &stack, wk);
+				continue;
+			}
+		}
+		if (f.stage == 1) {
+			if (f.su[inst.ndims] + 1 < inst.nsizes) {
+				set_up(&f, ret);
+			}
+			f.stage = 2;
+			if (take_state(f, &sv)) {
+				ret = push_state(sv, &stack, wk);
+				continue;
+			}
+			ret = -1;
+		}
+		ret = close_state(f, ret, wk);
+		stack.pop_back();
+	}
+	return ret;
+}
 
-		if (iv != -1) {
-			const std::vector<int> &v = NS.get_label(iv);
-			for (int d = 0; d < inst.ndims; d++) {
-				mu[d] = std::min(mu[d], v[d] - w[d]);
+void Arcflow::go_parallel(const std::vector<int> &s0) {
+	// Expands the top levels of the search breadth-first until there are
+	// enough subproblems for the workers, and solves them on a pool of
+	// `threads` workers sharing the memo and NS. Every state gets the same
+	// label as in a sequential build, so the final go(s0) only stitches the
+	// memoized subproblems together.
+	Worker wk;
+	std::vector<std::vector<int>> tasks(1, s0), next;
+	std::vector<Frame> stack;
+	std::vector<int> sv;
+	while (static_cast<int>(tasks.size()) < 256 * threads) {
+		next.clear();
+		for (const std::vector<int> &su : tasks) {
+			push_state(su, &stack, &wk);
+			if (stack.empty()) {
+				continue;
 			}
-			if (inst.binary) {
-				mu[inst.ndims] = std::min(mu[inst.ndims], it + 1);
+			if (up_state(stack.back(), &sv)) {
+				next.push_back(sv);
+			}
+			if (take_state(stack.back(), &sv)) {
+				next.push_back(sv);
 			}
-			int iu = NS.get_index(mu);
-			AS.insert(Arc(iu, iv, it));
-			if (up != -1 && iu != up) {
-				AS.insert(Arc(iu, up, LOSS));
+			stack.clear();
+		}
+		if (next.empty()) {
+			break;
+		}
+		sort(all(next));
+		next.erase(unique(all(next)), next.end());
+		tasks.swap(next);
+	}
+	merge_worker(&wk);
+	// deeper subproblems first, so the larger ones find them in the memo
+	int it_pos = inst.ndims;
+	std::stable_sort(all(tasks), [it_pos](const std::vector<int> &a,
+										  const std::vector<int> &b) {
+		return a[it_pos] > b[it_pos];
+	});
+
+	int ntasks = tasks.size();
+	std::atomic<int> next_task(0);
+	std::vector<Worker> workers(threads);
+	std::vector<std::exception_ptr> errors(threads);
+	auto work = [&](int t) {
+		try {
+			for (int i; (i = next_task++) < ntasks;) {
+				go(tasks[i], &workers[t]);
 			}
+		} catch (...) {
+			errors[t] = std::current_exception();
+			next_task = ntasks;
 		}
+	};
+	std::vector<std::thread> pool;
+	for (int t = 1; t < threads; t++) {
+		pool.emplace_back(work, t);
+	}
+	work(0);
+	for (std::thread &th : pool) {
+		th.join();
 	}
+	for (Worker &w : workers) {
+		merge_worker(&w);
+	}
+	for (const std::exception_ptr &e : errors) {
+		if (e) {
+			std::rethrow_exception(e);
+		}
+	}
+}
 
-	return dp[key] = NS.get_index(mu);
+void Arcflow::merge_worker(Worker *wk) {
+	std::lock_guard<std::mutex> lock(arcs_lock);
+	if (A.empty()) {
+		A.swap(wk->arcs);
+	} else {
+		A.insert(A.end(), all(wk->arcs));
+	}
+	std::vector<Arc>().swap(wk->arcs);
+	lift_hits += wk->lift_hits;
+	lift_misses += wk->lift_misses;
 }
 
 void Arcflow::build() {
 	throw_assert(ready == false);
-	dp.clear();
+	int nshards = 1;
+	while (threads > 1 && nshards < 64 * threads) {
+		nshards *= 2;
+	}
+	Memo memo;
+	memo.states.clear(key_words);
+	dp.assign(nshards, memo);
+	dp_locks.reset(new std::mutex[nshards]);
 	A.clear();
 	NS.clear();
+	lift_hits = lift_misses = 0;
+	nstates = 0;
+	used_memory = 0;
 
-	if (inst.binary) {
-		go(std::vector<int>(label_size, 0));
-	} else {
-		go(std::vector<int>(label_size + 2, 0));
+	std::vector<int> s0(inst.binary ? label_size : label_size + 2, 0);
+	Worker wk;
+	if (threads > 1) {
+		ns_labels.reset(label_size);
+		go_parallel(s0);
 	}
+	go(s0, &wk);
+	merge_worker(&wk);
 
-	printf("  #dp: %d\n", static_cast<int>(dp.size()));
+	ndp = 0;
+	for (const Memo &shard : dp) {
+		ndp += shard.states.size();
+	}
+	if (verbose) {
+		print("  #dp: %lld\n", ndp);
+		print("  #lift: %lld hits, %lld misses\n", lift_hits, lift_misses);
+	}
 
-	dp.clear();
-	A.assign(all(AS));
-	AS.clear();
+	std::vector<Memo>().swap(dp);
+	dp_locks.reset();
+	ns_labels = LabelTable();
+	sort(all(A));
+	A.erase(unique(all(A)), A.end());
 
 	relabel_graph(NS.topological_order());
 	NS.sort();
@@ -382,16 +771,32 @@ void Arcflow::final_compression_step() {
 	throw_assert(ready == false);
 	int nv = NS.size();
 	std::vector<int> labels(nv);
-	std::vector<std::vector<int_pair>> adj = get_adj(nv, A, TRANSPOSE);
+	// incoming arcs of each vertex: arcs[first[v]..first[v + 1]) (CSR)
+	std::vector<int> first(nv + 1, 0);
+	for (const Arc &a : A) {
+		throw_assert(a.u < nv && a.v < nv);
+		first[a.v + 1]++;
+	}
+	for (int v = 0; v < nv; v++) {
+		first[v + 1] += first[v];
+	}
+	std::vector<int> pos(first.begin(), first.end() - 1);
+	std::vector<int_pair> radj(A.size());
+	for (const Arc &a : A) {
+		radj[pos[a.v]++] = MP(a.u, a.label);
+	}
+	std::vector<int>().swap(pos);
 
 	NodeSet NStmp;
+	std::vector<int> lbl(label_size);
 	for (int u = 0; u < NS.size(); u++) {
-		std::vector<int> lbl(label_size, 0);
-		for (const auto &pa : adj[u]) {
+		std::fill(all(lbl), 0);
+		for (int j = first[u]; j < first[u + 1]; j++) {
+			const int_pair &pa = radj[j];
 			throw_assert(pa.first < u);
 			int v = labels[pa.first];
 			int it = pa.second;
-			const std::vector<int> &lv = NStmp.get_label(v);
+			const int *lv = NStmp.label(v);
 			for (int d = 0; d < inst.ndims; d++) {
 				lbl[d] = std::max(lbl[d], lv[d] + weights[it][d]);
 			}
@@ -408,7 +813,8 @@ void Arcflow::final_compression_step() {
 		labels[u] = NStmp.get_index(lbl);
 	}
 
-	NS = NStmp;
+	std::vector<int_pair>().swap(radj);
+	NS = std::move(NStmp);
 	std::vector<int> order = NS.topological_order();
 	for (int &v : labels) {
 		v = order[v];
@@ -439,6 +845,7 @@ void Arcflow::reduce_redundancy() {
 
 void Arcflow::finalize() {
 	throw_assert(ready == false);
+	Stopwatch sw;
 	if (inst.nbtypes == 1) {
 		S = 0;
 		Ts.assign({NS.size()});
@@ -476,8 +883,9 @@ void Arcflow::finalize() {
 		}
 
 		std::vector<bool> valid_tgts(inst.nbtypes);
+		std::vector<int> u;
 		for (int i = 1; i < static_cast<int>(NS.size()); i++) {
-			const std::vector<int> &u = NS.get_label(i);
+			u.assign(NS.label(i), NS.label(i) + NS.label_size());
 			for (int t = 0; t < inst.nbtypes; t++) {
 				valid_tgts[t] = is_valid(u, inst.Ws[t]);
 			}
@@ -514,7 +922,10 @@ void Arcflow::finalize() {
 			}
 		}
 	}
+	add_phase("finalize", sw, NS.size() + Ts.size(), A.size());
+	sw = Stopwatch();
 	reduce_redundancy();
+	add_phase("reduce_redundancy", sw, NS.size() + Ts.size(), A.size());
 	NV = NS.size() + Ts.size();
 	NA = A.size();
 	for (Arc &a : A) {
@@ -525,9 +936,33 @@ void Arcflow::finalize() {
 	ready = true;
 }
 
+void Arcflow::sort_arcs() {
+	throw_assert(ready == true);
+	if (mapped_arcs != NULL) {
+		A.assign(mapped_arcs, mapped_arcs + NA);
+		mapped_arcs = NULL;
+		mapping.reset();
+	}
+	int iS = 0;
+	int lastv = *std::min_element(all(Ts)) - 1;
+	auto group = [iS, lastv](const Arc &a) -> int {
+		if (a.u == iS) {
+			return 1;
+		} else if (a.v > lastv) {
+			return 2;
+		} else {
+			return 0;
+		}
+	};
+	sort(all(A), [&group](const Arc &a, const Arc &b) {
+		int ga = group(a), gb = group(b);
+		return ga < gb || (ga == gb && a < b);
+	});
+}
+
 void Arcflow::write(FILE *fout) {
 	throw_assert(ready == true);
-	sort(all(A));
+	sort_arcs();
 
 	int iS = 0;
 	fprintf(fout, "#GRAPH_BEGIN#\n");
@@ -542,71 +977,178 @@ void Arcflow::write(FILE *fout) {
 
 	fprintf(fout, "$LOSS{%d};\n", LOSS);
 
-	int lastv = NS.size() - 1;
 	fprintf(fout, "$NV{%d};\n", NV);
 	fprintf(fout, "$NA{%d};\n", NA);
 
-	sort(all(A));
 	fprintf(fout, "$ARCS{\n");
-	for (int i = 0; i < 3; i++) {
-		for (const Arc &a : A) {
-			if (i == 1 && a.u != iS) {
-				continue;
-			} else if (i == 2 && a.v <= lastv) {
-				continue;
-			} else if (i == 0 && (a.u == iS || a.v > lastv)) {
-				continue;
-			}
-			if (a.label == LOSS) {
-				fprintf(fout, "%d %d %d\n", a.u, a.v, LOSS);
-			} else {
-				fprintf(fout, "%d %d %d\n", a.u, a.v, a.label);
-			}
-		}
+	for (const Arc &a : A) {
+		fprintf(fout, "%d %d %d\n", a.u, a.v, a.label);
 	}
 	fprintf(fout, "};\n");
 	fprintf(fout, "#GRAPH_END#\n");
 }
 
-void Arcflow::read(FILE *fin) {
+void Arcflow::read(Scanner *in) {
 	throw_assert(ready == false);
 	tstart = CURTIME;
-	inst = Instance(fin);
-	throw_assert(fscanf(fin, " #GRAPH_BEGIN#") == 0);
+	inst = Instance(in);
+	in->match(" #GRAPH_BEGIN#");
 
-	int nbtypes;
-	throw_assert(fscanf(fin, " $NBTYPES { %d } ;", &nbtypes) == 1);
+	in->expect(" $NBTYPES {");
+	int nbtypes = in->next_int();
+	in->match(" } ;");
 	throw_assert(nbtypes == inst.nbtypes);
 
-	throw_assert(fscanf(fin, " $S { %d } ;", &S) == 1);
+	in->expect(" $S {");
+	S = in->next_int();
+	in->match(" } ;");
 
 	Ts.resize(nbtypes);
-	throw_assert(fscanf(fin, " $Ts { ") == 0);
+	in->match(" $Ts { ");
 	for (int i = 0; i < nbtypes; i++) {
-		if (i) throw_assert(fscanf(fin, " ,") == 0);
-		throw_assert(fscanf(fin, "%d", &Ts[i]) == 1);
+		if (i) in->match(" ,");
+		Ts[i] = in->next_int();
+	}
+	in->match(" } ;");
+
+	in->expect(" $LOSS {");
+	LOSS = in->next_int();
+	in->match(" } ;");
+
+	in->expect(" $NV {");
+	NV = in->next_int();
+	in->match(" } ;");
+
+	in->expect(" $NA {");
+	NA = in->next_int();
+	in->match(" } ;");
+
+	in->match(" $ARCS {");
+	A.resize(NA);
+	for (Arc &a : A) {
+		a.u = in->next_int();
+		a.v = in->next_int();
+		a.label = in->next_int();
+	}
+	in->match(" } ;");
+	in->match(" #GRAPH_END#");
+	ready = true;
+}
+
+void Arcflow::write_binary(FILE *fout) {
+	throw_assert(ready == true);
+	static_assert(sizeof(Arc) == 3 * sizeof(int), "Arc must be packed");
+	sort_arcs();
+
+	std::vector<int> header = {AFGB_VERSION, NV, NA, S, LOSS};
+	header.push_back(Ts.size());
+	header.insert(header.end(), all(Ts));
+	std::vector<int> data = inst.data();
+	header.push_back(data.size());
+	header.insert(header.end(), all(data));
+	header.push_back(inst.vtype);
+	header.push_back(inst.method);
+	header.push_back(inst.relax_domains);
+	header.push_back(inst.binary);
+	header.push_back(inst.m);
+	header.insert(header.end(), all(inst.ctypes));
+
+	throw_assert(fwrite("AFGB", 1, 4, fout) == 4);
+	throw_assert(fwrite(header.data(), sizeof(int), header.size(), fout) ==
+				 header.size());
+	throw_assert(fwrite(A.data(), sizeof(Arc), A.size(), fout) == A.size());
+}
+
+void Arcflow::add_phase(const char *name, const Stopwatch &sw, int nv,
+						int na) {
+	PhaseStats ps = {name, sw.wall(), sw.cpu(), nv, na};
+	phases.push_back(ps);
+}
+
+std::string Arcflow::stats() const {
+	// JSON object: {"ndp": ..., "lift_hits": ..., "lift_misses": ...,
+	// "threads": ..., "peak_rss_mb": ..., "phases": {name: {...}}}
+	char buf[MAX_LEN];
+	snprintf(buf, MAX_LEN, "{\"ndp\": %lld, \"lift_hits\": %lld, "
+			 "\"lift_misses\": %lld, \"threads\": %d, \"peak_rss_mb\": %.1f, "
+			 "\"phases\": {", ndp, lift_hits, lift_misses, threads, peak_rss_mb());
+	std::string res = buf;
+	for (int i = 0; i < static_cast<int>(phases.size()); i++) {
+		const PhaseStats &ps = phases[i];
+		snprintf(buf, MAX_LEN, "%s\"%s\": {\"wall\": %.6f, \"cpu\": %.6f, "
+				 "\"nv\": %d, \"na\": %d}", i ? ", " : "", ps.name, ps.wall,
+				 ps.cpu, ps.nv, ps.na);
+		res += buf;
 	}
-	throw_assert(fscanf(fin, " } ;") == 0);
+	return res + "}}";
+}
 
-	throw_assert(fscanf(fin, " $LOSS { %d } ;", &LOSS) == 1);
+void Arcflow::write_stats(const char *fname) const {
+	FILE *fout = fopen(fname, "w");
+	if (fout == NULL) {
+		perror("fopen");
+	}
+	throw_assert(fout != NULL);
+	fprintf(fout, "%s\n", stats().c_str());
+	fclose(fout);
+}
 
-	throw_assert(fscanf(fin, " $NV { %d } ;", &NV) == 1);
+void Arcflow::read_binary(const char *fname) {
+	throw_assert(ready == false);
+	throw_assert(check_ext(fname, ".afgb"));
+	tstart = CURTIME;
+	mapping = std::make_shared<MappedFile>(fname);
+	const char *buf = mapping->data();
+	throw_assert(mapping->size() >= 4 && strncmp(buf, "AFGB", 4) == 0);
+	const int *p = reinterpret_cast<const int *>(buf + 4);
+	const int *end = p + (mapping->size() - 4) / sizeof(int);
+	auto next = [&p, end]() -> int {
+		throw_assert(p < end);
+		return *p++;
+	};
 
-	throw_assert(fscanf(fin, " $NA { %d } ;", &NA) == 1);
+	throw_assert(next() == AFGB_VERSION);
+	NV = next();
+	NA = next();
+	S = next();
+	LOSS = next();
+	Ts.resize(next());
+	for (int &t : Ts) {
+		t = next();
+	}
 
-	throw_assert(fscanf(fin, " $ARCS {") == 0);
-	for (int i = 0; i < NA; i++) {
-		int i_u, i_v, label;
-		throw_assert(fscanf(fin, " %d %d %d ", &i_u, &i_v, &label) == 3);
-		A.push_back(Arc(i_u, i_v, label));
+	std::vector<int> data(next());
+	for (int &x : data) {
+		x = next();
+	}
+	inst = Instance(data, MVP);
+	inst.vtype = next();
+	inst.method = next();
+	inst.relax_domains = next();
+	inst.binary = next();
+	throw_assert(next() == inst.m);
+	for (char &ctype : inst.ctypes) {
+		ctype = next();
 	}
-	throw_assert(fscanf(fin, " } ;") == 0);
-	throw_assert(fscanf(fin, " #GRAPH_END#") == 0);
+	throw_assert(static_cast<int>(Ts.size()) == inst.nbtypes);
+
+	throw_assert(end - p == 3 * static_cast<ptrdiff_t>(NA));
+	mapped_arcs = reinterpret_cast<const Arc *>(p);
 	ready = true;
 }
 
 void Arcflow::write(const char *fname) {
 	throw_assert(ready == true);
+	if (check_ext(fname, ".afgb")) {
+		FILE *fout = fopen(fname, "wb");
+		if (fout == NULL) {
+			perror("fopen");
+		}
+		throw_assert(fout != NULL);
+		write_binary(fout);
+		fclose(fout);
+		return;
+	}
 	FILE *fout = fopen(fname, "w");
 	if (fout == NULL) {
 		perror("fopen");
@@ -619,12 +1161,7 @@ void Arcflow::write(const char *fname) {
 void Arcflow::read(const char *fname) {
 	throw_assert(ready == false);
 	throw_assert(check_ext(fname, ".afg"));
-	FILE *fin = fopen(fname, "r");
-	if (fin == NULL) {
-		perror("fopen");
-	}
-	throw_assert(fin != NULL);
-	read(fin);
-	fclose(fin);
+	Scanner in(fname);
+	read(&in);
 	throw_assert(ready == true);
 }
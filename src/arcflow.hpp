@@ -4,25 +4,158 @@ This code is part of the Arc-flow Vector Packing Solver (VPSolver).
 #ifndef SRC_ARCFLOW_HPP_
 #define SRC_ARCFLOW_HPP_
 
+#include <atomic>
 #include <ctime>
-#include <set>
-#include <map>
+#include <memory>
+#include <mutex>
+#include <stdexcept>
+#include <string>
 #include <vector>
 #include "graph.hpp"
 #include "common.hpp"
 #include "instance.hpp"
 
+#define AFGB_VERSION 1
+#define EXIT_BUDGET 2
+
+/* Time and graph size after a construction phase */
+struct PhaseStats {
+	const char *name;
+	double wall;
+	double cpu;
+	int nv;
+	int na;
+};
+
+/* Thrown when the construction exceeds its state (or memory) budget */
+class BudgetExceeded : public std::runtime_error {
+public:
+	long long states;
+
+	BudgetExceeded(long long _states, long long limit,
+				   const char *unit = "states");
+};
+
 class Arcflow {
 private:
 	bool ready;
-	std::set<Arc> AS;
+	bool verbose;
+	std::string *log_output;
+	int threads;
+	long long max_states;
+	long long max_memory;
+	long long memo_bytes;
+	long long lift_bytes;
+	std::atomic<long long> nstates;
+	mutable std::atomic<long long> used_memory;
+	std::shared_ptr<MappedFile> mapping;
+	const Arc *mapped_arcs;
 	NodeSet NS;
 	std::vector<int> maxW;
-	std::map<std::vector<int>, int> dp;
+	struct Memo {
+		StateIndex states;
+		std::vector<int> values;
+
+		int find(const int *key) const {
+			int ind = states.find(key);
+			return ind != -1 ? values[ind] : -1;
+		}
+
+		int insert(const int *key, int value) {
+			int ind = states.insert(key);
+			if (ind == static_cast<int>(values.size())) {
+				values.push_back(value);
+			}
+			return values[ind];
+		}
+	};
+
+	// Append-only copy of the NS labels for the worker threads: the blocks
+	// never move, so labels can be read without holding ns_lock.
+	struct LabelTable {
+		static const int BLOCK_BITS = 16;
+		int width = 0;
+		std::unique_ptr<std::atomic<int *>[]> blocks;
+		std::vector<std::unique_ptr<int[]>> owned;
+
+		void reset(int _width);
+
+		void set(int ind, const int *lbl);
+
+		const int *get(int ind) const {
+			const int *block = blocks[ind >> BLOCK_BITS].load(
+				std::memory_order_acquire);
+			return block + static_cast<size_t>(ind & ((1 << BLOCK_BITS) - 1)) * width;
+		}
+	};
+
+	std::vector<Memo> dp;  // shards of the memo, selected by key
+	std::unique_ptr<std::mutex[]> dp_locks;
+	std::mutex ns_lock;
+	LabelTable ns_labels;
+	std::mutex arcs_lock;
+	int key_words;
+
+	struct Frame {
+		std::vector<int> su;
+		std::vector<int> mu;
+		std::vector<int> maxw;
+		int up;
+		int stage;
+	};
+
+	struct Worker {
+		std::vector<int> key;
+		std::vector<Arc> arcs;
+		std::vector<int> mu;
+		std::vector<int> label;
+		// lift_state cache (packed unlifted state -> lifted dimensions)
+		StateIndex lifts;
+		std::vector<int> lifted;
+		std::vector<int> space;
+		std::vector<int> reps;
+		std::vector<int> caps;
+		std::vector<int> queue;
+		std::vector<char> vis;
+		// NS cache of the worker threads (label -> vertex index)
+		StateIndex nodes;
+		std::vector<int> node_ids;
+		long long lift_hits = 0;
+		long long lift_misses = 0;
+	};
+
+	long long lift_hits;
+	long long lift_misses;
+
+	int go(std::vector<int> su, Worker *wk);
+
+	void go_parallel(const std::vector<int> &s0);
+
+	int push_state(std::vector<int> su, std::vector<Frame> *stack, Worker *wk);
 
-	int go(std::vector<int> su);
+	bool up_state(const Frame &f, std::vector<int> *sv) const;
 
-	inline std::vector<int> hash(const std::vector<int> &su);
+	bool take_state(const Frame &f, std::vector<int> *sv) const;
+
+	void set_up(Frame *f, int up) const;
+
+	int close_state(const Frame &f, int iv, Worker *wk);
+
+	inline const int *hash(const std::vector<int> &su, Worker *wk) const;
+
+	int find_state(const std::vector<int> &su, Worker *wk);
+
+	int memoize(const std::vector<int> &su, int value, Worker *wk);
+
+	int node_index(const std::vector<int> &lbl, Worker *wk);
+
+	void node_label(int ind, std::vector<int> *lbl) const;
+
+	void merge_worker(Worker *wk);
+
+	void print(const char *fmt, ...) const;
+
+	void charge(long long bytes) const;
 
 	std::vector<int> max_label;
 	std::vector<int> hash_bits;
@@ -34,11 +167,17 @@ private:
 	std::vector<int> count_max_rep(const std::vector<int> &space, int i0,
 								   int sub_i0) const;
 
+	void count_max_rep(const std::vector<int> &space, int i0, int sub_i0,
+					   std::vector<int> *r) const;
+
 	void lift_state(const std::vector<int> &valid_opts, std::vector<int> &u, int it,
-					int ic) const;
+					int ic, Worker *wk) const;
 
 	int min_slack(const std::vector<int> &b, int i0, int d,
-				  const std::vector<int> &caps) const;
+				  const std::vector<int> &caps, Worker *wk) const;
+
+	void lift_cached(const std::vector<int> &valid_opts, std::vector<int> &u,
+					 int it, int ic, Worker *wk) const;
 
 	bool is_valid(const std::vector<int> &u, const std::vector<int> &W) const;
 
@@ -52,7 +191,9 @@ private:
 
 	void read(const char *fname);
 
-	void read(FILE *fin);
+	void read(Scanner *in);
+
+	void read_binary(const char *fname);
 
 	void build();
 
@@ -71,14 +212,32 @@ public:
 	std::vector<int> Ts;
 	std::vector<Arc> A;
 	int LOSS;
+	long long ndp;
+	std::vector<PhaseStats> phases;
 
-	explicit Arcflow(const Instance &_inst);
+	explicit Arcflow(const Instance &_inst, bool _verbose = true,
+					 int _threads = 1, long long _max_states = 0,
+					 long long _max_memory = 0, std::string *_log_output = NULL);
 
 	explicit Arcflow(const char *fname);
 
+	void sort_arcs();
+
 	void write(const char *fname);
 
 	void write(FILE *fout);
+
+	void write_binary(FILE *fout);
+
+	void add_phase(const char *name, const Stopwatch &sw, int nv, int na);
+
+	std::string stats() const;
+
+	void write_stats(const char *fname) const;
+
+	const Arc &arc(int i) const {
+		return mapped_arcs != NULL ? mapped_arcs[i] : A[i];
+	}
 };
 
 #endif  // SRC_ARCFLOW_HPP_
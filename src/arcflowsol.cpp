@@ -181,6 +181,40 @@ bool ArcflowSol::is_valid(const std::vector<pattern_pair> &sol, int btype) const
 	return true;
 }
 
+std::vector<int_pair> ArcflowSol::pattern_items(const pattern_pair &pat) const {
+	std::vector<int_pair> tmp;
+	for (const int_pair &itpair : pat.second) {
+		int t = inst.items[itpair.first].type;
+		int opt = inst.items[itpair.first].opt;
+		for (int i = 0; i < itpair.second; i++) {
+			tmp.push_back(MP(t, opt));
+		}
+	}
+	sort(all(tmp));
+	return tmp;
+}
+
+void ArcflowSol::write_solution(const char *fname) const {
+	FILE *fout = fopen(fname, "w");
+	if (fout == NULL) {
+		perror("fopen");
+	}
+	throw_assert(fout != NULL);
+	fprintf(fout, "%d %d\n", objvalue, inst.nbtypes);
+	for (int t = 0; t < inst.nbtypes; t++) {
+		fprintf(fout, "%d\n", static_cast<int>(sols[t].size()));
+		for (const pattern_pair &pat : sols[t]) {
+			std::vector<int_pair> tmp = pattern_items(pat);
+			fprintf(fout, "%d %d", pat.first, static_cast<int>(tmp.size()));
+			for (const int_pair &p : tmp) {
+				fprintf(fout, " %d %d", p.first, std::max(p.second, 0));
+			}
+			fprintf(fout, "\n");
+		}
+	}
+	fclose(fout);
+}
+
 void ArcflowSol::print_solution(bool print_inst = true, bool pyout = false) {
 	printf("Objective: %d\n", objvalue);
 	printf("Solution:\n");
@@ -190,15 +224,7 @@ void ArcflowSol::print_solution(bool print_inst = true, bool pyout = false) {
 		}
 		std::vector<pattern_pair> &sol = sols[t];
 		for (const pattern_pair &pat : sol) {
-			std::vector<int_pair> tmp;
-			for (const int_pair &itpair : pat.second) {
-				int t = inst.items[itpair.first].type;
-				int opt = inst.items[itpair.first].opt;
-				for (int i = 0; i < itpair.second; i++) {
-					tmp.push_back(MP(t, opt));
-				}
-			}
-			sort(all(tmp));
+			std::vector<int_pair> tmp = pattern_items(pat);
 			printf("%d x [", pat.first);
 			bool first = true;
 			for (const int_pair &p : tmp) {
@@ -227,16 +253,7 @@ void ArcflowSol::print_solution(bool print_inst = true, bool pyout = false) {
 			printf("[");
 			std::vector<pattern_pair> &sol = sols[t];
 			for (const pattern_pair &pat : sol) {
-				std::vector<int_pair> tmp;
-				for (const int_pair &itpair : pat.second) {
-					int t = inst.items[itpair.first].type;
-					int opt = inst.items[itpair.first].opt;
-					for (int i = 0; i < itpair.second; i++) {
-						tmp.push_back(MP(t, opt));
-					}
-				}
-				sort(all(tmp));
-
+				std::vector<int_pair> tmp = pattern_items(pat);
 				printf("(%d,[", pat.first);
 				for (const int_pair &p : tmp) {
 					if (p.second == -1) {
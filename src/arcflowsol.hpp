@@ -34,11 +34,15 @@ private:
 
 	bool is_valid(const std::vector<pattern_pair> &sol, int btype) const;
 
+	std::vector<int_pair> pattern_items(const pattern_pair &pat) const;
+
 public:
 	ArcflowSol(const Instance &_inst, const std::map<Arc, int> &_flow, int _S,
 			   const std::vector<int> &_Ts, int _LOSS);
 
 	void print_solution(bool print_inst, bool pyout);
+
+	void write_solution(const char *fname) const;
 };
 
 #endif  // SRC_ARCFLOWSOL_HPP_
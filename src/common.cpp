@@ -1,8 +1,22 @@
 /**
 This code is part of the Arc-flow Vector Packing Solver (VPSolver).
 **/
+#include <climits>
 #include <cstring>
+#include <cstdio>
+#include <cstdlib>
+#include <clocale>
 #include "common.hpp"
+#ifdef __APPLE__
+#include <xlocale.h>
+#endif
+#ifndef _WIN32
+#include <fcntl.h>
+#include <unistd.h>
+#include <sys/mman.h>
+#include <sys/stat.h>
+#include <sys/resource.h>
+#endif
 
 bool check_ext(const char *name, const char *extension) {
 	const char *end = strrchr(name, '.');
@@ -12,3 +26,170 @@ bool check_ext(const char *name, const char *extension) {
 bool prefix(const char *pre, const char *str) {
 	return strncmp(pre, str, strlen(pre)) == 0;
 }
+
+double peak_rss_mb() {
+#ifndef _WIN32
+	struct rusage usage;
+	if (getrusage(RUSAGE_SELF, &usage) == 0) {
+#ifdef __APPLE__
+		return usage.ru_maxrss / 1048576.0;  // bytes
+#else
+		return usage.ru_maxrss / 1024.0;  // kilobytes
+#endif
+	}
+#endif
+	return -1;
+}
+
+/* Class MappedFile */
+
+MappedFile::MappedFile(const char *fname) : ptr(NULL), len(0), mapped(false) {
+#ifndef _WIN32
+	int fd = open(fname, O_RDONLY);
+	if (fd == -1) {
+		perror("open");
+	}
+	throw_assert(fd != -1);
+	struct stat st;
+	throw_assert(fstat(fd, &st) == 0);
+	len = st.st_size;
+	if (len != 0) {
+		void *addr = mmap(NULL, len, PROT_READ, MAP_PRIVATE, fd, 0);
+		if (addr != MAP_FAILED) {
+			ptr = static_cast<const char *>(addr);
+			mapped = true;
+		}
+	}
+	close(fd);
+	if (mapped || len == 0) {
+		return;
+	}
+#endif
+	FILE *fin = fopen(fname, "rb");
+	if (fin == NULL) {
+		perror("fopen");
+	}
+	throw_assert(fin != NULL);
+	fseek(fin, 0, SEEK_END);
+	len = ftell(fin);
+	fseek(fin, 0, SEEK_SET);
+	buffer.resize(len);
+	size_t nread = len != 0 ? fread(buffer.data(), 1, len, fin) : 0;
+	fclose(fin);
+	throw_assert(nread == len);
+	ptr = buffer.data();
+}
+
+MappedFile::~MappedFile() {
+#ifndef _WIN32
+	if (mapped) {
+		munmap(const_cast<char *>(ptr), len);
+	}
+#endif
+}
+
+/* Class Scanner */
+
+static double strtod_c(const char *str, char **endptr) {
+	// strtod in the "C" locale, whatever the locale of the process
+#ifdef _WIN32
+	static _locale_t c_locale = _create_locale(LC_NUMERIC, "C");
+	return _strtod_l(str, endptr, c_locale);
+#else
+	static locale_t c_locale = newlocale(LC_NUMERIC_MASK, "C", (locale_t) 0);
+	return strtod_l(str, endptr, c_locale);
+#endif
+}
+
+Scanner::Scanner(const char *fname) : file(fname) {
+	p = file.data();
+	end = p + file.size();
+}
+
+bool Scanner::match(const char *lit) {
+	// like a fscanf literal: a space matches any amount of whitespace and
+	// the input is consumed up to the first mismatch
+	for (; *lit; lit++) {
+		if (is_space(*lit)) {
+			skip_ws();
+		} else if (p < end && *p == *lit) {
+			p++;
+		} else {
+			return false;
+		}
+	}
+	return true;
+}
+
+void Scanner::expect(const char *lit) {
+	if (!match(lit)) {
+		char msg[MAX_LEN];
+		snprintf(msg, MAX_LEN, "Error: expected \"%s\"", lit);
+		throw std::runtime_error(msg);
+	}
+}
+
+bool Scanner::try_int(int *value) {
+	skip_ws();
+	const char *q = p;
+	bool neg = false;
+	if (q < end && (*q == '-' || *q == '+')) {
+		neg = *q == '-';
+		q++;
+	}
+	const char *digits = q;
+	long long v = 0, limit = neg ? -static_cast<long long>(INT_MIN) : INT_MAX;
+	while (q < end && *q >= '0' && *q <= '9') {
+		v = v * 10 + (*q - '0');
+		if (v > limit) {
+			throw_error("integer out of range");
+		}
+		q++;
+	}
+	if (q == digits) {
+		return false;
+	}
+	*value = static_cast<int>(neg ? -v : v);
+	p = q;
+	return true;
+}
+
+int Scanner::next_int() {
+	int value;
+	if (!try_int(&value)) {
+		throw_error("expected an integer");
+	}
+	return value;
+}
+
+bool Scanner::try_double(double *value) {
+	skip_ws();
+	char buf[MAX_LEN];
+	int len = 0;
+	while (p + len < end && len < MAX_LEN - 1 && !is_space(p[len])) {
+		buf[len] = p[len];
+		len++;
+	}
+	buf[len] = '\0';
+	char *q;
+	*value = strtod_c(buf, &q);
+	if (q == buf) {
+		return false;
+	}
+	p += q - buf;
+	return true;
+}
+
+bool Scanner::next_token(char *buf, int size, const char *delims) {
+	skip_ws();
+	int len = 0;
+	while (p < end && !is_space(*p) && strchr(delims, *p) == NULL) {
+		if (len >= size - 1) {
+			throw_error("token too long");
+		}
+		buf[len++] = *p;
+		p++;
+	}
+	buf[len] = '\0';
+	return len != 0;
+}
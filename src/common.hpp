@@ -16,8 +16,11 @@ This code is part of the Arc-flow Vector Packing Solver (VPSolver).
 #define CURTIME clock()
 #define TIMEDIF(t0) (static_cast<double>(clock()-t0)/CLOCKS_PER_SEC)
 
+#include <chrono>
+#include <ctime>
 #include <utility>
 #include <cstdio>
+#include <vector>
 #include <exception>
 #include <stdexcept>
 
@@ -27,6 +30,89 @@ bool check_ext(const char *name, const char *extension);
 
 bool prefix(const char *pre, const char *str);
 
+double peak_rss_mb();
+
+/* Wall-clock and CPU time elapsed since construction */
+
+class Stopwatch {
+private:
+	std::chrono::steady_clock::time_point wall0;
+	clock_t cpu0;
+
+public:
+	Stopwatch() : wall0(std::chrono::steady_clock::now()), cpu0(clock()) {}
+
+	double wall() const {
+		return std::chrono::duration<double>(
+			std::chrono::steady_clock::now() - wall0).count();
+	}
+
+	double cpu() const { return TIMEDIF(cpu0); }
+};
+
+/* Read-only view of a file (memory-mapped where supported) */
+
+class MappedFile {
+private:
+	const char *ptr;
+	size_t len;
+	bool mapped;
+	std::vector<char> buffer;
+
+	MappedFile(const MappedFile &);
+
+	MappedFile &operator=(const MappedFile &);
+
+public:
+	explicit MappedFile(const char *fname);
+
+	~MappedFile();
+
+	const char *data() const { return ptr; }
+
+	size_t size() const { return len; }
+};
+
+/* Token reader over a MappedFile (replaces fscanf for the input files) */
+
+class Scanner {
+private:
+	MappedFile file;
+	const char *p;
+	const char *end;
+
+	static bool is_space(char c) {
+		return c == ' ' || c == '\n' || c == '\t' || c == '\r' ||
+			   c == '\f' || c == '\v';
+	}
+
+public:
+	explicit Scanner(const char *fname);
+
+	void skip_ws() {
+		while (p < end && is_space(*p)) {
+			p++;
+		}
+	}
+
+	bool eof() {
+		skip_ws();
+		return p == end;
+	}
+
+	bool match(const char *lit);
+
+	void expect(const char *lit);
+
+	bool try_int(int *value);
+
+	int next_int();
+
+	bool try_double(double *value);
+
+	bool next_token(char *buf, int size, const char *delims = "");
+};
+
 #define throw_error(error) \
 {                          \
     char _error_msg_[MAX_LEN]; \
@@ -1,52 +1,127 @@
 /**
 This code is part of the Arc-flow Vector Packing Solver (VPSolver).
 **/
+#include <cstdint>
 #include <vector>
 #include <algorithm>
 #include "graph.hpp"
 #include "common.hpp"
 
-/* Class NodeSet */
+/* Class StateIndex */
 
-int NodeSet::get_index(const std::vector<int> &lbl) {
-	if (index.count(lbl)) {
-		return index[lbl];
-	} else {
-		int ind = labels.size();
-		labels.push_back(lbl);
-		index[lbl] = ind;
+unsigned StateIndex::hash(const int *key) const {
+	uint64_t h = 0x9e3779b97f4a7c15ULL;
+	for (int i = 0; i < width; i++) {
+		h ^= static_cast<unsigned>(key[i]);
+		h *= 0xff51afd7ed558ccdULL;
+		h ^= h >> 32;
+	}
+	return static_cast<unsigned>(h);
+}
+
+int StateIndex::lookup(const int *key) const {
+	// returns the entry of key, or -(pos + 2) for the empty slot pos where
+	// it would be inserted
+	size_t mask = slots.size() - 1;
+	for (size_t pos = hash(key) & mask;; pos = (pos + 1) & mask) {
+		int ind = slots[pos] - 1;
+		if (ind == -1) {
+			return -(static_cast<int>(pos) + 2);
+		}
+		if (std::equal(key, key + width, this->key(ind))) {
+			return ind;
+		}
+	}
+}
+
+void StateIndex::grow() {
+	size_t nslots = slots.empty() ? 16 : slots.size() * 2;
+	slots.assign(nslots, 0);
+	size_t mask = nslots - 1;
+	for (int ind = 0; ind < nkeys; ind++) {
+		size_t pos = hash(key(ind)) & mask;
+		while (slots[pos] != 0) {
+			pos = (pos + 1) & mask;
+		}
+		slots[pos] = ind + 1;
+	}
+}
+
+int StateIndex::find(const int *key) const {
+	if (slots.empty()) {
+		return -1;
+	}
+	int ind = lookup(key);
+	return ind >= 0 ? ind : -1;
+}
+
+int StateIndex::insert(const int *key) {
+	if (4 * (static_cast<size_t>(nkeys) + 1) > 3 * slots.size()) {
+		grow();
+	}
+	int ind = lookup(key);
+	if (ind >= 0) {
 		return ind;
 	}
+	slots[-(ind + 2)] = nkeys + 1;
+	keys.insert(keys.end(), key, key + width);
+	return nkeys++;
 }
 
-std::vector<int> NodeSet::get_label(int ind) const {
-	throw_assert(ind < static_cast<int>(labels.size()));
-	return labels[ind];
+void StateIndex::clear(int _width) {
+	width = _width;
+	nkeys = 0;
+	std::vector<int>().swap(keys);
+	std::vector<int>().swap(slots);
+}
+
+
+/* Class NodeSet */
+
+int NodeSet::get_index(const std::vector<int> &lbl) {
+	if (index.size() == 0) {
+		index.clear(lbl.size());
+	}
+	throw_assert(static_cast<int>(lbl.size()) == index.key_width());
+	return index.insert(lbl.data());
 }
 
 int NodeSet::size() const {
-	return labels.size();
+	return index.size();
 }
 
 void NodeSet::clear() {
 	index.clear();
-	labels.clear();
 }
 
 void NodeSet::sort() {
-	index.clear();
-	std::sort(all(labels));
-	int pos = 0;
-	for (const std::vector<int> &lbl : labels) {
-		index[lbl] = pos++;
+	std::vector<int> ord = topological_order();
+	int width = index.key_width();
+	std::vector<int> labels(static_cast<size_t>(size()) * width);
+	for (int i = 0; i < size(); i++) {
+		std::copy(index.key(i), index.key(i) + width,
+				  &labels[static_cast<size_t>(ord[i]) * width]);
+	}
+	index.clear(width);
+	for (int i = 0; i < static_cast<int>(ord.size()); i++) {
+		index.insert(&labels[static_cast<size_t>(i) * width]);
 	}
 }
 
 std::vector<int> NodeSet::topological_order() const {
-	std::vector<int> ord(index.size());
-	int pos = 0;
-	for (const auto &kvpair : index) {
-		ord[kvpair.second] = pos++;
+	int width = index.key_width();
+	std::vector<int> inds(size());
+	for (int i = 0; i < size(); i++) {
+		inds[i] = i;
+	}
+	std::sort(all(inds), [this, width](int a, int b) {
+		return std::lexicographical_compare(
+			index.key(a), index.key(a) + width,
+			index.key(b), index.key(b) + width);
+	});
+	std::vector<int> ord(size());
+	for (int pos = 0; pos < size(); pos++) {
+		ord[inds[pos]] = pos;
 	}
 	return ord;
 }
@@ -63,19 +138,3 @@ bool Arc::operator<(const Arc &o) const {
 bool Arc::operator==(const Arc &o) const {
 	return u == o.u && v == o.v && label == o.label;
 }
-
-
-/* Additional Functions  */
-
-adj_list get_adj(int nv, const std::vector<Arc> &arcs, bool transpose) {
-	adj_list adj(nv);
-	for (const Arc &a : arcs) {
-		throw_assert(a.u < nv && a.v < nv);
-		if (!transpose) {
-			adj[a.u].push_back(MP(a.v, a.label));
-		} else {
-			adj[a.v].push_back(MP(a.u, a.label));
-		}
-	}
-	return adj;
-}
@@ -7,21 +7,50 @@ Copyright (C) 2013-2021, Filipe Brandao <fdabrandao@gmail.com>
 #define SRC_GRAPH_HPP_
 
 #include <ctime>
-#include <set>
-#include <map>
 #include <vector>
 #include "common.hpp"
 
-typedef std::vector<std::vector<int_pair>> adj_list;
+/* Open-addressing hash set of fixed-width integer keys; entries are
+   numbered in insertion order */
+
+class StateIndex {
+private:
+	int width;
+	int nkeys;
+	std::vector<int> keys;  // width integers per entry
+	std::vector<int> slots;  // entry + 1 (0 if empty); size is a power of 2
+
+	unsigned hash(const int *key) const;
+
+	int lookup(const int *key) const;
+
+	void grow();
+
+public:
+	explicit StateIndex(int _width = 0) : width(_width), nkeys(0) {}
+
+	int find(const int *key) const;
+
+	int insert(const int *key);
+
+	const int *key(int ind) const { return &keys[static_cast<size_t>(ind) * width]; }
+
+	int key_width() const { return width; }
+
+	int size() const { return nkeys; }
+
+	void clear(int _width = 0);
+};
 
 class NodeSet {
 private:
-	std::map<std::vector<int>, int> index;
-	std::vector<std::vector<int>> labels;
+	StateIndex index;
 public:
 	int get_index(const std::vector<int> &lbl);
 
-	std::vector<int> get_label(int ind) const;
+	const int *label(int ind) const { return index.key(ind); }
+
+	int label_size() const { return index.key_width(); }
 
 	int size() const;
 
@@ -46,6 +75,4 @@ public:
 	bool operator==(const Arc &o) const;
 };
 
-adj_list get_adj(int nv, const std::vector<Arc> &arcs, bool transpose = false);
-
 #endif  // SRC_GRAPH_HPP_
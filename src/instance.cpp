@@ -51,9 +51,9 @@ Instance::Instance() {
 	init();
 }
 
-Instance::Instance(FILE *fin, ftype type) {
+Instance::Instance(Scanner *in, ftype type) {
 	init();
-	read(fin, type);
+	read(in, type);
 }
 
 Instance::Instance(const char *fname) {
@@ -61,6 +61,11 @@ Instance::Instance(const char *fname) {
 	read(fname);
 }
 
+Instance::Instance(const std::vector<int> &data, ftype type) {
+	init();
+	read(data, type);
+}
+
 std::vector<Item> Instance::sorted_items() {
 	std::vector<Item> sitems(items);
 	std::stable_sort(all(sitems));
@@ -88,29 +93,96 @@ void Instance::print() const {
 }
 
 void Instance::read(const char *fname) {
-	FILE *fin = fopen(fname, "r");
-	if (fin == NULL) {
-		perror("fopen");
-	}
-	throw_assert(fin != NULL);
+	ftype type;
 	if (check_ext(fname, ".vbp")) {
-		read(fin, VBP);
+		type = VBP;
 	} else if (check_ext(fname, ".mvp")) {
-		read(fin, MVP);
+		type = MVP;
 	} else {
 		throw_error("Invalid file extension");
 	}
-	fclose(fin);
+	Scanner in(fname);
+	read(&in, type);
+}
+
+void Instance::read(Scanner *in, ftype type) {
+	in->match(" #INSTANCE_BEGIN#");
+	in->match(" $INSTANCE {");
+	std::vector<int> data;
+	int value;
+	while (in->try_int(&value)) {
+		data.push_back(value);
+	}
+	read_data(data, type);
+	in->match(" } ;");
+
+	char buf[MAX_LEN];
+	while (in->match(" $") && in->next_token(buf, MAX_LEN, "{")) {
+		if (!strcmp(buf, "VTYPE")) {
+			in->expect(" {");
+			throw_assert(in->next_token(buf, MAX_LEN, "},"));
+			in->match(" } ;");
+			vtype = buf[0];
+			throw_assert(vtype == 'C' || vtype == 'I');
+		} else if (!strcmp(buf, "CTYPE")) {
+			in->match(" {");
+			ctypes.clear();
+			for (int i = 0; i < m; i++) {
+				if (i) in->match(" ,");
+				throw_assert(in->next_token(buf, MAX_LEN, "},"));
+				if (!strcmp(buf, ">")) {
+					ctypes.push_back('>');
+				} else if (!strcmp(buf, "=")) {
+					ctypes.push_back('=');
+				} else {
+					throw_assert(!strcmp(buf, "*"));
+					ctypes.push_back('*');
+				}
+			}
+			in->match(" } ;");
+		} else if (!strcmp(buf, "METHOD")) {
+			in->expect(" {");
+			method = in->next_int();
+			in->match(" } ;");
+			throw_assert(method >= MIN_METHOD && method <= MAX_METHOD);
+		} else if (!strcmp(buf, "RELAX")) {
+			in->expect(" {");
+			int trelax = in->next_int();
+			in->match(" } ;");
+			throw_assert(trelax == 0 || trelax == 1);
+			relax_domains = trelax;
+		} else if (!strcmp(buf, "BINARY")) {
+			in->expect(" {");
+			int tbinary = in->next_int();
+			in->match(" } ;");
+			throw_assert(tbinary == 0 || tbinary == 1);
+			binary = tbinary;
+		} else {
+			printf("Invalid option '%s'!\n", buf);
+			exit(1);
+		}
+	}
+	in->match(" #INSTANCE_END#");
+	finalize();
+}
+
+void Instance::read(const std::vector<int> &data, ftype type) {
+	read_data(data, type);
+	finalize();
 }
 
-void Instance::read(FILE *fin, ftype type) {
-	throw_assert(fscanf(fin, " #INSTANCE_BEGIN#") == 0);
-	throw_assert(fscanf(fin, " $INSTANCE {") == 0);
-	throw_assert(fscanf(fin, "%d", &ndims) == 1);
+void Instance::read_data(const std::vector<int> &data, ftype type) {
+	int p = 0;
+	auto next = [&data, &p]() -> int {
+		throw_assert(p < static_cast<int>(data.size()));
+		return data[p++];
+	};
+
+	ndims = next();
 	throw_assert(ndims >= 1);
 
 	if (type == MVP) {
-		throw_assert(fscanf(fin, "%d", &nbtypes) == 1);
+		nbtypes = next();
 		throw_assert(nbtypes >= 1);
 	} else {
 		nbtypes = 1;
@@ -122,12 +194,12 @@ void Instance::read(FILE *fin, ftype type) {
 	for (int t = 0; t < nbtypes; t++) {
 		Ws[t].resize(ndims);
 		for (int d = 0; d < ndims; d++) {
-			throw_assert(fscanf(fin, "%d", &Ws[t][d]) == 1);
+			Ws[t][d] = next();
 			throw_assert(Ws[t][d] >= 0);
 		}
 		if (type == MVP) {
-			throw_assert(fscanf(fin, "%d", &Cs[t]) == 1);
-			throw_assert(fscanf(fin, "%d", &Qs[t]) == 1);
+			Cs[t] = next();
+			Qs[t] = next();
 		} else {
 			Cs[t] = 1;
 			Qs[t] = -1;
@@ -139,13 +211,13 @@ void Instance::read(FILE *fin, ftype type) {
 	ctypes.clear();
 	demands.clear();
 	int it_count = 0;
-	throw_assert(fscanf(fin, "%d", &m) == 1);
+	m = next();
 	for (int it_type = 0; it_type < m; it_type++) {
 		int ti, bi;
 		if (type == MVP) {
-			throw_assert(fscanf(fin, "%d", &ti) == 1);
+			ti = next();
 			throw_assert(ti >= 0);
-			throw_assert(fscanf(fin, "%d", &bi) == 1);
+			bi = next();
 			throw_assert(bi >= 0);
 			demands.push_back(bi);
 		} else {
@@ -166,7 +238,7 @@ void Instance::read(FILE *fin, ftype type) {
 			}
 
 			for (int d = 0; d < ndims; d++) {
-				throw_assert(fscanf(fin, "%d", &item[d]) == 1);
+				item[d] = next();
 				throw_assert(item[d] >= 0);
 				if (item[d] != 0) {
 					item.nonzero.push_back(d);
@@ -175,7 +247,7 @@ void Instance::read(FILE *fin, ftype type) {
 			throw_assert(!item.nonzero.empty());
 
 			if (type == VBP) {
-				throw_assert(fscanf(fin, "%d", &bi) == 1);
+				bi = next();
 				throw_assert(bi >= 0);
 				demands.push_back(bi);
 			}
@@ -218,50 +290,10 @@ void Instance::read(FILE *fin, ftype type) {
 			throw_assert(nfits >= 1);
 		}
 	}
-	throw_assert(fscanf(fin, " } ;") <= 0);
-
-	char buf[MAX_LEN];
-	while (fscanf(fin, " $%[^{ \n]", buf) == 1) {
-		if (!strcmp(buf, "VTYPE")) {
-			throw_assert(fscanf(fin, " { %[^}, \n] } ;", buf) == 1);
-			vtype = buf[0];
-			throw_assert(vtype == 'C' || vtype == 'I');
-		} else if (!strcmp(buf, "CTYPE")) {
-			throw_assert(fscanf(fin, " {") == 0);
-			ctypes.clear();
-			for (int i = 0; i < m; i++) {
-				if (i) throw_assert(fscanf(fin, " ,") == 0);
-				throw_assert(fscanf(fin, " %[^}, \n]", buf) == 1);
-				if (!strcmp(buf, ">")) {
-					ctypes.push_back('>');
-				} else if (!strcmp(buf, "=")) {
-					ctypes.push_back('=');
-				} else {
-					throw_assert(!strcmp(buf, "*"));
-					ctypes.push_back('*');
-				}
-			}
-			throw_assert(fscanf(fin, " } ;") == 0);
-		} else if (!strcmp(buf, "METHOD")) {
-			throw_assert(fscanf(fin, " { %d } ;", &method) == 1);
-			throw_assert(method >= MIN_METHOD && method <= MAX_METHOD);
-		} else if (!strcmp(buf, "RELAX")) {
-			int trelax = 0;
-			throw_assert(fscanf(fin, " { %d } ;", &trelax) == 1);
-			throw_assert(trelax == 0 || trelax == 1);
-			relax_domains = trelax;
-		} else if (!strcmp(buf, "BINARY")) {
-			int tbinary = 0;
-			throw_assert(fscanf(fin, " { %d } ;", &tbinary) == 1);
-			throw_assert(tbinary == 0 || tbinary == 1);
-			binary = tbinary;
-		} else {
-			printf("Invalid option '%s'!\n", buf);
-			exit(1);
-		}
-	}
-	throw_assert(fscanf(fin, " #INSTANCE_END#") <= 0);
+	throw_assert(p == static_cast<int>(data.size()));
+}
 
+void Instance::finalize() {
 	for (int i = 0; i < m; i++) {
 		if (ctypes[i] == '*') {
 			ctypes[i] = (demands[i] <= 1) ? '=' : '>';
@@ -326,3 +358,28 @@ void Instance::write(FILE *fout) const {
 
 	fprintf(fout, "#INSTANCE_END#\n");
 }
+
+std::vector<int> Instance::data() const {
+	std::vector<int> res = {ndims, nbtypes};
+	for (int t = 0; t < nbtypes; t++) {
+		res.insert(res.end(), all(Ws[t]));
+		res.push_back(Cs[t]);
+		res.push_back(Qs[t]);
+	}
+
+	res.push_back(m);
+	int p = 0;
+	std::vector<int> rid(items.size());
+	for (int it = 0; it < static_cast<int>(items.size()); it++) {
+		rid[items[it].id] = it;
+	}
+	for (int i = 0; i < m; i++) {
+		res.push_back(nopts[i]);
+		res.push_back(demands[i]);
+		for (int q = 0; q < nopts[i]; q++) {
+			res.insert(res.end(), all(items[rid[p]].w));
+			p++;
+		}
+	}
+	return res;
+}
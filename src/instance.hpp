@@ -42,6 +42,10 @@ class Instance {
 private:
 	void init();
 
+	void read_data(const std::vector<int> &data, ftype type);
+
+	void finalize();
+
 public:
 	int ndims;
 	int nbtypes;
@@ -64,7 +68,9 @@ public:
 
 	explicit Instance(const char *fname);
 
-	explicit Instance(FILE *fin, ftype type = MVP);
+	explicit Instance(Scanner *in, ftype type = MVP);
+
+	explicit Instance(const std::vector<int> &data, ftype type = MVP);
 
 	std::vector<Item> sorted_items();
 
@@ -72,9 +78,13 @@ public:
 
 	void read(const char *fname);
 
-	void read(FILE *fin, ftype type = MVP);
+	void read(Scanner *in, ftype type = MVP);
+
+	void read(const std::vector<int> &data, ftype type = MVP);
 
 	void write(FILE *fout) const;
+
+	std::vector<int> data() const;
 };
 
 #endif  // SRC_INSTANCE_HPP_
@@ -0,0 +1,300 @@
+/**
+This code is part of the Arc-flow Vector Packing Solver (VPSolver).
+**/
+#include <cstdio>
+#include <cstdlib>
+#include <cstring>
+#include <cstdarg>
+#include <map>
+#include <vector>
+#include "common.hpp"
+#include "arcflow.hpp"
+#include "instance.hpp"
+#include "model.hpp"
+
+/*
+MPS format
+
+Field:     1          2          3         4         5         6
+Columns:  2-3        5-12      15-22     25-36     40-47     50-61
+*/
+
+#define BUF_LEN 80
+#define NFIELDS 7
+
+const int field_start[NFIELDS] = {0, 1, 4, 14, 24, 39, 49};
+
+class MPS {
+private:
+	FILE *fout;
+	int p;
+	int cur_field;
+	char buf[BUF_LEN];
+
+	void clear() {
+		p = 0;
+		cur_field = 0;
+		memset(buf, ' ', sizeof(buf));
+	}
+
+	void add_field(const char *str) {
+		throw_assert(cur_field < NFIELDS);
+		p = field_start[cur_field];
+		for (int i = 0; str[i]; i++) {
+			buf[p++] = str[i];
+		}
+		cur_field++;
+	}
+
+public:
+	MPS(FILE *_fout = stdout) : fout(_fout) {}
+
+	void write(int count, ...) {
+		clear();
+
+		va_list v;
+		va_start(v, count);
+		for (int i = 0; i < count; i++) {
+			add_field(va_arg(v, const char *));
+		}
+		va_end(v);
+
+		throw_assert(p < BUF_LEN);
+		buf[p] = 0;
+		fprintf(fout, "%s\n", buf);
+		clear();
+	}
+};
+
+void write_mps(const Arcflow &afg, FILE *fout) {
+	const Instance &inst = afg.inst;
+	MPS mps(fout);
+	mps.write(4, "NAME", "", "", "ARCFLOW");
+	mps.write(1, "ROWS");
+	mps.write(3, "", "N", "OBJ");
+
+	char buf[BUF_LEN];
+	char buf1[BUF_LEN];
+	char buf2[BUF_LEN];
+
+	/* demand constraints */
+
+	for (int i = 0; i < inst.m; i++) {
+		char ctype = inst.ctypes[i];
+		throw_assert(ctype == '>' || ctype == '=');
+		snprintf(buf, sizeof(buf), "B%d", i);
+		if (ctype == '=' && !inst.relax_domains) {
+			mps.write(3, "", "E", buf);
+		} else {
+			mps.write(3, "", "G", buf);
+		}
+	}
+
+	/* flow conservation constraints */
+
+	for (int i = 0; i < afg.NV; i++) {
+		snprintf(buf, sizeof(buf), "F%x", i);
+		mps.write(3, "", "E", buf);
+	}
+
+	/* A-matrix */
+
+	mps.write(1, "COLUMNS");
+
+	if (inst.vtype == 'I') {
+		mps.write(6, "", "", "MARKER", "'MARKER'", "", "'INTORG'");
+	}
+
+	std::vector<int> labels;
+	std::vector<int> ub(afg.NA);
+	for (int i = 0; i < afg.NA; i++) {
+		const Arc &a = afg.arc(i);
+		labels.push_back(a.label);
+		snprintf(buf, sizeof(buf), "X%x", i);
+		snprintf(buf1, sizeof(buf1), "F%x", a.u);
+		snprintf(buf2, sizeof(buf2), "F%x", a.v);
+		mps.write(7, "", "", buf, buf1, "-1", buf2, "1");
+		if (a.label != afg.LOSS) {
+			snprintf(buf1, sizeof(buf1), "B%d", inst.items[a.label].type);
+			mps.write(5, "", "", buf, buf1, "1");
+		}
+		if (a.v == afg.S) {
+			for (int j = 0; j < static_cast<int>(afg.Ts.size()); j++) {
+				if (afg.Ts[j] == a.u) {
+					ub[i] = (inst.Qs[j] >= 0) ? inst.Qs[j] : inst.n;
+					snprintf(buf1, sizeof(buf1), "%d", inst.Cs[j]);
+					mps.write(5, "", "", buf, "OBJ", buf1);
+					break;
+				}
+			}
+		} else {
+			if (a.label != afg.LOSS && !inst.relax_domains) {
+				ub[i] = inst.items[a.label].demand;
+			} else {
+				ub[i] = inst.n;
+			}
+		}
+	}
+
+	if (inst.vtype == 'I') {
+		mps.write(6, "", "", "MARKER", "'MARKER'", "", "'INTEND'");
+	}
+
+	/* right-hand-side vector */
+
+	mps.write(1, "RHS");
+
+	for (int i = 0; i < inst.m; i++) {
+		snprintf(buf, sizeof(buf), "B%d", i);
+		snprintf(buf1, sizeof(buf1), "%d", inst.demands[i]);
+		mps.write(5, "", "", "RHS1", buf, buf1);
+	}
+
+	/* bounds */
+
+	mps.write(1, "BOUNDS");
+
+	for (int i = 0; i < afg.NA; i++) {
+		snprintf(buf, sizeof(buf), "X%x", i);
+		mps.write(5, "", "LO", "BND1", buf, "0");
+		snprintf(buf1, sizeof(buf1), "%d", ub[i]);
+		mps.write(5, "", "UP", "BND1", buf, buf1);
+	}
+
+	mps.write(1, "ENDATA");
+}
+
+/*
+    LP format example:
+
+    Maximize
+        obj: x1 + 2 x2 + 3 x3 + x4
+    Subject To
+        c1: - x1 + x2 + x3 + 10 x4 <= 20
+        c2: x1 - 3 x2 + x3 <= 30
+        c3: x2 - 3.5 x4 = 0
+    Bounds
+        0 <= x1 <= 40
+        2 <= x4 <= 3
+    General
+        x4
+    End
+*/
+
+void write_lp(const Arcflow &afg, FILE *fout) {
+	const Instance &inst = afg.inst;
+	std::map<int, std::vector<int>> Ai;
+	std::map<int, std::vector<int>> in;
+	std::map<int, std::vector<int>> out;
+
+	/* objective */
+
+	fprintf(fout, "Minimize");
+	std::vector<int> ub(afg.NA);
+	for (int i = 0; i < afg.NA; i++) {
+		const Arc &a = afg.arc(i);
+		Ai[a.label].push_back(i);
+		in[a.v].push_back(i);
+		out[a.u].push_back(i);
+		if (a.v == afg.S) {
+			for (int j = 0; j < static_cast<int>(afg.Ts.size()); j++) {
+				if (afg.Ts[j] == a.u) {
+					ub[i] = (inst.Qs[j] >= 0) ? inst.Qs[j] : inst.n;
+					if (inst.Cs[j] >= 0) {
+						fprintf(fout, " +%d X%x", inst.Cs[j], i);
+					} else {
+						fprintf(fout, " -%d X%x", abs(inst.Cs[j]), i);
+					}
+					break;
+				}
+			}
+		} else {
+			if (a.label != afg.LOSS && !inst.relax_domains) {
+				ub[i] = inst.items[a.label].demand;
+			} else {
+				ub[i] = inst.n;
+			}
+		}
+	}
+	fprintf(fout, "\n");
+
+	/* constraints */
+
+	fprintf(fout, "Subject To\n");
+
+	// demand constraints
+
+	for (int i = 0; i < inst.m; i++) {
+		if (inst.items[i].demand == 0) {
+			continue;
+		}
+		fprintf(fout, "\tB%d:", i);
+		for (int j = 0; j < inst.nsizes; j++) {
+			if (inst.items[j].type == i) {
+				for (const int &ai : Ai[j]) {
+					fprintf(fout, " + X%x", ai);
+				}
+			}
+		}
+		if (inst.ctypes[i] == '=' && !inst.relax_domains) {
+			fprintf(fout, " = %d", inst.demands[i]);
+		} else {
+			fprintf(fout, " >= %d", inst.demands[i]);
+		}
+		fprintf(fout, "\n");
+	}
+
+	// flow conservation constraints
+
+	for (int i = 0; i < afg.NV; i++) {
+		fprintf(fout, "\tF%x:", i);
+		for (const int &ai : in[i]) {
+			fprintf(fout, " + X%x", ai);
+		}
+		for (const int &ai : out[i]) {
+			fprintf(fout, " - X%x", ai);
+		}
+		fprintf(fout, " = 0\n");
+	}
+
+	/* bounds */
+
+	fprintf(fout, "Bounds\n");
+
+	for (int i = 0; i < afg.NA; i++) {
+		fprintf(fout, "0 <= X%x <= %d\n", i, ub[i]);
+	}
+
+	/* integer variables */
+
+	if (inst.vtype == 'I') {
+		fprintf(fout, "General\n");
+
+		fprintf(fout, "\t");
+		for (int i = 0; i < afg.NA; i++) {
+			if (!i) {
+				fprintf(fout, "X%x", i);
+			} else {
+				fprintf(fout, " X%x", i);
+			}
+		}
+	}
+
+	fprintf(fout, "\nEnd\n");
+}
+
+void write_model(const Arcflow &afg, const char *fname) {
+	bool lp = check_ext(fname, ".lp");
+	throw_assert(lp || check_ext(fname, ".mps"));
+	FILE *fout = fopen(fname, "w");
+	if (fout == NULL) {
+		perror("fopen");
+	}
+	throw_assert(fout != NULL);
+	if (lp) {
+		write_lp(afg, fout);
+	} else {
+		write_mps(afg, fout);
+	}
+	fclose(fout);
+}
@@ -0,0 +1,16 @@
+/**
+This code is part of the Arc-flow Vector Packing Solver (VPSolver).
+**/
+#ifndef SRC_MODEL_HPP_
+#define SRC_MODEL_HPP_
+
+#include <cstdio>
+#include "arcflow.hpp"
+
+void write_mps(const Arcflow &afg, FILE *fout);
+
+void write_lp(const Arcflow &afg, FILE *fout);
+
+void write_model(const Arcflow &afg, const char *fname);
+
+#endif  // SRC_MODEL_HPP_
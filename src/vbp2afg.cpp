@@ -3,6 +3,9 @@ This code is part of the Arc-flow Vector Packing Solver (VPSolver).
 **/
 #include <cstdio>
 #include <cstdlib>
+#include <cstring>
+#include <string>
+#include <vector>
 #include "config.hpp"
 #include "arcflow.hpp"
 #include "instance.hpp"
@@ -10,14 +13,16 @@ This code is part of the Arc-flow Vector Packing Solver (VPSolver).
 int swig_main(int argc, char **argv) {
 	printf(PACKAGE_STRING", Copyright (C) 2013-2022, Filipe Brandao\n");
 	setvbuf(stdout, NULL, _IONBF, 0);
-	if (argc < 3 || argc > 6) {
-		printf("Usage: vbp2afg instance.vbp/instance.mvp graph.afg "
-			   "[method:-3] [binary:0] [vtype:I]\n");
+	if (argc < 3 || argc > 10) {
+		printf("Usage: vbp2afg instance.vbp/instance.mvp graph.afg[b] "
+			   "[method:-3] [binary:0] [vtype:I] [threads:1] "
+			   "[max_states:0] [max_memory_mb:0] [stats.json:-]\n");
 		return 1;
 	}
 	FILE *fout = NULL;
 	try {
-		fout = fopen(argv[2], "w");
+		bool binary_output = check_ext(argv[2], ".afgb");
+		fout = fopen(argv[2], binary_output ? "wb" : "w");
 		if (fout == NULL) {
 			perror("fopen");
 		}
@@ -35,17 +40,47 @@ int swig_main(int argc, char **argv) {
 				inst.binary = value;
 			}
 		}
-		if (argc >= 6) {
+		if (argc >= 6 && strcmp(argv[5], "-") != 0) {
 			inst.vtype = argv[5][0];
 			throw_assert(inst.vtype == 'I' || inst.vtype == 'C');
 		}
+		int threads = 1;
+		if (argc >= 7) {
+			threads = atoi(argv[6]);
+			throw_assert(threads >= 1);
+		}
+		long long max_states = 0, max_memory = 0;
+		if (argc >= 8) {
+			max_states = atoll(argv[7]);
+			throw_assert(max_states >= 0);
+		}
+		if (argc >= 9) {
+			max_memory = atoll(argv[8]) << 20;
+			throw_assert(max_memory >= 0);
+		}
 
-		Arcflow graph(inst);
-		inst.write(fout);
-		graph.write(fout);
-
+		Arcflow graph(inst, true, threads, max_states, max_memory);
+		Stopwatch sw;
+		if (binary_output) {
+			graph.write_binary(fout);
+		} else {
+			inst.write(fout);
+			graph.write(fout);
+		}
 		fclose(fout);
+		fout = NULL;
+		graph.add_phase("write", sw, graph.NV, graph.NA);
+		if (argc >= 10 && strcmp(argv[9], "-") != 0) {
+			graph.write_stats(argv[9]);
+		}
 		return 0;
+	} catch (const BudgetExceeded &e) {
+		if (fout != NULL) {
+			fclose(fout);
+			remove(argv[2]);
+		}
+		printf("%s\n", e.what());
+		return EXIT_BUDGET;
 	} catch (const std::runtime_error &e) {
 		if (fout != NULL) {
 			fclose(fout);
@@ -61,6 +96,53 @@ int swig_main(int argc, char **argv) {
 	}
 }
 
+// statistics and log of the last swig_build call of each thread
+static thread_local std::string last_stats;
+static thread_local std::string last_log;
+
+std::vector<int> swig_build(const std::vector<int> &data, int method,
+							int binary, char vtype, bool verbose, int threads,
+							long long max_states, long long max_memory_mb) {
+	// the log is kept for swig_log instead of going to the C-level stdout
+	last_log.clear();
+	Instance inst(data, MVP);
+	inst.method = method;
+	throw_assert(inst.method >= MIN_METHOD && inst.method <= MAX_METHOD);
+	if (binary >= 0) {
+		inst.binary = binary;
+	}
+	inst.vtype = vtype;
+	throw_assert(inst.vtype == 'I' || inst.vtype == 'C');
+
+	throw_assert(threads >= 1);
+	throw_assert(max_states >= 0 && max_memory_mb >= 0);
+
+	Arcflow graph(inst, verbose, threads, max_states, max_memory_mb << 20,
+				  &last_log);
+	Stopwatch sw;
+	graph.sort_arcs();
+	std::vector<int> res = {graph.NV, graph.NA, graph.S, graph.LOSS};
+	res.push_back(graph.Ts.size());
+	res.insert(res.end(), all(graph.Ts));
+	res.reserve(res.size() + 3 * graph.A.size());
+	for (const Arc &a : graph.A) {
+		res.push_back(a.u);
+		res.push_back(a.v);
+		res.push_back(a.label);
+	}
+	graph.add_phase("write", sw, graph.NV, graph.NA);
+	last_stats = graph.stats();
+	return res;
+}
+
+std::string swig_stats() {
+	return last_stats;
+}
+
+std::string swig_log() {
+	return last_log;
+}
+
 int main(int argc, char *argv[]) {
 	return swig_main(argc, argv);
 }
@@ -0,0 +1,117 @@
+/**
+This code is part of the Arc-flow Vector Packing Solver (VPSolver).
+**/
+#include <cstdio>
+#include <cstdlib>
+#include <cstring>
+#include "config.hpp"
+#include "common.hpp"
+#include "arcflow.hpp"
+#include "instance.hpp"
+#include "model.hpp"
+
+int swig_main(int argc, char **argv) {
+	printf(PACKAGE_STRING", Copyright (C) 2013-2022, Filipe Brandao\n");
+	setvbuf(stdout, NULL, _IONBF, 0);
+	if (argc < 3 || argc > 11) {
+		printf("Usage: vbp2model instance.vbp/instance.mvp model.mps/model.lp "
+			   "[graph.afg[b]/-] [method:-3] [binary:0] [vtype:I] [threads:1] "
+			   "[max_states:0] [max_memory_mb:0] [stats.json:-]\n");
+		return 1;
+	}
+	FILE *fout = NULL;
+	try {
+		throw_assert(check_ext(argv[2], ".mps") || check_ext(argv[2], ".lp"));
+		const char *afg_file = NULL;
+		if (argc >= 4 && strcmp(argv[3], "-") != 0) {
+			afg_file = argv[3];
+			throw_assert(check_ext(afg_file, ".afg") ||
+						 check_ext(afg_file, ".afgb"));
+		}
+
+		Instance inst(argv[1]);
+		if (argc >= 5) {
+			inst.method = atoi(argv[4]);
+			throw_assert(inst.method >= MIN_METHOD &&
+						 inst.method <= MAX_METHOD);
+		}
+		if (argc >= 6) {
+			int value = atoi(argv[5]);
+			if (value >= 0) {
+				inst.binary = value;
+			}
+		}
+		if (argc >= 7 && strcmp(argv[6], "-") != 0) {
+			inst.vtype = argv[6][0];
+			throw_assert(inst.vtype == 'I' || inst.vtype == 'C');
+		}
+		int threads = 1;
+		if (argc >= 8) {
+			threads = atoi(argv[7]);
+			throw_assert(threads >= 1);
+		}
+		long long max_states = 0, max_memory = 0;
+		if (argc >= 9) {
+			max_states = atoll(argv[8]);
+			throw_assert(max_states >= 0);
+		}
+		if (argc >= 10) {
+			max_memory = atoll(argv[9]) << 20;
+			throw_assert(max_memory >= 0);
+		}
+
+		Arcflow graph(inst, true, threads, max_states, max_memory);
+		Stopwatch sw;
+		graph.sort_arcs();
+		if (afg_file != NULL) {
+			bool binary_output = check_ext(afg_file, ".afgb");
+			fout = fopen(afg_file, binary_output ? "wb" : "w");
+			if (fout == NULL) {
+				perror("fopen");
+			}
+			throw_assert(fout != NULL);
+			if (binary_output) {
+				graph.write_binary(fout);
+			} else {
+				inst.write(fout);
+				graph.write(fout);
+			}
+			fclose(fout);
+			fout = NULL;
+		}
+		graph.add_phase("write", sw, graph.NV, graph.NA);
+
+		printf("Generating the %s model...",
+			   check_ext(argv[2], ".lp") ? ".LP" : ".MPS");
+		sw = Stopwatch();
+		write_model(graph, argv[2]);
+		printf("DONE!\n");
+		graph.add_phase("write_model", sw, graph.NV, graph.NA);
+		if (argc >= 11 && strcmp(argv[10], "-") != 0) {
+			graph.write_stats(argv[10]);
+		}
+		return 0;
+	} catch (const BudgetExceeded &e) {
+		if (fout != NULL) {
+			fclose(fout);
+		}
+		printf("%s\n", e.what());
+		return EXIT_BUDGET;
+	} catch (const std::runtime_error &e) {
+		if (fout != NULL) {
+			fclose(fout);
+		}
+		printf("%s\n", e.what());
+		return 1;
+	} catch (...) {
+		if (fout != NULL) {
+			fclose(fout);
+		}
+		printf("UnknownError\n");
+		return 1;
+	}
+}
+
+int main(int argc, char *argv[]) {
+	return swig_main(argc, argv);
+}
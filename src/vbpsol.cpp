@@ -1,6 +1,7 @@
 /**
 This code is part of the Arc-flow Vector Packing Solver (VPSolver).
 **/
+#include <cerrno>
 #include <cstdio>
 #include <cstdlib>
 #include <cstring>
@@ -15,22 +16,18 @@ This code is part of the Arc-flow Vector Packing Solver (VPSolver).
 int swig_main(int argc, char **argv) {
 	printf(PACKAGE_STRING", Copyright (C) 2013-2022, Filipe Brandao\n");
 	setvbuf(stdout, NULL, _IONBF, 0);
-	if (argc < 3 || argc > 5) {
-		printf("Usage: vbpsol graph.afg vars.sol "
-			   "[print_instance:0] [pyout:0]\n");
+	if (argc < 3 || argc > 6) {
+		printf("Usage: vbpsol graph.afg[b] vars.sol "
+			   "[print_instance:0] [pyout:0] [solution.txt]\n");
 		return 1;
 	}
-	FILE *fsol = NULL;
 	try {
-		throw_assert(check_ext(argv[1], ".afg"));
+		throw_assert(check_ext(argv[1], ".afg") ||
+					 check_ext(argv[1], ".afgb"));
 		Arcflow afg(argv[1]);
 		Instance &inst = afg.inst;
 
-		fsol = fopen(argv[2], "r");
-		if (fsol == NULL) {
-			perror("fopen");
-		}
-		throw_assert(fsol != NULL);
+		Scanner fsol(argv[2]);
 
 		bool print_inst = false;
 		if (argc >= 4) {
@@ -41,41 +38,43 @@ int swig_main(int argc, char **argv) {
 			pyout = atoi(argv[4]) != 0;
 		}
 
-		int ind;
 		double x;
 		char buf[MAX_LEN];
 		std::map<Arc, int> flow;
-		while (fscanf(fsol, "%s %lf", buf, &x) != EOF) {
-			if (strlen(buf) <= 1) {
+		while (fsol.next_token(buf, MAX_LEN)) {
+			if (!fsol.try_double(&x) || strlen(buf) <= 1) {
+				continue;
+			}
+			const char *first = buf[0] == 'X' ? &buf[1] : &buf[0];
+			char *last;
+			errno = 0;
+			long ind = strtol(first, &last, buf[0] == 'X' ? 16 : 10);
+			if (last == first) {
 				continue;
 			}
-			if (buf[0] == 'X') {
-				sscanf(&buf[1], "%x", &ind);
-			} else {
-				sscanf(&buf[0], "%d", &ind);
+			if (*last != '\0' || errno == ERANGE || ind < 0 || ind >= afg.NA) {
+				char msg[MAX_LEN];
+				snprintf(msg, MAX_LEN, "Error: invalid variable name \"%.64s\"",
+						 buf);
+				throw std::runtime_error(msg);
 			}
-			throw_assert(ind < afg.NA);
 			int rx = static_cast<int>(round(x));
 			throw_assert(x - rx <= EPS);
 			if (rx > 0) {
-				flow[afg.A[ind]] = rx;
+				flow[afg.arc(static_cast<int>(ind))] = rx;
 			}
 		}
-		fclose(fsol);
 
 		ArcflowSol sol(inst, flow, afg.S, afg.Ts, afg.LOSS);
 		sol.print_solution(print_inst, pyout);
+		if (argc >= 6) {
+			sol.write_solution(argv[5]);
+		}
 		return 0;
 	} catch (const std::runtime_error &e) {
-		if (fsol != NULL) {
-			fclose(fsol);
-		}
 		printf("%s\n", e.what());
 		return 1;
 	} catch (...) {
-		if (fsol != NULL) {
-			fclose(fsol);
-		}
 		printf("UnknownError\n");
 		return 1;
 	}
@@ -14,7 +14,8 @@ This code is part of the Arc-flow Vector Packing Solver (VPSolver).
 #include "arcflow.hpp"
 #include "arcflowsol.hpp"
 
-void solve(const Instance &inst, bool print_inst = false, bool pyout = false) {
+void solve(const Instance &inst, bool print_inst = false, bool pyout = false,
+		   const char *sol_file = NULL) {
 	Arcflow afg(inst);
 	char vtype = inst.vtype;
 	GRBEnv env = GRBEnv();
@@ -136,16 +137,19 @@ void solve(const Instance &inst, bool print_inst = false, bool pyout = false) {
 		}
 		ArcflowSol solution(inst, flow, afg.S, afg.Ts, afg.LOSS);
 		solution.print_solution(print_inst, pyout);
+		if (sol_file != NULL) {
+			solution.write_solution(sol_file);
+		}
 	}
 }
 
 int main(int argc, char *argv[]) {
 	printf(PACKAGE_STRING", Copyright (C) 2013-2022, Filipe Brandao\n");
 	setvbuf(stdout, NULL, _IONBF, 0);
-	if (argc < 2 || argc > 7) {
+	if (argc < 2 || argc > 8) {
 		printf("Usage: vpsolver instance.vbp/instance.mvp "
 			   "[method:-3] [binary:0] [vtype:I] "
-			   "[print_instance:0] [pyout:0]\n");
+			   "[print_instance:0] [pyout:0] [solution.txt]\n");
 		return 1;
 	}
 	try {
@@ -173,7 +177,11 @@ int main(int argc, char *argv[]) {
 		if (argc >= 7) {
 			pyout = atoi(argv[6]) != 0;
 		}
-		solve(inst, print_inst, pyout);
+		const char *sol_file = NULL;
+		if (argc >= 8) {
+			sol_file = argv[7];
+		}
+		solve(inst, print_inst, pyout, sol_file);
 		return 0;
 	} catch (GRBException e) {
 		printf("Error code = %d\n", e.getErrorCode());
@@ -1,45 +1,18 @@
 /* ----------------------------------------------------------------------------
- * This file was automatically generated by SWIG (http://www.swig.org).
- * Version 4.0.2
+ * This file was automatically generated by SWIG (https://www.swig.org).
+ * Version 4.5.1
  *
- * This file is not intended to be easily readable and contains a number of
- * coding conventions designed to improve portability and efficiency. Do not make
- * changes to this file unless you know what you are doing--modify the SWIG
- * interface file instead.
+ * Do not make changes to this file unless you know what you are doing - modify
+ * the SWIG interface file instead.
  * ----------------------------------------------------------------------------- */
 
 
-#ifndef SWIGPYTHON
+#define SWIG_VERSION 0x040501
 #define SWIGPYTHON
-#endif
-
 #define SWIG_PYTHON_DIRECTOR_NO_VTABLE
 #define SWIGPYTHON_BUILTIN
 
-
-#ifdef __cplusplus
-/* SwigValueWrapper is described in swig.swg */
-template<typename T> class SwigValueWrapper {
-  struct SwigMovePointer {
-    T *ptr;
-    SwigMovePointer(T *p) : ptr(p) { }
-    ~SwigMovePointer() { delete ptr; }
-    SwigMovePointer& operator=(SwigMovePointer& rhs) { T* oldptr = ptr; ptr = 0; delete oldptr; ptr = rhs.ptr; rhs.ptr = 0; return *this; }
-  } pointer;
-  SwigValueWrapper& operator=(const SwigValueWrapper<T>& rhs);
-  SwigValueWrapper(const SwigValueWrapper<T>& rhs);
-public:
-  SwigValueWrapper() : pointer(0) { }
-  SwigValueWrapper& operator=(const T& t) { SwigMovePointer tmp(new T(t)); pointer = tmp; return *this; }
-  operator T&() const { return *pointer.ptr; }
-  T *operator&() { return pointer.ptr; }
-};
-
-template <typename T> T SwigValueInit() {
-  return T();
-}
-#endif
-
+#define SWIG_name    "_afg2ampl"
 /* -----------------------------------------------------------------------------
  *  This section contains generic SWIG labels for method/variable
  *  declarations/attributes, and other compiler dependent labels.
@@ -75,7 +48,7 @@ template <typename T> T SwigValueInit() {
 #   else
 #     define SWIGUNUSED
 #   endif
-# elif defined(__ICC)
+# elif defined(__ICC) || defined (__clang__)
 #   define SWIGUNUSED __attribute__ ((__unused__))
 # else
 #   define SWIGUNUSED
@@ -164,14 +137,69 @@ template <typename T> T SwigValueInit() {
 # pragma warning disable 592
 #endif
 
+#if defined(__cplusplus) && __cplusplus >= 201103L
+# define SWIG_NOEXCEPT noexcept
+#else
+# define SWIG_NOEXCEPT throw()
+#endif 
+
+#define SWIG_QUOTE_STRING(x) #x
+#define SWIG_STRINGIFY(x) SWIG_QUOTE_STRING(x)
+
+/* -----------------------------------------------------------------------------
+ * swigcompat.swg
+ *
+ * Macros to provide support compatibility with older C and C++ standards.
+ *
+ * Note that SWIG expects __cplusplus to be defined to the appropriate C++ standard.
+ * MSVC users are urged to check and examine the /Zc:__cplusplus compiler option.
+ * See https://learn.microsoft.com/en-us/cpp/build/reference/zc-cplusplus.
+ * ----------------------------------------------------------------------------- */
+
+/* C99 and C++11 should provide snprintf, but define SWIG_NO_SNPRINTF
+ * if you're missing it.
+ */
+#if ((defined __STDC_VERSION__ && __STDC_VERSION__ >= 199901L) || \
+     (defined __cplusplus && __cplusplus >= 201103L) || \
+     defined SWIG_HAVE_SNPRINTF) && \
+    !defined SWIG_NO_SNPRINTF
+# define SWIG_snprintf(O,S,F,A) snprintf(O,S,F,A)
+# define SWIG_snprintf2(O,S,F,A,B) snprintf(O,S,F,A,B)
+#else
+/* Fallback versions ignore the buffer size, but most of our uses either have a
+ * fixed maximum possible size or dynamically allocate a buffer that's large
+ * enough.
+ */
+# define SWIG_snprintf(O,S,F,A) sprintf(O,F,A)
+# define SWIG_snprintf2(O,S,F,A,B) sprintf(O,F,A,B)
+#endif
+
 
 #if defined(__GNUC__) && defined(_WIN32) && !defined(SWIG_PYTHON_NO_HYPOT_WORKAROUND)
 /* Workaround for '::hypot' has not been declared', see https://bugs.python.org/issue11566 */
 # include <math.h>
 #endif
 
+#if !defined(PY_SSIZE_T_CLEAN) && !defined(SWIG_NO_PY_SSIZE_T_CLEAN)
+#define PY_SSIZE_T_CLEAN
+#endif
+
+#if __GNUC__ >= 7
+#pragma GCC diagnostic push
+#if defined(__cplusplus) && __cplusplus >= 201703L
+#pragma GCC diagnostic ignored "-Wregister" /* For python-2.7 headers that use register */
+#endif
+#endif
+
 #if defined(_DEBUG) && defined(SWIG_PYTHON_INTERPRETER_NO_DEBUG)
 /* Use debug wrappers with the Python release dll */
+
+#if defined(_MSC_VER) && _MSC_VER >= 1929
+/* Workaround compilation errors when redefining _DEBUG in MSVC 2019 version 16.10 and later
+ * See https://github.com/swig/swig/issues/2090 */
+# include <corecrt.h>
+#endif
+
 # undef _DEBUG
 # include <Python.h>
 # define _DEBUG 1
@@ -179,6 +207,14 @@ template <typename T> T SwigValueInit() {
 # include <Python.h>
 #endif
 
+
+#if __GNUC__ >= 7
+#pragma GCC diagnostic pop
+#endif
+
+#include <stdio.h>
+#include <stdlib.h>
+
 /* -----------------------------------------------------------------------------
  * swigrun.swg
  *
@@ -188,13 +224,11 @@ template <typename T> T SwigValueInit() {
 
 /* This should only be incremented when either the layout of swig_type_info changes,
    or for whatever reason, the runtime changes incompatibly */
-#define SWIG_RUNTIME_VERSION "4"
+#define SWIG_RUNTIME_VERSION "5"
 
 /* define SWIG_TYPE_TABLE_NAME as "SWIG_TYPE_TABLE" */
 #ifdef SWIG_TYPE_TABLE
-# define SWIG_QUOTE_STRING(x) #x
-# define SWIG_EXPAND_AND_QUOTE_STRING(x) SWIG_QUOTE_STRING(x)
-# define SWIG_TYPE_TABLE_NAME SWIG_EXPAND_AND_QUOTE_STRING(SWIG_TYPE_TABLE)
+# define SWIG_TYPE_TABLE_NAME SWIG_STRINGIFY(SWIG_TYPE_TABLE)
 #else
 # define SWIG_TYPE_TABLE_NAME
 #endif
@@ -225,6 +259,8 @@ template <typename T> T SwigValueInit() {
 #define SWIG_POINTER_DISOWN        0x1
 #define SWIG_CAST_NEW_MEMORY       0x2
 #define SWIG_POINTER_NO_NULL       0x4
+#define SWIG_POINTER_CLEAR         0x8
+#define SWIG_POINTER_RELEASE       (SWIG_POINTER_CLEAR | SWIG_POINTER_DISOWN)
 
 /* Flags for new pointer objects */
 #define SWIG_POINTER_OWN           0x1
@@ -296,7 +332,7 @@ template <typename T> T SwigValueInit() {
    SWIG errors code.
 
    Finally, if the SWIG_CASTRANK_MODE is enabled, the result code
-   allows to return the 'cast rank', for example, if you have this
+   allows returning the 'cast rank', for example, if you have this
 
        int food(double)
        int fooi(int);
@@ -310,7 +346,13 @@ template <typename T> T SwigValueInit() {
 */
 
 #define SWIG_OK                    (0)
+/* Runtime errors are < 0 */
 #define SWIG_ERROR                 (-1)
+/* Errors in range -1 to -99 are in swigerrors.swg (errors for all languages including those not using the runtime) */
+/* Errors in range -100 to -199 are language specific errors defined in *errors.swg */
+/* Errors < -200 are generic runtime specific errors */
+#define SWIG_ERROR_RELEASE_NOT_OWNED (-200)
+
 #define SWIG_IsOK(r)               (r >= 0)
 #define SWIG_ArgError(r)           ((r != SWIG_ERROR) ? r : SWIG_TypeError)
 
@@ -318,20 +360,26 @@ template <typename T> T SwigValueInit() {
 #define SWIG_CASTRANKLIMIT         (1 << 8)
 /* The NewMask denotes the object was created (using new/malloc) */
 #define SWIG_NEWOBJMASK            (SWIG_CASTRANKLIMIT  << 1)
-/* The TmpMask is for in/out typemaps that use temporal objects */
+/* The TmpMask is for in/out typemaps that use temporary objects */
 #define SWIG_TMPOBJMASK            (SWIG_NEWOBJMASK << 1)
+/* The binary string mask denotes using string without unicode */
+#define SWIG_BINARYSTRMASK         (SWIG_TMPOBJMASK << 1)
 /* Simple returning values */
 #define SWIG_BADOBJ                (SWIG_ERROR)
 #define SWIG_OLDOBJ                (SWIG_OK)
 #define SWIG_NEWOBJ                (SWIG_OK | SWIG_NEWOBJMASK)
 #define SWIG_TMPOBJ                (SWIG_OK | SWIG_TMPOBJMASK)
-/* Check, add and del mask methods */
+#define SWIG_BINARYSTR             (SWIG_OK | SWIG_BINARYSTRMASK)
+/* Check, add and del object mask methods */
 #define SWIG_AddNewMask(r)         (SWIG_IsOK(r) ? (r | SWIG_NEWOBJMASK) : r)
 #define SWIG_DelNewMask(r)         (SWIG_IsOK(r) ? (r & ~SWIG_NEWOBJMASK) : r)
 #define SWIG_IsNewObj(r)           (SWIG_IsOK(r) && (r & SWIG_NEWOBJMASK))
 #define SWIG_AddTmpMask(r)         (SWIG_IsOK(r) ? (r | SWIG_TMPOBJMASK) : r)
 #define SWIG_DelTmpMask(r)         (SWIG_IsOK(r) ? (r & ~SWIG_TMPOBJMASK) : r)
 #define SWIG_IsTmpObj(r)           (SWIG_IsOK(r) && (r & SWIG_TMPOBJMASK))
+#define SWIG_AddBinaryStrMask(r)   (SWIG_IsOK(r) ? (r | SWIG_BINARYSTRMASK) : r)
+#define SWIG_DelBinaryStrMask(r)   (SWIG_IsOK(r) ? (r & ~SWIG_BINARYSTRMASK) : r)
+#define SWIG_IsBinaryStr(r)        (SWIG_IsOK(r) && (r & SWIG_BINARYSTRMASK))
 
 /* Cast-Rank Mode */
 #if defined(SWIG_CASTRANK_MODE)
@@ -378,8 +426,8 @@ typedef struct swig_type_info {
 typedef struct swig_cast_info {
   swig_type_info         *type;			/* pointer to type that is equivalent to this type */
   swig_converter_func     converter;		/* function to cast the void pointers */
-  struct swig_cast_info  *next;			/* pointer to next cast in linked list */
-  struct swig_cast_info  *prev;			/* pointer to the previous cast */
+  struct swig_cast_info  *next;			/* pointer to next array of casts | pointer to cast hashed by value */
+  unsigned int            value;		/* index of the last valid element in the array | typename hash value */
 } swig_cast_info;
 
 /* Structure used to store module information
@@ -440,55 +488,147 @@ SWIG_TypeEquiv(const char *nb, const char *tb) {
   return SWIG_TypeCmp(nb, tb) == 0 ? 1 : 0;
 }
 
+/*
+ * Hash function for type name strings, based on maRushPrime1Hash (http://amsoftware.narod.ru/algo2.html)
+ */
+SWIGRUNTIME unsigned int SWIG_Hash(const char *str, unsigned int len) {
+  const unsigned char *data = (const unsigned char *)str;
+  unsigned int hash = len, i = 0, k;
+  int rem = (int)len;
+
+  while (rem >= (int)sizeof(unsigned int)) {
+    memcpy(&k, data, sizeof(unsigned int));
+    k += i++;
+    hash ^= k;
+    hash *= 171717;
+    data += sizeof(unsigned int);
+    rem -= (int)sizeof(unsigned int);
+  }
+
+  switch (rem) {
+    case 3: k = (unsigned int)(data[2]) << 16;
+            k |= (unsigned int)(data[1]) << 8;
+            k |= (unsigned int)(data[0]);
+            k += i++;
+            hash ^= k;
+            hash *= 171717;
+            break;
+    case 2: k = (unsigned int)(data[1]) << 8;
+            k |= (unsigned int)(data[0]);
+            k += i++;
+            hash ^= k;
+            hash *= 171717;
+            break;
+    case 1: k = (unsigned int)(data[0]);
+            k += i++;
+            hash ^= k;
+            hash *= 171717;
+            break;
+  }
+  return hash;
+}
+
 /*
   Check the typename
 */
 SWIGRUNTIME swig_cast_info *
 SWIG_TypeCheck(const char *c, swig_type_info *ty) {
+  static const unsigned int scan_threshold = 4;
   if (ty) {
-    swig_cast_info *iter = ty->cast;
-    while (iter) {
-      if (strcmp(iter->type->name, c) == 0) {
-        if (iter == ty->cast)
-          return iter;
-        /* Move iter to the top of the linked list */
-        iter->prev->next = iter->next;
-        if (iter->next)
-          iter->next->prev = iter->prev;
-        iter->next = ty->cast;
-        iter->prev = 0;
-        if (ty->cast) ty->cast->prev = iter;
-        ty->cast = iter;
-        return iter;
+    swig_cast_info *head = ty->cast;
+    unsigned int hash_value = 0;
+    int hashed = 0;
+
+    while (head) {
+
+      if (strcmp(head->type->name, c) == 0) {
+        return head;
       }
-      iter = iter->next;
+
+      if (head->value) {
+        swig_cast_info *iter;
+        swig_cast_info *last = head + head->value;
+        swig_cast_info *first = head + 1;
+        int search = 1;
+
+        if (!hashed) {
+          if (head->value < scan_threshold) {
+            for (iter = first; iter <= last; iter++) {
+              if (strcmp(iter->type->name, c) == 0) {
+                return iter;
+              }
+            }
+            search = 0;
+          } else {
+            hashed = 1;
+            hash_value = SWIG_Hash(c, (unsigned int)strlen(c));
+          }
+        }
+
+        if (search) {
+          /* Binary search over sorted <'next'|'value'> pairs */
+          do {
+            iter = first + ((last - first) >> 1);
+            if (iter->value < hash_value) {
+              first = iter + 1;
+            } else if (iter->value == hash_value) {
+
+              if (strcmp(iter->next->type->name, c) == 0) {
+                return iter->next;
+              }
+
+              /* Hash collision check */
+              for (last = iter + 1; last->next && last->value == hash_value; last++) {
+                if (strcmp(last->next->type->name, c) == 0) {
+                  return last->next;
+                }
+              }
+              for (first = iter - 1; first != head && first->value == hash_value; first--) {
+                if (strcmp(first->next->type->name, c) == 0) {
+                  return first->next;
+                }
+              }
+              break;
+            } else
+              last = iter - 1;
+          } while (first <= last);
+        }
+      }
+      head = head->next;
     }
   }
   return 0;
 }
 
 /*
-  Identical to SWIG_TypeCheck, except strcmp is replaced with a pointer comparison
+  Check the type by type address
 */
 SWIGRUNTIME swig_cast_info *
-SWIG_TypeCheckStruct(swig_type_info *from, swig_type_info *ty) {
+SWIG_TypeCheckStruct(const swig_type_info *from, swig_type_info *ty) {
   if (ty) {
-    swig_cast_info *iter = ty->cast;
-    while (iter) {
-      if (iter->type == from) {
-        if (iter == ty->cast)
-          return iter;
-        /* Move iter to the top of the linked list */
-        iter->prev->next = iter->next;
-        if (iter->next)
-          iter->next->prev = iter->prev;
-        iter->next = ty->cast;
-        iter->prev = 0;
-        if (ty->cast) ty->cast->prev = iter;
-        ty->cast = iter;
-        return iter;
+    swig_cast_info *head = ty->cast;
+    while (head) {
+      if (head->type == from) {
+        return head;
       }
-      iter = iter->next;
+
+      if (head->value) {
+        swig_cast_info *iter;
+        swig_cast_info *last = head + head->value;
+        swig_cast_info *first = head + 1;
+
+        /* Binary search over sorted array of casts */
+        do {
+          iter = first + ((last - first) >> 1);
+          if (iter->type < from) {
+            first = iter + 1;
+          } else if (iter->type == from) {
+            return iter;
+          } else
+            last = iter - 1;
+        } while (first <= last);
+      }
+      head = head->next;
     }
   }
   return 0;
@@ -531,9 +671,9 @@ SWIG_TypeName(const swig_type_info *ty) {
 SWIGRUNTIME const char *
 SWIG_TypePrettyName(const swig_type_info *type) {
   /* The "str" field contains the equivalent pretty names of the
-     type, separated by vertical-bar characters.  We choose
-     to print the last name, as it is often (?) the most
-     specific. */
+     type, separated by vertical-bar characters.  Choose the last
+     name. It should be the most specific; a fully resolved name
+     but not necessarily with default template parameters expanded. */
   if (!type) return NULL;
   if (type->str != NULL) {
     const char *last_name = type->str;
@@ -551,20 +691,24 @@ SWIG_TypePrettyName(const swig_type_info *type) {
 */
 SWIGRUNTIME void
 SWIG_TypeClientData(swig_type_info *ti, void *clientdata) {
-  swig_cast_info *cast = ti->cast;
+  swig_cast_info *head = ti->cast;
   /* if (ti->clientdata == clientdata) return; */
   ti->clientdata = clientdata;
 
-  while (cast) {
-    if (!cast->converter) {
-      swig_type_info *tc = cast->type;
-      if (!tc->clientdata) {
-	SWIG_TypeClientData(tc, clientdata);
+  while (head) {
+    swig_cast_info *cast;
+    for (cast = head; (unsigned int)(cast - head) <= head->value; cast++) {
+      if (!cast->converter) {
+        swig_type_info *tc = cast->type;
+        if (!tc->clientdata) {
+          SWIG_TypeClientData(tc, clientdata);
+        }
       }
     }
-    cast = cast->next;
+    head = head->next;
   }
 }
+
 SWIGRUNTIME void
 SWIG_TypeNewClientData(swig_type_info *ti, void *clientdata) {
   SWIG_TypeClientData(ti, clientdata);
@@ -703,7 +847,7 @@ SWIG_PackVoidPtr(char *buff, void *ptr, const char *name, size_t bsz) {
   if ((2*sizeof(void *) + 2) > bsz) return 0;
   *(r++) = '_';
   r = SWIG_PackData(r,&ptr,sizeof(void *));
-  if (strlen(name) + 1 > (bsz - (r - buff))) return 0;
+  if (strlen(name) + 1 > (bsz - (size_t)(r - buff))) return 0;
   strcpy(r,name);
   return buff;
 }
@@ -753,7 +897,7 @@ SWIG_UnpackDataName(const char *c, void *ptr, size_t sz, const char *name) {
 }
 #endif
 
-/*  Errors in SWIG */
+/* SWIG Errors applicable to all language modules, values are reserved from -1 to -99 */
 #define  SWIG_UnknownError    	   -1
 #define  SWIG_IOError        	   -2
 #define  SWIG_RuntimeError   	   -3
@@ -769,97 +913,150 @@ SWIG_UnpackDataName(const char *c, void *ptr, size_t sz, const char *name) {
 #define  SWIG_NullReferenceError   -13
 
 
-
-/* Compatibility macros for Python 3 */
-#if PY_VERSION_HEX >= 0x03000000
-
-#define PyClass_Check(obj) PyObject_IsInstance(obj, (PyObject *)&PyType_Type)
-#define PyInt_Check(x) PyLong_Check(x)
-#define PyInt_AsLong(x) PyLong_AsLong(x)
-#define PyInt_FromLong(x) PyLong_FromLong(x)
-#define PyInt_FromSize_t(x) PyLong_FromSize_t(x)
-#define PyString_Check(name) PyBytes_Check(name)
-#define PyString_FromString(x) PyUnicode_FromString(x)
-#define PyString_Format(fmt, args)  PyUnicode_Format(fmt, args)
-#define PyString_AsString(str) PyBytes_AsString(str)
-#define PyString_Size(str) PyBytes_Size(str)	
-#define PyString_InternFromString(key) PyUnicode_InternFromString(key)
-#define Py_TPFLAGS_HAVE_CLASS Py_TPFLAGS_BASETYPE
-#define PyString_AS_STRING(x) PyUnicode_AS_STRING(x)
-#define _PyLong_FromSsize_t(x) PyLong_FromSsize_t(x)
-
+#if !defined(SWIG_NO_HEAPTYPES)
+#if !defined(SWIG_HEAPTYPES)
+#define SWIG_HEAPTYPES
 #endif
-
-#ifndef Py_TYPE
-#  define Py_TYPE(op) ((op)->ob_type)
 #endif
 
-/* SWIG APIs for compatibility of both Python 2 & 3 */
-
-#if PY_VERSION_HEX >= 0x03000000
-#  define SWIG_Python_str_FromFormat PyUnicode_FromFormat
-#else
-#  define SWIG_Python_str_FromFormat PyString_FromFormat
+#if defined(SWIG_HEAPTYPES)
+#if PY_VERSION_HEX < 0x030c0000
+#include <structmember.h>
+#define Py_READONLY READONLY
+#define Py_T_PYSSIZET T_PYSSIZET
+#endif
 #endif
 
+#include <stddef.h> /* For offsetof */
 
-/* Warning: This function will allocate a new string in Python 3,
- * so please call SWIG_Python_str_DelForPy3(x) to free the space.
- */
-SWIGINTERN char*
-SWIG_Python_str_AsChar(PyObject *str)
+
+/* Wrapper around PyUnicode_AsUTF8AndSize - call Py_XDECREF on the returned pbytes when finished with the returned string */
+SWIGINTERN const char *
+SWIG_PyUnicode_AsUTF8AndSize(PyObject *str, Py_ssize_t *psize, PyObject **pbytes)
 {
-#if PY_VERSION_HEX >= 0x03030000
-  return (char *)PyUnicode_AsUTF8(str);
-#elif PY_VERSION_HEX >= 0x03000000
-  char *newstr = 0;
-  str = PyUnicode_AsUTF8String(str);
-  if (str) {
-    char *cstr;
-    Py_ssize_t len;
-    if (PyBytes_AsStringAndSize(str, &cstr, &len) != -1) {
-      newstr = (char *) malloc(len+1);
-      if (newstr)
-        memcpy(newstr, cstr, len+1);
-    }
-    Py_XDECREF(str);
-  }
-  return newstr;
+#if !defined(Py_LIMITED_API) || Py_LIMITED_API+0 >= 0x030A0000
+  *pbytes = NULL;
+  return PyUnicode_AsUTF8AndSize(str, psize);
 #else
-  return PyString_AsString(str);
+  const char *chars;
+  *pbytes = PyUnicode_AsUTF8String(str);
+  chars = *pbytes ? PyBytes_AsString(*pbytes) : NULL;
+  if (chars && psize)
+    *psize = PyBytes_Size(*pbytes);
+  return chars;
 #endif
 }
 
-#if PY_VERSION_HEX >= 0x03030000 || PY_VERSION_HEX < 0x03000000
-#  define SWIG_Python_str_DelForPy3(x)
+#define SWIG_RUNTIME_MODULE "swig_runtime_data" SWIG_RUNTIME_VERSION
+
+/* SWIGPY_USE_CAPSULE is no longer used within SWIG itself, but some user interface files check for it. */
+# define SWIGPY_USE_CAPSULE
+#ifdef SWIGPYTHON_BUILTIN
+# define SWIGPY_CAPSULE_ATTR_NAME "type_pointer_capsule_builtin" SWIG_TYPE_TABLE_NAME
 #else
-#  define SWIG_Python_str_DelForPy3(x) free( (void*) (x) )
+# define SWIGPY_CAPSULE_ATTR_NAME "type_pointer_capsule" SWIG_TYPE_TABLE_NAME
+#endif
+#define SWIGPY_CAPSULE_NAME SWIG_RUNTIME_MODULE "." SWIGPY_CAPSULE_ATTR_NAME
+
+#if defined(Py_LIMITED_API)
+# define PyTuple_GET_ITEM PyTuple_GetItem
+/* Note that PyTuple_SetItem() has different semantics from PyTuple_SET_ITEM as it decref's the original tuple item, so in general they cannot be used
+  interchangeably. However in SWIG-generated code PyTuple_SET_ITEM is only used with newly initialized tuples without any items and for them this does work. */
+# define PyTuple_SET_ITEM PyTuple_SetItem
+# define PyTuple_GET_SIZE PyTuple_Size
+# define PyCFunction_GET_FLAGS PyCFunction_GetFlags
+# define PyCFunction_GET_FUNCTION PyCFunction_GetFunction
+# define PyCFunction_GET_SELF PyCFunction_GetSelf
+# define PyList_GET_ITEM PyList_GetItem
+# define PyList_SET_ITEM PyList_SetItem
+# define PySliceObject PyObject
+#endif
+
+/* Increment and Decrement wrappers - for portability when using the stable abi and for performance otherwise */
+#ifdef Py_LIMITED_API
+# define SWIG_Py_INCREF Py_IncRef
+# define SWIG_Py_XINCREF Py_IncRef
+# define SWIG_Py_DECREF Py_DecRef
+# define SWIG_Py_XDECREF Py_DecRef
+#else
+# define SWIG_Py_INCREF Py_INCREF
+# define SWIG_Py_XINCREF Py_XINCREF
+# define SWIG_Py_DECREF Py_DECREF
+# define SWIG_Py_XDECREF Py_XDECREF
 #endif
 
-
-SWIGINTERN PyObject*
-SWIG_Python_str_FromChar(const char *c)
-{
-#if PY_VERSION_HEX >= 0x03000000
-  return PyUnicode_FromString(c); 
+#if (PY_VERSION_HEX >= 0x030d00a6) && (!defined(Py_LIMITED_API) || Py_LIMITED_API+0 >= 0x030d00a6)
+# define SWIG_PyType_GetFullyQualifiedName PyType_GetFullyQualifiedName
 #else
-  return PyString_FromString(c);
-#endif
+SWIGINTERN PyObject *
+SWIG_PyType_GetFullyQualifiedName(PyTypeObject *type) {
+  PyObject *result = NULL;
+  PyObject *qualname = PyObject_GetAttrString((PyObject *)type, "__qualname__");
+  if (qualname) {
+    PyObject *mod = PyObject_GetAttrString((PyObject *)type, "__module__");
+    if (mod) {
+      if (PyUnicode_Check(mod) && PyUnicode_CompareWithASCIIString(mod, "builtins") && PyUnicode_CompareWithASCIIString(mod, "__main__")) {
+        result = PyUnicode_FromFormat("%U%c%U", mod, '.', qualname);
+        SWIG_Py_DECREF(qualname);
+      } else {
+        result = qualname;
+      }
+      SWIG_Py_DECREF(mod);
+    } else {
+      result = qualname;
+    }
+  }
+
+  return result;
 }
+#endif
 
-#ifndef PyObject_DEL
-# define PyObject_DEL PyObject_Del
+/* gh-114329 added PyList_GetItemRef() to Python 3.13.0a4 */
+#if (PY_VERSION_HEX >= 0x030d00a4) && (!defined(Py_LIMITED_API) || Py_LIMITED_API+0 >= 0x030d00a4)
+# define SWIG_PyList_GetItemRef PyList_GetItemRef
+#else
+SWIGINTERN PyObject *
+SWIG_PyList_GetItemRef(PyObject *op, Py_ssize_t index) {
+  PyObject *item = PyList_GetItem(op, index);
+  Py_XINCREF(item);
+  return item;
+}
 #endif
 
-// SWIGPY_USE_CAPSULE is no longer used within SWIG itself, but some user
-// interface files check for it.
-# define SWIGPY_USE_CAPSULE
-# define SWIGPY_CAPSULE_NAME ("swig_runtime_data" SWIG_RUNTIME_VERSION ".type_pointer_capsule" SWIG_TYPE_TABLE_NAME)
+/* gh-106004 added PyDict_GetItemRef() and PyDict_GetItemStringRef() to Python 3.13.0a1
+   functions are renamed here for compatibility with abi3audit */
+#if (PY_VERSION_HEX >= 0x030d00a1) && (!defined(Py_LIMITED_API) || Py_LIMITED_API+0 >= 0x030d00a1)
+# define SWIG_PyDict_GetItemRef PyDict_GetItemRef
+# define SWIG_PyDict_GetItemStringRef PyDict_GetItemStringRef
+#else
+SWIGINTERN int
+SWIG_PyDict_GetItemRef(PyObject *mp, PyObject *key, PyObject **result) {
+  PyObject *item = PyDict_GetItemWithError(mp, key);
+  if (item != NULL) {
+    *result = (PyObject *)(item);
+    SWIG_Py_INCREF(*result);
+    return 1;
+  }
+  if (!PyErr_Occurred()) {
+    *result = NULL;
+    return 0;
+  }
+  *result = NULL;
+  return -1;
+}
 
-#if PY_VERSION_HEX < 0x03020000
-#define PyDescr_TYPE(x) (((PyDescrObject *)(x))->d_type)
-#define PyDescr_NAME(x) (((PyDescrObject *)(x))->d_name)
-#define Py_hash_t long
+SWIGINTERN int
+SWIG_PyDict_GetItemStringRef(PyObject *mp, const char *key, PyObject **result) {
+  int res;
+  PyObject *key_obj = PyUnicode_FromString(key);
+  if (key_obj == NULL) {
+    *result = NULL;
+    return -1;
+  }
+  res = SWIG_PyDict_GetItemRef(mp, key_obj, result);
+  Py_DECREF(key_obj);
+  return res;
+}
 #endif
 
 /* -----------------------------------------------------------------------------
@@ -903,6 +1100,9 @@ SWIG_Python_ErrorType(int code) {
   case SWIG_AttributeError:
     type = PyExc_AttributeError;
     break;
+  case SWIG_NullReferenceError:
+    type = PyExc_TypeError;
+    break;
   default:
     type = PyExc_RuntimeError;
   }
@@ -921,16 +1121,17 @@ SWIG_Python_AddErrorMsg(const char* mesg)
     PyErr_Fetch(&type, &value, &traceback);
   if (value) {
     PyObject *old_str = PyObject_Str(value);
-    const char *tmp = SWIG_Python_str_AsChar(old_str);
+    PyObject *bytes = NULL;
+    const char *tmp = SWIG_PyUnicode_AsUTF8AndSize(old_str, NULL, &bytes);
     PyErr_Clear();
-    Py_XINCREF(type);
+    SWIG_Py_XINCREF(type);
     if (tmp)
       PyErr_Format(type, "%s %s", tmp, mesg);
     else
       PyErr_Format(type, "%s", mesg);
-    SWIG_Python_str_DelForPy3(tmp);
-    Py_DECREF(old_str);
-    Py_DECREF(value);
+    SWIG_Py_XDECREF(bytes);
+    SWIG_Py_DECREF(old_str);
+    SWIG_Py_DECREF(value);
   } else {
     PyErr_SetString(PyExc_RuntimeError, mesg);
   }
@@ -954,13 +1155,13 @@ SWIG_Python_RaiseOrModifyTypeError(const char *message)
     PyObject *newvalue;
     PyObject *type = NULL, *value = NULL, *traceback = NULL;
     PyErr_Fetch(&type, &value, &traceback);
-#if PY_VERSION_HEX >= 0x03000000
     newvalue = PyUnicode_FromFormat("%S\nAdditional information:\n%s", value, message);
-#else
-    newvalue = PyString_FromFormat("%s\nAdditional information:\n%s", PyString_AsString(value), message);
-#endif
-    Py_XDECREF(value);
-    PyErr_Restore(type, newvalue, traceback);
+    if (newvalue) {
+      SWIG_Py_XDECREF(value);
+      PyErr_Restore(type, newvalue, traceback);
+    } else {
+      PyErr_Restore(type, value, traceback);
+    }
   } else {
     /* Raise TypeError using given message */
     PyErr_SetString(PyExc_TypeError, message);
@@ -977,8 +1178,12 @@ SWIG_Python_RaiseOrModifyTypeError(const char *message)
 #    define SWIG_PYTHON_USE_GIL
 #  endif
 #  if defined(SWIG_PYTHON_USE_GIL) /* Use PyGILState threads calls */
-#    ifndef SWIG_PYTHON_INITIALIZE_THREADS
-#     define SWIG_PYTHON_INITIALIZE_THREADS  PyEval_InitThreads() 
+#    if !defined(SWIG_PYTHON_INITIALIZE_THREADS)
+#      if PY_VERSION_HEX < 0x03070000
+#        define SWIG_PYTHON_INITIALIZE_THREADS PyEval_InitThreads()
+#      else
+#        define SWIG_PYTHON_INITIALIZE_THREADS
+#      endif
 #    endif
 #    ifdef __cplusplus /* C++ code */
        class SWIG_Python_Thread_Block {
@@ -993,7 +1198,7 @@ SWIG_Python_RaiseOrModifyTypeError(const char *message)
          bool status;
          PyThreadState *save;
        public:
-         void end() { if (status) { PyEval_RestoreThread(save); status = false; }}
+         void end() { if (status) { status = false; PyEval_RestoreThread(save); }}
          SWIG_Python_Thread_Allow() : status(true), save(PyEval_SaveThread()) {}
          ~SWIG_Python_Thread_Allow() { end(); }
        };
@@ -1072,12 +1277,8 @@ typedef struct swig_const_info {
  *
  * ----------------------------------------------------------------------------- */
 
-#if PY_VERSION_HEX < 0x02070000 /* 2.7.0 */
-# error "This version of SWIG only supports Python >= 2.7"
-#endif
-
-#if PY_VERSION_HEX >= 0x03000000 && PY_VERSION_HEX < 0x03020000
-# error "This version of SWIG only supports Python 3 >= 3.2"
+#if PY_VERSION_HEX < 0x03050000
+# error "This version of SWIG only supports Python >= 3.5"
 #endif
 
 /* Common SWIG API */
@@ -1128,7 +1329,6 @@ typedef struct swig_const_info {
 #define SWIG_Error(code, msg)            		SWIG_Python_SetErrorMsg(SWIG_ErrorType(code), msg) 
 #define SWIG_fail                        		goto fail					   
 
-
 /* Runtime API implementation */
 
 /* Error manipulation */
@@ -1137,7 +1337,7 @@ SWIGINTERN void
 SWIG_Python_SetErrorObj(PyObject *errtype, PyObject *obj) {
   SWIG_PYTHON_THREAD_BEGIN_BLOCK; 
   PyErr_SetObject(errtype, obj);
-  Py_DECREF(obj);
+  SWIG_Py_DECREF(obj);
   SWIG_PYTHON_THREAD_END_BLOCK;
 }
 
@@ -1156,15 +1356,15 @@ SWIG_Python_SetErrorMsg(PyObject *errtype, const char *msg) {
 
 SWIGINTERN void
 SwigPyBuiltin_AddPublicSymbol(PyObject *seq, const char *key) {
-  PyObject *s = PyString_InternFromString(key);
+  PyObject *s = PyUnicode_InternFromString(key);
   PyList_Append(seq, s);
-  Py_DECREF(s);
+  SWIG_Py_DECREF(s);
 }
 
 SWIGINTERN void
 SWIG_Python_SetConstant(PyObject *d, PyObject *public_interface, const char *name, PyObject *obj) {   
   PyDict_SetItemString(d, name, obj);
-  Py_DECREF(obj);
+  SWIG_Py_DECREF(obj);
   if (public_interface)
     SwigPyBuiltin_AddPublicSymbol(public_interface, name);
 }
@@ -1174,28 +1374,52 @@ SWIG_Python_SetConstant(PyObject *d, PyObject *public_interface, const char *nam
 SWIGINTERN void
 SWIG_Python_SetConstant(PyObject *d, const char *name, PyObject *obj) {   
   PyDict_SetItemString(d, name, obj);
-  Py_DECREF(obj);                            
+  SWIG_Py_DECREF(obj);
 }
 
 #endif
 
-/* Append a value to the result obj */
+/* SWIG runtime data Python module */
+static PyObject *Swig_runtime_data_module_global = NULL;
+
+/* Create/obtain the single swig_runtime_data module which is used across different SWIG generated modules */
+SWIGINTERN PyObject *
+SWIG_runtime_data_module(void) {
+  if (!Swig_runtime_data_module_global) {
+#if (PY_VERSION_HEX >= 0x030d0000) && (!defined(Py_LIMITED_API) || Py_LIMITED_API+0 >= 0x030d0000)
+    /* free-threading note: the GIL is always enabled when this function is first called
+       by SWIG_init, so there's no risk of race conditions */
+    Swig_runtime_data_module_global = PyImport_AddModuleRef(SWIG_RUNTIME_MODULE);
+#else
+    Swig_runtime_data_module_global = PyImport_AddModule(SWIG_RUNTIME_MODULE);
+    SWIG_Py_XINCREF(Swig_runtime_data_module_global);
+#endif
+  }
+  assert(Swig_runtime_data_module_global);
+  return Swig_runtime_data_module_global;
+}
 
+/* Append a value to the result obj */
 SWIGINTERN PyObject*
-SWIG_Python_AppendOutput(PyObject* result, PyObject* obj) {
+SWIG_Python_AppendOutput(PyObject* result, PyObject* obj, int is_void) {
   if (!result) {
     result = obj;
-  } else if (result == Py_None) {
-    Py_DECREF(result);
+  } else if (result == Py_None && is_void) {
+    SWIG_Py_DECREF(result);
     result = obj;
   } else {
     if (!PyList_Check(result)) {
       PyObject *o2 = result;
       result = PyList_New(1);
-      PyList_SetItem(result, 0, o2);
+      if (result) {
+        PyList_SET_ITEM(result, 0, o2);
+      } else {
+        SWIG_Py_DECREF(obj);
+        return o2;
+      }
     }
     PyList_Append(result,obj);
-    Py_DECREF(obj);
+    SWIG_Py_DECREF(obj);
   }
   return result;
 }
@@ -1274,6 +1498,256 @@ SWIG_Python_CheckNoKeywords(PyObject *kwargs, const char *name) {
 #define SWIG_STATIC_POINTER(var)  var = 0; if (!var) var
 #endif
 
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/* Python-specific SWIG API */
+#define SWIG_newvarlink()                             SWIG_Python_newvarlink()
+#define SWIG_addvarlink(p, name, get_attr, set_attr)  SWIG_Python_addvarlink(p, name, get_attr, set_attr)
+#define SWIG_InstallConstants(d, constants)           SWIG_Python_InstallConstants(d, constants)
+ 
+/* -----------------------------------------------------------------------------
+ * global variable support code.
+ * ----------------------------------------------------------------------------- */
+ 
+typedef struct swig_globalvar {   
+  char       *name;                  /* Name of global variable */
+  PyObject *(*get_attr)(void);       /* Return the current value */
+  int       (*set_attr)(PyObject *); /* Set the value */
+  struct swig_globalvar *next;
+} swig_globalvar;
+
+typedef struct swig_varlinkobject {
+  PyObject_HEAD
+  swig_globalvar *vars;
+} swig_varlinkobject;
+
+SWIGINTERN PyObject *
+SwigVarLink_repr(PyObject *SWIGUNUSEDPARM(v)) {
+  return PyUnicode_InternFromString("<Swig global variables>");
+}
+
+SWIGINTERN PyObject *
+SwigVarLink_str(PyObject *o) {
+  swig_varlinkobject *v = (swig_varlinkobject *) o;
+  PyObject *str = PyUnicode_InternFromString("(");
+  PyObject *tail;
+  PyObject *joined;
+  swig_globalvar *var;
+  for (var = v->vars; var; var=var->next) {
+    tail = PyUnicode_FromString(var->name);
+    joined = PyUnicode_Concat(str, tail);
+    SWIG_Py_DECREF(str);
+    SWIG_Py_DECREF(tail);
+    str = joined;
+    if (var->next) {
+        tail = PyUnicode_InternFromString(", ");
+        joined = PyUnicode_Concat(str, tail);
+        SWIG_Py_DECREF(str);
+        SWIG_Py_DECREF(tail);
+        str = joined;
+    }
+  }
+  tail = PyUnicode_InternFromString(")");
+  joined = PyUnicode_Concat(str, tail);
+  SWIG_Py_DECREF(str);
+  SWIG_Py_DECREF(tail);
+  str = joined;
+  return str;
+}
+
+SWIGINTERN void
+SwigVarLink_dealloc(PyObject *o) {
+  swig_varlinkobject *v = (swig_varlinkobject *) o;
+  swig_globalvar *var = v->vars;
+  while (var) {
+    swig_globalvar *n = var->next;
+    free(var->name);
+    free(var);
+    var = n;
+  }
+}
+
+SWIGINTERN PyObject *
+SwigVarLink_getattr(PyObject *o, char *n) {
+  swig_varlinkobject *v = (swig_varlinkobject *) o;
+  PyObject *res = NULL;
+  swig_globalvar *var = v->vars;
+  while (var) {
+    if (strcmp(var->name,n) == 0) {
+      res = (*var->get_attr)();
+      break;
+    }
+    var = var->next;
+  }
+  if (res == NULL && !PyErr_Occurred()) {
+    PyErr_Format(PyExc_AttributeError, "Unknown C global variable '%s'", n);
+  }
+  return res;
+}
+
+SWIGINTERN int
+SwigVarLink_setattr(PyObject *o, char *n, PyObject *p) {
+  swig_varlinkobject *v = (swig_varlinkobject *) o;
+  int res = 1;
+  swig_globalvar *var = v->vars;
+  while (var) {
+    if (strcmp(var->name,n) == 0) {
+      res = (*var->set_attr)(p);
+      break;
+    }
+    var = var->next;
+  }
+  if (res == 1 && !PyErr_Occurred()) {
+    PyErr_Format(PyExc_AttributeError, "Unknown C global variable '%s'", n);
+  }
+  return res;
+}
+
+SWIGINTERN PyTypeObject*
+SwigVarLink_TypeOnce(void) {
+  static char SwigVarLink_doc[] = "Swig variable link object";
+#ifndef SWIG_HEAPTYPES
+  static PyTypeObject varlink_type;
+  static int type_init = 0;
+  if (!type_init) {
+    const PyTypeObject tmp = {
+      PyVarObject_HEAD_INIT(NULL, 0)
+      SWIG_RUNTIME_MODULE ".SwigVarLink", /* tp_name */
+      sizeof(swig_varlinkobject),         /* tp_basicsize */
+      0,                                  /* tp_itemsize */
+      (destructor) SwigVarLink_dealloc,   /* tp_dealloc */
+#if PY_VERSION_HEX < 0x030800b4
+      (printfunc)0,                       /* tp_print */
+#else
+      (Py_ssize_t)0,                      /* tp_vectorcall_offset */
+#endif
+      (getattrfunc) SwigVarLink_getattr,  /* tp_getattr */
+      (setattrfunc) SwigVarLink_setattr,  /* tp_setattr */
+      0,                                  /* tp_compare */
+      (reprfunc) SwigVarLink_repr,        /* tp_repr */
+      0,                                  /* tp_as_number */
+      0,                                  /* tp_as_sequence */
+      0,                                  /* tp_as_mapping */
+      0,                                  /* tp_hash */
+      0,                                  /* tp_call */
+      (reprfunc) SwigVarLink_str,         /* tp_str */
+      0,                                  /* tp_getattro */
+      0,                                  /* tp_setattro */
+      0,                                  /* tp_as_buffer */
+      0,                                  /* tp_flags */
+      SwigVarLink_doc,                    /* tp_doc */
+      0,                                  /* tp_traverse */
+      0,                                  /* tp_clear */
+      0,                                  /* tp_richcompare */
+      0,                                  /* tp_weaklistoffset */
+      0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0, /* tp_iter -> tp_weaklist */
+      0,                                  /* tp_del */
+      0,                                  /* tp_version_tag */
+      0,                                  /* tp_finalize */
+#if PY_VERSION_HEX >= 0x03080000
+      0,                                  /* tp_vectorcall */
+#endif
+#if (PY_VERSION_HEX >= 0x03080000) && (PY_VERSION_HEX < 0x03090000)
+      0,                                  /* tp_print */
+#endif
+#if PY_VERSION_HEX >= 0x030c0000
+      0,                                  /* tp_watched */
+#endif
+#if PY_VERSION_HEX >= 0x030d00a4
+      0,                                  /* tp_versions_used */
+#endif
+#ifdef COUNT_ALLOCS
+      0,                                  /* tp_allocs */
+      0,                                  /* tp_frees */
+      0,                                  /* tp_maxalloc */
+      0,                                  /* tp_prev */
+      0                                   /* tp_next */
+#endif
+    };
+    PyObject *runtime_data_module = SWIG_runtime_data_module();
+    varlink_type = tmp;
+    type_init = 1;
+    if (PyType_Ready(&varlink_type) < 0)
+      return NULL;
+    if (PyModule_AddObject(runtime_data_module, "SwigVarLink", (PyObject *)&varlink_type) == 0)
+      SWIG_Py_INCREF((PyObject *)&varlink_type);
+  }
+  return &varlink_type;
+#else
+  PyType_Slot slots[] = {
+    { Py_tp_dealloc, (void *)SwigVarLink_dealloc },
+    { Py_tp_repr, (void *)SwigVarLink_repr },
+    { Py_tp_getattr, (void *)SwigVarLink_getattr },
+    { Py_tp_setattr, (void *)SwigVarLink_setattr },
+    { Py_tp_str, (void *)SwigVarLink_str },
+    { Py_tp_doc, (void *)SwigVarLink_doc },
+    { 0, NULL }
+  };
+  PyType_Spec spec = {
+    SWIG_RUNTIME_MODULE ".SwigVarLink",
+    sizeof(swig_varlinkobject),
+    0,
+    Py_TPFLAGS_DEFAULT,
+    slots
+  };
+  PyObject *pytype = PyType_FromSpec(&spec);
+  PyObject *runtime_data_module = SWIG_runtime_data_module();
+  if (pytype && PyModule_AddObject(runtime_data_module, "SwigVarLink", pytype) == 0)
+    SWIG_Py_INCREF(pytype);
+  return (PyTypeObject *)pytype;
+#endif
+}
+
+SWIGRUNTIME PyTypeObject*
+SwigVarLink_Type(void) {
+  static PyTypeObject *SWIG_STATIC_POINTER(type) = SwigVarLink_TypeOnce();
+  return type;
+}
+
+/* Create a variable linking object for use later */
+SWIGINTERN PyObject *
+SWIG_Python_newvarlink(void) {
+  swig_varlinkobject *result = PyObject_New(swig_varlinkobject, SwigVarLink_Type());
+  if (result) {
+    result->vars = 0;
+  }
+  return ((PyObject*) result);
+}
+
+SWIGINTERN void 
+SWIG_Python_addvarlink(PyObject *p, const char *name, PyObject *(*get_attr)(void), int (*set_attr)(PyObject *p)) {
+  swig_varlinkobject *v = (swig_varlinkobject *) p;
+  swig_globalvar *gv = (swig_globalvar *) malloc(sizeof(swig_globalvar));
+  if (gv) {
+    size_t size = strlen(name)+1;
+    gv->name = (char *)malloc(size);
+    if (gv->name) {
+      memcpy(gv->name, name, size);
+      gv->get_attr = get_attr;
+      gv->set_attr = set_attr;
+      gv->next = v->vars;
+    }
+  }
+  v->vars = gv;
+}
+
+
+static PyObject *Swig_Globals_global = NULL;
+  
+SWIGINTERN PyObject *
+SWIG_globals(void) {
+  if (Swig_Globals_global == NULL) {
+    Swig_Globals_global = SWIG_newvarlink();
+  }
+  return Swig_Globals_global;
+}
+
+#ifdef __cplusplus
+}
+#endif
+
 /* -----------------------------------------------------------------------------
  * Pointer declarations
  * ----------------------------------------------------------------------------- */
@@ -1297,7 +1771,7 @@ SWIGRUNTIMEINLINE PyObject *
 SWIG_Py_Void(void)
 {
   PyObject *none = Py_None;
-  Py_INCREF(none);
+  SWIG_Py_INCREF(none);
   return none;
 }
 
@@ -1340,22 +1814,29 @@ SwigPyClientData_New(PyObject* obj)
     SwigPyClientData *data = (SwigPyClientData *)malloc(sizeof(SwigPyClientData));
     /* the klass element */
     data->klass = obj;
-    Py_INCREF(data->klass);
+    SWIG_Py_INCREF(data->klass);
     /* the newraw method and newargs arguments used to create a new raw instance */
-    if (PyClass_Check(obj)) {
+    if (PyObject_IsInstance(obj, (PyObject *)&PyType_Type)) {
       data->newraw = 0;
+      SWIG_Py_INCREF(obj);
       data->newargs = obj;
-      Py_INCREF(obj);
     } else {
       data->newraw = PyObject_GetAttrString(data->klass, "__new__");
       if (data->newraw) {
-	Py_INCREF(data->newraw);
-	data->newargs = PyTuple_New(1);
-	PyTuple_SetItem(data->newargs, 0, obj);
+        data->newargs = PyTuple_New(1);
+        if (data->newargs) {
+          SWIG_Py_INCREF(obj);
+          PyTuple_SET_ITEM(data->newargs, 0, obj);
+        } else {
+          SWIG_Py_DECREF(data->newraw);
+          SWIG_Py_DECREF(data->klass);
+          free(data);
+          return 0;
+        }
       } else {
-	data->newargs = obj;
+        SWIG_Py_INCREF(obj);
+        data->newargs = obj;
       }
-      Py_INCREF(data->newargs);
     }
     /* the destroy method, aka as the C++ delete method */
     data->destroy = PyObject_GetAttrString(data->klass, "__swig_destroy__");
@@ -1364,10 +1845,7 @@ SwigPyClientData_New(PyObject* obj)
       data->destroy = 0;
     }
     if (data->destroy) {
-      int flags;
-      Py_INCREF(data->destroy);
-      flags = PyCFunction_GET_FLAGS(data->destroy);
-      data->delargs = !(flags & (METH_O));
+      data->delargs = !(PyCFunction_GET_FLAGS(data->destroy) & METH_O);
     } else {
       data->delargs = 0;
     }
@@ -1378,10 +1856,13 @@ SwigPyClientData_New(PyObject* obj)
 }
 
 SWIGRUNTIME void 
-SwigPyClientData_Del(SwigPyClientData *data) {
-  Py_XDECREF(data->newraw);
-  Py_XDECREF(data->newargs);
-  Py_XDECREF(data->destroy);
+SwigPyClientData_Del(SwigPyClientData *data)
+{
+  SWIG_Py_XDECREF(data->klass);
+  SWIG_Py_XDECREF(data->newraw);
+  SWIG_Py_XDECREF(data->newargs);
+  SWIG_Py_XDECREF(data->destroy);
+  free(data);
 }
 
 /* =============== SwigPyObject =====================*/
@@ -1392,9 +1873,8 @@ typedef struct {
   swig_type_info *ty;
   int own;
   PyObject *next;
-#ifdef SWIGPYTHON_BUILTIN
-  PyObject *dict;
-#endif
+  PyObject *swigdict;
+  PyObject *weakreflist;
 } SwigPyObject;
 
 
@@ -1405,11 +1885,11 @@ SwigPyObject_get___dict__(PyObject *v, PyObject *SWIGUNUSEDPARM(args))
 {
   SwigPyObject *sobj = (SwigPyObject *)v;
 
-  if (!sobj->dict)
-    sobj->dict = PyDict_New();
+  if (!sobj->swigdict)
+    sobj->swigdict = PyDict_New();
 
-  Py_INCREF(sobj->dict);
-  return sobj->dict;
+  SWIG_Py_XINCREF(sobj->swigdict);
+  return sobj->swigdict;
 }
 
 #endif
@@ -1426,18 +1906,17 @@ SwigPyObject_format(const char* fmt, SwigPyObject *v)
   PyObject *res = NULL;
   PyObject *args = PyTuple_New(1);
   if (args) {
-    if (PyTuple_SetItem(args, 0, SwigPyObject_long(v)) == 0) {
-      PyObject *ofmt = SWIG_Python_str_FromChar(fmt);
+    PyObject *val = SwigPyObject_long(v);
+    if (val) {
+      PyObject *ofmt;
+      PyTuple_SET_ITEM(args, 0, val);
+      ofmt = PyUnicode_FromString(fmt);
       if (ofmt) {
-#if PY_VERSION_HEX >= 0x03000000
-	res = PyUnicode_Format(ofmt,args);
-#else
-	res = PyString_Format(ofmt,args);
-#endif
-	Py_DECREF(ofmt);
+        res = PyUnicode_Format(ofmt,args);
+        SWIG_Py_DECREF(ofmt);
       }
-      Py_DECREF(args);
     }
+    SWIG_Py_DECREF(args);
   }
   return res;
 }
@@ -1458,23 +1937,24 @@ SWIGRUNTIME PyObject *
 SwigPyObject_repr(SwigPyObject *v)
 {
   const char *name = SWIG_TypePrettyName(v->ty);
-  PyObject *repr = SWIG_Python_str_FromFormat("<Swig Object of type '%s' at %p>", (name ? name : "unknown"), (void *)v);
-  if (v->next) {
+  PyObject *repr = PyUnicode_FromFormat("<Swig Object of type '%s' at %p>", (name ? name : "unknown"), (void *)v);
+  if (repr && v->next) {
     PyObject *nrep = SwigPyObject_repr((SwigPyObject *)v->next);
-# if PY_VERSION_HEX >= 0x03000000
-    PyObject *joined = PyUnicode_Concat(repr, nrep);
-    Py_DecRef(repr);
-    Py_DecRef(nrep);
-    repr = joined;
-# else
-    PyString_ConcatAndDel(&repr,nrep);
-# endif
+    if (nrep) {
+      PyObject *joined = PyUnicode_Concat(repr, nrep);
+      SWIG_Py_DECREF(repr);
+      SWIG_Py_DECREF(nrep);
+      repr = joined;
+    } else {
+      SWIG_Py_DECREF(repr);
+      repr = NULL;
+    }
   }
-  return repr;  
+  return repr;
 }
 
 /* We need a version taking two PyObject* parameters so it's a valid
- * PyCFunction to use in swigobject_methods[]. */
+ * PyCFunction to use in SwigPyObject_methods[]. */
 SWIGRUNTIME PyObject *
 SwigPyObject_repr2(PyObject *v, PyObject *SWIGUNUSEDPARM(args))
 {
@@ -1482,24 +1962,33 @@ SwigPyObject_repr2(PyObject *v, PyObject *SWIGUNUSEDPARM(args))
 }
 
 SWIGRUNTIME int
-SwigPyObject_compare(SwigPyObject *v, SwigPyObject *w)
+SwigPyObject_compare(PyObject *v, PyObject *w)
 {
-  void *i = v->ptr;
-  void *j = w->ptr;
+  /* tp_compare is only called when both objects have the same type, so
+   * the casts are guaranteed to be ok. */
+  void *i = ((SwigPyObject *)v)->ptr;
+  void *j = ((SwigPyObject *)w)->ptr;
   return (i < j) ? -1 : ((i > j) ? 1 : 0);
 }
 
-/* Added for Python 3.x, would it also be useful for Python 2.x? */
+SWIGRUNTIMEINLINE int SwigPyObject_Check(PyObject *);
+
+/* Rich comparison support */
 SWIGRUNTIME PyObject*
-SwigPyObject_richcompare(SwigPyObject *v, SwigPyObject *w, int op)
+SwigPyObject_richcompare(PyObject *v, PyObject *w, int op)
 {
-  PyObject* res;
-  if( op != Py_EQ && op != Py_NE ) {
-    Py_INCREF(Py_NotImplemented);
-    return Py_NotImplemented;
+  PyObject* res = NULL;
+  if (!PyErr_Occurred()) {
+    /* Per https://docs.python.org/3/c-api/typeobj.html#c.PyTypeObject.tp_richcompare
+     * the first argument is guaranteed to be an instance of SwigPyObject, but the
+     * second is not, so we typecheck that one. */
+    if ((op != Py_EQ && op != Py_NE) || !SwigPyObject_Check(w)) {
+      SWIG_Py_INCREF(Py_NotImplemented);
+      return Py_NotImplemented;
+    }
+    res = PyBool_FromLong( (SwigPyObject_compare(v, w)==0) == (op == Py_EQ) ? 1 : 0);
   }
-  res = PyBool_FromLong( (SwigPyObject_compare(v, w)==0) == (op == Py_EQ) ? 1 : 0);
-  return res;  
+  return res;
 }
 
 
@@ -1508,7 +1997,7 @@ SWIGRUNTIME PyTypeObject* SwigPyObject_TypeOnce(void);
 #ifdef SWIGPYTHON_BUILTIN
 static swig_type_info *SwigPyObject_stype = 0;
 SWIGRUNTIME PyTypeObject*
-SwigPyObject_type(void) {
+SwigPyObject_Type(void) {
     SwigPyClientData *cd;
     assert(SwigPyObject_stype);
     cd = (SwigPyClientData*) SwigPyObject_stype->clientdata;
@@ -1518,7 +2007,7 @@ SwigPyObject_type(void) {
 }
 #else
 SWIGRUNTIME PyTypeObject*
-SwigPyObject_type(void) {
+SwigPyObject_Type(void) {
   static PyTypeObject *SWIG_STATIC_POINTER(type) = SwigPyObject_TypeOnce();
   return type;
 }
@@ -1526,20 +2015,33 @@ SwigPyObject_type(void) {
 
 SWIGRUNTIMEINLINE int
 SwigPyObject_Check(PyObject *op) {
+  PyTypeObject *target_tp = SwigPyObject_Type();
+  PyTypeObject *op_type = Py_TYPE(op);
 #ifdef SWIGPYTHON_BUILTIN
-  PyTypeObject *target_tp = SwigPyObject_type();
-  if (PyType_IsSubtype(op->ob_type, target_tp))
-    return 1;
-  return (strcmp(op->ob_type->tp_name, "SwigPyObject") == 0);
+  /* Only builtin types have SwigPyObject as a base type */
+  return PyType_IsSubtype(op_type, target_tp);
 #else
-  return (Py_TYPE(op) == SwigPyObject_type())
-    || (strcmp(Py_TYPE(op)->tp_name,"SwigPyObject") == 0);
+  /* Check for an exact match to SwigPyObject */
+  if (op_type == target_tp) {
+    return 1;
+  } else {
+    /* Fallback for multiple modules */
+    int cmp;
+    PyObject *tpname = SWIG_PyType_GetFullyQualifiedName(op_type);
+    if (!tpname)
+      return 0;
+    cmp = PyUnicode_CompareWithASCIIString(tpname, SWIG_RUNTIME_MODULE ".SwigPyObject");
+    SWIG_Py_DECREF(tpname);
+    return cmp == 0;
+  }
 #endif
 }
 
 SWIGRUNTIME PyObject *
 SwigPyObject_New(void *ptr, swig_type_info *ty, int own);
 
+static PyObject* Swig_Capsule_global = NULL;
+
 SWIGRUNTIME void
 SwigPyObject_dealloc(PyObject *v)
 {
@@ -1566,8 +2068,12 @@ SwigPyObject_dealloc(PyObject *v)
       if (data->delargs) {
         /* we need to create a temporary object to carry the destroy operation */
         PyObject *tmp = SwigPyObject_New(sobj->ptr, ty, 0);
-        res = SWIG_Python_CallFunctor(destroy, tmp);
-        Py_DECREF(tmp);
+        if (tmp) {
+          res = SWIG_Python_CallFunctor(destroy, tmp);
+        } else {
+          res = 0;
+        }
+        SWIG_Py_XDECREF(tmp);
       } else {
         PyCFunction meth = PyCFunction_GET_FUNCTION(destroy);
         PyObject *mself = PyCFunction_GET_SELF(destroy);
@@ -1578,7 +2084,7 @@ SwigPyObject_dealloc(PyObject *v)
 
       PyErr_Restore(type, value, traceback);
 
-      Py_XDECREF(res);
+      SWIG_Py_XDECREF(res);
     } 
 #if !defined(SWIG_PYTHON_SILENT_MEMLEAK)
     else {
@@ -1586,9 +2092,11 @@ SwigPyObject_dealloc(PyObject *v)
       printf("swig/python detected a memory leak of type '%s', no destructor found.\n", (name ? name : "unknown"));
     }
 #endif
-  } 
-  Py_XDECREF(next);
-  PyObject_DEL(v);
+    SWIG_Py_XDECREF(Swig_Capsule_global);
+  }
+  SWIG_Py_XDECREF(next);
+  SWIG_Py_XDECREF(sobj->swigdict);
+  PyObject_Free(v);
 }
 
 SWIGRUNTIME PyObject* 
@@ -1599,8 +2107,9 @@ SwigPyObject_append(PyObject* v, PyObject* next)
     PyErr_SetString(PyExc_TypeError, "Attempt to append a non SwigPyObject");
     return NULL;
   }
+  ((SwigPyObject *)next)->next = sobj->next;
   sobj->next = next;
-  Py_INCREF(next);
+  SWIG_Py_INCREF(next);
   return SWIG_Py_Void();
 }
 
@@ -1609,7 +2118,7 @@ SwigPyObject_next(PyObject* v, PyObject *SWIGUNUSEDPARM(args))
 {
   SwigPyObject *sobj = (SwigPyObject *) v;
   if (sobj->next) {    
-    Py_INCREF(sobj->next);
+    SWIG_Py_INCREF(sobj->next);
     return sobj->next;
   } else {
     return SWIG_Py_Void();
@@ -1643,9 +2152,9 @@ SwigPyObject_own(PyObject *v, PyObject *args)
     PyObject *obj = PyBool_FromLong(sobj->own);
     if (val) {
       if (PyObject_IsTrue(val)) {
-        SwigPyObject_acquire(v,args);
+        SWIG_Py_DECREF(SwigPyObject_acquire(v,args));
       } else {
-        SwigPyObject_disown(v,args);
+        SWIG_Py_DECREF(SwigPyObject_disown(v,args));
       }
     } 
     return obj;
@@ -1653,7 +2162,7 @@ SwigPyObject_own(PyObject *v, PyObject *args)
 }
 
 static PyMethodDef
-swigobject_methods[] = {
+SwigPyObject_methods[] = {
   {"disown",  SwigPyObject_disown,  METH_NOARGS,  "releases ownership of the pointer"},
   {"acquire", SwigPyObject_acquire, METH_NOARGS,  "acquires ownership of the pointer"},
   {"own",     SwigPyObject_own,     METH_VARARGS, "returns/sets ownership of the pointer"},
@@ -1665,74 +2174,48 @@ swigobject_methods[] = {
 
 SWIGRUNTIME PyTypeObject*
 SwigPyObject_TypeOnce(void) {
-  static char swigobject_doc[] = "Swig object carries a C/C++ instance pointer";
-
+  static char SwigPyObject_doc[] = "Swig object holding a C/C++ pointer";
+#ifndef SWIG_HEAPTYPES
   static PyNumberMethods SwigPyObject_as_number = {
     (binaryfunc)0, /*nb_add*/
     (binaryfunc)0, /*nb_subtract*/
     (binaryfunc)0, /*nb_multiply*/
-    /* nb_divide removed in Python 3 */
-#if PY_VERSION_HEX < 0x03000000
-    (binaryfunc)0, /*nb_divide*/
-#endif
     (binaryfunc)0, /*nb_remainder*/
     (binaryfunc)0, /*nb_divmod*/
     (ternaryfunc)0,/*nb_power*/
     (unaryfunc)0,  /*nb_negative*/
     (unaryfunc)0,  /*nb_positive*/
     (unaryfunc)0,  /*nb_absolute*/
-    (inquiry)0,    /*nb_nonzero*/
+    (inquiry)0,    /*nb_bool*/
     0,		   /*nb_invert*/
     0,		   /*nb_lshift*/
     0,		   /*nb_rshift*/
     0,		   /*nb_and*/
     0,		   /*nb_xor*/
     0,		   /*nb_or*/
-#if PY_VERSION_HEX < 0x03000000
-    0,   /*nb_coerce*/
-#endif
     (unaryfunc)SwigPyObject_long, /*nb_int*/
-#if PY_VERSION_HEX < 0x03000000
-    (unaryfunc)SwigPyObject_long, /*nb_long*/
-#else
     0, /*nb_reserved*/
-#endif
     (unaryfunc)0,                 /*nb_float*/
-#if PY_VERSION_HEX < 0x03000000
-    (unaryfunc)SwigPyObject_oct,  /*nb_oct*/
-    (unaryfunc)SwigPyObject_hex,  /*nb_hex*/
-#endif
-#if PY_VERSION_HEX >= 0x03050000 /* 3.5 */
     0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0 /* nb_inplace_add -> nb_inplace_matrix_multiply */
-#elif PY_VERSION_HEX >= 0x03000000 /* 3.0 */
-    0,0,0,0,0,0,0,0,0,0,0,0,0,0,0 /* nb_inplace_add -> nb_index, nb_inplace_divide removed */
-#else
-    0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0 /* nb_inplace_add -> nb_index */
-#endif
   };
 
   static PyTypeObject swigpyobject_type;
   static int type_init = 0;
   if (!type_init) {
     const PyTypeObject tmp = {
-#if PY_VERSION_HEX >= 0x03000000
       PyVarObject_HEAD_INIT(NULL, 0)
-#else
-      PyObject_HEAD_INIT(NULL)
-      0,                                    /* ob_size */
-#endif
-      "SwigPyObject",                       /* tp_name */
+      SWIG_RUNTIME_MODULE ".SwigPyObject",  /* tp_name */
       sizeof(SwigPyObject),                 /* tp_basicsize */
       0,                                    /* tp_itemsize */
       (destructor)SwigPyObject_dealloc,     /* tp_dealloc */
-      0,                                    /* tp_print */
+#if PY_VERSION_HEX < 0x030800b4
+      (printfunc)0,                         /* tp_print */
+#else
+      (Py_ssize_t)0,                        /* tp_vectorcall_offset */
+#endif
       (getattrfunc)0,                       /* tp_getattr */
       (setattrfunc)0,                       /* tp_setattr */
-#if PY_VERSION_HEX >= 0x03000000
       0, /* tp_reserved in 3.0.1, tp_compare in 3.0.0 but not used */
-#else
-      (cmpfunc)SwigPyObject_compare,        /* tp_compare */
-#endif
       (reprfunc)SwigPyObject_repr,          /* tp_repr */
       &SwigPyObject_as_number,              /* tp_as_number */
       0,                                    /* tp_as_sequence */
@@ -1744,14 +2227,14 @@ SwigPyObject_TypeOnce(void) {
       0,                                    /* tp_setattro */
       0,                                    /* tp_as_buffer */
       Py_TPFLAGS_DEFAULT,                   /* tp_flags */
-      swigobject_doc,                       /* tp_doc */
+      SwigPyObject_doc,                     /* tp_doc */
       0,                                    /* tp_traverse */
       0,                                    /* tp_clear */
       (richcmpfunc)SwigPyObject_richcompare,/* tp_richcompare */
-      0,                                    /* tp_weaklistoffset */
+      offsetof(SwigPyObject, weakreflist),  /* tp_weaklistoffset */
       0,                                    /* tp_iter */
       0,                                    /* tp_iternext */
-      swigobject_methods,                   /* tp_methods */
+      SwigPyObject_methods,                 /* tp_methods */
       0,                                    /* tp_members */
       0,                                    /* tp_getset */
       0,                                    /* tp_base */
@@ -1771,15 +2254,19 @@ SwigPyObject_TypeOnce(void) {
       0,                                    /* tp_weaklist */
       0,                                    /* tp_del */
       0,                                    /* tp_version_tag */
-#if PY_VERSION_HEX >= 0x03040000
       0,                                    /* tp_finalize */
-#endif
 #if PY_VERSION_HEX >= 0x03080000
       0,                                    /* tp_vectorcall */
 #endif
 #if (PY_VERSION_HEX >= 0x03080000) && (PY_VERSION_HEX < 0x03090000)
       0,                                    /* tp_print */
 #endif
+#if PY_VERSION_HEX >= 0x030c0000
+      0,                                    /* tp_watched */
+#endif
+#if PY_VERSION_HEX >= 0x030d00a4
+      0,                                    /* tp_versions_used */
+#endif
 #ifdef COUNT_ALLOCS
       0,                                    /* tp_allocs */
       0,                                    /* tp_frees */
@@ -1788,23 +2275,75 @@ SwigPyObject_TypeOnce(void) {
       0                                     /* tp_next */
 #endif
     };
+    PyObject *runtime_data_module = SWIG_runtime_data_module();
     swigpyobject_type = tmp;
     type_init = 1;
-    if (PyType_Ready(&swigpyobject_type) < 0)
+    if (PyType_Ready(&swigpyobject_type) != 0)
       return NULL;
+    if (PyModule_AddObject(runtime_data_module, "SwigPyObject", (PyObject *)&swigpyobject_type) == 0)
+      SWIG_Py_INCREF((PyObject *)&swigpyobject_type);
   }
   return &swigpyobject_type;
+#else
+  static PyMemberDef SwigPyObject_members[] = {
+      { (char *)"__dictoffset__", Py_T_PYSSIZET, offsetof(SwigPyObject, swigdict), Py_READONLY, NULL },
+      { (char *)"__weaklistoffset__", Py_T_PYSSIZET, offsetof(SwigPyObject, weakreflist), Py_READONLY, NULL },
+      { NULL, 0, 0, 0, NULL }
+  };
+  PyType_Slot slots[] = {
+    { Py_tp_dealloc, (void *)SwigPyObject_dealloc },
+    { Py_tp_repr, (void *)SwigPyObject_repr },
+    { Py_tp_getattro, (void *)PyObject_GenericGetAttr },
+    { Py_tp_doc, (void *)SwigPyObject_doc },
+    { Py_tp_richcompare, (void *)SwigPyObject_richcompare },
+    { Py_tp_methods, (void *)SwigPyObject_methods },
+    { Py_nb_int, (void *)SwigPyObject_long },
+    { Py_tp_members, (void *)SwigPyObject_members },
+    { 0, NULL }
+  };
+  PyType_Spec spec = {
+    SWIG_RUNTIME_MODULE ".SwigPyObject",
+    sizeof(SwigPyObject),
+    0,
+    Py_TPFLAGS_DEFAULT|Py_TPFLAGS_BASETYPE,
+    slots
+  };
+  PyObject *pytype = PyType_FromSpec(&spec);
+  PyObject *runtime_data_module = SWIG_runtime_data_module();
+#if !defined(Py_LIMITED_API)
+/* While this __dictoffset__ is only used with the builtin wrappers, SwigPyObject ought to be
+   identical when created for use by proxy class wrappers in case it is shared across multiple modules. */
+#if PY_VERSION_HEX < 0x03090000
+    /* Workaround as __dictoffset__ and __weaklistoffset__ above are only supported from python-3.9 */
+  if (pytype) {
+    ((PyTypeObject *)pytype)->tp_dictoffset = offsetof(SwigPyObject, swigdict);
+    ((PyTypeObject *)pytype)->tp_weaklistoffset = offsetof(SwigPyObject, weakreflist);
+  }
+#endif
+#endif
+  if (pytype && PyModule_AddObject(runtime_data_module, "SwigPyObject", pytype) == 0)
+    SWIG_Py_INCREF(pytype);
+  return (PyTypeObject *)pytype;
+#endif
 }
 
 SWIGRUNTIME PyObject *
 SwigPyObject_New(void *ptr, swig_type_info *ty, int own)
 {
-  SwigPyObject *sobj = PyObject_NEW(SwigPyObject, SwigPyObject_type());
+  SwigPyObject *sobj = PyObject_New(SwigPyObject, SwigPyObject_Type());
   if (sobj) {
     sobj->ptr  = ptr;
     sobj->ty   = ty;
     sobj->own  = own;
     sobj->next = 0;
+    sobj->swigdict = 0;
+    sobj->weakreflist = 0;
+    if (own == SWIG_POINTER_OWN) {
+      /* Obtain a reference to the Python capsule wrapping the module information, so that the
+       * module information is correctly destroyed after all SWIG python objects have been freed
+       * by the GC (and corresponding destructors invoked) */
+      SWIG_Py_XINCREF(Swig_Capsule_global);
+    }
   }
   return (PyObject *)sobj;
 }
@@ -1825,9 +2364,9 @@ SwigPyPacked_repr(SwigPyPacked *v)
 {
   char result[SWIG_BUFFER_SIZE];
   if (SWIG_PackDataName(result, v->pack, v->size, 0, sizeof(result))) {
-    return SWIG_Python_str_FromFormat("<Swig Packed at %s%s>", result, v->ty->name);
+    return PyUnicode_FromFormat("<Swig Packed at %s%s>", result, v->ty->name);
   } else {
-    return SWIG_Python_str_FromFormat("<Swig Packed %s>", v->ty->name);
+    return PyUnicode_FromFormat("<Swig Packed %s>", v->ty->name);
   }  
 }
 
@@ -1836,10 +2375,10 @@ SwigPyPacked_str(SwigPyPacked *v)
 {
   char result[SWIG_BUFFER_SIZE];
   if (SWIG_PackDataName(result, v->pack, v->size, 0, sizeof(result))){
-    return SWIG_Python_str_FromFormat("%s%s", result, v->ty->name);
+    return PyUnicode_FromFormat("%s%s", result, v->ty->name);
   } else {
-    return SWIG_Python_str_FromChar(v->ty->name);
-  }  
+    return PyUnicode_FromString(v->ty->name);
+  }
 }
 
 SWIGRUNTIME int
@@ -1854,15 +2393,28 @@ SwigPyPacked_compare(SwigPyPacked *v, SwigPyPacked *w)
 SWIGRUNTIME PyTypeObject* SwigPyPacked_TypeOnce(void);
 
 SWIGRUNTIME PyTypeObject*
-SwigPyPacked_type(void) {
+SwigPyPacked_Type(void) {
   static PyTypeObject *SWIG_STATIC_POINTER(type) = SwigPyPacked_TypeOnce();
   return type;
 }
 
 SWIGRUNTIMEINLINE int
 SwigPyPacked_Check(PyObject *op) {
-  return ((op)->ob_type == SwigPyPacked_TypeOnce()) 
-    || (strcmp((op)->ob_type->tp_name,"SwigPyPacked") == 0);
+  PyTypeObject *target_tp = SwigPyPacked_Type();
+  PyTypeObject *op_type = Py_TYPE(op);
+  /* Check for an exact match to SwigPyPacked */
+  if (op_type == target_tp) {
+    return 1;
+  } else {
+    /* Fallback for multiple modules */
+    int cmp;
+    PyObject *tpname = SWIG_PyType_GetFullyQualifiedName(op_type);
+    if (!tpname)
+      return 0;
+    cmp = PyUnicode_CompareWithASCIIString(tpname, SWIG_RUNTIME_MODULE ".SwigPyPacked");
+    SWIG_Py_DECREF(tpname);
+    return cmp == 0;
+  }
 }
 
 SWIGRUNTIME void
@@ -1872,34 +2424,30 @@ SwigPyPacked_dealloc(PyObject *v)
     SwigPyPacked *sobj = (SwigPyPacked *) v;
     free(sobj->pack);
   }
-  PyObject_DEL(v);
+  PyObject_Free(v);
 }
 
 SWIGRUNTIME PyTypeObject*
 SwigPyPacked_TypeOnce(void) {
-  static char swigpacked_doc[] = "Swig object carries a C/C++ instance pointer";
+  static char SwigPyPacked_doc[] = "Swig object holding a C/C++ function pointer";
+#ifndef SWIG_HEAPTYPES
   static PyTypeObject swigpypacked_type;
   static int type_init = 0;
   if (!type_init) {
     const PyTypeObject tmp = {
-#if PY_VERSION_HEX>=0x03000000
       PyVarObject_HEAD_INIT(NULL, 0)
-#else
-      PyObject_HEAD_INIT(NULL)
-      0,                                    /* ob_size */
-#endif
-      "SwigPyPacked",                       /* tp_name */
+      SWIG_RUNTIME_MODULE ".SwigPyPacked",  /* tp_name */
       sizeof(SwigPyPacked),                 /* tp_basicsize */
       0,                                    /* tp_itemsize */
       (destructor)SwigPyPacked_dealloc,     /* tp_dealloc */
-      0,                                    /* tp_print */
+#if PY_VERSION_HEX < 0x030800b4
+      (printfunc)0,                         /* tp_print */
+#else
+      (Py_ssize_t)0,                        /* tp_vectorcall_offset */
+#endif
       (getattrfunc)0,                       /* tp_getattr */
       (setattrfunc)0,                       /* tp_setattr */
-#if PY_VERSION_HEX>=0x03000000
       0, /* tp_reserved in 3.0.1 */
-#else
-      (cmpfunc)SwigPyPacked_compare,        /* tp_compare */
-#endif
       (reprfunc)SwigPyPacked_repr,          /* tp_repr */
       0,                                    /* tp_as_number */
       0,                                    /* tp_as_sequence */
@@ -1911,7 +2459,7 @@ SwigPyPacked_TypeOnce(void) {
       0,                                    /* tp_setattro */
       0,                                    /* tp_as_buffer */
       Py_TPFLAGS_DEFAULT,                   /* tp_flags */
-      swigpacked_doc,                       /* tp_doc */
+      SwigPyPacked_doc,                     /* tp_doc */
       0,                                    /* tp_traverse */
       0,                                    /* tp_clear */
       0,                                    /* tp_richcompare */
@@ -1938,15 +2486,19 @@ SwigPyPacked_TypeOnce(void) {
       0,                                    /* tp_weaklist */
       0,                                    /* tp_del */
       0,                                    /* tp_version_tag */
-#if PY_VERSION_HEX >= 0x03040000
       0,                                    /* tp_finalize */
-#endif
 #if PY_VERSION_HEX >= 0x03080000
       0,                                    /* tp_vectorcall */
 #endif
 #if (PY_VERSION_HEX >= 0x03080000) && (PY_VERSION_HEX < 0x03090000)
       0,                                    /* tp_print */
 #endif
+#if PY_VERSION_HEX >= 0x030c0000
+      0,                                    /* tp_watched */
+#endif
+#if PY_VERSION_HEX >= 0x030d00a4
+      0,                                    /* tp_versions_used */
+#endif
 #ifdef COUNT_ALLOCS
       0,                                    /* tp_allocs */
       0,                                    /* tp_frees */
@@ -1955,18 +2507,43 @@ SwigPyPacked_TypeOnce(void) {
       0                                     /* tp_next */
 #endif
     };
+    PyObject *runtime_data_module = SWIG_runtime_data_module();
     swigpypacked_type = tmp;
     type_init = 1;
-    if (PyType_Ready(&swigpypacked_type) < 0)
+    if (PyType_Ready(&swigpypacked_type) != 0)
       return NULL;
+    if (PyModule_AddObject(runtime_data_module, "SwigPyPacked", (PyObject *)&swigpypacked_type) == 0)
+      SWIG_Py_INCREF((PyObject *)&swigpypacked_type);
   }
   return &swigpypacked_type;
+#else
+  PyType_Slot slots[] = {
+    { Py_tp_dealloc, (void *)SwigPyPacked_dealloc },
+    { Py_tp_repr, (void *)SwigPyPacked_repr },
+    { Py_tp_str, (void *)SwigPyPacked_str },
+    { Py_tp_getattro, (void *)PyObject_GenericGetAttr },
+    { Py_tp_doc, (void *)SwigPyPacked_doc },
+    { 0, NULL }
+  };
+  PyType_Spec spec = {
+    SWIG_RUNTIME_MODULE ".SwigPyPacked",
+    sizeof(SwigPyPacked),
+    0,
+    Py_TPFLAGS_DEFAULT,
+    slots
+  };
+  PyObject *pytype = PyType_FromSpec(&spec);
+  PyObject *runtime_data_module = SWIG_runtime_data_module();
+  if (pytype && PyModule_AddObject(runtime_data_module, "SwigPyPacked", pytype) == 0)
+    SWIG_Py_INCREF(pytype);
+  return (PyTypeObject *)pytype;
+#endif
 }
 
 SWIGRUNTIME PyObject *
 SwigPyPacked_New(void *ptr, size_t size, swig_type_info *ty)
 {
-  SwigPyPacked *sobj = PyObject_NEW(SwigPyPacked, SwigPyPacked_type());
+  SwigPyPacked *sobj = PyObject_New(SwigPyPacked, SwigPyPacked_Type());
   if (sobj) {
     void *pack = malloc(size);
     if (pack) {
@@ -1975,7 +2552,7 @@ SwigPyPacked_New(void *ptr, size_t size, swig_type_info *ty)
       sobj->ty   = ty;
       sobj->size = size;
     } else {
-      PyObject_DEL((PyObject *) sobj);
+      PyObject_Free((PyObject *)sobj);
       sobj = 0;
     }
   }
@@ -2005,17 +2582,11 @@ SWIGRUNTIME PyObject *
 SWIG_This(void)
 {
   if (Swig_This_global == NULL)
-    Swig_This_global = SWIG_Python_str_FromChar("this");
+    Swig_This_global = PyUnicode_FromString("this");
   return Swig_This_global;
 }
 
-/* #define SWIG_PYTHON_SLOW_GETSET_THIS */
-
-/* TODO: I don't know how to implement the fast getset in Python 3 right now */
-#if PY_VERSION_HEX>=0x03000000
-#define SWIG_PYTHON_SLOW_GETSET_THIS 
-#endif
-
+/* Returns a borrowed reference to the 'this' object */
 SWIGRUNTIME SwigPyObject *
 SWIG_Python_GetSwigThis(PyObject *pyobj) 
 {
@@ -2026,51 +2597,30 @@ SWIG_Python_GetSwigThis(PyObject *pyobj)
 
 #ifdef SWIGPYTHON_BUILTIN
   (void)obj;
-# ifdef PyWeakref_CheckProxy
   if (PyWeakref_CheckProxy(pyobj)) {
-    pyobj = PyWeakref_GET_OBJECT(pyobj);
+#if PY_VERSION_HEX >= 0x030d0000
+    if (PyWeakref_GetRef(pyobj, &pyobj) > 0)
+      Py_DECREF(pyobj);
+    else
+      pyobj = NULL;
+#else
+    pyobj = PyWeakref_GetObject(pyobj);
+#endif
     if (pyobj && SwigPyObject_Check(pyobj))
       return (SwigPyObject*) pyobj;
   }
-# endif
   return NULL;
 #else
 
   obj = 0;
 
-#if !defined(SWIG_PYTHON_SLOW_GETSET_THIS)
-  if (PyInstance_Check(pyobj)) {
-    obj = _PyInstance_Lookup(pyobj, SWIG_This());      
-  } else {
-    PyObject **dictptr = _PyObject_GetDictPtr(pyobj);
-    if (dictptr != NULL) {
-      PyObject *dict = *dictptr;
-      obj = dict ? PyDict_GetItem(dict, SWIG_This()) : 0;
-    } else {
-#ifdef PyWeakref_CheckProxy
-      if (PyWeakref_CheckProxy(pyobj)) {
-	PyObject *wobj = PyWeakref_GET_OBJECT(pyobj);
-	return wobj ? SWIG_Python_GetSwigThis(wobj) : 0;
-      }
-#endif
-      obj = PyObject_GetAttr(pyobj,SWIG_This());
-      if (obj) {
-	Py_DECREF(obj);
-      } else {
-	if (PyErr_Occurred()) PyErr_Clear();
-	return 0;
-      }
-    }
-  }
-#else
-  obj = PyObject_GetAttr(pyobj,SWIG_This());
+  obj = PyObject_GetAttr(pyobj, SWIG_This());
   if (obj) {
-    Py_DECREF(obj);
+    SWIG_Py_DECREF(obj);
   } else {
     if (PyErr_Occurred()) PyErr_Clear();
     return 0;
   }
-#endif
   if (obj && !SwigPyObject_Check(obj)) {
     /* a PyObject is called 'this', try to get the 'real this'
        SwigPyObject from it */ 
@@ -2147,12 +2697,19 @@ SWIG_Python_ConvertPtrAndOwn(PyObject *obj, void **ptr, swig_type_info *ty, int
     }
   }
   if (sobj) {
-    if (own)
-      *own = *own | sobj->own;
-    if (flags & SWIG_POINTER_DISOWN) {
-      sobj->own = 0;
+    if (((flags & SWIG_POINTER_RELEASE) == SWIG_POINTER_RELEASE) && !sobj->own) {
+      res = SWIG_ERROR_RELEASE_NOT_OWNED;
+    } else {
+      if (own)
+        *own = *own | sobj->own;
+      if (flags & SWIG_POINTER_DISOWN) {
+        sobj->own = 0;
+      }
+      if (flags & SWIG_POINTER_CLEAR) {
+        sobj->ptr = 0;
+      }
+      res = SWIG_OK;
     }
-    res = SWIG_OK;
   } else {
     if (implicit_conv) {
       SwigPyClientData *data = ty ? (SwigPyClientData *) ty->clientdata : 0;
@@ -2184,7 +2741,7 @@ SWIG_Python_ConvertPtrAndOwn(PyObject *obj, void **ptr, swig_type_info *ty, int
                 }
               }
             }
-            Py_DECREF(impconv);
+            SWIG_Py_DECREF(impconv);
           }
         }
       }
@@ -2211,10 +2768,20 @@ SWIG_Python_ConvertFunctionPtr(PyObject *obj, void **ptr, swig_type_info *ty) {
     swig_cast_info *tc;
 
     /* here we get the method pointer for callbacks */
+#ifndef Py_LIMITED_API
     const char *doc = (((PyCFunctionObject *)obj) -> m_ml -> ml_doc);
+#else
+    PyObject* pystr_doc = PyObject_GetAttrString(obj, "__doc__");
+    PyObject *bytes = NULL;
+    const char *doc = pystr_doc ? SWIG_PyUnicode_AsUTF8AndSize(pystr_doc, NULL, &bytes) : 0;
+#endif
     const char *desc = doc ? strstr(doc, "swig_ptr: ") : 0;
     if (desc)
       desc = ty ? SWIG_UnpackVoidPtr(desc + 10, &vptr, ty->name) : 0;
+#ifdef Py_LIMITED_API
+    SWIG_Py_XDECREF(bytes);
+    SWIG_Py_XDECREF(pystr_doc);
+#endif
     if (!desc)
       return SWIG_ERROR;
     tc = SWIG_TypeCheck(desc,ty);
@@ -2262,50 +2829,34 @@ SWIG_Python_NewShadowInstance(SwigPyClientData *data, PyObject *swig_this)
   if (newraw) {
     inst = PyObject_Call(newraw, data->newargs, NULL);
     if (inst) {
-#if !defined(SWIG_PYTHON_SLOW_GETSET_THIS)
-      PyObject **dictptr = _PyObject_GetDictPtr(inst);
-      if (dictptr != NULL) {
-	PyObject *dict = *dictptr;
-	if (dict == NULL) {
-	  dict = PyDict_New();
-	  *dictptr = dict;
-	  PyDict_SetItem(dict, SWIG_This(), swig_this);
-	}
-      }
-#else
       if (PyObject_SetAttr(inst, SWIG_This(), swig_this) == -1) {
-        Py_DECREF(inst);
+        SWIG_Py_DECREF(inst);
         inst = 0;
       }
-#endif
     }
   } else {
-#if PY_VERSION_HEX >= 0x03000000
     PyObject *empty_args = PyTuple_New(0);
     if (empty_args) {
       PyObject *empty_kwargs = PyDict_New();
       if (empty_kwargs) {
-        inst = ((PyTypeObject *)data->newargs)->tp_new((PyTypeObject *)data->newargs, empty_args, empty_kwargs);
-        Py_DECREF(empty_kwargs);
+#ifndef Py_LIMITED_API
+        newfunc newfn = ((PyTypeObject *)data->newargs)->tp_new;
+#else
+        newfunc newfn = (newfunc)PyType_GetSlot((PyTypeObject *)data->newargs, Py_tp_new);
+#endif
+        inst = newfn((PyTypeObject *)data->newargs, empty_args, empty_kwargs);
+        SWIG_Py_DECREF(empty_kwargs);
         if (inst) {
           if (PyObject_SetAttr(inst, SWIG_This(), swig_this) == -1) {
-            Py_DECREF(inst);
+            SWIG_Py_DECREF(inst);
             inst = 0;
           } else {
-            Py_TYPE(inst)->tp_flags &= ~Py_TPFLAGS_VALID_VERSION_TAG;
+            PyType_Modified(Py_TYPE(inst));
           }
         }
       }
-      Py_DECREF(empty_args);
+      SWIG_Py_DECREF(empty_args);
     }
-#else
-    PyObject *dict = PyDict_New();
-    if (dict) {
-      PyDict_SetItem(dict, SWIG_This(), swig_this);
-      inst = PyInstance_NewRaw(data->newargs, dict);
-      Py_DECREF(dict);
-    }
-#endif
   }
   return inst;
 }
@@ -2313,17 +2864,6 @@ SWIG_Python_NewShadowInstance(SwigPyClientData *data, PyObject *swig_this)
 SWIGRUNTIME int
 SWIG_Python_SetSwigThis(PyObject *inst, PyObject *swig_this)
 {
-#if !defined(SWIG_PYTHON_SLOW_GETSET_THIS)
-  PyObject **dictptr = _PyObject_GetDictPtr(inst);
-  if (dictptr != NULL) {
-    PyObject *dict = *dictptr;
-    if (dict == NULL) {
-      dict = PyDict_New();
-      *dictptr = dict;
-    }
-    return PyDict_SetItem(dict, SWIG_This(), swig_this);
-  }
-#endif
   return PyObject_SetAttr(inst, SWIG_This(), swig_this);
 } 
 
@@ -2336,7 +2876,7 @@ SWIG_Python_InitShadowInstance(PyObject *args) {
   } else {
     SwigPyObject *sthis = SWIG_Python_GetSwigThis(obj[0]);
     if (sthis) {
-      SwigPyObject_append((PyObject*) sthis, obj[1]);
+      SWIG_Py_DECREF(SwigPyObject_append((PyObject*) sthis, obj[1]));
     } else {
       if (SWIG_Python_SetSwigThis(obj[0], obj[1]) != 0)
         return NULL;
@@ -2363,20 +2903,25 @@ SWIG_Python_NewPointerObj(PyObject *self, void *ptr, swig_type_info *type, int f
     if (flags & SWIG_BUILTIN_TP_INIT) {
       newobj = (SwigPyObject*) self;
       if (newobj->ptr) {
-        PyObject *next_self = clientdata->pytype->tp_alloc(clientdata->pytype, 0);
+#ifndef Py_LIMITED_API
+        allocfunc alloc = clientdata->pytype->tp_alloc;
+#else
+        allocfunc alloc = (allocfunc)PyType_GetSlot(clientdata->pytype, Py_tp_alloc);
+#endif
+        PyObject *next_self = alloc(clientdata->pytype, 0);
         while (newobj->next)
 	  newobj = (SwigPyObject *) newobj->next;
         newobj->next = next_self;
         newobj = (SwigPyObject *)next_self;
-#ifdef SWIGPYTHON_BUILTIN
-        newobj->dict = 0;
-#endif
+        newobj->swigdict = 0;
+        newobj->weakreflist = 0;
       }
     } else {
       newobj = PyObject_New(SwigPyObject, clientdata->pytype);
-#ifdef SWIGPYTHON_BUILTIN
-      newobj->dict = 0;
-#endif
+      if (newobj) {
+        newobj->swigdict = 0;
+        newobj->weakreflist = 0;
+      }
     }
     if (newobj) {
       newobj->ptr = ptr;
@@ -2393,7 +2938,7 @@ SWIG_Python_NewPointerObj(PyObject *self, void *ptr, swig_type_info *type, int f
   robj = SwigPyObject_New(ptr, type, own);
   if (robj && clientdata && !(flags & SWIG_POINTER_NOSHADOW)) {
     PyObject *inst = SWIG_Python_NewShadowInstance(clientdata, robj);
-    Py_DECREF(robj);
+    SWIG_Py_DECREF(robj);
     robj = inst;
   }
   return robj;
@@ -2414,72 +2959,103 @@ SWIG_Python_NewPackedObj(void *ptr, size_t sz, swig_type_info *type) {
 void *SWIG_ReturnGlobalTypeList(void *);
 #endif
 
+static PyObject *Swig_TypeCache_global = NULL;
+
+/* The python cached type query */
+SWIGRUNTIME PyObject *
+SWIG_Python_TypeCache(void) {
+  if (Swig_TypeCache_global == NULL) {
+    Swig_TypeCache_global = PyDict_New();
+  }
+  return Swig_TypeCache_global;
+}
+
 SWIGRUNTIME swig_module_info *
 SWIG_Python_GetModule(void *SWIGUNUSEDPARM(clientdata)) {
+#ifdef SWIG_LINK_RUNTIME
   static void *type_pointer = (void *)0;
   /* first check if module already created */
   if (!type_pointer) {
-#ifdef SWIG_LINK_RUNTIME
     type_pointer = SWIG_ReturnGlobalTypeList((void *)0);
+  }
 #else
-    type_pointer = PyCapsule_Import(SWIGPY_CAPSULE_NAME, 0);
-    if (PyErr_Occurred()) {
-      PyErr_Clear();
-      type_pointer = (void *)0;
-    }
-#endif
+  void *type_pointer = PyCapsule_Import(SWIGPY_CAPSULE_NAME, 0);
+  if (PyErr_Occurred()) {
+    PyErr_Clear();
+    type_pointer = (void *)0;
   }
+#endif
   return (swig_module_info *) type_pointer;
 }
 
+
+#if defined(SWIG_REFCNT_DEBUG)
+#define SWIG_PYOBJ_REFCNT(OBJ) fprintf(stdout, "" #OBJ " count %ld\n", (OBJ ? Py_REFCNT(OBJ) : 0))
+#else
+#define SWIG_PYOBJ_REFCNT(OBJ)
+#endif
+
+static int interpreter_counter = 0; /* how many (sub-)interpreters are using swig_module's types */
+
 SWIGRUNTIME void
 SWIG_Python_DestroyModule(PyObject *obj)
 {
   swig_module_info *swig_module = (swig_module_info *) PyCapsule_GetPointer(obj, SWIGPY_CAPSULE_NAME);
   swig_type_info **types = swig_module->types;
   size_t i;
-  for (i =0; i < swig_module->size; ++i) {
+  if (--interpreter_counter != 0) /* another sub-interpreter may still be using the swig_module's types */
+    return;
+  for (i = 0; i < swig_module->size; ++i) {
     swig_type_info *ty = types[i];
     if (ty->owndata) {
       SwigPyClientData *data = (SwigPyClientData *) ty->clientdata;
+      ty->clientdata = 0;
       if (data) SwigPyClientData_Del(data);
     }
   }
-  Py_DECREF(SWIG_This());
+  SWIG_PYOBJ_REFCNT(Swig_This_global);
+  SWIG_Py_XDECREF(Swig_This_global);
   Swig_This_global = NULL;
+
+  SWIG_PYOBJ_REFCNT(Swig_Globals_global);
+  SWIG_Py_XDECREF(Swig_Globals_global);
+  Swig_Globals_global = NULL;
+
+  SWIG_PYOBJ_REFCNT(Swig_TypeCache_global);
+  SWIG_Py_XDECREF(Swig_TypeCache_global);
+  Swig_TypeCache_global = NULL;
+
+  SWIG_PYOBJ_REFCNT(Swig_Capsule_global);
+  Swig_Capsule_global = NULL;
+
+  SWIG_PYOBJ_REFCNT(Swig_runtime_data_module_global);
+  SWIG_Py_XDECREF(Swig_runtime_data_module_global);
+  Swig_runtime_data_module_global = NULL;
 }
 
 SWIGRUNTIME void
 SWIG_Python_SetModule(swig_module_info *swig_module) {
-#if PY_VERSION_HEX >= 0x03000000
- /* Add a dummy module object into sys.modules */
-  PyObject *module = PyImport_AddModule("swig_runtime_data" SWIG_RUNTIME_VERSION);
-#else
-  static PyMethodDef swig_empty_runtime_method_table[] = { {NULL, NULL, 0, NULL} }; /* Sentinel */
-  PyObject *module = Py_InitModule("swig_runtime_data" SWIG_RUNTIME_VERSION, swig_empty_runtime_method_table);
-#endif
+  PyObject *runtime_data_module = SWIG_runtime_data_module();
   PyObject *pointer = PyCapsule_New((void *) swig_module, SWIGPY_CAPSULE_NAME, SWIG_Python_DestroyModule);
-  if (pointer && module) {
-    PyModule_AddObject(module, "type_pointer_capsule" SWIG_TYPE_TABLE_NAME, pointer);
+  if (pointer && runtime_data_module) {
+    if (PyModule_AddObject(runtime_data_module, SWIGPY_CAPSULE_ATTR_NAME, pointer) == 0) {
+      ++interpreter_counter;
+      Swig_Capsule_global = pointer;
+    } else {
+      SWIG_Py_DECREF(pointer);
+    }
   } else {
-    Py_XDECREF(pointer);
+    SWIG_Py_XDECREF(pointer);
   }
 }
 
-/* The python cached type query */
-SWIGRUNTIME PyObject *
-SWIG_Python_TypeCache(void) {
-  static PyObject *SWIG_STATIC_POINTER(cache) = PyDict_New();
-  return cache;
-}
-
 SWIGRUNTIME swig_type_info *
 SWIG_Python_TypeQuery(const char *type)
 {
-  PyObject *cache = SWIG_Python_TypeCache();
-  PyObject *key = SWIG_Python_str_FromChar(type); 
-  PyObject *obj = PyDict_GetItem(cache, key);
   swig_type_info *descriptor;
+  PyObject *cache = SWIG_Python_TypeCache();
+  PyObject *obj;
+  SWIG_PyDict_GetItemStringRef(cache, type, &obj);
   if (obj) {
     descriptor = (swig_type_info *) PyCapsule_GetPointer(obj, NULL);
   } else {
@@ -2487,11 +3063,10 @@ SWIG_Python_TypeQuery(const char *type)
     descriptor = SWIG_TypeQueryModule(swig_module, swig_module, type);
     if (descriptor) {
       obj = PyCapsule_New((void*) descriptor, NULL, NULL);
-      PyDict_SetItem(cache, key, obj);
-      Py_DECREF(obj);
+      if (obj) PyDict_SetItemString(cache, type, obj);
     }
   }
-  Py_DECREF(key);
+  SWIG_Py_XDECREF(obj);
   return descriptor;
 }
 
@@ -2512,17 +3087,18 @@ SWIG_Python_AddErrMesg(const char* mesg, int infront)
     PyErr_Fetch(&type, &value, &traceback);
     if (value) {
       PyObject *old_str = PyObject_Str(value);
-      const char *tmp = SWIG_Python_str_AsChar(old_str);
+      PyObject *bytes = NULL;
+      const char *tmp = SWIG_PyUnicode_AsUTF8AndSize(old_str, NULL, &bytes);
       const char *errmesg = tmp ? tmp : "Invalid error message";
-      Py_XINCREF(type);
+      SWIG_Py_XINCREF(type);
       PyErr_Clear();
       if (infront) {
 	PyErr_Format(type, "%s %s", mesg, errmesg);
       } else {
 	PyErr_Format(type, "%s %s", errmesg, mesg);
       }
-      SWIG_Python_str_DelForPy3(tmp);
-      Py_DECREF(old_str);
+      SWIG_Py_XDECREF(bytes);
+      SWIG_Py_DECREF(old_str);
     }
     return 1;
   } else {
@@ -2551,56 +3127,12 @@ SwigPyObject_GetDesc(PyObject *self)
   return ty ? ty->str : "";
 }
 
-SWIGRUNTIME void
-SWIG_Python_TypeError(const char *type, PyObject *obj)
-{
-  if (type) {
-#if defined(SWIG_COBJECT_TYPES)
-    if (obj && SwigPyObject_Check(obj)) {
-      const char *otype = (const char *) SwigPyObject_GetDesc(obj);
-      if (otype) {
-	PyErr_Format(PyExc_TypeError, "a '%s' is expected, 'SwigPyObject(%s)' is received",
-		     type, otype);
-	return;
-      }
-    } else 
-#endif      
-    {
-      const char *otype = (obj ? obj->ob_type->tp_name : 0); 
-      if (otype) {
-	PyObject *str = PyObject_Str(obj);
-	const char *cstr = str ? SWIG_Python_str_AsChar(str) : 0;
-	if (cstr) {
-	  PyErr_Format(PyExc_TypeError, "a '%s' is expected, '%s(%s)' is received",
-		       type, otype, cstr);
-          SWIG_Python_str_DelForPy3(cstr);
-	} else {
-	  PyErr_Format(PyExc_TypeError, "a '%s' is expected, '%s' is received",
-		       type, otype);
-	}
-	Py_XDECREF(str);
-	return;
-      }
-    }   
-    PyErr_Format(PyExc_TypeError, "a '%s' is expected", type);
-  } else {
-    PyErr_Format(PyExc_TypeError, "unexpected type is received");
-  }
-}
-
-
 /* Convert a pointer value, signal an exception on a type mismatch */
 SWIGRUNTIME void *
 SWIG_Python_MustGetPtr(PyObject *obj, swig_type_info *ty, int SWIGUNUSEDPARM(argnum), int flags) {
   void *result;
   if (SWIG_Python_ConvertPtr(obj, &result, ty, flags) == -1) {
     PyErr_Clear();
-#if SWIG_POINTER_EXCEPTION
-    if (flags) {
-      SWIG_Python_TypeError(SWIG_TypePrettyName(ty), obj);
-      SWIG_Python_ArgFail(argnum);
-    }
-#endif
   }
   return result;
 }
@@ -2608,54 +3140,56 @@ SWIG_Python_MustGetPtr(PyObject *obj, swig_type_info *ty, int SWIGUNUSEDPARM(arg
 #ifdef SWIGPYTHON_BUILTIN
 SWIGRUNTIME int
 SWIG_Python_NonDynamicSetAttr(PyObject *obj, PyObject *name, PyObject *value) {
-  PyTypeObject *tp = obj->ob_type;
+  PyTypeObject *tp = Py_TYPE(obj);
   PyObject *descr;
   PyObject *encoded_name;
   descrsetfunc f;
   int res = -1;
 
 # ifdef Py_USING_UNICODE
-  if (PyString_Check(name)) {
-    name = PyUnicode_Decode(PyString_AsString(name), PyString_Size(name), NULL, NULL);
+  if (PyBytes_Check(name)) {
+    name = PyUnicode_Decode(PyBytes_AsString(name), PyBytes_Size(name), NULL, NULL);
     if (!name)
       return -1;
   } else if (!PyUnicode_Check(name))
 # else
-  if (!PyString_Check(name))
+  if (!PyBytes_Check(name))
 # endif
   {
-    PyErr_Format(PyExc_TypeError, "attribute name must be string, not '%.200s'", name->ob_type->tp_name);
+    PyObject *tpname = SWIG_PyType_GetFullyQualifiedName(Py_TYPE(name));
+    PyErr_Format(PyExc_TypeError, "attribute name must be string, not '%S'", tpname);
+    SWIG_Py_DECREF(tpname);
     return -1;
   } else {
-    Py_INCREF(name);
+    SWIG_Py_INCREF(name);
   }
 
   if (!tp->tp_dict) {
-    if (PyType_Ready(tp) < 0)
+    if (PyType_Ready(tp) != 0)
       goto done;
   }
 
   descr = _PyType_Lookup(tp, name);
   f = NULL;
   if (descr != NULL)
-    f = descr->ob_type->tp_descr_set;
+    f = Py_TYPE(descr)->tp_descr_set;
   if (!f) {
-    if (PyString_Check(name)) {
+    if (PyBytes_Check(name)) {
       encoded_name = name;
-      Py_INCREF(name);
+      SWIG_Py_INCREF(name);
     } else {
       encoded_name = PyUnicode_AsUTF8String(name);
       if (!encoded_name)
-        return -1;
+        goto done;
     }
-    PyErr_Format(PyExc_AttributeError, "'%.100s' object has no attribute '%.200s'", tp->tp_name, PyString_AsString(encoded_name));
-    Py_DECREF(encoded_name);
+    PyErr_Format(PyExc_AttributeError, "'%s' object has no attribute '%s'", tp->tp_name, PyBytes_AsString(encoded_name));
+    SWIG_Py_DECREF(encoded_name);
   } else {
     res = f(descr, obj, value);
   }
   
   done:
-  Py_DECREF(name);
+  SWIG_Py_DECREF(name);
   return res;
 }
 #endif
@@ -2679,15 +3213,8 @@ SwigPyObject_hash(PyObject *obj) {
 SWIGINTERN Py_hash_t
 SWIG_PyNumber_AsPyHash(PyObject *obj) {
   Py_hash_t result = -1;
-#if PY_VERSION_HEX < 0x03020000
-  if (PyInt_Check(obj))
-    result = PyInt_AsLong(obj);
-  else if (PyLong_Check(obj))
-    result = PyLong_AsLong(obj);
-#else
   if (PyNumber_Check(obj))
     result = PyNumber_AsSsize_t(obj, NULL);
-#endif
   else
     PyErr_Format(PyExc_TypeError, "Wrong type for hash function");
   return PyErr_Occurred() ? -1 : result;
@@ -2695,7 +3222,9 @@ SWIG_PyNumber_AsPyHash(PyObject *obj) {
 
 SWIGINTERN int
 SwigPyBuiltin_BadInit(PyObject *self, PyObject *SWIGUNUSEDPARM(args), PyObject *SWIGUNUSEDPARM(kwds)) {
-  PyErr_Format(PyExc_TypeError, "Cannot create new instances of type '%.300s'", self->ob_type->tp_name);
+  PyObject *tpname = SWIG_PyType_GetFullyQualifiedName(Py_TYPE(self));
+  PyErr_Format(PyExc_TypeError, "Cannot create new instances of type '%S'", tpname);
+  SWIG_Py_DECREF(tpname);
   return -1;
 }
 
@@ -2703,7 +3232,9 @@ SWIGINTERN void
 SwigPyBuiltin_BadDealloc(PyObject *obj) {
   SwigPyObject *sobj = (SwigPyObject *)obj;
   if (sobj->own) {
-    PyErr_Format(PyExc_TypeError, "Swig detected a memory leak in type '%.300s': no callable destructor found.", obj->ob_type->tp_name);
+    PyObject *tpname = SWIG_PyType_GetFullyQualifiedName(Py_TYPE(obj));
+    PyErr_Format(PyExc_TypeError, "Swig detected a memory leak in type '%S': no callable destructor found.", tpname);
+    SWIG_Py_DECREF(tpname);
   }
 }
 
@@ -2724,7 +3255,7 @@ SwigPyBuiltin_GetterClosure (PyObject *obj, void *closure) {
   tuple = PyTuple_New(0);
   assert(tuple);
   result = (*getset->get)(obj, tuple);
-  Py_DECREF(tuple);
+  SWIG_Py_DECREF(tuple);
   return result;
 }
 
@@ -2746,21 +3277,29 @@ SwigPyBuiltin_SetterClosure (PyObject *obj, PyObject *val, void *closure) {
   SwigPyGetSet *getset;
   PyObject *tuple, *result;
   if (!closure) {
-    PyErr_Format(PyExc_TypeError, "Missing getset closure");
+    PyErr_Format(PyExc_AttributeError, "Missing getset closure");
+    return -1;
+  }
+  if (!val) {
+    PyObject *tpname = SWIG_PyType_GetFullyQualifiedName(Py_TYPE(obj));
+    PyErr_Format(PyExc_AttributeError, "Illegal member variable deletion in type '%S'", tpname);
+    SWIG_Py_DECREF(tpname);
     return -1;
   }
   getset = (SwigPyGetSet *)closure;
   if (!getset->set) {
-    PyErr_Format(PyExc_TypeError, "Illegal member variable assignment in type '%.300s'", obj->ob_type->tp_name);
+    PyObject *tpname = SWIG_PyType_GetFullyQualifiedName(Py_TYPE(obj));
+    PyErr_Format(PyExc_AttributeError, "Illegal member variable assignment in type '%S'", tpname);
+    SWIG_Py_DECREF(tpname);
     return -1;
   }
   tuple = PyTuple_New(1);
   assert(tuple);
-  Py_INCREF(val);
+  SWIG_Py_INCREF(val);
   PyTuple_SET_ITEM(tuple, 0, val);
   result = (*getset->set)(obj, tuple);
-  Py_DECREF(tuple);
-  Py_XDECREF(result);
+  SWIG_Py_DECREF(tuple);
+  SWIG_Py_XDECREF(result);
   return result ? 0 : -1;
 }
 
@@ -2769,35 +3308,38 @@ SwigPyBuiltin_FunpackSetterClosure (PyObject *obj, PyObject *val, void *closure)
   SwigPyGetSet *getset;
   PyObject *result;
   if (!closure) {
-    PyErr_Format(PyExc_TypeError, "Missing getset closure");
+    PyErr_Format(PyExc_AttributeError, "Missing getset closure");
+    return -1;
+  }
+  if (!val) {
+    PyObject *tpname = SWIG_PyType_GetFullyQualifiedName(Py_TYPE(obj));
+    PyErr_Format(PyExc_AttributeError, "Illegal member variable deletion in type '%S'", tpname);
+    SWIG_Py_DECREF(tpname);
     return -1;
   }
   getset = (SwigPyGetSet *)closure;
   if (!getset->set) {
-    PyErr_Format(PyExc_TypeError, "Illegal member variable assignment in type '%.300s'", obj->ob_type->tp_name);
+    PyObject *tpname = SWIG_PyType_GetFullyQualifiedName(Py_TYPE(obj));
+    PyErr_Format(PyExc_AttributeError, "Illegal member variable assignment in type '%S'", tpname);
+    SWIG_Py_DECREF(tpname);
     return -1;
   }
   result = (*getset->set)(obj, val);
-  Py_XDECREF(result);
+  SWIG_Py_XDECREF(result);
   return result ? 0 : -1;
 }
 
 SWIGINTERN void
 SwigPyStaticVar_dealloc(PyDescrObject *descr) {
   PyObject_GC_UnTrack(descr);
-  Py_XDECREF(PyDescr_TYPE(descr));
-  Py_XDECREF(PyDescr_NAME(descr));
+  SWIG_Py_XDECREF((PyObject *)PyDescr_TYPE(descr));
+  SWIG_Py_XDECREF((PyObject *)PyDescr_NAME(descr));
   PyObject_GC_Del(descr);
 }
 
 SWIGINTERN PyObject *
 SwigPyStaticVar_repr(PyGetSetDescrObject *descr) {
-#if PY_VERSION_HEX >= 0x03000000
-
   return PyUnicode_FromFormat("<class attribute '%S' of type '%s'>", PyDescr_NAME(descr), PyDescr_TYPE(descr)->tp_name);
-#else
-  return PyString_FromFormat("<class attribute '%s' of type '%s'>", PyString_AsString(PyDescr_NAME(descr)), PyDescr_TYPE(descr)->tp_name);
-#endif
 }
 
 SWIGINTERN int
@@ -2812,11 +3354,7 @@ SWIGINTERN PyObject *
 SwigPyStaticVar_get(PyGetSetDescrObject *descr, PyObject *obj, PyObject *SWIGUNUSEDPARM(type)) {
   if (descr->d_getset->get != NULL)
     return descr->d_getset->get(obj, descr->d_getset->closure);
-#if PY_VERSION_HEX >= 0x03000000
-  PyErr_Format(PyExc_AttributeError, "attribute '%.300S' of '%.100s' objects is not readable", PyDescr_NAME(descr), PyDescr_TYPE(descr)->tp_name);
-#else
-  PyErr_Format(PyExc_AttributeError, "attribute '%.300s' of '%.100s' objects is not readable", PyString_AsString(PyDescr_NAME(descr)), PyDescr_TYPE(descr)->tp_name);
-#endif
+  PyErr_Format(PyExc_AttributeError, "attribute '%S' of '%s' objects is not readable", PyDescr_NAME(descr), PyDescr_TYPE(descr)->tp_name);
   return NULL;
 }
 
@@ -2824,11 +3362,7 @@ SWIGINTERN int
 SwigPyStaticVar_set(PyGetSetDescrObject *descr, PyObject *obj, PyObject *value) {
   if (descr->d_getset->set != NULL)
     return descr->d_getset->set(obj, value, descr->d_getset->closure);
-#if PY_VERSION_HEX >= 0x03000000
-  PyErr_Format(PyExc_AttributeError, "attribute '%.300S' of '%.100s' objects is not writable", PyDescr_NAME(descr), PyDescr_TYPE(descr)->tp_name);
-#else
-  PyErr_Format(PyExc_AttributeError, "attribute '%.300s' of '%.100s' objects is not writable", PyString_AsString(PyDescr_NAME(descr)), PyDescr_TYPE(descr)->tp_name);
-#endif
+  PyErr_Format(PyExc_AttributeError, "attribute '%S' of '%s' objects is not writable", PyDescr_NAME(descr), PyDescr_TYPE(descr)->tp_name);
   return -1;
 }
 
@@ -2836,49 +3370,47 @@ SWIGINTERN int
 SwigPyObjectType_setattro(PyObject *typeobject, PyObject *name, PyObject *value) {
   PyObject *attribute;
   PyTypeObject *type;
-  descrsetfunc local_set;
 
   assert(PyType_Check(typeobject));
   type = (PyTypeObject *)typeobject;
   attribute = _PyType_Lookup(type, name);
   if (attribute != NULL) {
     /* Implement descriptor functionality, if any */
-    local_set = attribute->ob_type->tp_descr_set;
-    if (local_set != NULL)
+    descrsetfunc local_set = Py_TYPE(attribute)->tp_descr_set;
+    if (local_set == NULL) {
+      PyObject *tpname = SWIG_PyType_GetFullyQualifiedName(type);
+      PyErr_Format(PyExc_AttributeError, "cannot modify read-only attribute '%S.%S'", tpname, name);
+      SWIG_Py_DECREF(tpname);
+    } else {
       return local_set(attribute, (PyObject *)type, value);
-#if PY_VERSION_HEX >= 0x03000000
-    PyErr_Format(PyExc_AttributeError, "cannot modify read-only attribute '%.50s.%.400S'", type->tp_name, name);
-#else 
-    PyErr_Format(PyExc_AttributeError, "cannot modify read-only attribute '%.50s.%.400s'", type->tp_name, PyString_AS_STRING(name));
-#endif
+    }
   } else {
-#if PY_VERSION_HEX >= 0x03000000
-    PyErr_Format(PyExc_AttributeError, "type '%.50s' has no attribute '%.400S'", type->tp_name, name);
-#else
-    PyErr_Format(PyExc_AttributeError, "type '%.50s' has no attribute '%.400s'", type->tp_name, PyString_AS_STRING(name));
-#endif
+    PyObject *tpname = SWIG_PyType_GetFullyQualifiedName(type);
+    PyErr_Format(PyExc_AttributeError, "type '%S' has no attribute '%S'", tpname, name);
+    SWIG_Py_DECREF(tpname);
   }
 
   return -1;
 }
 
 SWIGINTERN PyTypeObject*
-SwigPyStaticVar_Type(void) {
+SwigPyStaticVar_TypeOnce(void) {
+  static char SwigPyStaticVar_doc[] = "Swig member static variables";
+#ifndef SWIG_HEAPTYPES
   static PyTypeObject staticvar_type;
   static int type_init = 0;
   if (!type_init) {
     const PyTypeObject tmp = {
-#if PY_VERSION_HEX >= 0x03000000
       PyVarObject_HEAD_INIT(&PyType_Type, 0)
-#else
-      PyObject_HEAD_INIT(&PyType_Type)
-      0,                                        /* ob_size */
-#endif
-      "swig_static_var_getset_descriptor",      /* tp_name */
+      SWIG_RUNTIME_MODULE ".SwigPyStaticVar",   /* tp_name */
       sizeof(PyGetSetDescrObject),              /* tp_basicsize */
       0,                                        /* tp_itemsize */
       (destructor)SwigPyStaticVar_dealloc,      /* tp_dealloc */
-      0,                                        /* tp_print */
+#if PY_VERSION_HEX < 0x030800b4
+      (printfunc)0,                             /* tp_print */
+#else
+      (Py_ssize_t)0,                            /* tp_vectorcall_offset */
+#endif
       0,                                        /* tp_getattr */
       0,                                        /* tp_setattr */
       0,                                        /* tp_compare */
@@ -2892,8 +3424,8 @@ SwigPyStaticVar_Type(void) {
       PyObject_GenericGetAttr,                  /* tp_getattro */
       0,                                        /* tp_setattro */
       0,                                        /* tp_as_buffer */
-      Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_GC|Py_TPFLAGS_HAVE_CLASS, /* tp_flags */
-      0,                                        /* tp_doc */
+      Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_GC|Py_TPFLAGS_BASETYPE, /* tp_flags */
+      SwigPyStaticVar_doc,                      /* tp_doc */
       SwigPyStaticVar_traverse,                 /* tp_traverse */
       0,                                        /* tp_clear */
       0,                                        /* tp_richcompare */
@@ -2920,15 +3452,19 @@ SwigPyStaticVar_Type(void) {
       0,                                        /* tp_weaklist */
       0,                                        /* tp_del */
       0,                                        /* tp_version_tag */
-#if PY_VERSION_HEX >= 0x03040000
       0,                                        /* tp_finalize */
-#endif
 #if PY_VERSION_HEX >= 0x03080000
       0,                                        /* tp_vectorcall */
 #endif
 #if (PY_VERSION_HEX >= 0x03080000) && (PY_VERSION_HEX < 0x03090000)
       0,                                        /* tp_print */
 #endif
+#if PY_VERSION_HEX >= 0x030c0000
+      0,                                        /* tp_watched */
+#endif
+#if PY_VERSION_HEX >= 0x030d00a4
+      0,                                        /* tp_versions_used */
+#endif
 #ifdef COUNT_ALLOCS
       0,                                        /* tp_allocs */
       0,                                        /* tp_frees */
@@ -2937,32 +3473,70 @@ SwigPyStaticVar_Type(void) {
       0                                         /* tp_next */
 #endif
     };
+    PyObject *runtime_data_module = SWIG_runtime_data_module();
     staticvar_type = tmp;
     type_init = 1;
     if (PyType_Ready(&staticvar_type) < 0)
       return NULL;
+    if (PyModule_AddObject(runtime_data_module, "SwigPyStaticVar", (PyObject *)&staticvar_type) == 0)
+      SWIG_Py_INCREF((PyObject *)&staticvar_type);
   }
   return &staticvar_type;
+#else
+  PyType_Slot slots[] = {
+    { Py_tp_doc, (void *)SwigPyStaticVar_doc},
+    { Py_tp_dealloc, (void *)(destructor)SwigPyStaticVar_dealloc },
+    { Py_tp_repr, (void *)(reprfunc)SwigPyStaticVar_repr },
+    { Py_tp_getattro, (void *)PyObject_GenericGetAttr },
+    { Py_tp_traverse, (void *)SwigPyStaticVar_traverse },
+    { Py_tp_descr_get, (void *)(descrgetfunc)SwigPyStaticVar_get },
+    { Py_tp_descr_set, (void *)(descrsetfunc)SwigPyStaticVar_set },
+    { 0, NULL }
+  };
+  PyType_Spec spec = {
+    SWIG_RUNTIME_MODULE ".SwigPyStaticVar",
+    sizeof(PyGetSetDescrObject),
+    0,
+    Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_GC|Py_TPFLAGS_BASETYPE,
+    slots
+  };
+  PyObject *runtime_data_module = SWIG_runtime_data_module();
+  PyObject *pytype = PyObject_GetAttrString(runtime_data_module, "SwigPyStaticVar");
+  if (pytype) {
+    return (PyTypeObject *)pytype;
+  }
+  PyErr_Clear();
+  pytype = PyType_FromSpec(&spec);
+  if (pytype && PyModule_AddObject(runtime_data_module, "SwigPyStaticVar", pytype) == 0)
+    SWIG_Py_INCREF(pytype);
+  return (PyTypeObject *)pytype;
+#endif
+}
+
+SWIGRUNTIME PyTypeObject *
+SwigPyStaticVar_Type(void) {
+  static PyTypeObject *SWIG_STATIC_POINTER(type) = SwigPyStaticVar_TypeOnce();
+  return type;
 }
 
 SWIGINTERN PyTypeObject*
-SwigPyObjectType(void) {
-  static char swigpyobjecttype_doc[] = "Metaclass for SWIG wrapped types";
+SwigPyObjectType_TypeOnce(void) {
+  static char SwigPyObjectType_doc[] = "Metaclass for SWIG wrapped types";
+#ifndef SWIG_HEAPTYPES
   static PyTypeObject swigpyobjecttype_type;
   static int type_init = 0;
   if (!type_init) {
     const PyTypeObject tmp = {
-#if PY_VERSION_HEX >= 0x03000000
       PyVarObject_HEAD_INIT(&PyType_Type, 0)
-#else
-      PyObject_HEAD_INIT(&PyType_Type)
-      0,                                        /* ob_size */
-#endif
-      "SwigPyObjectType",                       /* tp_name */
+      SWIG_RUNTIME_MODULE ".SwigPyObjectType",  /* tp_name */
       PyType_Type.tp_basicsize,                 /* tp_basicsize */
       0,                                        /* tp_itemsize */
       0,                                        /* tp_dealloc */
-      0,                                        /* tp_print */
+#if PY_VERSION_HEX < 0x030800b4
+      (printfunc)0,                             /* tp_print */
+#else
+      (Py_ssize_t)0,                            /* tp_vectorcall_offset */
+#endif
       0,                                        /* tp_getattr */
       0,                                        /* tp_setattr */
       0,                                        /* tp_compare */
@@ -2976,8 +3550,8 @@ SwigPyObjectType(void) {
       0,                                        /* tp_getattro */
       SwigPyObjectType_setattro,                /* tp_setattro */
       0,                                        /* tp_as_buffer */
-      Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_CLASS, /* tp_flags */
-      swigpyobjecttype_doc,                     /* tp_doc */
+      Py_TPFLAGS_DEFAULT|Py_TPFLAGS_BASETYPE,   /* tp_flags */
+      SwigPyObjectType_doc,                     /* tp_doc */
       0,                                        /* tp_traverse */
       0,                                        /* tp_clear */
       0,                                        /* tp_richcompare */
@@ -3004,15 +3578,19 @@ SwigPyObjectType(void) {
       0,                                        /* tp_weaklist */
       0,                                        /* tp_del */
       0,                                        /* tp_version_tag */
-#if PY_VERSION_HEX >= 0x03040000
       0,                                        /* tp_finalize */
-#endif
 #if PY_VERSION_HEX >= 0x03080000
       0,                                        /* tp_vectorcall */
 #endif
 #if (PY_VERSION_HEX >= 0x03080000) && (PY_VERSION_HEX < 0x03090000)
       0,                                        /* tp_print */
 #endif
+#if PY_VERSION_HEX >= 0x030c0000
+      0,                                        /* tp_watched */
+#endif
+#if PY_VERSION_HEX >= 0x030d00a4
+      0,                                        /* tp_versions_used */
+#endif
 #ifdef COUNT_ALLOCS
       0,                                        /* tp_allocs */
       0,                                        /* tp_frees */
@@ -3021,13 +3599,47 @@ SwigPyObjectType(void) {
       0                                         /* tp_next */
 #endif
     };
+    PyObject *runtime_data_module = SWIG_runtime_data_module();
     swigpyobjecttype_type = tmp;
     type_init = 1;
     swigpyobjecttype_type.tp_base = &PyType_Type;
     if (PyType_Ready(&swigpyobjecttype_type) < 0)
       return NULL;
+    if (PyModule_AddObject(runtime_data_module, "SwigPyObjectType", (PyObject *)&swigpyobjecttype_type) == 0)
+      SWIG_Py_INCREF((PyObject *)&swigpyobjecttype_type);
   }
   return &swigpyobjecttype_type;
+#else
+  PyType_Slot slots[] = {
+    { Py_tp_setattro, (void *)SwigPyObjectType_setattro },
+    { Py_tp_doc, (void *)SwigPyObjectType_doc},
+    { Py_tp_base, (void *)&PyType_Type},
+    { 0, NULL }
+  };
+  PyType_Spec spec = {
+    SWIG_RUNTIME_MODULE ".SwigPyObjectType",
+    (int)PyType_Type.tp_basicsize,
+    0,
+    Py_TPFLAGS_DEFAULT|Py_TPFLAGS_BASETYPE,
+    slots
+  };
+  PyObject *runtime_data_module = SWIG_runtime_data_module();
+  PyObject *pytype = PyObject_GetAttrString(runtime_data_module, "SwigPyObjectType");
+  if (pytype) {
+    return (PyTypeObject *)pytype;
+  }
+  PyErr_Clear();
+  pytype = PyType_FromSpec(&spec);
+  if (pytype && PyModule_AddObject(runtime_data_module, "SwigPyObjectType", pytype) == 0)
+    SWIG_Py_INCREF(pytype);
+  return (PyTypeObject *)pytype;
+#endif
+}
+
+SWIGRUNTIME PyTypeObject *
+SwigPyObjectType_Type(void) {
+  static PyTypeObject *SWIG_STATIC_POINTER(type) = SwigPyObjectType_TypeOnce();
+  return type;
 }
 
 SWIGINTERN PyGetSetDescrObject *
@@ -3036,55 +3648,53 @@ SwigPyStaticVar_new_getset(PyTypeObject *type, PyGetSetDef *getset) {
   PyGetSetDescrObject *descr;
   descr = (PyGetSetDescrObject *)PyType_GenericAlloc(SwigPyStaticVar_Type(), 0);
   assert(descr);
-  Py_XINCREF(type);
+  SWIG_Py_XINCREF((PyObject *)type);
   PyDescr_TYPE(descr) = type;
-  PyDescr_NAME(descr) = PyString_InternFromString(getset->name);
+  PyDescr_NAME(descr) = PyUnicode_InternFromString(getset->name);
   descr->d_getset = getset;
   if (PyDescr_NAME(descr) == NULL) {
-    Py_DECREF(descr);
+    SWIG_Py_DECREF((PyObject *)descr);
     descr = NULL;
   }
   return descr;
 }
 
-SWIGINTERN void
-SwigPyBuiltin_InitBases (PyTypeObject *type, PyTypeObject **bases) {
+SWIGINTERN PyObject *
+SwigPyBuiltin_InitBases(PyTypeObject **bases) {
   Py_ssize_t base_count = 0;
   PyTypeObject **b;
   PyObject *tuple;
   Py_ssize_t i;
 
   if (!bases[0]) {
-    bases[0] = SwigPyObject_type();
+    bases[0] = SwigPyObject_Type();
     bases[1] = NULL;
   }
-  type->tp_base = bases[0];
-  Py_INCREF((PyObject *)bases[0]);
   for (b = bases; *b != NULL; ++b)
     ++base_count;
   tuple = PyTuple_New(base_count);
   for (i = 0; i < base_count; ++i) {
-    Py_INCREF((PyObject *)bases[i]);
+    SWIG_Py_INCREF((PyObject *)bases[i]);
     PyTuple_SET_ITEM(tuple, i, (PyObject *)bases[i]);
   }
-  type->tp_bases = tuple;
+  return tuple;
 }
 
 SWIGINTERN PyObject *
 SwigPyBuiltin_ThisClosure (PyObject *self, void *SWIGUNUSEDPARM(closure)) {
   PyObject *result;
   result = (PyObject *)SWIG_Python_GetSwigThis(self);
-  Py_XINCREF(result);
+  SWIG_Py_XINCREF(result);
   return result;
 }
 
 SWIGINTERN void
-SwigPyBuiltin_SetMetaType (PyTypeObject *type, PyTypeObject *metatype)
+SwigPyBuiltin_SetMetaType(PyTypeObject *type, PyTypeObject *metatype)
 {
-#if PY_VERSION_HEX >= 0x03000000
-    type->ob_base.ob_base.ob_type = metatype;
+#if PY_VERSION_HEX >= 0x030900a4
+  Py_SET_TYPE((PyObject *)type, metatype);
 #else
-    type->ob_type = metatype;
+  Py_TYPE(type) = metatype;
 #endif
 }
 
@@ -3112,24 +3722,26 @@ SWIGINTERN void
 SwigPyBuiltin_destructor_closure(SwigPyWrapperFunction wrapper, const char *wrappername, PyObject *a) {
   SwigPyObject *sobj;
   sobj = (SwigPyObject *)a;
-  Py_XDECREF(sobj->dict);
+  if (sobj->weakreflist != NULL)
+    PyObject_ClearWeakRefs(a);
+  SWIG_Py_XDECREF(sobj->swigdict);
   if (sobj->own) {
     PyObject *o;
     PyObject *type = 0, *value = 0, *traceback = 0;
     PyErr_Fetch(&type, &value, &traceback);
     o = wrapper(a, NULL);
     if (!o) {
-      PyObject *deallocname = PyString_FromString(wrappername);
+      PyObject *deallocname = PyUnicode_FromString(wrappername);
       PyErr_WriteUnraisable(deallocname);
-      Py_DECREF(deallocname);
+      SWIG_Py_DECREF(deallocname);
     }
     PyErr_Restore(type, value, traceback);
-    Py_XDECREF(o);
+    SWIG_Py_XDECREF(o);
   }
-  if (PyType_IS_GC(a->ob_type)) {
+  if (PyType_IS_GC(Py_TYPE(a))) {
     PyObject_GC_Del(a);
   } else {
-    PyObject_Del(a);
+    PyObject_Free(a);
   }
 }
 
@@ -3144,7 +3756,7 @@ SwigPyBuiltin_inquiry_closure(SwigPyWrapperFunction wrapper, PyObject *a) {
   int result;
   pyresult = wrapper(a, NULL);
   result = pyresult && PyObject_IsTrue(pyresult) ? 1 : 0;
-  Py_XDECREF(pyresult);
+  SWIG_Py_XDECREF(pyresult);
   return result;
 }
 
@@ -3168,10 +3780,10 @@ SwigPyBuiltin_binaryfunc_closure(SwigPyWrapperFunction wrapper, PyObject *a, PyO
   PyObject *tuple, *result;
   tuple = PyTuple_New(1);
   assert(tuple);
-  Py_INCREF(b);
+  SWIG_Py_INCREF(b);
   PyTuple_SET_ITEM(tuple, 0, b);
   result = wrapper(a, tuple);
-  Py_DECREF(tuple);
+  SWIG_Py_DECREF(tuple);
   return result;
 }
 
@@ -3187,12 +3799,14 @@ SwigPyBuiltin_ternaryfunc_closure(SwigPyWrapperFunction wrapper, PyObject *a, Py
   PyObject *tuple, *result;
   tuple = PyTuple_New(2);
   assert(tuple);
-  Py_INCREF(b);
+  SWIG_Py_INCREF(b);
   PyTuple_SET_ITEM(tuple, 0, b);
-  Py_INCREF(c);
-  PyTuple_SET_ITEM(tuple, 1, c);
+  if (c) {
+    SWIG_Py_INCREF(c);
+    PyTuple_SET_ITEM(tuple, 1, c);
+  }
   result = wrapper(a, tuple);
-  Py_DECREF(tuple);
+  SWIG_Py_DECREF(tuple);
   return result;
 }
 
@@ -3218,7 +3832,7 @@ SwigPyBuiltin_lenfunc_closure(SwigPyWrapperFunction wrapper, PyObject *a) {
   Py_ssize_t result;
   resultobj = wrapper(a, NULL);
   result = PyNumber_AsSsize_t(resultobj, NULL);
-  Py_DECREF(resultobj);
+  SWIG_Py_DECREF(resultobj);
   return result;
 }
 
@@ -3232,10 +3846,10 @@ SwigPyBuiltin_ssizessizeargfunc_closure(SwigPyWrapperFunction wrapper, PyObject
   PyObject *tuple, *result;
   tuple = PyTuple_New(2);
   assert(tuple);
-  PyTuple_SET_ITEM(tuple, 0, _PyLong_FromSsize_t(b));
-  PyTuple_SET_ITEM(tuple, 1, _PyLong_FromSsize_t(c));
+  PyTuple_SET_ITEM(tuple, 0, PyLong_FromSsize_t(b));
+  PyTuple_SET_ITEM(tuple, 1, PyLong_FromSsize_t(c));
   result = wrapper(a, tuple);
-  Py_DECREF(tuple);
+  SWIG_Py_DECREF(tuple);
   return result;
 }
 
@@ -3250,16 +3864,16 @@ SwigPyBuiltin_ssizessizeobjargproc_closure(SwigPyWrapperFunction wrapper, PyObje
   int result;
   tuple = PyTuple_New(d ? 3 : 2);
   assert(tuple);
-  PyTuple_SET_ITEM(tuple, 0, _PyLong_FromSsize_t(b));
-  PyTuple_SET_ITEM(tuple, 1, _PyLong_FromSsize_t(c));
+  PyTuple_SET_ITEM(tuple, 0, PyLong_FromSsize_t(b));
+  PyTuple_SET_ITEM(tuple, 1, PyLong_FromSsize_t(c));
   if (d) {
-    Py_INCREF(d);
+    SWIG_Py_INCREF(d);
     PyTuple_SET_ITEM(tuple, 2, d);
   }
   resultobj = wrapper(a, tuple);
   result = resultobj ? 0 : -1;
-  Py_DECREF(tuple);
-  Py_XDECREF(resultobj);
+  SWIG_Py_DECREF(tuple);
+  SWIG_Py_XDECREF(resultobj);
   return result;
 }
 
@@ -3273,9 +3887,9 @@ SwigPyBuiltin_funpack_ssizeargfunc_closure(SwigPyWrapperFunction wrapper, PyObje
   PyObject *tuple, *result;
   tuple = PyTuple_New(1);
   assert(tuple);
-  PyTuple_SET_ITEM(tuple, 0, _PyLong_FromSsize_t(b));
+  PyTuple_SET_ITEM(tuple, 0, PyLong_FromSsize_t(b));
   result = wrapper(a, tuple);
-  Py_DECREF(tuple);
+  SWIG_Py_DECREF(tuple);
   return result;
 }
 
@@ -3287,9 +3901,9 @@ wrapper##_ssizeargfunc_closure(PyObject *a, Py_ssize_t b) {		\
 SWIGINTERN PyObject *
 SwigPyBuiltin_ssizeargfunc_closure(SwigPyWrapperFunction wrapper, PyObject *a, Py_ssize_t b) {
   PyObject *arg, *result;
-  arg = _PyLong_FromSsize_t(b);
+  arg = PyLong_FromSsize_t(b);
   result = wrapper(a, arg);
-  Py_DECREF(arg);
+  SWIG_Py_DECREF(arg);
   return result;
 }
 
@@ -3304,13 +3918,15 @@ SwigPyBuiltin_ssizeobjargproc_closure(SwigPyWrapperFunction wrapper, PyObject *a
   int result;
   tuple = PyTuple_New(2);
   assert(tuple);
-  PyTuple_SET_ITEM(tuple, 0, _PyLong_FromSsize_t(b));
-  Py_INCREF(c);
-  PyTuple_SET_ITEM(tuple, 1, c);
+  PyTuple_SET_ITEM(tuple, 0, PyLong_FromSsize_t(b));
+  if (c) {
+    SWIG_Py_INCREF(c);
+    PyTuple_SET_ITEM(tuple, 1, c);
+  }
   resultobj = wrapper(a, tuple);
   result = resultobj ? 0 : -1;
-  Py_XDECREF(resultobj);
-  Py_DECREF(tuple);
+  SWIG_Py_XDECREF(resultobj);
+  SWIG_Py_DECREF(tuple);
   return result;
 }
 
@@ -3326,12 +3942,12 @@ SwigPyBuiltin_objobjproc_closure(SwigPyWrapperFunction wrapper, PyObject *a, PyO
   PyObject *tuple;
   tuple = PyTuple_New(1);
   assert(tuple);
-  Py_INCREF(b);
+  SWIG_Py_INCREF(b);
   PyTuple_SET_ITEM(tuple, 0, b);
   pyresult = wrapper(a, tuple);
   result = pyresult ? (PyObject_IsTrue(pyresult) ? 1 : 0) : -1;
-  Py_XDECREF(pyresult);
-  Py_DECREF(tuple);
+  SWIG_Py_XDECREF(pyresult);
+  SWIG_Py_DECREF(tuple);
   return result;
 }
 
@@ -3346,7 +3962,7 @@ SwigPyBuiltin_funpack_objobjproc_closure(SwigPyWrapperFunction wrapper, PyObject
   PyObject *pyresult;
   pyresult = wrapper(a, b);
   result = pyresult ? (PyObject_IsTrue(pyresult) ? 1 : 0) : -1;
-  Py_XDECREF(pyresult);
+  SWIG_Py_XDECREF(pyresult);
   return result;
 }
 
@@ -3361,16 +3977,16 @@ SwigPyBuiltin_objobjargproc_closure(SwigPyWrapperFunction wrapper, PyObject *a,
   int result;
   tuple = PyTuple_New(c ? 2 : 1);
   assert(tuple);
-  Py_INCREF(b);
+  SWIG_Py_INCREF(b);
   PyTuple_SET_ITEM(tuple, 0, b);
   if (c) {
-    Py_INCREF(c);
+    SWIG_Py_INCREF(c);
     PyTuple_SET_ITEM(tuple, 1, c);
   }
   resultobj = wrapper(a, tuple);
   result = resultobj ? 0 : -1;
-  Py_XDECREF(resultobj);
-  Py_DECREF(tuple);
+  SWIG_Py_XDECREF(resultobj);
+  SWIG_Py_DECREF(tuple);
   return result;
 }
 
@@ -3397,7 +4013,7 @@ SwigPyBuiltin_hashfunc_closure(SwigPyWrapperFunction wrapper, PyObject *a) {
   if (!pyresult)
     return -1;
   result = SWIG_PyNumber_AsPyHash(pyresult);
-  Py_DECREF(pyresult);
+  SWIG_Py_DECREF(pyresult);
   return result;
 }
 
@@ -3422,23 +4038,8 @@ SwigPyBuiltin_iternextfunc_closure(SwigPyWrapperFunction wrapper, PyObject *a) {
 
 #define SWIG_exception_fail(code, msg) do { SWIG_Error(code, msg); SWIG_fail; } while(0) 
 
-#define SWIG_contract_assert(expr, msg) if (!(expr)) { SWIG_Error(SWIG_RuntimeError, msg); SWIG_fail; } else 
-
-
-
-#ifdef __cplusplus
-extern "C" {
-#endif
-
-/* Method creation and docstring support functions */
+#define SWIG_contract_assert(expr, msg) do { if (!(expr)) { SWIG_Error(SWIG_RuntimeError, msg); SWIG_fail; } } while (0) 
 
-SWIGINTERN PyMethodDef *SWIG_PythonGetProxyDoc(const char *name);
-SWIGINTERN PyObject *SWIG_PyInstanceMethod_New(PyObject *SWIGUNUSEDPARM(self), PyObject *func);
-SWIGINTERN PyObject *SWIG_PyStaticMethod_New(PyObject *SWIGUNUSEDPARM(self), PyObject *func);
-
-#ifdef __cplusplus
-}
-#endif
 
 
 /* -------- TYPES TABLE (BEGIN) -------- */
@@ -3461,17 +4062,61 @@ static swig_module_info swig_module = {swig_types, 3, 0, 0, 0, 0};
 /*-----------------------------------------------
               @(target):= _afg2ampl.so
   ------------------------------------------------*/
-#if PY_VERSION_HEX >= 0x03000000
-#  define SWIG_init    PyInit__afg2ampl
+#define SWIG_init    PyInit__afg2ampl
+
+
+#ifdef __cplusplus
+#include <utility>
+/* SwigValueWrapper is described in swig.swg */
+template<typename T> class SwigValueWrapper {
+  struct SwigSmartPointer {
+    T *ptr;
+    SwigSmartPointer(T *p) : ptr(p) { }
+    ~SwigSmartPointer() { delete ptr; }
+    SwigSmartPointer& operator=(SwigSmartPointer& rhs) { T* oldptr = ptr; ptr = 0; delete oldptr; ptr = rhs.ptr; rhs.ptr = 0; return *this; }
+    void reset(T *p) { T* oldptr = ptr; ptr = 0; delete oldptr; ptr = p; }
+  } pointer;
+  SwigValueWrapper& operator=(const SwigValueWrapper<T>& rhs);
+  SwigValueWrapper(const SwigValueWrapper<T>& rhs);
+public:
+  SwigValueWrapper() : pointer(0) { }
+  SwigValueWrapper& operator=(const T& t) { SwigSmartPointer tmp(new T(t)); pointer = tmp; return *this; }
+#if __cplusplus >= 201103L
+  SwigValueWrapper& operator=(T&& t) { SwigSmartPointer tmp(new T(std::move(t))); pointer = tmp; return *this; }
+  operator T&&() const { return std::move(*pointer.ptr); }
+#else
+  operator T&() const { return *pointer.ptr; }
+#endif
+  T *operator&() const { return pointer.ptr; }
+  static void reset(SwigValueWrapper& t, T *p) { t.pointer.reset(p); }
+};
 
+/*
+ * SwigValueInit() is a generic initialisation solution as the following approach:
+ * 
+ *       T c_result = T();
+ * 
+ * doesn't compile for all types for example:
+ * 
+ *       unsigned int c_result = unsigned int();
+ */
+template <typename T> T SwigValueInit() {
+  return T();
+}
+
+#if __cplusplus >= 201103L
+# define SWIG_STD_MOVE(OBJ) std::move(OBJ)
 #else
-#  define SWIG_init    init_afg2ampl
+# define SWIG_STD_MOVE(OBJ) OBJ
+#endif
 
+#if __cplusplus >= 201103L
+# define SWIG_OVERRIDE override
+#else
+# define SWIG_OVERRIDE
 #endif
-#define SWIG_name    "_afg2ampl"
 
-#define SWIGVERSION 0x040002 
-#define SWIG_VERSION SWIGVERSION
+#endif
 
 
 #define SWIG_as_voidptr(a) const_cast< void * >(static_cast< const void * >(a)) 
@@ -3494,7 +4139,7 @@ namespace swig {
     SwigPtr_PyObject(const SwigPtr_PyObject& item) : _obj(item._obj)
     {
       SWIG_PYTHON_THREAD_BEGIN_BLOCK;
-      Py_XINCREF(_obj);      
+      SWIG_Py_XINCREF(_obj);
       SWIG_PYTHON_THREAD_END_BLOCK;
     }
     
@@ -3502,7 +4147,7 @@ namespace swig {
     {
       if (initial_ref) {
         SWIG_PYTHON_THREAD_BEGIN_BLOCK;
-        Py_XINCREF(_obj);
+        SWIG_Py_XINCREF(_obj);
         SWIG_PYTHON_THREAD_END_BLOCK;
       }
     }
@@ -3510,8 +4155,8 @@ namespace swig {
     SwigPtr_PyObject & operator=(const SwigPtr_PyObject& item) 
     {
       SWIG_PYTHON_THREAD_BEGIN_BLOCK;
-      Py_XINCREF(item._obj);
-      Py_XDECREF(_obj);
+      SWIG_Py_XINCREF(item._obj);
+      SWIG_Py_XDECREF(_obj);
       _obj = item._obj;
       SWIG_PYTHON_THREAD_END_BLOCK;
       return *this;      
@@ -3520,7 +4165,7 @@ namespace swig {
     ~SwigPtr_PyObject() 
     {
       SWIG_PYTHON_THREAD_BEGIN_BLOCK;
-      Py_XDECREF(_obj);
+      SWIG_Py_XDECREF(_obj);
       SWIG_PYTHON_THREAD_END_BLOCK;
     }
     
@@ -3543,7 +4188,7 @@ namespace swig {
     
     SwigVar_PyObject & operator = (PyObject* obj)
     {
-      Py_XDECREF(_obj);
+      SWIG_Py_XDECREF(_obj);
       _obj = obj;
       return *this;      
     }
@@ -3551,9 +4196,6 @@ namespace swig {
 }
 
 
-#include <stddef.h>
-
-
 /* Put header files here or function declarations like below */
 extern int swig_main(int argc, char **argv);
 
@@ -3575,11 +4217,6 @@ SWIG_AsVal_double (PyObject *obj, double *val)
   if (PyFloat_Check(obj)) {
     if (val) *val = PyFloat_AsDouble(obj);
     return SWIG_OK;
-#if PY_VERSION_HEX < 0x03000000
-  } else if (PyInt_Check(obj)) {
-    if (val) *val = (double) PyInt_AsLong(obj);
-    return SWIG_OK;
-#endif
   } else if (PyLong_Check(obj)) {
     double v = PyLong_AsDouble(obj);
     if (!PyErr_Occurred()) {
@@ -3614,6 +4251,9 @@ SWIG_AsVal_double (PyObject *obj, double *val)
 }
 
 
+#include <errno.h>
+
+
 #include <float.h>
 
 
@@ -3624,9 +4264,11 @@ SWIGINTERNINLINE int
 SWIG_CanCastAsInteger(double *d, double min, double max) {
   double x = *d;
   if ((min <= x && x <= max)) {
-   double fx = floor(x);
-   double cx = ceil(x);
-   double rd =  ((x - fx) < 0.5) ? fx : cx; /* simple rint */
+   double fx, cx, rd;
+   errno = 0;
+   fx = floor(x);
+   cx = ceil(x);
+   rd =  ((x - fx) < 0.5) ? fx : cx; /* simple rint */
    if ((errno == EDOM) || (errno == ERANGE)) {
      errno = 0;
    } else {
@@ -3653,12 +4295,6 @@ SWIG_CanCastAsInteger(double *d, double min, double max) {
 SWIGINTERN int
 SWIG_AsVal_long (PyObject *obj, long* val)
 {
-#if PY_VERSION_HEX < 0x03000000
-  if (PyInt_Check(obj)) {
-    if (val) *val = PyInt_AsLong(obj);
-    return SWIG_OK;
-  } else
-#endif
   if (PyLong_Check(obj)) {
     long v = PyLong_AsLong(obj);
     if (!PyErr_Occurred()) {
@@ -3672,7 +4308,7 @@ SWIG_AsVal_long (PyObject *obj, long* val)
 #ifdef SWIG_PYTHON_CAST_MODE
   {
     int dispatch = 0;
-    long v = PyInt_AsLong(obj);
+    long v = PyLong_AsLong(obj);
     if (!PyErr_Occurred()) {
       if (val) *val = v;
       return SWIG_AddCast(SWIG_OK);
@@ -3682,7 +4318,12 @@ SWIG_AsVal_long (PyObject *obj, long* val)
     if (!dispatch) {
       double d;
       int res = SWIG_AddCast(SWIG_AsVal_double (obj,&d));
-      if (SWIG_IsOK(res) && SWIG_CanCastAsInteger(&d, LONG_MIN, LONG_MAX)) {
+      // Largest double not larger than LONG_MAX (not portably calculated easily)
+      // Note that double(LONG_MAX) is stored in a double rounded up by one (for 64-bit long)
+      // 0x7ffffffffffffc00LL == (int64_t)std::nextafter(double(__uint128_t(LONG_MAX)+1), double(0))
+      const double long_max = sizeof(long) == 8 ? 0x7ffffffffffffc00LL : LONG_MAX;
+      // No equivalent needed for 64-bit double(LONG_MIN) is exactly LONG_MIN
+      if (SWIG_IsOK(res) && SWIG_CanCastAsInteger(&d, LONG_MIN, long_max)) {
 	if (val) *val = (long)(d);
 	return res;
       }
@@ -3712,7 +4353,7 @@ SWIG_AsVal_int (PyObject * obj, int *val)
 SWIGINTERNINLINE PyObject*
   SWIG_From_int  (int value)
 {
-  return PyInt_FromLong((long) value);
+  return PyLong_FromLong((long) value);
 }
 
 #ifdef __cplusplus
@@ -3721,7 +4362,7 @@ extern "C" {
 SWIGINTERN PyObject *_wrap_swig_main(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
   int arg1 ;
-  char **arg2 = (char **) 0 ;
+  char **arg2 = 0 ;
   int val1 ;
   int ecode1 = 0 ;
   PyObject *swig_obj[2] ;
@@ -3741,8 +4382,8 @@ SWIGINTERN PyObject *_wrap_swig_main(PyObject *self, PyObject *args) {
       arg2 = (char **) malloc((size+1)*sizeof(char *));
       for (i = 0; i < size; i++) {
         PyObject *o = PyList_GetItem(swig_obj[1], i);
-        if (PyString_Check(o))
-        arg2[i] = PyString_AsString(PyList_GetItem(swig_obj[1], i));
+        if (PyBytes_Check(o))
+        arg2[i] = PyBytes_AsString(PyList_GetItem(swig_obj[1], i));
         else {
           PyErr_SetString(PyExc_TypeError, "list must contain strings");
           free(arg2);
@@ -3770,15 +4411,10 @@ fail:
 
 
 static PyMethodDef SwigMethods[] = {
-	 { "SWIG_PyInstanceMethod_New", SWIG_PyInstanceMethod_New, METH_O, NULL},
 	 { "swig_main", _wrap_swig_main, METH_VARARGS, NULL},
 	 { NULL, NULL, 0, NULL }
 };
 
-static PyMethodDef SwigMethods_proxydocs[] = {
-	 { NULL, NULL, 0, NULL }
-};
-
 
 /* -------- TYPE CONVERSION AND EQUIVALENCE RULES (BEGIN) -------- */
 
@@ -3813,7 +4449,7 @@ static swig_const_info swig_const_table[] = {
 #endif
 /* -----------------------------------------------------------------------------
  * Type initialization:
- * This problem is tough by the requirement that no dynamic
+ * This problem is made tough by the requirement that no dynamic
  * memory is used. Also, since swig_type_info structures store pointers to
  * swig_cast_info structures and swig_cast_info structures store pointers back
  * to swig_type_info structures, we need some lookup code at initialization.
@@ -3828,15 +4464,20 @@ static swig_const_info swig_const_table[] = {
  * array. We just loop through that array, and handle each type individually.
  * First we lookup if this type has been already loaded, and if so, use the
  * loaded structure instead of the generated one. Then we have to fill in the
- * cast linked list. The cast data is initially stored in something like a
+ * cast dependencies. The cast data is initially stored in something like a
  * two-dimensional array. Each row corresponds to a type (there are the same
  * number of rows as there are in the swig_type_initial array). Each entry in
  * a column is one of the swig_cast_info structures for that type.
  * The cast_initial array is actually an array of arrays, because each row has
- * a variable number of columns. So to actually build the cast linked list,
- * we find the array of casts associated with the type, and loop through it
- * adding the casts to the list. The one last trick we need to do is making
- * sure the type pointer in the swig_cast_info struct is correct.
+ * a variable number of columns.
+ *
+ * We loop through the cast[] array associated with the type and mark casts
+ * which have not been defined in previously loaded modules by assigning
+ * cast pointer value to cast->next. We also hash cast->type->name string
+ * and store the value in the cast->value field. If we encounter swig_cast_info
+ * structure that represents a cast to self we move it to the beginning
+ * of the cast array. One trick we need to do is making sure the type pointer
+ * in the swig_cast_info struct is correct.
  *
  * First off, we lookup the cast->type name to see if it is already loaded.
  * There are three cases to handle:
@@ -3848,8 +4489,71 @@ static swig_const_info swig_const_table[] = {
  *     cast->type) are loaded, THEN the cast info has already been loaded by
  *     the previous module so we just ignore it.
  *  3) Finally, if cast->type has not already been loaded, then we add that
- *     swig_cast_info to the linked list (because the cast->type) pointer will
+ *     swig_cast_info to the list (because the cast->type) pointer will
  *     be correct.
+ *
+ * Once the cast array has been set up AND it does have new casts that need
+ * to be added we sort non-self cast entries to move filtered out entries
+ * to the end of the array and to arrange the rest in the increasing order
+ * of their type pointer values. We store the index of the last added entry
+ * in the cast->value field of the entry[0] (overwriting the name hash). Then
+ * we sort <next|value> fields of the remaining entries to arrange hash values
+ * in the increasing order. This way cast->next->type->name field matches
+ * the cast->value hash.
+ *
+ * Example:
+ * Array of casts for type stored at 0x5000, cast to type stored at 0x3000
+ * has already been loaded
+ *
+ *      After sweep-and-hash:   After sort-by-type:    After sort-by-hash:
+ *        ________________       ________________       ________________
+ *       |                |     |                |     |                |
+ * Entry |  type = 0x5000 |     |  type = 0x5000 |     |  type = 0x5000 |
+ *   0   |                |     |                |     |                |
+ *       |  next = Entry0 |     |  next = Entry0 |     |  next = Entry0 |
+ *       | value = 1212   |     | value = 3      |     | value = 3      |
+ *       |                |     |                |     |                |
+ *       |================|     |================|     |================|
+ *       |                |     |                |     |                |
+ * Entry |  type = 0x2000 |     |  type = 0x1000 |     |  type = 0x1000 |
+ *   1   |                |     |                |     |                |
+ *       |  next = Entry1 |     |  next = Entry1 |     |  next = Entry3 |
+ *       | value = 3434   |     | value = 4545   |     | value = 2323   |
+ *       |________________|     |________________|     |________________|
+ *       |                |     |                |     |                |
+ * Entry |  type = 0x3000 |     |  type = 0x2000 |     |  type = 0x2000 |
+ *   2   |                |     |                |     |                |
+ *       |  next = 0      |     |  next = Entry2 |     |  next = Entry2 |
+ *       | value = 0      |     | value = 3434   |     | value = 3434   |
+ *       |________________|     |________________|     |________________|
+ *       |                |     |                |     |                |
+ * Entry |  type = 0x1000 |     |  type = 0x4000 |     |  type = 0x4000 |
+ *   3   |                |     |                |     |                |
+ *       |  next = Entry3 |     |  next = Entry3 |     |  next = Entry1 |
+ *       | value = 4545   |     | value = 2323   |     | value = 4545   |
+ *       |________________|     |________________|     |________________|
+ *       |                |     |                |     |                |
+ * Entry |  type = 0x4000 |     |  type = 0x3000 |     |  type = 0x3000 |
+ *   4   |                |     |                |     |                |
+ *       |  next = Entry4 |     |  next = 0      |     |  next = 0      |
+ *       | value = 2323   |     | value = 0      |     | value = 0      |
+ *       |________________|     |________________|     |________________|
+ *
+ * Once the cast array has been initialized, we use cast[0]->next field to link
+ * it into the list of cast arrays for the type.
+ *              ____    ____    ____
+ * type->cast->|next|->|next|->|next|->0
+ *             |----|  |----|  |----|
+ *             |----|  |----|  |----|
+ *             |----|  |----|  |----|
+ *
+ * Subsequent cast resolution works as follows:
+ *
+ * 1. Check whether the type matches the first entry in the current cast array.
+ * 2. If not, then do a binary search over the (0:cast->value] interval using
+ *    either type address or the hash value of the type name.
+ * 3. If not found, then move over to the next cast array (cast[0]->next).
+ *
  * ----------------------------------------------------------------------------- */
 
 #ifdef __cplusplus
@@ -3863,9 +4567,54 @@ extern "C" {
 #define SWIGRUNTIME_DEBUG
 #endif
 
+#ifndef SWIG_INIT_CLIENT_DATA_TYPE
+#define SWIG_INIT_CLIENT_DATA_TYPE void *
+#endif
+
+/*
+ * Sort function that puts cast entries with nonzero 'next' at the front
+ * of the array while ordering them by addresses of their 'type' structs.
+ */
+SWIGINTERN int SWIG_CastCmpStruct(const void *pa, const void *pb) {
+  swig_cast_info *pca = (swig_cast_info *)pa;
+  swig_cast_info *pcb = (swig_cast_info *)pb;
+  /* Entries with next != 0 (newly mapped) come before entries with next == 0 (already loaded) */
+  if (!pca->next && pcb->next) return 1;
+  if (pca->next && !pcb->next) return -1;
+  /* Within the same group, sort by type pointer for binary search */
+  if (pca->type < pcb->type) return -1;
+  if (pca->type > pcb->type) return 1;
+  return 0;
+}
+
+/*
+ * Shell-sort 'next' and 'value' field pairs to order them by 'value'.
+ */
+SWIGINTERN void SWIG_CastHashSort(swig_cast_info *cast, int size) {
+  const int hmax = size/9;
+  int h, i;
+  for(h = 1; h <= hmax; h = 3*h+1);
+  for(; h > 0; h /= 3)
+  {
+    for(i = h; i < size; ++i)
+    {
+      swig_cast_info *p = cast[i].next;
+      unsigned int hash = cast[i].value;
+      int j = i;
+      while(j >= h && hash < cast[j-h].value)
+      {
+        cast[j].next = cast[j-h].next;
+        cast[j].value = cast[j-h].value;
+        j -= h;
+      }
+      cast[j].next = p;
+      cast[j].value = hash;
+    }
+  }
+}
 
 SWIGRUNTIME void
-SWIG_InitializeModule(void *clientdata) {
+SWIG_InitializeModule(SWIG_INIT_CLIENT_DATA_TYPE clientdata) {
   size_t i;
   swig_module_info *module_head, *iter;
   int init;
@@ -3915,8 +4664,9 @@ SWIG_InitializeModule(void *clientdata) {
 #endif
   for (i = 0; i < swig_module.size; ++i) {
     swig_type_info *type = 0;
-    swig_type_info *ret;
-    swig_cast_info *cast;
+    swig_type_info *target_type;
+    swig_cast_info *cast, *first;
+    int num_mapped = 0;
     
 #ifdef SWIGRUNTIME_DEBUG
     printf("SWIG_InitializeModule: type %lu %s\n", (unsigned long)i, swig_module.type_initial[i]->name);
@@ -3942,48 +4692,104 @@ SWIG_InitializeModule(void *clientdata) {
     }
     
     /* Insert casting types */
-    cast = swig_module.cast_initial[i];
+    cast = first = swig_module.cast_initial[i];
     while (cast->type) {
       /* Don't need to add information already in the list */
-      ret = 0;
+      target_type = 0;
 #ifdef SWIGRUNTIME_DEBUG
       printf("SWIG_InitializeModule: look cast %s\n", cast->type->name);
 #endif
       if (swig_module.next != &swig_module) {
-        ret = SWIG_MangledTypeQueryModule(swig_module.next, &swig_module, cast->type->name);
+        target_type = SWIG_MangledTypeQueryModule(swig_module.next, &swig_module, cast->type->name);
+        if (target_type) {
+          /* Target type already defined in another module */
 #ifdef SWIGRUNTIME_DEBUG
-        if (ret) printf("SWIG_InitializeModule: found cast %s\n", ret->name);
+          printf("SWIG_InitializeModule: found cast %s\n", target_type->name);
 #endif
-      }
-      if (ret) {
-        if (type == swig_module.type_initial[i]) {
+          if (type == swig_module.type_initial[i]) {
 #ifdef SWIGRUNTIME_DEBUG
-          printf("SWIG_InitializeModule: skip old type %s\n", ret->name);
+            printf("SWIG_InitializeModule: skip old type %s\n", target_type->name);
 #endif
-          cast->type = ret;
-          ret = 0;
-        } else {
-          /* Check for casting already in the list */
-          swig_cast_info *ocast = SWIG_TypeCheck(ret->name, type);
+            cast->type = target_type;
+            target_type = 0;
+          } else {
+            /* Check if this cast is already in the list */
+            swig_cast_info *ocast = SWIG_TypeCheck(target_type->name, type);
 #ifdef SWIGRUNTIME_DEBUG
-          if (ocast) printf("SWIG_InitializeModule: skip old cast %s\n", ret->name);
+            if (ocast) printf("SWIG_InitializeModule: skip old cast %s\n", target_type->name);
 #endif
-          if (!ocast) ret = 0;
+            if (!ocast) {
+              cast->type = target_type;
+              target_type = 0;
+            }
+          }
         }
       }
       
-      if (!ret) {
+      if (!target_type) {
 #ifdef SWIGRUNTIME_DEBUG
         printf("SWIG_InitializeModule: adding cast %s\n", cast->type->name);
 #endif
-        if (type->cast) {
-          type->cast->prev = cast;
-          cast->next = type->cast;
+        /* Set inclusion mark for sorting */
+        cast->next = cast;
+        num_mapped++;
+        
+        if (type == cast->type) {
+#ifdef SWIGRUNTIME_DEBUG
+          printf("%s : self cast at pos [%li]\n", type->name, cast - first);
+#endif
+          if (cast - first) {
+            /* Move cast to itself to the first entry in the array */
+            
+            swig_cast_info tmp = *cast;
+            *cast = *first;
+            *first = tmp;
+          }
+          first++;
+          
+        } else {
+          cast->value = SWIG_Hash(cast->type->name, (unsigned int)strlen(cast->type->name));
         }
-        type->cast = cast;
       }
       cast++;
     }
+    
+    if (num_mapped) {
+      if (cast - first) {
+        swig_cast_info *tmp;
+        
+        /* Sort casts by type address for binary search in SWIG_TypeCheckStruct */
+        qsort(first, (size_t)(cast - first), sizeof(swig_cast_info), SWIG_CastCmpStruct);
+        
+        /* Remap back links for added entries */
+        cast = swig_module.cast_initial[i] + num_mapped;
+        for (tmp = first; tmp < cast; tmp++) {
+          tmp->next = tmp;
+        }
+      }
+      
+      /* Set the value field of the first entry to the index of the last added entry */
+      cast = swig_module.cast_initial[i];
+      cast->value = (unsigned int)(num_mapped - 1);
+      
+      num_mapped -= (int)(first - cast);
+      if (num_mapped > 1) {
+        /* Sort <'next','value'> pairs by 'value' for binary search in SWIG_TypeCheck */
+        
+        SWIG_CastHashSort(first, num_mapped);
+      }
+      
+      first = type->cast;
+      if (first) {
+        /* Link the current set into the list of cast arrays */
+        cast->next = first->next;
+        first->next = cast;
+      } else {
+        cast->next = 0;
+        type->cast = cast;
+      }
+    }
+    
     /* Set entry in modules->types array equal to the type */
     swig_module.types[i] = type;
   }
@@ -4014,7 +4820,6 @@ SWIG_InitializeModule(void *clientdata) {
 SWIGRUNTIME void
 SWIG_PropagateClientData(void) {
   size_t i;
-  swig_cast_info *equiv;
   static int init_run = 0;
   
   if (init_run) return;
@@ -4022,13 +4827,16 @@ SWIG_PropagateClientData(void) {
   
   for (i = 0; i < swig_module.size; i++) {
     if (swig_module.types[i]->clientdata) {
-      equiv = swig_module.types[i]->cast;
-      while (equiv) {
-        if (!equiv->converter) {
-          if (equiv->type && !equiv->type->clientdata)
-          SWIG_TypeClientData(equiv->type, swig_module.types[i]->clientdata);
+      swig_cast_info *head, *cast;
+      head = swig_module.types[i]->cast;
+      while (head) {
+        for (cast = head; (cast - head) <= head->value; cast++) {
+          if (!cast->converter) {
+            if (cast->type && !cast->type->clientdata)
+            SWIG_TypeClientData(cast->type, swig_module.types[i]->clientdata);
+          }
         }
-        equiv = equiv->next;
+        head = head->next;
       }
     }
   }
@@ -4048,220 +4856,6 @@ SWIG_PropagateClientData(void) {
 extern "C" {
 #endif
   
-  /* Python-specific SWIG API */
-#define SWIG_newvarlink()                             SWIG_Python_newvarlink()
-#define SWIG_addvarlink(p, name, get_attr, set_attr)  SWIG_Python_addvarlink(p, name, get_attr, set_attr)
-#define SWIG_InstallConstants(d, constants)           SWIG_Python_InstallConstants(d, constants)
-  
-  /* -----------------------------------------------------------------------------
-   * global variable support code.
-   * ----------------------------------------------------------------------------- */
-  
-  typedef struct swig_globalvar {
-    char       *name;                  /* Name of global variable */
-    PyObject *(*get_attr)(void);       /* Return the current value */
-    int       (*set_attr)(PyObject *); /* Set the value */
-    struct swig_globalvar *next;
-  } swig_globalvar;
-  
-  typedef struct swig_varlinkobject {
-    PyObject_HEAD
-    swig_globalvar *vars;
-  } swig_varlinkobject;
-  
-  SWIGINTERN PyObject *
-  swig_varlink_repr(swig_varlinkobject *SWIGUNUSEDPARM(v)) {
-#if PY_VERSION_HEX >= 0x03000000
-    return PyUnicode_InternFromString("<Swig global variables>");
-#else
-    return PyString_FromString("<Swig global variables>");
-#endif
-  }
-  
-  SWIGINTERN PyObject *
-  swig_varlink_str(swig_varlinkobject *v) {
-#if PY_VERSION_HEX >= 0x03000000
-    PyObject *str = PyUnicode_InternFromString("(");
-    PyObject *tail;
-    PyObject *joined;
-    swig_globalvar *var;
-    for (var = v->vars; var; var=var->next) {
-      tail = PyUnicode_FromString(var->name);
-      joined = PyUnicode_Concat(str, tail);
-      Py_DecRef(str);
-      Py_DecRef(tail);
-      str = joined;
-      if (var->next) {
-        tail = PyUnicode_InternFromString(", ");
-        joined = PyUnicode_Concat(str, tail);
-        Py_DecRef(str);
-        Py_DecRef(tail);
-        str = joined;
-      }
-    }
-    tail = PyUnicode_InternFromString(")");
-    joined = PyUnicode_Concat(str, tail);
-    Py_DecRef(str);
-    Py_DecRef(tail);
-    str = joined;
-#else
-    PyObject *str = PyString_FromString("(");
-    swig_globalvar *var;
-    for (var = v->vars; var; var=var->next) {
-      PyString_ConcatAndDel(&str,PyString_FromString(var->name));
-      if (var->next) PyString_ConcatAndDel(&str,PyString_FromString(", "));
-    }
-    PyString_ConcatAndDel(&str,PyString_FromString(")"));
-#endif
-    return str;
-  }
-  
-  SWIGINTERN void
-  swig_varlink_dealloc(swig_varlinkobject *v) {
-    swig_globalvar *var = v->vars;
-    while (var) {
-      swig_globalvar *n = var->next;
-      free(var->name);
-      free(var);
-      var = n;
-    }
-  }
-  
-  SWIGINTERN PyObject *
-  swig_varlink_getattr(swig_varlinkobject *v, char *n) {
-    PyObject *res = NULL;
-    swig_globalvar *var = v->vars;
-    while (var) {
-      if (strcmp(var->name,n) == 0) {
-        res = (*var->get_attr)();
-        break;
-      }
-      var = var->next;
-    }
-    if (res == NULL && !PyErr_Occurred()) {
-      PyErr_Format(PyExc_AttributeError, "Unknown C global variable '%s'", n);
-    }
-    return res;
-  }
-  
-  SWIGINTERN int
-  swig_varlink_setattr(swig_varlinkobject *v, char *n, PyObject *p) {
-    int res = 1;
-    swig_globalvar *var = v->vars;
-    while (var) {
-      if (strcmp(var->name,n) == 0) {
-        res = (*var->set_attr)(p);
-        break;
-      }
-      var = var->next;
-    }
-    if (res == 1 && !PyErr_Occurred()) {
-      PyErr_Format(PyExc_AttributeError, "Unknown C global variable '%s'", n);
-    }
-    return res;
-  }
-  
-  SWIGINTERN PyTypeObject*
-  swig_varlink_type(void) {
-    static char varlink__doc__[] = "Swig var link object";
-    static PyTypeObject varlink_type;
-    static int type_init = 0;
-    if (!type_init) {
-      const PyTypeObject tmp = {
-#if PY_VERSION_HEX >= 0x03000000
-        PyVarObject_HEAD_INIT(NULL, 0)
-#else
-        PyObject_HEAD_INIT(NULL)
-        0,                                  /* ob_size */
-#endif
-        "swigvarlink",                      /* tp_name */
-        sizeof(swig_varlinkobject),         /* tp_basicsize */
-        0,                                  /* tp_itemsize */
-        (destructor) swig_varlink_dealloc,  /* tp_dealloc */
-        0,                                  /* tp_print */
-        (getattrfunc) swig_varlink_getattr, /* tp_getattr */
-        (setattrfunc) swig_varlink_setattr, /* tp_setattr */
-        0,                                  /* tp_compare */
-        (reprfunc) swig_varlink_repr,       /* tp_repr */
-        0,                                  /* tp_as_number */
-        0,                                  /* tp_as_sequence */
-        0,                                  /* tp_as_mapping */
-        0,                                  /* tp_hash */
-        0,                                  /* tp_call */
-        (reprfunc) swig_varlink_str,        /* tp_str */
-        0,                                  /* tp_getattro */
-        0,                                  /* tp_setattro */
-        0,                                  /* tp_as_buffer */
-        0,                                  /* tp_flags */
-        varlink__doc__,                     /* tp_doc */
-        0,                                  /* tp_traverse */
-        0,                                  /* tp_clear */
-        0,                                  /* tp_richcompare */
-        0,                                  /* tp_weaklistoffset */
-        0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0, /* tp_iter -> tp_weaklist */
-        0,                                  /* tp_del */
-        0,                                  /* tp_version_tag */
-#if PY_VERSION_HEX >= 0x03040000
-        0,                                  /* tp_finalize */
-#endif
-#if PY_VERSION_HEX >= 0x03080000
-        0,                                  /* tp_vectorcall */
-#endif
-#if (PY_VERSION_HEX >= 0x03080000) && (PY_VERSION_HEX < 0x03090000)
-        0,                                  /* tp_print */
-#endif
-#ifdef COUNT_ALLOCS
-        0,                                  /* tp_allocs */
-        0,                                  /* tp_frees */
-        0,                                  /* tp_maxalloc */
-        0,                                  /* tp_prev */
-        0                                   /* tp_next */
-#endif
-      };
-      varlink_type = tmp;
-      type_init = 1;
-      if (PyType_Ready(&varlink_type) < 0)
-      return NULL;
-    }
-    return &varlink_type;
-  }
-  
-  /* Create a variable linking object for use later */
-  SWIGINTERN PyObject *
-  SWIG_Python_newvarlink(void) {
-    swig_varlinkobject *result = PyObject_NEW(swig_varlinkobject, swig_varlink_type());
-    if (result) {
-      result->vars = 0;
-    }
-    return ((PyObject*) result);
-  }
-  
-  SWIGINTERN void 
-  SWIG_Python_addvarlink(PyObject *p, const char *name, PyObject *(*get_attr)(void), int (*set_attr)(PyObject *p)) {
-    swig_varlinkobject *v = (swig_varlinkobject *) p;
-    swig_globalvar *gv = (swig_globalvar *) malloc(sizeof(swig_globalvar));
-    if (gv) {
-      size_t size = strlen(name)+1;
-      gv->name = (char *)malloc(size);
-      if (gv->name) {
-        memcpy(gv->name, name, size);
-        gv->get_attr = get_attr;
-        gv->set_attr = set_attr;
-        gv->next = v->vars;
-      }
-    }
-    v->vars = gv;
-  }
-  
-  SWIGINTERN PyObject *
-  SWIG_globals(void) {
-    static PyObject *globals = 0;
-    if (!globals) {
-      globals = SWIG_newvarlink();
-    }
-    return globals;
-  }
-  
   /* -----------------------------------------------------------------------------
    * constants/methods manipulation
    * ----------------------------------------------------------------------------- */
@@ -4277,7 +4871,7 @@ extern "C" {
         obj = SWIG_InternalNewPointerObj(constants[i].pvalue, *(constants[i]).ptype,0);
         break;
       case SWIG_PY_BINARY:
-        obj = SWIG_NewPackedObj(constants[i].pvalue, constants[i].lvalue, *(constants[i].ptype));
+        obj = SWIG_NewPackedObj(constants[i].pvalue, (size_t)constants[i].lvalue, *(constants[i].ptype));
         break;
       default:
         obj = 0;
@@ -4285,20 +4879,17 @@ extern "C" {
       }
       if (obj) {
         PyDict_SetItemString(d, constants[i].name, obj);
-        Py_DECREF(obj);
+        SWIG_Py_DECREF(obj);
       }
     }
   }
   
-  /* -----------------------------------------------------------------------------*/
-  /* Fix SwigMethods to carry the callback ptrs when needed */
-  /* -----------------------------------------------------------------------------*/
+  /* -----------------------------------------------------------------------------
+   * Patch %callback methods' docstrings to hold the callback ptrs
+   * -----------------------------------------------------------------------------*/
   
   SWIGINTERN void
-  SWIG_Python_FixMethods(PyMethodDef *methods,
-    swig_const_info *const_table,
-    swig_type_info **types,
-    swig_type_info **types_initial) {
+  SWIG_Python_FixMethods(PyMethodDef *methods, const swig_const_info *const_table, swig_type_info **types, swig_type_info **types_initial) {
     size_t i;
     for (i = 0; methods[i].ml_name; ++i) {
       const char *c = methods[i].ml_doc;
@@ -4306,7 +4897,7 @@ extern "C" {
       c = strstr(c, "swig_ptr: ");
       if (c) {
         int j;
-        swig_const_info *ci = 0;
+        const swig_const_info *ci = 0;
         const char *name = c + 10;
         for (j = 0; const_table[j].type; ++j) {
           if (strncmp(const_table[j].name, name, 
@@ -4318,9 +4909,9 @@ extern "C" {
         if (ci) {
           void *ptr = (ci->type == SWIG_PY_POINTER) ? ci->pvalue : 0;
           if (ptr) {
-            size_t shift = (ci->ptype) - types;
+            size_t shift = (size_t)((ci->ptype) - types);
             swig_type_info *ty = types_initial[shift];
-            size_t ldoc = (c - methods[i].ml_doc);
+            size_t ldoc = (size_t)(c - methods[i].ml_doc);
             size_t lptr = strlen(ty->name)+2*sizeof(void*)+2;
             char *ndoc = (char*)malloc(ldoc + lptr + 10);
             if (ndoc) {
@@ -4338,98 +4929,59 @@ extern "C" {
     }
   } 
   
-  /* -----------------------------------------------------------------------------
-   * Method creation and docstring support functions
-   * ----------------------------------------------------------------------------- */
-  
-  /* -----------------------------------------------------------------------------
-   * Function to find the method definition with the correct docstring for the
-   * proxy module as opposed to the low-level API
-   * ----------------------------------------------------------------------------- */
-  
-  SWIGINTERN PyMethodDef *SWIG_PythonGetProxyDoc(const char *name) {
-    /* Find the function in the modified method table */
-    size_t offset = 0;
-    int found = 0;
-    while (SwigMethods_proxydocs[offset].ml_meth != NULL) {
-      if (strcmp(SwigMethods_proxydocs[offset].ml_name, name) == 0) {
-        found = 1;
-        break;
-      }
-      offset++;
-    }
-    /* Use the copy with the modified docstring if available */
-    return found ? &SwigMethods_proxydocs[offset] : NULL;
-  }
-  
-  /* -----------------------------------------------------------------------------
-   * Wrapper of PyInstanceMethod_New() used in Python 3
-   * It is exported to the generated module, used for -fastproxy
-   * ----------------------------------------------------------------------------- */
-  
-  SWIGINTERN PyObject *SWIG_PyInstanceMethod_New(PyObject *SWIGUNUSEDPARM(self), PyObject *func) {
-    if (PyCFunction_Check(func)) {
-      PyCFunctionObject *funcobj = (PyCFunctionObject *)func;
-      PyMethodDef *ml = SWIG_PythonGetProxyDoc(funcobj->m_ml->ml_name);
-      if (ml)
-      func = PyCFunction_NewEx(ml, funcobj->m_self, funcobj->m_module);
-    }
-#if PY_VERSION_HEX >= 0x03000000
-    return PyInstanceMethod_New(func);
-#else
-    return PyMethod_New(func, NULL, NULL);
-#endif
-  }
-  
-  /* -----------------------------------------------------------------------------
-   * Wrapper of PyStaticMethod_New()
-   * It is exported to the generated module, used for -fastproxy
-   * ----------------------------------------------------------------------------- */
-  
-  SWIGINTERN PyObject *SWIG_PyStaticMethod_New(PyObject *SWIGUNUSEDPARM(self), PyObject *func) {
-    if (PyCFunction_Check(func)) {
-      PyCFunctionObject *funcobj = (PyCFunctionObject *)func;
-      PyMethodDef *ml = SWIG_PythonGetProxyDoc(funcobj->m_ml->ml_name);
-      if (ml)
-      func = PyCFunction_NewEx(ml, funcobj->m_self, funcobj->m_module);
-    }
-    return PyStaticMethod_New(func);
-  }
-  
 #ifdef __cplusplus
 }
 #endif
 
+
+
+
 /* -----------------------------------------------------------------------------*
  *  Partial Init method
  * -----------------------------------------------------------------------------*/
 
+SWIGINTERN int SWIG_mod_exec(PyObject *module);
+
 #ifdef __cplusplus
 extern "C"
 #endif
 
 SWIGEXPORT 
-#if PY_VERSION_HEX >= 0x03000000
 PyObject*
-#else
-void
-#endif
 SWIG_init(void) {
-  PyObject *m, *d, *md, *globals;
+  static PyModuleDef_Slot SwigSlots[] = {
+    {
+      Py_mod_exec, (void *)SWIG_mod_exec 
+    },
+#ifdef SWIGPYTHON_NOGIL
+#ifdef Py_GIL_DISABLED
+    {
+      Py_mod_gil, Py_MOD_GIL_NOT_USED 
+    },
+#endif
+#endif
+    {
+      0, NULL 
+    }
+  };
   
-#if PY_VERSION_HEX >= 0x03000000
   static struct PyModuleDef SWIG_module = {
     PyModuleDef_HEAD_INIT,
     SWIG_name,
     NULL,
-    -1,
+    0,
     SwigMethods,
-    NULL,
+    SwigSlots,
     NULL,
     NULL,
     NULL
   };
-#endif
+  
+  return PyModuleDef_Init(&SWIG_module);
+}
+
+SWIGINTERN int SWIG_mod_exec(PyObject *m) {
+  PyObject *d, *md, *globals;
   
 #if defined(SWIGPYTHON_BUILTIN)
   static SwigPyClientData SwigPyObject_clientdata = {
@@ -4467,27 +5019,31 @@ SWIG_init(void) {
   (void)self;
   
   /* Metaclass is used to implement static member variables */
-  metatype = SwigPyObjectType();
+  metatype = SwigPyObjectType_Type();
   assert(metatype);
+  
+  SwigPyStaticVar_Type();
 #endif
   
   (void)globals;
   
   /* Create singletons now to avoid potential deadlocks with multi-threaded usage after module initialization */
+  SWIG_runtime_data_module();
   SWIG_This();
   SWIG_Python_TypeCache();
-  SwigPyPacked_type();
+  SwigPyPacked_Type();
+  SwigVarLink_Type();
 #ifndef SWIGPYTHON_BUILTIN
-  SwigPyObject_type();
+  SwigPyObject_Type();
 #endif
   
   /* Fix SwigMethods to carry the callback ptrs when needed */
   SWIG_Python_FixMethods(SwigMethods, swig_const_table, swig_types, swig_type_initial);
   
-#if PY_VERSION_HEX >= 0x03000000
-  m = PyModule_Create(&SWIG_module);
-#else
-  m = Py_InitModule(SWIG_name, SwigMethods);
+#ifdef SWIGPYTHON_NOGIL
+#ifdef Py_GIL_DISABLED
+  PyUnstable_Module_SetGIL(m, Py_MOD_GIL_NOT_USED);
+#endif
 #endif
   
   md = d = PyModule_GetDict(m);
@@ -4506,19 +5062,15 @@ SWIG_init(void) {
     SwigPyObject_clientdata.pytype = swigpyobject;
   } else if (swigpyobject->tp_basicsize != cd->pytype->tp_basicsize) {
     PyErr_SetString(PyExc_RuntimeError, "Import error: attempted to load two incompatible swig-generated modules.");
-# if PY_VERSION_HEX >= 0x03000000
-    return NULL;
-# else
-    return;
-# endif
+    return -1;
   }
   
   /* All objects have a 'this' attribute */
-  this_descr = PyDescr_NewGetSet(SwigPyObject_type(), &this_getset_def);
+  this_descr = PyDescr_NewGetSet(SwigPyObject_Type(), &this_getset_def);
   (void)this_descr;
   
   /* All objects have a 'thisown' attribute */
-  thisown_descr = PyDescr_NewGetSet(SwigPyObject_type(), &thisown_getset_def);
+  thisown_descr = PyDescr_NewGetSet(SwigPyObject_Type(), &thisown_getset_def);
   (void)thisown_descr;
   
   public_interface = PyList_New(0);
@@ -4526,7 +5078,7 @@ SWIG_init(void) {
   (void)public_symbol;
   
   PyDict_SetItemString(md, "__all__", public_interface);
-  Py_DECREF(public_interface);
+  SWIG_Py_DECREF(public_interface);
   for (i = 0; SwigMethods[i].ml_name != NULL; ++i)
   SwigPyBuiltin_AddPublicSymbol(public_interface, SwigMethods[i].ml_name);
   for (i = 0; swig_const_table[i].name != 0; ++i)
@@ -4535,10 +5087,6 @@ SWIG_init(void) {
   
   SWIG_InstallConstants(d,swig_const_table);
   
-#if PY_VERSION_HEX >= 0x03000000
-  return m;
-#else
-  return;
-#endif
+  return 0;
 }
 
@@ -10,8 +10,8 @@
         $1 = (char **) malloc((size+1)*sizeof(char *));
         for (i = 0; i < size; i++) {
             PyObject *o = PyList_GetItem($input, i);
-            if (PyString_Check(o))
-	            $1[i] = PyString_AsString(PyList_GetItem($input, i));
+            if (PyBytes_Check(o))
+	            $1[i] = PyBytes_AsString(PyList_GetItem($input, i));
             else {
 	            PyErr_SetString(PyExc_TypeError, "list must contain strings");
 	            free($1);
@@ -30,9 +30,101 @@
     free((char *) $1);
 }
 
+// Integer sequences are passed to C++ as std::vector<int>
+%typemap(in) const std::vector<int> & (std::vector<int> temp) {
+    PyObject *seq = PySequence_Fast($input, "expected a sequence of integers");
+    if (seq == NULL) {
+        SWIG_fail;
+    }
+    Py_ssize_t size = PySequence_Fast_GET_SIZE(seq);
+    temp.resize(size);
+    for (Py_ssize_t i = 0; i < size; i++) {
+        temp[i] = (int) PyLong_AsLong(PySequence_Fast_GET_ITEM(seq, i));
+    }
+    Py_DECREF(seq);
+    if (PyErr_Occurred()) {
+        SWIG_fail;
+    }
+    $1 = &temp;
+}
+
+// Integer vectors are returned as packed native ints (bytes)
+%typemap(out) std::vector<int> {
+    $result = PyBytes_FromStringAndSize(
+        (const char *) (&$1)->data(), (&$1)->size() * sizeof(int));
+}
+
+%include "std_string.i"
+
+// The build runs without the GIL (its log is returned by swig_log, not
+// printed), so that builds from several Python threads run in parallel
+%exception swig_build {
+    try {
+        AllowThreads nogil;
+        $action
+    } catch (const BudgetExceeded &e) {
+        PyErr_SetString(budget_exceeded, e.what());
+        SWIG_fail;
+    } catch (const std::bad_alloc &e) {
+        PyErr_NoMemory();
+        SWIG_fail;
+    } catch (const std::runtime_error &e) {
+        PyErr_SetString(PyExc_RuntimeError, e.what());
+        SWIG_fail;
+    }
+}
+
+%exception {
+    try {
+        $action
+    } catch (const BudgetExceeded &e) {
+        PyErr_SetString(budget_exceeded, e.what());
+        SWIG_fail;
+    } catch (const std::bad_alloc &e) {
+        PyErr_NoMemory();
+        SWIG_fail;
+    } catch (const std::runtime_error &e) {
+        PyErr_SetString(PyExc_RuntimeError, e.what());
+        SWIG_fail;
+    }
+}
+
 %{
 /* Put header files here or function declarations like below */
+#include <new>
+#include <string>
+#include <vector>
+#include <stdexcept>
+#include "../src/arcflow.hpp"
+// raised when a build exceeds its state/memory budget
+static PyObject *budget_exceeded = NULL;
+// releases the GIL for its lifetime
+class AllowThreads {
+    PyThreadState *state;
+public:
+    AllowThreads() : state(PyEval_SaveThread()) {}
+    ~AllowThreads() { PyEval_RestoreThread(state); }
+};
 extern int swig_main(int argc, char **argv);
+extern std::vector<int> swig_build(const std::vector<int> &data, int method,
+                                   int binary, char vtype, bool verbose,
+                                   int threads, long long max_states,
+                                   long long max_memory_mb);
+extern std::string swig_stats();
+extern std::string swig_log();
 %}
 
 extern int swig_main(int argc, char **argv);
+extern std::vector<int> swig_build(const std::vector<int> &data, int method,
+                                   int binary, char vtype, bool verbose,
+                                   int threads, long long max_states,
+                                   long long max_memory_mb);
+extern std::string swig_stats();
+extern std::string swig_log();
+
+%init %{
+    budget_exceeded = PyErr_NewException(
+        "_vbp2afg.BudgetExceeded", PyExc_RuntimeError, NULL);
+    Py_INCREF(budget_exceeded);
+    PyModule_AddObject(m, "BudgetExceeded", budget_exceeded);
+%}
@@ -0,0 +1,12 @@
+# This file was automatically generated by SWIG (https://www.swig.org).
+# Version 4.5.1
+#
+# Do not make changes to this file unless you know what you are doing - modify
+# the SWIG interface file instead.
+
+import typing
+# Pull in all the attributes from the low-level C/C++ module
+if getattr(globals().get("__spec__"), "parent", None) or __package__ or "." in __name__:
+    from ._vbp2model import *
+else:
+    from _vbp2model import *